@@ -26,11 +26,13 @@ import os
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Mapping, Optional
 from urllib.parse import urlencode, urljoin
 
 import urllib3
 
+from polaris_mcp.routing import RealmRouter
+
 
 class AuthorizationProvider(ABC):
     """Return Authorization header values for outgoing requests."""
@@ -59,12 +61,16 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
         http: urllib3.PoolManager,
         refresh_buffer_seconds: float,
         timeout: urllib3.Timeout,
+        router: Optional[RealmRouter] = None,
     ) -> None:
         self._base_url = base_url
         self._http = http
+        self._router = router
         self._refresh_buffer_seconds = max(refresh_buffer_seconds, 0.0)
         self._timeout = timeout
         self._lock = threading.Lock()
+        # One lock per realm so concurrent fan-out calls fetch their tokens in parallel.
+        self._realm_locks: dict[str, threading.Lock] = {}
         # {realm: (token, expires_at_epoch)}
         self._cached: dict[str, tuple[str, float]] = {}
 
@@ -84,8 +90,8 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
         # Token not expired
         if token and not needs_refresh(token):
             return token[0]
-        # Acquire lock and verify again if token expired
-        with self._lock:
+        # Acquire the realm's lock and verify again if token expired
+        with self._realm_lock(cache_key):
             token = self._cached.get(cache_key)
             if needs_refresh(token):
                 credentials = self._get_credentials_from_realm(realm)
@@ -95,6 +101,10 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
                 self._cached[cache_key] = token
         return token[0] if token else None
 
+    def _realm_lock(self, cache_key: str) -> threading.Lock:
+        with self._lock:
+            return self._realm_locks.setdefault(cache_key, threading.Lock())
+
     def _get_credentials_from_realm(
         self, realm: Optional[str]
     ) -> Optional[dict[str, str]]:
@@ -126,8 +136,13 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
     def _fetch_token(
         self, realm: Optional[str], credentials: dict[str, str]
     ) -> tuple[str, float]:
+        base_url, http = self._base_url, self._http
+        if self._router is not None:
+            # Tokens come from the deployment that serves the realm.
+            backend = self._router.backend(realm)
+            base_url, http = backend.base_url, backend.http
         token_url = credentials.get("token_url") or urljoin(
-            self._base_url, "api/catalog/v1/oauth/tokens"
+            base_url, "api/catalog/v1/oauth/tokens"
         )
         payload = {
             "grant_type": "client_credentials",
@@ -142,7 +157,7 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         if realm:
             headers[header_name] = realm
-        response = self._http.request(
+        response = http.request(
             "POST",
             token_url,
             body=encoded,
@@ -173,6 +188,22 @@ class ClientCredentialsAuthorizationProvider(AuthorizationProvider):
         return token, expires_at
 
 
+def configured_realms(environ: Optional[Mapping[str, str]] = None) -> List[str]:
+    """Return the realms that have both a client id and secret configured."""
+
+    env = os.environ if environ is None else environ
+    prefix, suffix = "POLARIS_REALM_", "_CLIENT_ID"
+    realms = []
+    for key, value in env.items():
+        if not (key.startswith(prefix) and key.endswith(suffix)):
+            continue
+        realm = key[len(prefix) : -len(suffix)]
+        secret = env.get(f"{prefix}{realm}_CLIENT_SECRET")
+        if realm and value.strip() and secret and secret.strip():
+            realms.append(realm)
+    return sorted(realms)
+
+
 class _NoneAuthorizationProvider(AuthorizationProvider):
     def authorization_header(self, realm: Optional[str] = None) -> Optional[str]:
         return None
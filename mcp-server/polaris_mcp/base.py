@@ -23,11 +23,14 @@ from __future__ import annotations
 
 import copy
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Callable, Dict, Optional, Protocol
 
 
 JSONDict = Dict[str, Any]
 
+# Receives (progress, total, message) updates from long-running tool operations.
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], None]
+
 NAMESPACE_PATH_DELIMITER = "\x1f"
 
 
@@ -0,0 +1,218 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Run manifests of independent REST actions with bounded concurrency and retries."""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import urllib3
+
+from polaris_mcp.base import JSONDict, ProgressCallback
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    RateLimiter,
+    RetryableError,
+    TaskOutcome,
+    run_concurrently,
+)
+from polaris_mcp.export import resolve_import_path
+from polaris_mcp.rest import PolarisRestTool
+
+DEFAULT_BULK_RETRIES = 2
+DEFAULT_BULK_REQUESTS_PER_SECOND = 25.0
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# A POST that timed out or failed with 5xx may already have been applied, so it is only
+# retried when the request provably did not run: connect failures, throttling and 503.
+NON_IDEMPOTENT_METHODS = {"POST"}
+NON_IDEMPOTENT_RETRYABLE_STATUSES = {429, 503}
+
+
+@dataclass(frozen=True)
+class BulkAction:
+    """One HTTP request of a manifest, labelled for the status report."""
+
+    index: int
+    action: str
+    target: str
+    method: str
+    path: str
+    query: Optional[Dict[str, str]] = None
+    body: Any = None
+
+
+def load_manifest(
+    inline: Any = None, path: Optional[str] = None, export_dir: Optional[str] = None
+) -> List[JSONDict]:
+    """Return manifest entries given inline or read from a JSON/JSONL file.
+
+    Files are only read from inside ``export_dir`` (``POLARIS_EXPORT_DIR``). A JSON
+    file may hold an array or an object with an ``actions`` array; a JSONL file holds
+    one entry per line.
+    """
+
+    if (inline is None) == (path is None):
+        raise ValueError("Provide exactly one of manifest or manifestPath.")
+    if path is not None:
+        manifest_path = Path(resolve_import_path(str(path), export_dir))
+        if not manifest_path.is_file():
+            raise ValueError(f"Manifest file not found: {path}")
+        text = manifest_path.read_text(encoding="utf-8")
+        try:
+            inline = json.loads(text)
+        except json.JSONDecodeError:
+            try:
+                inline = [
+                    json.loads(line) for line in text.splitlines() if line.strip()
+                ]
+            except json.JSONDecodeError as error:
+                raise ValueError(
+                    f"Manifest must be JSON or JSONL: {manifest_path}: {error}"
+                ) from error
+    if isinstance(inline, dict):
+        inline = inline.get("actions")
+    if not isinstance(inline, list) or not inline:
+        raise ValueError("Manifest must be a non-empty array of actions.")
+    if not all(isinstance(entry, dict) for entry in inline):
+        raise ValueError("Every manifest entry must be a JSON object.")
+    return inline
+
+
+def run_actions(
+    rest_client: PolarisRestTool,
+    actions: List[BulkAction],
+    realm: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    retries: int = DEFAULT_BULK_RETRIES,
+    progress: Optional[ProgressCallback] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    include_successes: bool = True,
+) -> JSONDict:
+    """Execute ``actions`` concurrently and return a compact per-item status report.
+
+    Throttling, server errors and transport failures are retried; other HTTP errors are
+    reported for the item without failing the rest of the batch. POST requests
+    (creates, registers, revokes) are retried only on connect failures, 429 and 503. Every attempt waits for
+    ``rate_limiter`` when given. With ``include_successes=False`` only the counts and
+    the failed items (under ``failures``) are reported.
+    """
+
+    lock = threading.Lock()
+    completed = [0]
+
+    def execute(action: BulkAction) -> JSONDict:
+        arguments: JSONDict = {"method": action.method, "path": action.path}
+        if action.query:
+            arguments["query"] = action.query
+        if action.body is not None:
+            arguments["body"] = action.body
+        if realm:
+            arguments["realm"] = realm
+        idempotent = action.method.upper() not in NON_IDEMPOTENT_METHODS
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            response = rest_client.fetch(arguments)
+        except urllib3.exceptions.HTTPError as error:
+            if idempotent or _is_connect_error(error):
+                raise RetryableError(str(error)) from error
+            raise
+        retryable = (
+            RETRYABLE_STATUSES if idempotent else NON_IDEMPOTENT_RETRYABLE_STATUSES
+        )
+        if response.status in retryable:
+            raise RetryableError(
+                f"{action.method} {action.path} returned {response.status}"
+            )
+        status: JSONDict = {"status": response.status, "ok": response.ok}
+        if not response.ok:
+            status["error"] = _error_message(response.body)
+        return status
+
+    def report(outcome: TaskOutcome[BulkAction, JSONDict]) -> None:
+        if progress is None:
+            return
+        with lock:
+            completed[0] += 1
+            done = completed[0]
+        state = "ok" if outcome.ok and (outcome.result or {}).get("ok") else "failed"
+        progress(
+            float(done),
+            float(len(actions)),
+            f"{outcome.item.action} {outcome.item.target}: {state}",
+        )
+
+    items: List[JSONDict] = []
+    for outcome in run_concurrently(
+        execute, actions, max_concurrency, retries=retries, on_complete=report
+    ):
+        action = outcome.item
+        entry: JSONDict = {
+            "index": action.index,
+            "action": action.action,
+            "target": action.target,
+            "attempts": outcome.attempts,
+        }
+        if outcome.error is not None or outcome.result is None:
+            entry.update({"ok": False, "error": str(outcome.error)})
+        else:
+            entry.update(outcome.result)
+        items.append(entry)
+    succeeded = sum(1 for entry in items if entry["ok"])
+    summary: JSONDict = {
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+    }
+    if include_successes:
+        summary["items"] = items
+    else:
+        summary["failures"] = [entry for entry in items if not entry["ok"]]
+    return summary
+
+
+def _is_connect_error(error: urllib3.exceptions.HTTPError) -> bool:
+    """Return whether ``error`` happened before the request reached the server."""
+
+    if isinstance(error, urllib3.exceptions.MaxRetryError):
+        reason: Optional[Exception] = error.reason
+    else:
+        reason = error
+    return isinstance(
+        reason,
+        (
+            urllib3.exceptions.ConnectTimeoutError,
+            urllib3.exceptions.NewConnectionError,
+        ),
+    )
+
+
+def _error_message(body: Any) -> str:
+    if isinstance(body, dict):
+        error = body.get("error")
+        if isinstance(error, dict) and error.get("message"):
+            return str(error["message"])
+        return json.dumps(body)[:500]
+    return str(body or "")[:500]
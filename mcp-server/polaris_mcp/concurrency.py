@@ -0,0 +1,118 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Bounded-concurrency helpers for fanning out Polaris REST calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class TaskOutcome(Generic[T, R]):
+    """Result of applying a function to one item of a concurrent batch."""
+
+    item: T
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class RateLimiter:
+    """Space calls evenly so that at most ``rate_per_second`` start each second.
+
+    Shared by all worker threads of a batch; a non-positive rate disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RetryableError(RuntimeError):
+    """Raised by batch functions for failures worth retrying (throttling, 5xx, I/O)."""
+
+
+def run_concurrently(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+    retries: int = 0,
+    backoff_seconds: float = 0.5,
+    on_complete: Optional[Callable[[TaskOutcome[T, R]], None]] = None,
+) -> List[TaskOutcome[T, R]]:
+    """Apply ``func`` to every item using at most ``max_workers`` threads.
+
+    Outcomes are returned in input order. Exceptions raised by ``func`` are captured on
+    the corresponding outcome instead of aborting the batch. A :class:`RetryableError`
+    is retried up to ``retries`` times with exponential backoff. ``on_complete`` is
+    invoked (from the worker thread) as soon as each item finishes.
+    """
+
+    def run_one(item: T) -> TaskOutcome[T, R]:
+        attempt = 1
+        while True:
+            try:
+                outcome = TaskOutcome(item=item, result=func(item), attempts=attempt)
+            except RetryableError as error:
+                if attempt <= retries:
+                    time.sleep(backoff_seconds * (2 ** (attempt - 1)))
+                    attempt += 1
+                    continue
+                outcome = TaskOutcome(item=item, error=error, attempts=attempt)
+            except Exception as error:
+                outcome = TaskOutcome(item=item, error=error, attempts=attempt)
+            if on_complete is not None:
+                on_complete(outcome)
+            return outcome
+
+    if not items:
+        return []
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [run_one(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="polaris-mcp"
+    ) as executor:
+        return list(executor.map(run_one, items))
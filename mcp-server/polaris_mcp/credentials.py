@@ -0,0 +1,190 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Cache of storage credentials vended by ``loadTable`` access delegation."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from polaris_mcp.base import JSONDict
+
+VENDED_CREDENTIALS = "vended-credentials"
+DEFAULT_CREDENTIAL_REFRESH_BUFFER_SECONDS = 300.0
+REDACTED = "[REDACTED]"
+
+# Config keys carrying secrets (matched as suffixes, e.g. ``s3.secret-access-key``).
+_SECRET_KEY_SUFFIXES = (
+    "access-key-id",
+    "secret-access-key",
+    "session-token",
+    "sas-token",
+    "oauth2.token",
+)
+_SECRET_KEYS = {"token", "credential"}
+_EXPIRY_KEY_SUFFIXES = ("expires-at-ms", "expires-at")
+
+CredentialKey = Tuple[str, ...]
+
+
+def is_secret_key(name: str) -> bool:
+    lowered = name.lower()
+    if lowered.endswith(_EXPIRY_KEY_SUFFIXES):
+        return False
+    return (
+        lowered in _SECRET_KEYS
+        or lowered.endswith(_SECRET_KEY_SUFFIXES)
+        or ".sas-token." in lowered
+    )
+
+
+def _is_credential_key(name: str) -> bool:
+    return is_secret_key(name) or name.lower().endswith(_EXPIRY_KEY_SUFFIXES)
+
+
+def redact_credentials(node: Any) -> Any:
+    """Return a copy of ``node`` with secret-looking config values replaced."""
+
+    if isinstance(node, dict):
+        return {
+            key: (
+                REDACTED
+                if isinstance(key, str) and is_secret_key(key) and value is not None
+                else redact_credentials(value)
+            )
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [redact_credentials(item) for item in node]
+    return node
+
+
+def _expiry_seconds(config: Dict[str, Any]) -> Optional[float]:
+    expiries = []
+    for key, value in config.items():
+        if not key.lower().endswith(_EXPIRY_KEY_SUFFIXES):
+            continue
+        try:
+            expiries.append(float(value) / 1000.0)
+        except (TypeError, ValueError):
+            continue
+    return min(expiries) if expiries else None
+
+
+@dataclass(frozen=True)
+class VendedCredentials:
+    """Credential-bearing parts of a ``LoadTableResult``."""
+
+    config: JSONDict
+    storage_credentials: List[JSONDict]
+    expires_at: float
+
+
+class VendedCredentialCache:
+    """Keep vended storage credentials per identity and table until shortly before expiry.
+
+    Credentials without an expiry (``*expires-at-ms``) are never cached.
+    """
+
+    def __init__(
+        self, refresh_buffer_seconds: float = DEFAULT_CREDENTIAL_REFRESH_BUFFER_SECONDS
+    ) -> None:
+        self._refresh_buffer_seconds = refresh_buffer_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[CredentialKey, VendedCredentials] = {}
+
+    def get(self, key: CredentialKey) -> Optional[VendedCredentials]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at - self._refresh_buffer_seconds <= time.time():
+                del self._entries[key]
+                return None
+            return entry
+
+    def store(self, key: CredentialKey, result: Any) -> Optional[VendedCredentials]:
+        """Extract and cache the credentials of a ``LoadTableResult``, if any."""
+
+        credentials = extract_credentials(result)
+        if credentials is None:
+            return None
+        with self._lock:
+            self._entries[key] = credentials
+        return credentials
+
+    def invalidate(self, *prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix`` (everything when empty)."""
+
+        with self._lock:
+            for key in [k for k in self._entries if k[: len(prefix)] == prefix]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def extract_credentials(result: Any) -> Optional[VendedCredentials]:
+    if not isinstance(result, dict):
+        return None
+    config = result.get("config")
+    if not isinstance(config, dict):
+        config = {}
+    config_credentials = {
+        key: value for key, value in config.items() if _is_credential_key(key)
+    }
+    storage_credentials = [
+        entry
+        for entry in result.get("storage-credentials") or []
+        if isinstance(entry, dict) and isinstance(entry.get("config"), dict)
+    ]
+    expiries = [
+        expiry
+        for expiry in [_expiry_seconds(config_credentials)]
+        + [_expiry_seconds(entry["config"]) for entry in storage_credentials]
+        if expiry is not None
+    ]
+    if not expiries or not (config_credentials or storage_credentials):
+        return None
+    return VendedCredentials(
+        config=copy.deepcopy(config_credentials),
+        storage_credentials=copy.deepcopy(storage_credentials),
+        expires_at=min(expiries),
+    )
+
+
+def apply_credentials(result: Any, credentials: VendedCredentials) -> Any:
+    """Merge cached credentials into a ``LoadTableResult`` loaded without delegation."""
+
+    if not isinstance(result, dict):
+        return result
+    merged = dict(result)
+    config = dict(merged.get("config") or {})
+    config.update(copy.deepcopy(credentials.config))
+    if config:
+        merged["config"] = config
+    if credentials.storage_credentials:
+        merged["storage-credentials"] = copy.deepcopy(credentials.storage_credentials)
+    return merged
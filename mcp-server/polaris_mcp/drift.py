@@ -0,0 +1,274 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Crawl two catalogs and report where they drifted apart."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from polaris_mcp.base import JSONDict, ProgressCallback
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    TaskOutcome,
+    run_concurrently,
+)
+from polaris_mcp.iceberg import table_metadata
+from polaris_mcp.listing import (
+    Namespace,
+    list_catalog_roles,
+    list_grants,
+    list_tables,
+    load_namespace_properties,
+    load_table,
+    walk_namespaces,
+)
+from polaris_mcp.rbac import grant_identity
+from polaris_mcp.rest import PolarisRestTool
+
+# (kind, drift) pairs in report order.
+DRIFT_KINDS = (
+    ("namespace", "missing"),
+    ("namespace", "extra"),
+    ("namespace", "propertiesChanged"),
+    ("table", "missing"),
+    ("table", "extra"),
+    ("table", "metadataLocationChanged"),
+    ("table", "propertiesChanged"),
+    ("catalogRole", "missing"),
+    ("catalogRole", "extra"),
+    ("catalogRole", "grantsChanged"),
+)
+
+_TableTarget = Tuple[Namespace, str]
+# Receives every finished table load of a crawl (used for progress reporting).
+TableListener = Callable[[TaskOutcome[_TableTarget, Tuple[str, str]]], None]
+
+
+def summary_hash(value: Any) -> str:
+    """Return a short, order-insensitive fingerprint of a JSON-compatible value."""
+
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CatalogFingerprint:
+    """Hashed summaries of one catalog's namespaces, tables and catalog-role grants."""
+
+    catalog: str
+    realm: Optional[str]
+    namespaces: Dict[str, str] = field(default_factory=dict)
+    tables: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    grants: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def describe(self) -> JSONDict:
+        described: JSONDict = {
+            "catalog": self.catalog,
+            "realm": self.realm,
+            "namespaces": len(self.namespaces),
+            "tables": len(self.tables),
+            "catalogRoles": len(self.grants),
+        }
+        if self.errors:
+            described["errors"] = self.errors
+        return described
+
+
+def crawl_catalog(
+    catalog_rest: PolarisRestTool,
+    management_rest: PolarisRestTool,
+    catalog: str,
+    realm: Optional[str] = None,
+    include_grants: bool = True,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+    on_table: Optional[TableListener] = None,
+) -> CatalogFingerprint:
+    """Fingerprint ``catalog``; every level of the crawl fans out concurrently.
+
+    Only hashes are kept: namespace properties, each table's ``metadata-location`` and
+    properties, and each catalog role's grant set. Failures are recorded per entity so
+    a single unreadable table does not abort the crawl.
+    """
+
+    result = CatalogFingerprint(catalog=catalog, realm=realm)
+    namespaces = walk_namespaces(
+        catalog_rest, catalog, realm=realm, max_workers=max_workers
+    )
+
+    def describe_namespace(namespace: Namespace) -> Tuple[str, List[str]]:
+        properties = load_namespace_properties(catalog_rest, catalog, namespace, realm)
+        tables = list_tables(catalog_rest, catalog, namespace, realm)
+        return summary_hash(properties), tables
+
+    tables: List[_TableTarget] = []
+    for outcome in run_concurrently(describe_namespace, namespaces, max_workers):
+        name = ".".join(outcome.item)
+        if outcome.error is not None or outcome.result is None:
+            result.errors[name] = str(outcome.error)
+            continue
+        result.namespaces[name] = outcome.result[0]
+        tables.extend((outcome.item, table) for table in outcome.result[1])
+
+    def describe_table(target: _TableTarget) -> Tuple[str, str]:
+        response = load_table(
+            catalog_rest,
+            catalog,
+            target[0],
+            target[1],
+            realm,
+            query={"snapshots": "refs"},
+        )
+        if not response.ok:
+            raise RuntimeError(f"loadTable returned {response.status}")
+        body = response.body if isinstance(response.body, dict) else {}
+        return (
+            summary_hash(body.get("metadata-location")),
+            summary_hash(table_metadata(body).get("properties") or {}),
+        )
+
+    for loaded in run_concurrently(
+        describe_table, tables, max_workers, on_complete=on_table
+    ):
+        name = ".".join((*loaded.item[0], loaded.item[1]))
+        if loaded.error is not None or loaded.result is None:
+            result.errors[name] = str(loaded.error)
+        else:
+            result.tables[name] = loaded.result
+
+    if include_grants:
+        roles = list_catalog_roles(management_rest, catalog, realm)
+        for granted in run_concurrently(
+            lambda role: list_grants(management_rest, catalog, role, realm),
+            roles,
+            max_workers,
+        ):
+            if granted.error is not None:
+                result.errors[_role_key(granted.item)] = str(granted.error)
+                continue
+            identities = sorted(
+                list(grant_identity(grant)) for grant in granted.result or []
+            )
+            result.grants[granted.item] = summary_hash(identities)
+    return result
+
+
+def iter_drift(
+    source: CatalogFingerprint, target: CatalogFingerprint
+) -> Iterator[JSONDict]:
+    """Yield one ``{"kind", "drift", "name"}`` entry per difference, in report order.
+
+    Entities that could not be read on either side are reported as errors only.
+    """
+
+    unreadable = set(source.errors) | set(target.errors)
+    for kind, left, right, changes in (
+        (
+            "namespace",
+            source.namespaces,
+            target.namespaces,
+            lambda a, b: ["propertiesChanged"] if a != b else [],
+        ),
+        (
+            "table",
+            source.tables,
+            target.tables,
+            lambda a, b: [
+                label
+                for label, index in (
+                    ("metadataLocationChanged", 0),
+                    ("propertiesChanged", 1),
+                )
+                if a[index] != b[index]
+            ],
+        ),
+        (
+            "catalogRole",
+            source.grants,
+            target.grants,
+            lambda a, b: ["grantsChanged"] if a != b else [],
+        ),
+    ):
+        skip = {
+            name
+            for name in left.keys() ^ right.keys()
+            if (_role_key(name) if kind == "catalogRole" else name) in unreadable
+        }
+        for name in sorted(left.keys() - right.keys() - skip):
+            yield {"kind": kind, "drift": "missing", "name": name}
+        for name in sorted(right.keys() - left.keys() - skip):
+            yield {"kind": kind, "drift": "extra", "name": name}
+        for name in sorted(left.keys() & right.keys()):
+            for drift in changes(left[name], right[name]):
+                yield {"kind": kind, "drift": drift, "name": name}
+
+
+def compare_catalogs(
+    catalog_rest: PolarisRestTool,
+    management_rest: PolarisRestTool,
+    source: Tuple[str, Optional[str]],
+    target: Tuple[str, Optional[str]],
+    include_grants: bool = True,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[CatalogFingerprint, CatalogFingerprint]:
+    """Crawl the ``(catalog, realm)`` sides concurrently and return both fingerprints."""
+
+    lock = threading.Lock()
+    loaded = [0]
+
+    def report(outcome: TaskOutcome[_TableTarget, Tuple[str, str]]) -> None:
+        if progress is None:
+            return
+        with lock:
+            loaded[0] += 1
+            done = loaded[0]
+        progress(
+            float(done), None, f"table {'.'.join(outcome.item[0])}.{outcome.item[1]}"
+        )
+
+    outcomes = run_concurrently(
+        lambda side: crawl_catalog(
+            catalog_rest,
+            management_rest,
+            side[0],
+            side[1],
+            include_grants=include_grants,
+            max_workers=max_workers,
+            on_table=report,
+        ),
+        [source, target],
+        2,
+    )
+    fingerprints: List[CatalogFingerprint] = []
+    for outcome in outcomes:
+        if outcome.error is not None or outcome.result is None:
+            raise outcome.error or RuntimeError(f"Crawling {outcome.item[0]} failed")
+        fingerprints.append(outcome.result)
+    return fingerprints[0], fingerprints[1]
+
+
+def _role_key(role: str) -> str:
+    return f"catalog-role:{role}"
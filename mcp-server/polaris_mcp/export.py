@@ -0,0 +1,121 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+"""Streaming JSONL and CSV exports for reports too large to return inline.
+
+Exports are only written inside the directory configured by ``POLARIS_EXPORT_DIR``,
+and files named by tool calls are only read from it; those paths come from MCP
+clients and must not reach arbitrary files.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from typing import Callable, Iterable, Optional, Sequence, TextIO
+
+from polaris_mcp.base import JSONDict
+
+
+def resolve_export_path(path: str, export_dir: Optional[str]) -> str:
+    """Return the absolute target for ``path``, which must resolve inside ``export_dir``.
+
+    Relative paths are taken relative to ``export_dir``; symlinks are resolved before the
+    check. Raises ``ValueError`` when exports are disabled or the path escapes.
+    """
+
+    if not export_dir:
+        raise ValueError("Exports are disabled; set POLARIS_EXPORT_DIR to enable them.")
+    return _confine(path, export_dir, "Export")
+
+
+def resolve_import_path(path: str, export_dir: Optional[str]) -> str:
+    """Return the absolute source for ``path``, which must resolve inside ``export_dir``.
+
+    The read-side counterpart of :func:`resolve_export_path` for files named by tool
+    calls, such as bulk manifests.
+    """
+
+    if not export_dir:
+        raise ValueError(
+            "Reading files is disabled; set POLARIS_EXPORT_DIR to enable it."
+        )
+    return _confine(path, export_dir, "Input")
+
+
+def _confine(path: str, export_dir: str, kind: str) -> str:
+    root = os.path.realpath(export_dir)
+    target = os.path.realpath(os.path.join(root, path))
+    if target == root or os.path.commonpath([root, target]) != root:
+        raise ValueError(f"{kind} path must be a file inside {root}: {path}")
+    return target
+
+
+def write_jsonl(
+    rows: Iterable[JSONDict], path: str, export_dir: Optional[str] = None
+) -> JSONDict:
+    """Write ``rows`` to ``path`` as JSONL and return the path, row count and size."""
+
+    def emit(handle: TextIO) -> int:
+        count = 0
+        for row in rows:
+            handle.write(json.dumps(row, separators=(",", ":")) + "\n")
+            count += 1
+        return count
+
+    return _write_atomically(resolve_export_path(path, export_dir), emit)
+
+
+def write_csv(
+    rows: Iterable[JSONDict],
+    path: str,
+    columns: Sequence[str],
+    export_dir: Optional[str] = None,
+) -> JSONDict:
+    """Write ``rows`` to ``path`` as CSV with a ``columns`` header row."""
+
+    def emit(handle: TextIO) -> int:
+        writer = csv.DictWriter(handle, fieldnames=list(columns))
+        writer.writeheader()
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    return _write_atomically(resolve_export_path(path, export_dir), emit)
+
+
+def _write_atomically(target: str, emit: Callable[[TextIO], int]) -> JSONDict:
+    # Rows are written as they are produced to a sibling ``.partial`` file that is moved
+    # into place once complete, so readers never observe a partial export.
+    directory = os.path.dirname(target)
+    if not os.path.isdir(directory):
+        raise ValueError(f"Export directory does not exist: {directory}")
+    partial = f"{target}.partial"
+    try:
+        with open(partial, "w", encoding="utf-8", newline="") as handle:
+            count = emit(handle)
+        os.replace(partial, target)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return {"path": target, "rows": count, "bytes": os.path.getsize(target)}
@@ -0,0 +1,149 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+"""Fan a tool call out across realms and merge the per-realm results."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Union
+
+from polaris_mcp.base import JSONDict, ProgressCallback, ToolExecutionResult
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    TaskOutcome,
+    run_concurrently,
+)
+
+# Expands to every realm with configured client credentials.
+ALL_REALMS = "*"
+
+ToolCall = Callable[[JSONDict], ToolExecutionResult]
+
+
+class RealmFanOut:
+    """Run one tool call per realm concurrently and merge the outcomes."""
+
+    def __init__(
+        self,
+        realms_provider: Callable[[], Sequence[str]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._realms_provider = realms_provider
+        self._max_concurrency = max(1, max_concurrency)
+
+    def resolve(self, realms: Union[str, Sequence[str]]) -> List[str]:
+        """Return the de-duplicated realm list, expanding ``*`` to configured realms."""
+
+        requested = [realms] if isinstance(realms, str) else list(realms)
+        resolved: List[str] = []
+        for entry in requested:
+            if not isinstance(entry, str) or not entry.strip():
+                raise ValueError("realms entries must be non-empty strings.")
+            names = (
+                self._configured_realms()
+                if entry.strip() == ALL_REALMS
+                else [entry.strip()]
+            )
+            resolved.extend(name for name in names if name not in resolved)
+        if not resolved:
+            raise ValueError("realms must name at least one realm.")
+        return resolved
+
+    def call(
+        self,
+        call: ToolCall,
+        arguments: Mapping[str, Any],
+        realms: Union[str, Sequence[str]],
+        progress: Optional[ProgressCallback] = None,
+    ) -> ToolExecutionResult:
+        """Invoke ``call`` once per realm and merge the results.
+
+        Each realm's status is ``ok``, ``error`` (the tool reported an error) or
+        ``failed`` (the call raised). The merged result is an error only when no realm
+        succeeded.
+        """
+
+        if arguments.get("realm") is not None:
+            raise ValueError("Specify either realm or realms, not both.")
+        targets = self.resolve(realms)
+        lock = threading.Lock()
+        finished = [0]
+
+        def run(realm: str) -> ToolExecutionResult:
+            return call({**arguments, "realm": realm})
+
+        def on_complete(outcome: TaskOutcome[str, ToolExecutionResult]) -> None:
+            if progress is None:
+                return
+            with lock:
+                finished[0] += 1
+                done = finished[0]
+            progress(float(done), float(len(targets)), f"realm {outcome.item}")
+
+        outcomes = run_concurrently(
+            run,
+            targets,
+            max_workers=self._max_concurrency,
+            on_complete=on_complete,
+        )
+        entries = [_realm_entry(outcome) for outcome in outcomes]
+        succeeded = sum(1 for entry in entries if entry["status"] == "ok")
+        summary: JSONDict = {
+            "realms": len(entries),
+            "succeeded": succeeded,
+            "failed": len(entries) - succeeded,
+        }
+        payload = {**summary, "results": entries}
+        metadata = {
+            **summary,
+            "results": [
+                {key: value for key, value in entry.items() if key != "text"}
+                for entry in entries
+            ],
+        }
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=succeeded == 0,
+            metadata=metadata,
+        )
+
+    def _configured_realms(self) -> List[str]:
+        realms = list(self._realms_provider())
+        if not realms:
+            raise ValueError(
+                "No realms are configured; set POLARIS_REALM_<realm>_CLIENT_ID and "
+                "POLARIS_REALM_<realm>_CLIENT_SECRET or list realms explicitly."
+            )
+        return realms
+
+
+def _realm_entry(outcome: TaskOutcome[str, ToolExecutionResult]) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {"realm": outcome.item}
+    if outcome.error is not None or outcome.result is None:
+        entry["status"] = "failed"
+        entry["error"] = str(outcome.error)
+        return entry
+    result = outcome.result
+    entry["status"] = "error" if result.is_error else "ok"
+    entry["text"] = result.text
+    if result.metadata is not None:
+        entry["meta"] = result.metadata
+    return entry
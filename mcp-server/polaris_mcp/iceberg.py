@@ -0,0 +1,822 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Helpers that interpret Iceberg table metadata returned by ``loadTable``."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from polaris_mcp.base import JSONDict
+
+# Snapshot summary counters reported for new snapshots in compact diffs.
+SNAPSHOT_SUMMARY_FIELDS = (
+    "added-records",
+    "deleted-records",
+    "added-data-files",
+    "deleted-data-files",
+    "added-delete-files",
+    "total-records",
+    "total-data-files",
+    "total-delete-files",
+    "total-files-size",
+)
+
+
+# Snapshot summary counters extracted into columns for history analytics.
+_HISTORY_COLUMNS = (
+    "added-data-files",
+    "deleted-data-files",
+    "total-data-files",
+    "total-delete-files",
+    "total-files-size",
+    "total-records",
+)
+# Cumulative counters: snapshots that omit them carry the previous value forward.
+_HISTORY_TOTALS = (
+    "total-data-files",
+    "total-delete-files",
+    "total-files-size",
+    "total-records",
+)
+_DAY_MS = 86_400_000
+
+# Primitive type promotions allowed by the Iceberg spec; decimal widening is separate.
+_TYPE_PROMOTIONS = {
+    ("int", "long"),
+    ("float", "double"),
+    ("date", "timestamp"),
+    ("date", "timestamp_ns"),
+}
+_DECIMAL = re.compile(r"decimal\(\s*(\d+)\s*,\s*(\d+)\s*\)")
+_MAX_ID = 2**63 - 1
+
+
+def _as_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+
+def table_metadata(result: Any) -> JSONDict:
+    """Return the ``metadata`` object of a ``LoadTableResult`` (or ``{}``)."""
+
+    if isinstance(result, dict) and isinstance(result.get("metadata"), dict):
+        return result["metadata"]
+    return {}
+
+
+@dataclass
+class TableDigest:
+    """Compact fingerprint of table metadata used to detect and describe changes."""
+
+    metadata_location: Optional[str] = None
+    current_snapshot_id: Optional[int] = None
+    snapshot_ids: Set[int] = field(default_factory=set)
+    current_schema_id: Optional[int] = None
+    default_spec_id: Optional[int] = None
+    default_sort_order_id: Optional[int] = None
+    refs: Dict[str, Optional[int]] = field(default_factory=dict)
+    properties: Dict[str, str] = field(default_factory=dict)
+
+
+def digest_table(result: Any) -> TableDigest:
+    """Build a :class:`TableDigest` from a ``LoadTableResult`` document."""
+
+    metadata = table_metadata(result)
+    location = result.get("metadata-location") if isinstance(result, dict) else None
+    snapshot_ids: Set[int] = set()
+    for entry in metadata.get("snapshots") or []:
+        snapshot_id = (
+            _as_int(entry.get("snapshot-id")) if isinstance(entry, dict) else None
+        )
+        if snapshot_id is not None:
+            snapshot_ids.add(snapshot_id)
+    for entry in metadata.get("snapshot-log") or []:
+        snapshot_id = (
+            _as_int(entry.get("snapshot-id")) if isinstance(entry, dict) else None
+        )
+        if snapshot_id is not None:
+            snapshot_ids.add(snapshot_id)
+    refs: Dict[str, Optional[int]] = {}
+    raw_refs = metadata.get("refs")
+    if isinstance(raw_refs, dict):
+        for name, ref in raw_refs.items():
+            refs[str(name)] = (
+                _as_int(ref.get("snapshot-id")) if isinstance(ref, dict) else None
+            )
+    properties = metadata.get("properties")
+    current_snapshot_id = _as_int(metadata.get("current-snapshot-id"))
+    return TableDigest(
+        metadata_location=location if isinstance(location, str) else None,
+        # Iceberg v1 tables may report -1 when no snapshot exists.
+        current_snapshot_id=(
+            current_snapshot_id
+            if current_snapshot_id is not None and current_snapshot_id >= 0
+            else None
+        ),
+        snapshot_ids=snapshot_ids,
+        current_schema_id=_as_int(metadata.get("current-schema-id")),
+        default_spec_id=_as_int(metadata.get("default-spec-id")),
+        default_sort_order_id=_as_int(metadata.get("default-sort-order-id")),
+        refs=refs,
+        properties=(
+            {str(k): str(v) for k, v in properties.items()}
+            if isinstance(properties, dict)
+            else {}
+        ),
+    )
+
+
+def diff_digests(old: TableDigest, new: TableDigest, result: Any = None) -> JSONDict:
+    """Describe what changed between two digests.
+
+    ``result`` is the ``LoadTableResult`` that produced ``new``; when supplied, new
+    snapshots are annotated with their operation and summary counters. Returns an
+    empty dict when nothing observable changed.
+    """
+
+    diff: JSONDict = {}
+    added_ids = sorted(new.snapshot_ids - old.snapshot_ids)
+    if added_ids:
+        diff["newSnapshots"] = _describe_snapshots(result, added_ids)
+    expired = sorted(old.snapshot_ids - new.snapshot_ids)
+    if expired:
+        diff["expiredSnapshots"] = expired
+    for label, before, after in (
+        ("currentSnapshotId", old.current_snapshot_id, new.current_snapshot_id),
+        ("currentSchemaId", old.current_schema_id, new.current_schema_id),
+        ("defaultSpecId", old.default_spec_id, new.default_spec_id),
+        ("defaultSortOrderId", old.default_sort_order_id, new.default_sort_order_id),
+    ):
+        if before != after:
+            diff[label] = {"from": before, "to": after}
+    refs = _diff_mapping(old.refs, new.refs)
+    if refs:
+        diff["refs"] = refs
+    properties = _diff_mapping(old.properties, new.properties)
+    if properties:
+        diff["properties"] = properties
+    if diff or old.metadata_location != new.metadata_location:
+        diff["metadataLocation"] = {
+            "from": old.metadata_location,
+            "to": new.metadata_location,
+        }
+    return diff
+
+
+def summarize_table(result: Any) -> JSONDict:
+    """Condense a ``LoadTableResult`` to what a reader needs to understand the table.
+
+    Returns the current schema, default partition spec and sort order (with source column
+    names resolved), the current snapshot's operation and totals, the snapshot count and
+    the last-updated time. Snapshots are scanned once; history, metadata logs and the
+    catalog config are dropped.
+    """
+
+    metadata = table_metadata(result)
+    schema = _current_schema(metadata)
+    columns: Dict[int, str] = {}
+    for column in schema.get("fields") or []:
+        if isinstance(column, dict) and _as_int(column.get("id")) is not None:
+            columns[int(column["id"])] = str(column.get("name"))
+
+    current_snapshot_id = _as_int(metadata.get("current-snapshot-id"))
+    current_snapshot: Optional[JSONDict] = None
+    # With snapshots=refs only referenced snapshots are returned, but the snapshot log
+    # still lists the history, so count the union of both.
+    snapshot_ids: Set[int] = set()
+    for entry in metadata.get("snapshots") or []:
+        snapshot_id = (
+            _as_int(entry.get("snapshot-id")) if isinstance(entry, dict) else None
+        )
+        if snapshot_id is None:
+            continue
+        snapshot_ids.add(snapshot_id)
+        if snapshot_id == current_snapshot_id:
+            current_snapshot = entry
+    for entry in metadata.get("snapshot-log") or []:
+        snapshot_id = (
+            _as_int(entry.get("snapshot-id")) if isinstance(entry, dict) else None
+        )
+        if snapshot_id is not None:
+            snapshot_ids.add(snapshot_id)
+
+    summary: JSONDict = {
+        "metadata-location": (
+            result.get("metadata-location") if isinstance(result, dict) else None
+        ),
+        "format-version": metadata.get("format-version"),
+        "table-uuid": metadata.get("table-uuid"),
+        "location": metadata.get("location"),
+        "last-updated-ms": metadata.get("last-updated-ms"),
+        "schema": {
+            "schema-id": schema.get("schema-id"),
+            "fields": [
+                {
+                    "id": column.get("id"),
+                    "name": column.get("name"),
+                    "type": column.get("type"),
+                    "required": column.get("required"),
+                }
+                for column in schema.get("fields") or []
+                if isinstance(column, dict)
+            ],
+        },
+        "partition-spec": _summarize_fields(
+            _find_by_id(
+                metadata.get("partition-specs"),
+                "spec-id",
+                metadata.get("default-spec-id"),
+            )
+            or {"spec-id": 0, "fields": metadata.get("partition-spec") or []},
+            "spec-id",
+            columns,
+        ),
+        "sort-order": _summarize_fields(
+            _find_by_id(
+                metadata.get("sort-orders"),
+                "order-id",
+                metadata.get("default-sort-order-id"),
+            )
+            or {"order-id": 0, "fields": []},
+            "order-id",
+            columns,
+        ),
+        "snapshot-count": len(snapshot_ids),
+        "current-snapshot": None,
+        "properties": metadata.get("properties") or {},
+    }
+    if current_snapshot is not None:
+        snapshot_summary = current_snapshot.get("summary")
+        if not isinstance(snapshot_summary, dict):
+            snapshot_summary = {}
+        described: JSONDict = {
+            "snapshot-id": current_snapshot.get("snapshot-id"),
+            "timestamp-ms": current_snapshot.get("timestamp-ms"),
+            "operation": snapshot_summary.get("operation"),
+        }
+        for name in SNAPSHOT_SUMMARY_FIELDS:
+            if name.startswith("total-") and name in snapshot_summary:
+                described[name] = snapshot_summary[name]
+        summary["current-snapshot"] = described
+    return summary
+
+
+def snapshot_metrics(result: Any) -> JSONDict:
+    """Extract the counters maintenance planning needs from a ``LoadTableResult``.
+
+    Returns the current snapshot's file totals and ``added-files-size``, the snapshot
+    count and the oldest/newest snapshot timestamps (from the snapshot list and log, so
+    ``snapshots=refs`` responses still count the full history), and the table's
+    ``write.target-file-size-bytes`` property when set.
+    """
+
+    metadata = table_metadata(result)
+    current_snapshot_id = _as_int(metadata.get("current-snapshot-id"))
+    current_summary: JSONDict = {}
+    timestamps: Dict[int, Optional[int]] = {}
+    for key in ("snapshots", "snapshot-log"):
+        for entry in metadata.get(key) or []:
+            if not isinstance(entry, dict):
+                continue
+            snapshot_id = _as_int(entry.get("snapshot-id"))
+            if snapshot_id is None:
+                continue
+            timestamp = _as_int(entry.get("timestamp-ms"))
+            if timestamps.get(snapshot_id) is None:
+                timestamps[snapshot_id] = timestamp
+            summary = entry.get("summary")
+            if snapshot_id == current_snapshot_id and isinstance(summary, dict):
+                current_summary = summary
+    known = [ts for ts in timestamps.values() if ts is not None]
+    properties = metadata.get("properties")
+    target_size = (
+        _as_int(properties.get("write.target-file-size-bytes"))
+        if isinstance(properties, dict)
+        else None
+    )
+    metrics: JSONDict = {
+        "snapshot-count": len(timestamps),
+        "oldest-snapshot-ms": min(known) if known else None,
+        "newest-snapshot-ms": max(known) if known else None,
+        "snapshot-timestamps": sorted(known),
+        "target-file-size-bytes": target_size,
+    }
+    for name in (
+        "total-data-files",
+        "total-delete-files",
+        "total-files-size",
+        "added-files-size",
+    ):
+        metrics[name] = _as_int(current_summary.get(name)) or 0
+    return metrics
+
+
+def snapshot_history(result: Any) -> Dict[str, Any]:
+    """Extract the snapshot history of a ``LoadTableResult`` into columnar arrays.
+
+    The snapshot list is scanned once. Returns ``timestamp-ms``, one int64 array per
+    summary counter in ``_HISTORY_COLUMNS`` and an ``operation`` list, all sorted by
+    commit time.
+    """
+
+    rows = []
+    for entry in table_metadata(result).get("snapshots") or []:
+        if not isinstance(entry, dict):
+            continue
+        timestamp = _as_int(entry.get("timestamp-ms"))
+        if timestamp is None:
+            continue
+        summary = entry.get("summary")
+        rows.append((timestamp, summary if isinstance(summary, dict) else {}))
+    rows.sort(key=lambda row: row[0])
+
+    history: Dict[str, Any] = {
+        "timestamp-ms": array("q", (row[0] for row in rows)),
+        "operation": [str(row[1].get("operation") or "unknown") for row in rows],
+    }
+    for name in _HISTORY_COLUMNS:
+        column = array("q", bytes(8 * len(rows)))
+        carried = 0
+        for position, (_, summary) in enumerate(rows):
+            value = _as_int(summary.get(name))
+            if value is None:
+                value = carried if name in _HISTORY_TOTALS else 0
+            column[position] = carried = value
+        history[name] = column
+    return history
+
+
+def snapshot_analytics(
+    result: Any,
+    window_hours: float = 24.0,
+    windows: int = 7,
+    now_ms: Optional[int] = None,
+) -> JSONDict:
+    """Aggregate a table's snapshot history into growth and activity statistics.
+
+    Covers the whole history (commit rate, data file and size growth, the current
+    delete-file ratio and operation mix) and ``windows`` consecutive windows of
+    ``window_hours`` ending at ``now_ms``. Only aggregates are returned.
+    """
+
+    history = snapshot_history(result)
+    timestamps: Sequence[int] = history["timestamp-ms"]
+    count = len(timestamps)
+    payload: JSONDict = {"snapshots": count}
+    if not count:
+        return payload
+    span_days = (timestamps[-1] - timestamps[0]) / _DAY_MS
+    payload.update(
+        {
+            "firstSnapshotMs": timestamps[0],
+            "lastSnapshotMs": timestamps[-1],
+            "commitsPerDay": _rate(count - 1, span_days),
+            "operations": dict(Counter(history["operation"])),
+            "dataFiles": _growth(history["total-data-files"], 0, count, span_days),
+            "sizeBytes": _growth(history["total-files-size"], 0, count, span_days),
+            "records": _growth(history["total-records"], 0, count, span_days),
+            "deleteFileRatio": _delete_ratio(history, count - 1),
+        }
+    )
+
+    width = int(window_hours * 3_600_000)
+    end = now_ms if now_ms is not None else timestamps[-1]
+    summaries = []
+    for index in range(max(windows, 0), 0, -1):
+        window_end = end - (index - 1) * width
+        window_start = window_end - width
+        first = bisect_right(timestamps, window_start)
+        last = bisect_right(timestamps, window_end)
+        # Growth is measured from the last snapshot before the window (0 if none).
+        base = first - 1
+        window: JSONDict = {
+            "startMs": window_start,
+            "endMs": window_end,
+            "commits": last - first,
+            "operations": dict(Counter(history["operation"][first:last])),
+            "addedDataFiles": sum(history["added-data-files"][first:last]),
+            "deletedDataFiles": sum(history["deleted-data-files"][first:last]),
+            "dataFileGrowth": _delta(history["total-data-files"], base, last - 1),
+            "sizeGrowthBytes": _delta(history["total-files-size"], base, last - 1),
+            "deleteFileRatio": (_delete_ratio(history, last - 1) if last > 0 else None),
+        }
+        summaries.append(window)
+    payload["windowHours"] = window_hours
+    payload["windows"] = summaries
+    return payload
+
+
+def _rate(amount: float, days: float) -> Optional[float]:
+    return round(amount / days, 3) if days > 0 else None
+
+
+def _delta(column: Sequence[int], base: int, last: int) -> int:
+    if last < 0 or last <= base:
+        return 0
+    return column[last] - (column[base] if base >= 0 else 0)
+
+
+def _growth(column: Sequence[int], first: int, end: int, days: float) -> JSONDict:
+    growth = column[end - 1] - column[first]
+    return {
+        "first": column[first],
+        "last": column[end - 1],
+        "growth": growth,
+        "perDay": _rate(growth, days),
+    }
+
+
+def _delete_ratio(history: Dict[str, Any], position: int) -> Optional[float]:
+    data = history["total-data-files"][position]
+    deletes = history["total-delete-files"][position]
+    return round(deletes / (data + deletes), 4) if data + deletes else None
+
+
+@dataclass(frozen=True)
+class ParsedMetadata:
+    """Schema, partition-spec, sort-order and snapshot history of one metadata file.
+
+    Schemas are flattened to ``{field-id: {"name", "type", "required"}}`` with dotted
+    paths for nested fields, so evolution diffs never revisit the raw document.
+    """
+
+    metadata_location: Optional[str]
+    current_schema_id: Optional[int]
+    default_spec_id: Optional[int]
+    default_sort_order_id: Optional[int]
+    schemas: Dict[int, Dict[int, JSONDict]]
+    specs: Dict[int, List[JSONDict]]
+    sort_orders: Dict[int, List[JSONDict]]
+    column_names: Dict[int, str]
+    snapshot_schemas: Dict[int, Optional[int]]
+    snapshot_log: List[Tuple[int, int]]
+
+
+def parse_metadata(result: Any) -> ParsedMetadata:
+    """Index a ``LoadTableResult`` for :func:`diff_schemas` and friends."""
+
+    metadata = table_metadata(result)
+    schemas: Dict[int, Dict[int, JSONDict]] = {}
+    raw_schemas = list(metadata.get("schemas") or [])
+    if not raw_schemas and isinstance(metadata.get("schema"), dict):
+        # Format v1 metadata may only carry the single ``schema`` field.
+        raw_schemas = [{"schema-id": 0, **metadata["schema"]}]
+    for schema in raw_schemas:
+        schema_id = (
+            _as_int(schema.get("schema-id")) if isinstance(schema, dict) else None
+        )
+        if schema_id is not None:
+            schemas[schema_id] = flatten_schema(schema)
+    current_schema_id = _as_int(metadata.get("current-schema-id"))
+    if current_schema_id is None and len(schemas) == 1:
+        current_schema_id = next(iter(schemas))
+
+    column_names: Dict[int, str] = {}
+    # Name columns after their latest appearance, preferring the current schema.
+    for schema_id in sorted(schemas, key=lambda sid: (sid == current_schema_id, sid)):
+        for field_id, column in schemas[schema_id].items():
+            column_names[field_id] = column["name"]
+
+    specs: Dict[int, List[JSONDict]] = {}
+    for spec in metadata.get("partition-specs") or []:
+        spec_id = _as_int(spec.get("spec-id")) if isinstance(spec, dict) else None
+        if spec_id is not None:
+            specs[spec_id] = [
+                f for f in spec.get("fields") or [] if isinstance(f, dict)
+            ]
+    if not specs and isinstance(metadata.get("partition-spec"), list):
+        specs[0] = [f for f in metadata["partition-spec"] if isinstance(f, dict)]
+    sort_orders: Dict[int, List[JSONDict]] = {}
+    for order in metadata.get("sort-orders") or []:
+        order_id = _as_int(order.get("order-id")) if isinstance(order, dict) else None
+        if order_id is not None:
+            sort_orders[order_id] = [
+                f for f in order.get("fields") or [] if isinstance(f, dict)
+            ]
+
+    snapshot_schemas: Dict[int, Optional[int]] = {}
+    for entry in metadata.get("snapshots") or []:
+        snapshot_id = (
+            _as_int(entry.get("snapshot-id")) if isinstance(entry, dict) else None
+        )
+        if snapshot_id is not None:
+            snapshot_schemas[snapshot_id] = _as_int(entry.get("schema-id"))
+    snapshot_log: List[Tuple[int, int]] = []
+    for entry in metadata.get("snapshot-log") or []:
+        if not isinstance(entry, dict):
+            continue
+        timestamp = _as_int(entry.get("timestamp-ms"))
+        snapshot_id = _as_int(entry.get("snapshot-id"))
+        if timestamp is not None and snapshot_id is not None:
+            snapshot_log.append((timestamp, snapshot_id))
+    snapshot_log.sort()
+
+    location = result.get("metadata-location") if isinstance(result, dict) else None
+    return ParsedMetadata(
+        metadata_location=location if isinstance(location, str) else None,
+        current_schema_id=current_schema_id,
+        default_spec_id=_as_int(metadata.get("default-spec-id")),
+        default_sort_order_id=_as_int(metadata.get("default-sort-order-id")),
+        schemas=schemas,
+        specs=specs,
+        sort_orders=sort_orders,
+        column_names=column_names,
+        snapshot_schemas=snapshot_schemas,
+        snapshot_log=snapshot_log,
+    )
+
+
+def flatten_schema(schema: JSONDict) -> Dict[int, JSONDict]:
+    """Map every field id of ``schema`` (nested ones included) to its path and type."""
+
+    fields: Dict[int, JSONDict] = {}
+
+    def record(field_id: Any, name: str, field_type: Any, required: Any) -> None:
+        parsed_id = _as_int(field_id)
+        if parsed_id is not None:
+            fields[parsed_id] = {
+                "name": name,
+                "type": field_type.get("type")
+                if isinstance(field_type, dict)
+                else str(field_type),
+                "required": bool(required),
+            }
+        visit(field_type, f"{name}.")
+
+    def visit(node: Any, prefix: str) -> None:
+        if not isinstance(node, dict):
+            return
+        kind = node.get("type")
+        if kind == "struct":
+            for column in node.get("fields") or []:
+                if isinstance(column, dict):
+                    record(
+                        column.get("id"),
+                        f"{prefix}{column.get('name')}",
+                        column.get("type"),
+                        column.get("required"),
+                    )
+        elif kind == "list":
+            record(
+                node.get("element-id"),
+                f"{prefix}element",
+                node.get("element"),
+                node.get("element-required"),
+            )
+        elif kind == "map":
+            record(node.get("key-id"), f"{prefix}key", node.get("key"), True)
+            record(
+                node.get("value-id"),
+                f"{prefix}value",
+                node.get("value"),
+                node.get("value-required"),
+            )
+
+    visit({"type": "struct", "fields": schema.get("fields") or []}, "")
+    return fields
+
+
+def resolve_schema_id(parsed: ParsedMetadata, version: Optional[JSONDict]) -> int:
+    """Return the schema id selected by ``schemaId``, ``snapshotId`` or ``timestampMs``.
+
+    A timestamp selects the snapshot that was current at that time (from the snapshot
+    log). Without a selector the current schema is returned.
+    """
+
+    version = version or {}
+    if version.get("schemaId") is not None:
+        schema_id = _as_int(version["schemaId"])
+        if schema_id is None or schema_id not in parsed.schemas:
+            raise ValueError(f"Unknown schema id: {version['schemaId']}")
+        return schema_id
+    snapshot_id: Optional[int] = None
+    if version.get("snapshotId") is not None:
+        snapshot_id = _as_int(version["snapshotId"])
+        if snapshot_id is None or snapshot_id not in parsed.snapshot_schemas:
+            raise ValueError(f"Unknown snapshot id: {version['snapshotId']}")
+    elif version.get("timestampMs") is not None:
+        timestamp = _as_int(version["timestampMs"])
+        if timestamp is None:
+            raise ValueError("timestampMs must be an integer.")
+        position = bisect_right(parsed.snapshot_log, (timestamp, _MAX_ID))
+        if position == 0:
+            raise ValueError(f"No snapshot was current at {timestamp}.")
+        snapshot_id = parsed.snapshot_log[position - 1][1]
+    if snapshot_id is not None:
+        schema_id = parsed.snapshot_schemas.get(snapshot_id)
+        if schema_id is None:
+            raise ValueError(f"Snapshot {snapshot_id} does not record its schema id.")
+        return schema_id
+    if parsed.current_schema_id is None:
+        raise ValueError("The table metadata has no current schema.")
+    return parsed.current_schema_id
+
+
+def diff_schemas(old: Dict[int, JSONDict], new: Dict[int, JSONDict]) -> JSONDict:
+    """Describe added, dropped, renamed, promoted and nullability-changed fields.
+
+    Fields are matched by id, so a rename is a field whose own name changed (renaming a
+    struct does not report its children). Returns an empty dict for identical schemas.
+    """
+
+    diff: JSONDict = {}
+    added = [{"id": fid, **new[fid]} for fid in sorted(new.keys() - old.keys())]
+    dropped = [{"id": fid, **old[fid]} for fid in sorted(old.keys() - new.keys())]
+    renamed: List[JSONDict] = []
+    promoted: List[JSONDict] = []
+    retyped: List[JSONDict] = []
+    nullability: List[JSONDict] = []
+    for field_id in sorted(old.keys() & new.keys()):
+        before, after = old[field_id], new[field_id]
+        if before["name"].rsplit(".", 1)[-1] != after["name"].rsplit(".", 1)[-1]:
+            renamed.append(
+                {"id": field_id, "from": before["name"], "to": after["name"]}
+            )
+        if before["type"] != after["type"]:
+            change = {
+                "id": field_id,
+                "name": after["name"],
+                "from": before["type"],
+                "to": after["type"],
+            }
+            if _is_promotion(before["type"], after["type"]):
+                promoted.append(change)
+            else:
+                retyped.append(change)
+        if before["required"] != after["required"]:
+            nullability.append(
+                {"id": field_id, "name": after["name"], "required": after["required"]}
+            )
+    for key, entries in (
+        ("added", added),
+        ("dropped", dropped),
+        ("renamed", renamed),
+        ("promoted", promoted),
+        ("typeChanged", retyped),
+        ("requiredChanged", nullability),
+    ):
+        if entries:
+            diff[key] = entries
+    return diff
+
+
+def diff_partition_specs(
+    old: List[JSONDict], new: List[JSONDict], columns: Dict[int, str]
+) -> JSONDict:
+    """Describe partition fields added, removed or renamed between two specs."""
+
+    def key(entry: JSONDict) -> Any:
+        field_id = _as_int(entry.get("field-id"))
+        # Format v1 specs may omit partition field ids.
+        return field_id if field_id is not None else entry.get("name")
+
+    before = {key(entry): _describe_sort_or_spec(entry, columns) for entry in old}
+    after = {key(entry): _describe_sort_or_spec(entry, columns) for entry in new}
+    diff: JSONDict = {}
+    added = [after[k] for k in after if k not in before]
+    removed = [before[k] for k in before if k not in after]
+    renamed = [
+        {"from": before[k]["name"], "to": after[k]["name"]}
+        for k in after
+        if k in before and before[k]["name"] != after[k]["name"]
+    ]
+    for name, entries in (("added", added), ("removed", removed), ("renamed", renamed)):
+        if entries:
+            diff[name] = entries
+    return diff
+
+
+def diff_sort_orders(
+    old: List[JSONDict], new: List[JSONDict], columns: Dict[int, str]
+) -> JSONDict:
+    """Return both field lists when the (ordered) sort orders differ, else ``{}``."""
+
+    before = [_describe_sort_or_spec(entry, columns) for entry in old]
+    after = [_describe_sort_or_spec(entry, columns) for entry in new]
+    return {} if before == after else {"fields": {"from": before, "to": after}}
+
+
+def _describe_sort_or_spec(entry: JSONDict, columns: Dict[int, str]) -> JSONDict:
+    source_id = _as_int(entry.get("source-id"))
+    described: JSONDict = {
+        "source": columns.get(source_id, source_id) if source_id is not None else None,
+        "transform": entry.get("transform"),
+    }
+    if "name" in entry:
+        described = {"name": entry.get("name"), **described}
+    for name in ("direction", "null-order"):
+        if name in entry:
+            described[name] = entry[name]
+    return described
+
+
+def _is_promotion(before: str, after: str) -> bool:
+    if (before, after) in _TYPE_PROMOTIONS:
+        return True
+    old_decimal = _DECIMAL.fullmatch(before)
+    new_decimal = _DECIMAL.fullmatch(after)
+    return bool(
+        old_decimal
+        and new_decimal
+        and old_decimal.group(2) == new_decimal.group(2)
+        and int(new_decimal.group(1)) > int(old_decimal.group(1))
+    )
+
+
+def _current_schema(metadata: JSONDict) -> JSONDict:
+    schema = _find_by_id(
+        metadata.get("schemas"), "schema-id", metadata.get("current-schema-id")
+    )
+    if schema is None and isinstance(metadata.get("schema"), dict):
+        # Format v1 metadata may only carry the single ``schema`` field.
+        schema = metadata["schema"]
+    return schema or {}
+
+
+def _find_by_id(entries: Any, id_field: str, wanted: Any) -> Optional[JSONDict]:
+    wanted_id = _as_int(wanted)
+    for entry in entries or []:
+        if isinstance(entry, dict) and _as_int(entry.get(id_field)) == wanted_id:
+            return entry
+    return None
+
+
+def _summarize_fields(
+    entry: JSONDict, id_field: str, columns: Dict[int, str]
+) -> JSONDict:
+    fields = []
+    for item in entry.get("fields") or []:
+        if not isinstance(item, dict):
+            continue
+        described = dict(item)
+        source_id = _as_int(item.get("source-id"))
+        if source_id is not None and source_id in columns:
+            described["source"] = columns[source_id]
+        fields.append(described)
+    return {id_field: entry.get(id_field), "fields": fields}
+
+
+def _describe_snapshots(result: Any, snapshot_ids: List[int]) -> List[JSONDict]:
+    wanted = set(snapshot_ids)
+    described: Dict[int, JSONDict] = {}
+    for entry in table_metadata(result).get("snapshots") or []:
+        if not isinstance(entry, dict):
+            continue
+        snapshot_id = _as_int(entry.get("snapshot-id"))
+        if snapshot_id not in wanted or snapshot_id is None:
+            continue
+        summary = entry.get("summary")
+        if not isinstance(summary, dict):
+            summary = {}
+        info: JSONDict = {
+            "snapshot-id": snapshot_id,
+            "timestamp-ms": entry.get("timestamp-ms"),
+            "operation": summary.get("operation"),
+        }
+        for name in SNAPSHOT_SUMMARY_FIELDS:
+            if name in summary:
+                info[name] = summary[name]
+        described[snapshot_id] = info
+    return [described.get(sid, {"snapshot-id": sid}) for sid in snapshot_ids]
+
+
+def _diff_mapping(old: Dict[str, Any], new: Dict[str, Any]) -> JSONDict:
+    diff: JSONDict = {}
+    updated = {k: v for k, v in new.items() if k not in old or old[k] != v}
+    removed = sorted(k for k in old if k not in new)
+    if updated:
+        diff["set"] = updated
+    if removed:
+        diff["removed"] = removed
+    return diff
@@ -0,0 +1,760 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Persistent catalog/namespace/table inventory for the Polaris MCP server."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import urllib3
+
+from polaris_mcp.base import JSONDict, NAMESPACE_PATH_DELIMITER
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.listing import (
+    Namespace,
+    list_catalogs,
+    list_tables,
+    load_table,
+    walk_namespaces,
+)
+from polaris_mcp.rest import PolarisRestTool
+from polaris_mcp.routing import RealmRouter
+
+logger = logging.getLogger(__name__)
+
+TableKey = Tuple[str, Namespace, str]
+
+SYNC_MODES = ("structure", "incremental", "full")
+
+# Change feed entries kept per base URL and realm; older entries are pruned on write.
+DEFAULT_MAX_CHANGES = 10000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        base_url TEXT NOT NULL,
+        realm TEXT NOT NULL,
+        refreshed_at REAL NOT NULL,
+        PRIMARY KEY (base_url, realm)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS catalogs (
+        base_url TEXT NOT NULL,
+        realm TEXT NOT NULL,
+        catalog TEXT NOT NULL,
+        PRIMARY KEY (base_url, realm, catalog)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS namespaces (
+        base_url TEXT NOT NULL,
+        realm TEXT NOT NULL,
+        catalog TEXT NOT NULL,
+        namespace TEXT NOT NULL,
+        PRIMARY KEY (base_url, realm, catalog, namespace)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS tables (
+        base_url TEXT NOT NULL,
+        realm TEXT NOT NULL,
+        catalog TEXT NOT NULL,
+        namespace TEXT NOT NULL,
+        name TEXT NOT NULL,
+        PRIMARY KEY (base_url, realm, catalog, namespace, name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        base_url TEXT NOT NULL,
+        realm TEXT NOT NULL,
+        recorded_at REAL NOT NULL,
+        change TEXT NOT NULL,
+        catalog TEXT NOT NULL,
+        namespace TEXT NOT NULL,
+        name TEXT NOT NULL,
+        metadata_location TEXT,
+        previous_metadata_location TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS changes_by_realm ON changes (base_url, realm, seq)",
+)
+
+# Columns added after the initial schema; applied to existing inventory files on open.
+_TABLE_COLUMNS = (("metadata_location", "TEXT"), ("etag", "TEXT"))
+
+
+def _encode_namespace(namespace: Namespace) -> str:
+    return NAMESPACE_PATH_DELIMITER.join(namespace)
+
+
+def _decode_namespace(value: str) -> Namespace:
+    return tuple(value.split(NAMESPACE_PATH_DELIMITER))
+
+
+@dataclass(frozen=True)
+class TableState:
+    """Last observed ``metadata-location`` and ETag of a table."""
+
+    metadata_location: Optional[str] = None
+    etag: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TableChange:
+    """Entry of the inventory change feed."""
+
+    change: str
+    catalog: str
+    namespace: Namespace
+    name: str
+    metadata_location: Optional[str] = None
+    previous_metadata_location: Optional[str] = None
+    recorded_at: float = 0.0
+    seq: int = 0
+
+    def to_json(self) -> JSONDict:
+        return {
+            "seq": self.seq,
+            "change": self.change,
+            "catalog": self.catalog,
+            "namespace": list(self.namespace),
+            "name": self.name,
+            "metadataLocation": self.metadata_location,
+            "previousMetadataLocation": self.previous_metadata_location,
+            "recordedAt": self.recorded_at,
+        }
+
+
+@dataclass
+class InventorySnapshot:
+    """Structural view of one realm: catalogs, their namespaces and tables."""
+
+    realm: str
+    refreshed_at: float
+    catalogs: List[str] = field(default_factory=list)
+    namespaces: Dict[str, List[Namespace]] = field(default_factory=dict)
+    tables: Dict[Tuple[str, Namespace], List[str]] = field(default_factory=dict)
+    table_states: Dict[TableKey, TableState] = field(default_factory=dict)
+
+    def table_count(self) -> int:
+        return sum(len(names) for names in self.tables.values())
+
+    def table_keys(self) -> List[TableKey]:
+        return [
+            (catalog, namespace, name)
+            for (catalog, namespace), names in self.tables.items()
+            for name in names
+        ]
+
+
+@dataclass
+class SyncResult:
+    """Outcome of :meth:`PolarisInventory.sync`."""
+
+    snapshot: InventorySnapshot
+    mode: str
+    baseline: bool
+    changes: List[TableChange] = field(default_factory=list)
+    loaded: int = 0
+    not_modified: int = 0
+    baselined: int = 0
+    failures: List[JSONDict] = field(default_factory=list)
+
+
+class InventoryStore:
+    """SQLite file holding inventory snapshots keyed by base URL and realm.
+
+    The change feed keeps the newest ``max_changes`` entries per realm and, when
+    ``max_change_age_seconds`` is positive, drops entries older than that.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_changes: int = DEFAULT_MAX_CHANGES,
+        max_change_age_seconds: float = 0.0,
+    ) -> None:
+        self._path = path
+        self._max_changes = max(max_changes, 1)
+        self._max_change_age_seconds = max(max_change_age_seconds, 0.0)
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            existing = {
+                row[1] for row in connection.execute("PRAGMA table_info(tables)")
+            }
+            for column, column_type in _TABLE_COLUMNS:
+                if column not in existing:
+                    connection.execute(
+                        f"ALTER TABLE tables ADD COLUMN {column} {column_type}"
+                    )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load_all(self, base_url: str) -> List[InventorySnapshot]:
+        """Return every snapshot persisted for ``base_url``."""
+
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT realm, refreshed_at FROM snapshots WHERE base_url = ?",
+                (base_url,),
+            ).fetchall()
+            return [
+                self._load(connection, base_url, realm, refreshed_at)
+                for realm, refreshed_at in rows
+            ]
+
+    def save(self, base_url: str, snapshot: InventorySnapshot) -> None:
+        """Replace the persisted snapshot for ``(base_url, snapshot.realm)``."""
+
+        key = (base_url, snapshot.realm)
+        with self._lock, self._connect() as connection:
+            for table in ("snapshots", "catalogs", "namespaces", "tables"):
+                connection.execute(
+                    f"DELETE FROM {table} WHERE base_url = ? AND realm = ?", key
+                )
+            connection.execute(
+                "INSERT INTO snapshots (base_url, realm, refreshed_at) VALUES (?, ?, ?)",
+                (*key, snapshot.refreshed_at),
+            )
+            connection.executemany(
+                "INSERT INTO catalogs (base_url, realm, catalog) VALUES (?, ?, ?)",
+                [(*key, catalog) for catalog in snapshot.catalogs],
+            )
+            connection.executemany(
+                "INSERT INTO namespaces (base_url, realm, catalog, namespace) VALUES (?, ?, ?, ?)",
+                [
+                    (*key, catalog, _encode_namespace(namespace))
+                    for catalog, namespaces in snapshot.namespaces.items()
+                    for namespace in namespaces
+                ],
+            )
+            rows = []
+            for catalog, namespace, name in snapshot.table_keys():
+                state = snapshot.table_states.get((catalog, namespace, name))
+                rows.append(
+                    (
+                        *key,
+                        catalog,
+                        _encode_namespace(namespace),
+                        name,
+                        state.metadata_location if state else None,
+                        state.etag if state else None,
+                    )
+                )
+            connection.executemany(
+                "INSERT INTO tables (base_url, realm, catalog, namespace, name, metadata_location, etag) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def record_changes(
+        self, base_url: str, realm: str, changes: List[TableChange]
+    ) -> List[TableChange]:
+        """Append ``changes`` to the feed and return them with sequence numbers assigned."""
+
+        recorded: List[TableChange] = []
+        with self._lock, self._connect() as connection:
+            for change in changes:
+                cursor = connection.execute(
+                    "INSERT INTO changes (base_url, realm, recorded_at, change, catalog, namespace, name, "
+                    "metadata_location, previous_metadata_location) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        base_url,
+                        realm,
+                        change.recorded_at,
+                        change.change,
+                        change.catalog,
+                        _encode_namespace(change.namespace),
+                        change.name,
+                        change.metadata_location,
+                        change.previous_metadata_location,
+                    ),
+                )
+                recorded.append(_with_seq(change, int(cursor.lastrowid or 0)))
+            self._prune_changes(connection, base_url, realm)
+        return recorded
+
+    def changes_since(
+        self, base_url: str, realm: str, since: int, limit: int
+    ) -> List[TableChange]:
+        """Return up to ``limit`` changes with a sequence number greater than ``since``."""
+
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(
+                "SELECT seq, recorded_at, change, catalog, namespace, name, metadata_location, "
+                "previous_metadata_location FROM changes WHERE base_url = ? AND realm = ? AND seq > ? "
+                "ORDER BY seq LIMIT ?",
+                (base_url, realm, since, limit),
+            ).fetchall()
+        return [
+            TableChange(
+                seq=seq,
+                recorded_at=recorded_at,
+                change=change,
+                catalog=catalog,
+                namespace=_decode_namespace(namespace),
+                name=name,
+                metadata_location=location,
+                previous_metadata_location=previous,
+            )
+            for seq, recorded_at, change, catalog, namespace, name, location, previous in rows
+        ]
+
+    def _prune_changes(
+        self, connection: sqlite3.Connection, base_url: str, realm: str
+    ) -> None:
+        if self._max_change_age_seconds:
+            connection.execute(
+                "DELETE FROM changes WHERE base_url = ? AND realm = ? AND recorded_at < ?",
+                (base_url, realm, time.time() - self._max_change_age_seconds),
+            )
+        # Delete everything at or below the newest entry beyond the retained window.
+        connection.execute(
+            "DELETE FROM changes WHERE base_url = ? AND realm = ? AND seq <= ("
+            "SELECT seq FROM changes WHERE base_url = ? AND realm = ? "
+            "ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+            (base_url, realm, base_url, realm, self._max_changes),
+        )
+
+    def _load(
+        self,
+        connection: sqlite3.Connection,
+        base_url: str,
+        realm: str,
+        refreshed_at: float,
+    ) -> InventorySnapshot:
+        key = (base_url, realm)
+        snapshot = InventorySnapshot(realm=realm, refreshed_at=refreshed_at)
+        for (catalog,) in connection.execute(
+            "SELECT catalog FROM catalogs WHERE base_url = ? AND realm = ? ORDER BY catalog",
+            key,
+        ):
+            snapshot.catalogs.append(catalog)
+            snapshot.namespaces[catalog] = []
+        for catalog, namespace in connection.execute(
+            "SELECT catalog, namespace FROM namespaces WHERE base_url = ? AND realm = ? "
+            "ORDER BY catalog, namespace",
+            key,
+        ):
+            snapshot.namespaces.setdefault(catalog, []).append(
+                _decode_namespace(namespace)
+            )
+        for catalog, namespace, name, location, etag in connection.execute(
+            "SELECT catalog, namespace, name, metadata_location, etag FROM tables "
+            "WHERE base_url = ? AND realm = ? ORDER BY catalog, namespace, name",
+            key,
+        ):
+            decoded = _decode_namespace(namespace)
+            snapshot.tables.setdefault((catalog, decoded), []).append(name)
+            if location or etag:
+                snapshot.table_states[(catalog, decoded, name)] = TableState(
+                    metadata_location=location, etag=etag
+                )
+        return snapshot
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # The connection's own context manager only commits or rolls back.
+        with contextlib.closing(sqlite3.connect(self._path)) as connection:
+            with connection:
+                yield connection
+
+
+def _with_seq(change: TableChange, seq: int) -> TableChange:
+    return TableChange(
+        seq=seq,
+        recorded_at=change.recorded_at,
+        change=change.change,
+        catalog=change.catalog,
+        namespace=change.namespace,
+        name=change.name,
+        metadata_location=change.metadata_location,
+        previous_metadata_location=change.previous_metadata_location,
+    )
+
+
+class PolarisInventory:
+    """Serve structural catalog queries from a snapshot that is revalidated in the background.
+
+    Persisted snapshots and change feeds are keyed by the base URL that serves each
+    realm, so realms routed to different deployments never overwrite each other.
+    """
+
+    MAX_IN_MEMORY_CHANGES = DEFAULT_MAX_CHANGES
+
+    def __init__(
+        self,
+        catalog_rest: PolarisRestTool,
+        management_rest: PolarisRestTool,
+        base_url: str,
+        store: Optional[InventoryStore] = None,
+        revalidate_after_seconds: float = 300.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        router: Optional[RealmRouter] = None,
+    ) -> None:
+        self._catalog_rest = catalog_rest
+        self._management_rest = management_rest
+        self._base_url = base_url
+        self._router = router
+        self._store = store
+        self._revalidate_after_seconds = max(revalidate_after_seconds, 0.0)
+        self._max_concurrency = max(max_concurrency, 1)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._snapshots: Dict[str, InventorySnapshot] = {}
+        self._refreshing: Set[str] = set()
+        self._changes: Dict[str, List[TableChange]] = {}
+        self._next_seq = 1
+
+    @property
+    def store(self) -> Optional[InventoryStore]:
+        return self._store
+
+    def start(self) -> None:
+        """Load persisted snapshots and revalidate each of them in the background."""
+
+        if self._store is None:
+            return
+        base_urls = [self._base_url]
+        if self._router is not None:
+            base_urls.extend(backend.base_url for backend in self._router.backends())
+        for base_url in dict.fromkeys(base_urls):
+            for snapshot in self._store.load_all(base_url):
+                # Skip snapshots left behind by a realm that has since been re-routed.
+                if self._store_key(snapshot.realm) == base_url:
+                    self._snapshots[snapshot.realm] = snapshot
+        logger.info(
+            "Loaded inventory snapshots",
+            extra={"path": self._store.path, "realms": sorted(self._snapshots)},
+        )
+        for realm in list(self._snapshots):
+            self._revalidate_in_background(realm)
+
+    def snapshot(self, realm: Optional[str] = None) -> InventorySnapshot:
+        """Return the current snapshot, crawling synchronously only when none exists yet."""
+
+        key = realm or ""
+        with self._lock:
+            current = self._snapshots.get(key)
+        if current is None:
+            return self.refresh(realm)
+        if time.time() - current.refreshed_at > self._revalidate_after_seconds:
+            self._revalidate_in_background(key)
+        return current
+
+    def refresh(self, realm: Optional[str] = None) -> InventorySnapshot:
+        """Re-list catalogs, namespaces and tables, then persist the snapshot."""
+
+        return self.sync(realm, "structure").snapshot
+
+    def sync(
+        self, realm: Optional[str] = None, mode: str = "incremental"
+    ) -> SyncResult:
+        """Re-list the catalog tree and reconcile table metadata pointers.
+
+        ``structure`` only re-lists entities. ``incremental`` additionally loads new tables
+        and revalidates known ones with conditional requests, so only tables whose ETag or
+        ``metadata-location`` changed are transferred. ``full`` reloads every table.
+        Added, removed and updated tables are appended to the change feed; the very first
+        sync of a realm establishes the baseline and records no changes, as does the first
+        load of a table whose pointer a structure-only sync never recorded.
+        """
+
+        if mode not in SYNC_MODES:
+            raise ValueError(
+                f"Unsupported sync mode: {mode}. Expected one of {', '.join(SYNC_MODES)}."
+            )
+        key = realm or ""
+        with self._sync_lock:
+            with self._lock:
+                previous = self._snapshots.get(key)
+            failures: List[JSONDict] = []
+            snapshot = self._crawl(key, previous, failures)
+            result = SyncResult(
+                snapshot=snapshot,
+                mode=mode,
+                baseline=previous is None,
+                failures=failures,
+            )
+            self._reconcile(result, previous)
+            if result.baseline:
+                result.changes = []
+            elif result.changes:
+                result.changes = self._record_changes(key, result.changes)
+            with self._lock:
+                self._snapshots[key] = snapshot
+            if self._store is not None:
+                self._store.save(self._store_key(key), snapshot)
+        return result
+
+    def changes_since(
+        self, realm: Optional[str] = None, since: int = 0, limit: int = 1000
+    ) -> List[TableChange]:
+        """Return change feed entries recorded after sequence number ``since``."""
+
+        key = realm or ""
+        if self._store is not None:
+            return self._store.changes_since(self._store_key(key), key, since, limit)
+        with self._lock:
+            return [c for c in self._changes.get(key, []) if c.seq > since][:limit]
+
+    def is_refreshing(self, realm: Optional[str] = None) -> bool:
+        with self._lock:
+            return (realm or "") in self._refreshing
+
+    def _store_key(self, realm: str) -> str:
+        if self._router is None:
+            return self._base_url
+        return self._router.backend(realm or None).base_url
+
+    def _revalidate_in_background(self, realm: str) -> None:
+        with self._lock:
+            if realm in self._refreshing:
+                return
+            self._refreshing.add(realm)
+
+        def run() -> None:
+            try:
+                self.refresh(realm)
+            except Exception:  # pragma: no cover - background failures are logged only
+                logger.exception(
+                    "Inventory revalidation failed", extra={"realm": realm}
+                )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(realm)
+
+        threading.Thread(
+            target=run, name=f"polaris-inventory-{realm or 'default'}", daemon=True
+        ).start()
+
+    def _reconcile(
+        self, result: SyncResult, previous: Optional[InventorySnapshot]
+    ) -> None:
+        snapshot = result.snapshot
+        now = snapshot.refreshed_at
+        previous_states = previous.table_states if previous else {}
+        previous_keys = set(previous.table_keys()) if previous else set()
+        current_keys = snapshot.table_keys()
+
+        for key in previous_keys.difference(current_keys):
+            state = previous_states.get(key)
+            result.changes.append(
+                self._change(
+                    "removed",
+                    key,
+                    now,
+                    previous=state.metadata_location if state else None,
+                )
+            )
+        for key in current_keys:
+            if key in previous_states:
+                snapshot.table_states[key] = previous_states[key]
+
+        if result.mode == "structure":
+            for key in current_keys:
+                if key not in previous_keys:
+                    result.changes.append(self._change("added", key, now))
+            return
+
+        conditional = result.mode == "incremental"
+
+        def revalidate(key: TableKey) -> Optional[TableState]:
+            known = snapshot.table_states.get(key)
+            etag = known.etag if conditional and known else None
+            catalog, namespace, name = key
+            response = load_table(
+                self._catalog_rest,
+                catalog,
+                namespace,
+                name,
+                realm=snapshot.realm or None,
+                etag=etag,
+                query={"snapshots": "refs"},
+            )
+            if response.status == 304:
+                return None
+            if response.status == 404:
+                raise LookupError("Table disappeared during sync")
+            if not response.ok:
+                raise RuntimeError(f"loadTable returned {response.status}")
+            body = response.body if isinstance(response.body, dict) else {}
+            location = body.get("metadata-location")
+            return TableState(
+                metadata_location=location if isinstance(location, str) else None,
+                etag=response.header("ETag"),
+            )
+
+        for outcome in run_concurrently(
+            revalidate, current_keys, self._max_concurrency
+        ):
+            key = outcome.item
+            known = snapshot.table_states.get(key)
+            if outcome.error is not None:
+                result.failures.append(
+                    {
+                        "catalog": key[0],
+                        "namespace": list(key[1]),
+                        "name": key[2],
+                        "error": str(outcome.error),
+                    }
+                )
+                # The listing already proves the table is new; the next sync only
+                # baselines its pointer, so the event must not wait for a load.
+                if key not in previous_keys:
+                    result.changes.append(self._change("added", key, now))
+                continue
+            if outcome.result is None:
+                result.not_modified += 1
+                continue
+            result.loaded += 1
+            state = outcome.result
+            snapshot.table_states[key] = state
+            if key not in previous_keys:
+                result.changes.append(
+                    self._change("added", key, now, location=state.metadata_location)
+                )
+            elif known is None or known.metadata_location is None:
+                # First pointer seen for a table listed by a structure-only sync.
+                result.baselined += 1
+            elif known.metadata_location != state.metadata_location:
+                result.changes.append(
+                    self._change(
+                        "updated",
+                        key,
+                        now,
+                        location=state.metadata_location,
+                        previous=known.metadata_location,
+                    )
+                )
+
+    @staticmethod
+    def _change(
+        change: str,
+        key: TableKey,
+        recorded_at: float,
+        location: Optional[str] = None,
+        previous: Optional[str] = None,
+    ) -> TableChange:
+        catalog, namespace, name = key
+        return TableChange(
+            change=change,
+            catalog=catalog,
+            namespace=namespace,
+            name=name,
+            metadata_location=location,
+            previous_metadata_location=previous,
+            recorded_at=recorded_at,
+        )
+
+    def _record_changes(
+        self, realm: str, changes: List[TableChange]
+    ) -> List[TableChange]:
+        if self._store is not None:
+            return self._store.record_changes(self._store_key(realm), realm, changes)
+        with self._lock:
+            recorded = []
+            for change in changes:
+                recorded.append(_with_seq(change, self._next_seq))
+                self._next_seq += 1
+            feed = self._changes.setdefault(realm, [])
+            feed.extend(recorded)
+            del feed[: max(0, len(feed) - self.MAX_IN_MEMORY_CHANGES)]
+            return recorded
+
+    def _crawl(
+        self,
+        realm: str,
+        previous: Optional[InventorySnapshot],
+        failures: List[JSONDict],
+    ) -> InventorySnapshot:
+        realm_arg = realm or None
+        snapshot = InventorySnapshot(realm=realm, refreshed_at=time.time())
+        snapshot.catalogs = list_catalogs(self._management_rest, realm_arg)
+        for catalog in snapshot.catalogs:
+            try:
+                namespaces = walk_namespaces(
+                    self._catalog_rest,
+                    catalog,
+                    realm=realm_arg,
+                    max_workers=self._max_concurrency,
+                )
+                tables: Dict[Tuple[str, Namespace], List[str]] = {}
+                for outcome in run_concurrently(
+                    lambda ns: list_tables(self._catalog_rest, catalog, ns, realm_arg),
+                    namespaces,
+                    self._max_concurrency,
+                ):
+                    if outcome.error is not None:
+                        raise outcome.error
+                    tables[(catalog, outcome.item)] = outcome.result or []
+            except (RuntimeError, OSError, urllib3.exceptions.HTTPError) as error:
+                # Transport errors count like HTTP errors: one unreachable catalog must
+                # not discard the catalogs that were already crawled.
+                failures.append({"catalog": catalog, "error": str(error)})
+                logger.warning(
+                    "Keeping previous inventory for catalog after crawl failure",
+                    extra={"catalog": catalog, "realm": realm, "error": str(error)},
+                )
+                namespaces, tables = self._previous_entries(previous, catalog)
+            snapshot.namespaces[catalog] = namespaces
+            snapshot.tables.update(tables)
+        return snapshot
+
+    @staticmethod
+    def _previous_entries(
+        previous: Optional[InventorySnapshot], catalog: str
+    ) -> Tuple[List[Namespace], Dict[Tuple[str, Namespace], List[str]]]:
+        if previous is None:
+            return [], {}
+        tables = {
+            key: list(names)
+            for key, names in previous.tables.items()
+            if key[0] == catalog
+        }
+        return list(previous.namespaces.get(catalog, [])), tables
+
+
+def namespaces_under(
+    namespaces: Iterable[Namespace], parent: Optional[Namespace]
+) -> List[Namespace]:
+    """Filter ``namespaces`` to ``parent`` and its descendants."""
+
+    if not parent:
+        return list(namespaces)
+    depth = len(parent)
+    return [ns for ns in namespaces if ns[:depth] == parent]
@@ -0,0 +1,409 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Helpers that enumerate and load catalog entities through the Polaris REST API."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from polaris_mcp.base import JSONDict, NAMESPACE_PATH_DELIMITER
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.rest import PolarisRestTool, RestResponse, encode_path_segment
+
+Namespace = Tuple[str, ...]
+
+
+def namespace_path(namespace: Sequence[str]) -> str:
+    """Encode namespace parts as a single REST path segment."""
+
+    return encode_path_segment(NAMESPACE_PATH_DELIMITER.join(namespace))
+
+
+def list_catalogs(
+    management_rest: PolarisRestTool, realm: Optional[str] = None
+) -> List[str]:
+    """Return the names of all catalogs visible to the caller."""
+
+    response = _get(management_rest, "catalogs", None, realm)
+    body = response.body if isinstance(response.body, dict) else {}
+    names: List[str] = []
+    for entry in body.get("catalogs") or []:
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str):
+            names.append(entry["name"])
+    return names
+
+
+def list_namespaces(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    parent: Optional[Sequence[str]] = None,
+    realm: Optional[str] = None,
+) -> List[Namespace]:
+    """Return the direct children of ``parent`` (or the top-level namespaces)."""
+
+    query: Dict[str, Any] = {}
+    if parent:
+        query["parent"] = NAMESPACE_PATH_DELIMITER.join(parent)
+    namespaces: List[Namespace] = []
+    for page in _paginate(
+        catalog_rest, f"{encode_path_segment(catalog)}/namespaces", query, realm
+    ):
+        for entry in page.get("namespaces") or []:
+            if isinstance(entry, list) and entry:
+                namespaces.append(tuple(str(part) for part in entry))
+    return namespaces
+
+
+def load_namespace_properties(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    realm: Optional[str] = None,
+) -> Dict[str, str]:
+    """Return the properties of ``namespace``."""
+
+    response = _get(
+        catalog_rest,
+        f"{encode_path_segment(catalog)}/namespaces/{namespace_path(namespace)}",
+        None,
+        realm,
+    )
+    body = response.body if isinstance(response.body, dict) else {}
+    properties = body.get("properties")
+    if not isinstance(properties, dict):
+        return {}
+    return {str(key): str(value) for key, value in properties.items()}
+
+
+def list_tables(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    realm: Optional[str] = None,
+) -> List[str]:
+    """Return the table names registered directly under ``namespace``."""
+
+    return _list_identifiers(catalog_rest, catalog, namespace, "tables", realm)
+
+
+def list_views(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    realm: Optional[str] = None,
+) -> List[str]:
+    """Return the view names registered directly under ``namespace``."""
+
+    return _list_identifiers(catalog_rest, catalog, namespace, "views", realm)
+
+
+def walk_namespaces(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    root: Optional[Sequence[str]] = None,
+    realm: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Namespace]:
+    """Return every namespace below ``root`` (exclusive) in breadth-first order.
+
+    Each level of the tree is listed concurrently.
+    """
+
+    discovered: List[Namespace] = []
+    level: List[Optional[Namespace]] = [tuple(root) if root else None]
+    while level:
+        outcomes = run_concurrently(
+            lambda parent: list_namespaces(catalog_rest, catalog, parent, realm),
+            level,
+            max_workers,
+        )
+        level = []
+        for outcome in outcomes:
+            if outcome.error is not None:
+                raise outcome.error
+            for child in outcome.result or []:
+                discovered.append(child)
+                level.append(child)
+    return discovered
+
+
+def list_policies(
+    policy_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    realm: Optional[str] = None,
+) -> List[str]:
+    """Return the policy names defined directly under ``namespace``."""
+
+    return _list_identifiers(policy_rest, catalog, namespace, "policies", realm)
+
+
+def list_applicable_policies(
+    policy_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Optional[Sequence[str]] = None,
+    table: Optional[str] = None,
+    policy_type: Optional[str] = None,
+    realm: Optional[str] = None,
+) -> List[JSONDict]:
+    """Return the policies in effect on a catalog, namespace or table, across all pages."""
+
+    query: Dict[str, Any] = {}
+    if namespace:
+        query["namespace"] = NAMESPACE_PATH_DELIMITER.join(namespace)
+    if table:
+        query["target-name"] = table
+    if policy_type:
+        query["policyType"] = policy_type
+    policies: List[JSONDict] = []
+    for page in _paginate(
+        policy_rest, f"{encode_path_segment(catalog)}/applicable-policies", query, realm
+    ):
+        policies.extend(
+            entry
+            for entry in page.get("applicable-policies") or []
+            if isinstance(entry, dict)
+        )
+    return policies
+
+
+def list_principals(
+    management_rest: PolarisRestTool, realm: Optional[str] = None
+) -> List[str]:
+    """Return the names of all principals in the realm."""
+
+    response = _get(management_rest, "principals", None, realm)
+    body = response.body if isinstance(response.body, dict) else {}
+    return [
+        entry["name"]
+        for entry in body.get("principals") or []
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str)
+    ]
+
+
+def list_catalog_roles(
+    management_rest: PolarisRestTool, catalog: str, realm: Optional[str] = None
+) -> List[str]:
+    """Return the names of the catalog roles defined in ``catalog``."""
+
+    return _role_names(
+        _get(
+            management_rest,
+            f"catalogs/{encode_path_segment(catalog)}/catalog-roles",
+            None,
+            realm,
+        )
+    )
+
+
+def list_catalog_role_assignees(
+    management_rest: PolarisRestTool,
+    catalog: str,
+    catalog_role: str,
+    realm: Optional[str] = None,
+) -> List[str]:
+    """Return the principal roles that ``catalog_role`` is granted to."""
+
+    return _role_names(
+        _get(
+            management_rest,
+            f"catalogs/{encode_path_segment(catalog)}"
+            f"/catalog-roles/{encode_path_segment(catalog_role)}/principal-roles",
+            None,
+            realm,
+        )
+    )
+
+
+def list_principal_roles(
+    management_rest: PolarisRestTool, principal: str, realm: Optional[str] = None
+) -> List[str]:
+    """Return the principal roles assigned to ``principal``."""
+
+    return _role_names(
+        _get(
+            management_rest,
+            f"principals/{encode_path_segment(principal)}/principal-roles",
+            None,
+            realm,
+        )
+    )
+
+
+def list_assigned_catalog_roles(
+    management_rest: PolarisRestTool,
+    principal_role: str,
+    catalog: str,
+    realm: Optional[str] = None,
+) -> List[str]:
+    """Return the catalog roles of ``catalog`` granted to ``principal_role``."""
+
+    return _role_names(
+        _get(
+            management_rest,
+            f"principal-roles/{encode_path_segment(principal_role)}"
+            f"/catalog-roles/{encode_path_segment(catalog)}",
+            None,
+            realm,
+        )
+    )
+
+
+def list_grants(
+    management_rest: PolarisRestTool,
+    catalog: str,
+    catalog_role: str,
+    realm: Optional[str] = None,
+) -> List[JSONDict]:
+    """Return the privilege grants held by ``catalog_role``."""
+
+    response = _get(
+        management_rest,
+        f"catalogs/{encode_path_segment(catalog)}"
+        f"/catalog-roles/{encode_path_segment(catalog_role)}/grants",
+        None,
+        realm,
+    )
+    body = response.body if isinstance(response.body, dict) else {}
+    return [grant for grant in body.get("grants") or [] if isinstance(grant, dict)]
+
+
+def select_namespaces(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    root: Optional[Sequence[str]] = None,
+    prefix: Optional[str] = None,
+    include_root: bool = False,
+    realm: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Namespace]:
+    """Return the namespaces below ``root`` whose dotted name starts with ``prefix``."""
+
+    discovered = walk_namespaces(
+        catalog_rest, catalog, root=root, realm=realm, max_workers=max_workers
+    )
+    if include_root and root:
+        discovered.insert(0, tuple(root))
+    if prefix:
+        discovered = [
+            namespace
+            for namespace in discovered
+            if ".".join(namespace).startswith(prefix)
+        ]
+    return discovered
+
+
+def load_table(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    table: str,
+    realm: Optional[str] = None,
+    etag: Optional[str] = None,
+    query: Optional[Dict[str, Any]] = None,
+) -> RestResponse:
+    """Issue ``loadTable``, as a conditional request when ``etag`` is supplied.
+
+    The raw response is returned so callers can distinguish ``304 Not Modified`` and
+    ``404 Not Found`` from successful loads.
+    """
+
+    arguments: JSONDict = {
+        "method": "GET",
+        "path": (
+            f"{encode_path_segment(catalog)}/namespaces/{namespace_path(namespace)}"
+            f"/tables/{encode_path_segment(table)}"
+        ),
+    }
+    if query:
+        arguments["query"] = dict(query)
+    if etag:
+        arguments["headers"] = {"If-None-Match": etag}
+    if realm:
+        arguments["realm"] = realm
+    return catalog_rest.fetch(arguments)
+
+
+def _list_identifiers(
+    catalog_rest: PolarisRestTool,
+    catalog: str,
+    namespace: Sequence[str],
+    kind: str,
+    realm: Optional[str],
+) -> List[str]:
+    path = (
+        f"{encode_path_segment(catalog)}/namespaces/{namespace_path(namespace)}/{kind}"
+    )
+    names: List[str] = []
+    for page in _paginate(catalog_rest, path, {}, realm):
+        for entry in page.get("identifiers") or []:
+            if isinstance(entry, dict) and isinstance(entry.get("name"), str):
+                names.append(entry["name"])
+    return names
+
+
+def _role_names(response: RestResponse) -> List[str]:
+    body = response.body if isinstance(response.body, dict) else {}
+    return [
+        entry["name"]
+        for entry in body.get("roles") or []
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str)
+    ]
+
+
+def _paginate(
+    rest: PolarisRestTool,
+    path: str,
+    query: Dict[str, Any],
+    realm: Optional[str],
+) -> List[JSONDict]:
+    pages: List[JSONDict] = []
+    params = dict(query)
+    seen: Set[str] = set()
+    while True:
+        response = _get(rest, path, params, realm)
+        body = response.body if isinstance(response.body, dict) else {}
+        pages.append(body)
+        token = body.get("next-page-token")
+        if not isinstance(token, str) or not token:
+            return pages
+        # A server that ignores the token would hand back the same page forever.
+        if token in seen:
+            raise RuntimeError(f"GET {path} repeated page token {token!r}")
+        seen.add(token)
+        params["pageToken"] = token
+
+
+def _get(
+    rest: PolarisRestTool,
+    path: str,
+    query: Optional[Dict[str, Any]],
+    realm: Optional[str],
+) -> RestResponse:
+    arguments: JSONDict = {"method": "GET", "path": path}
+    if query:
+        arguments["query"] = query
+    if realm:
+        arguments["realm"] = realm
+    response = rest.fetch(arguments)
+    if not response.ok:
+        raise RuntimeError(f"GET {path} returned {response.status}: {response.body}")
+    return response
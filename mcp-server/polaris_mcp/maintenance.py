@@ -0,0 +1,284 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Catalog scans that rank tables needing compaction or snapshot expiry."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from polaris_mcp.base import JSONDict, ProgressCallback
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    TaskOutcome,
+    run_concurrently,
+)
+from polaris_mcp.iceberg import snapshot_metrics
+from polaris_mcp.listing import Namespace, list_tables, load_table, select_namespaces
+from polaris_mcp.policies import ApplicablePolicyCache, format_target
+from polaris_mcp.rest import PolarisRestTool
+
+COMPACTION_POLICY_TYPE = "system.data-compaction"
+SNAPSHOT_EXPIRY_POLICY_TYPE = "system.snapshot-expiry"
+
+# Iceberg's defaults for write.target-file-size-bytes and history.expire.max-snapshot-age-ms.
+DEFAULT_TARGET_FILE_SIZE_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_SNAPSHOT_AGE_HOURS = 120.0
+DEFAULT_MAX_SNAPSHOTS = 100
+DEFAULT_MIN_EXCESS_FILES = 10
+DEFAULT_CANDIDATE_LIMIT = 20
+
+
+@dataclass(frozen=True)
+class ScanThresholds:
+    """When a table's counters make it a maintenance candidate."""
+
+    min_excess_files: int = DEFAULT_MIN_EXCESS_FILES
+    max_snapshots: int = DEFAULT_MAX_SNAPSHOTS
+    max_snapshot_age_hours: float = DEFAULT_MAX_SNAPSHOT_AGE_HOURS
+    require_policy: bool = False
+
+
+def _policy_content(policy: JSONDict) -> JSONDict:
+    content = policy.get("content")
+    if isinstance(content, str):
+        try:
+            content = json.loads(content)
+        except ValueError:
+            return {}
+    return content if isinstance(content, dict) else {}
+
+
+def _positive_number(value: object) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    return float(value)
+
+
+def _effective_policy(
+    policies: Sequence[JSONDict], policy_type: str
+) -> Optional[JSONDict]:
+    # Polaris returns at most one effective policy per system type, the most specific one.
+    for policy in policies:
+        if policy.get("policy-type") == policy_type:
+            return policy
+    return None
+
+
+def assess_table(
+    metrics: JSONDict,
+    policies: Sequence[JSONDict],
+    thresholds: ScanThresholds,
+    now_ms: int,
+) -> Optional[JSONDict]:
+    """Score one table, returning ``None`` when no maintenance is warranted.
+
+    The score is the amount of work the table would shed: data files beyond what its
+    bytes need at the target file size, delete files awaiting compaction, and snapshots
+    beyond the count or age limits. Policies that set ``enable: false`` suppress their
+    action; with ``require_policy`` only actions backed by an applicable policy count.
+    A snapshot-expiry policy's ``max_snapshot_age_days`` and ``min_snapshot_to_keep``
+    override the age threshold and the number of newest snapshots that are never aged out.
+    """
+
+    actions: List[JSONDict] = []
+    compaction = _effective_policy(policies, COMPACTION_POLICY_TYPE)
+    compaction_content = _policy_content(compaction) if compaction else {}
+    if (compaction or not thresholds.require_policy) and compaction_content.get(
+        "enable", True
+    ) is not False:
+        target = (
+            compaction_content.get("target_file_size_bytes")
+            or metrics.get("target-file-size-bytes")
+            or DEFAULT_TARGET_FILE_SIZE_BYTES
+        )
+        data_files = metrics["total-data-files"]
+        needed = math.ceil(metrics["total-files-size"] / target) if target else 0
+        excess = max(data_files - max(needed, 1), 0) if data_files else 0
+        excess = excess if excess >= thresholds.min_excess_files else 0
+        delete_files = metrics["total-delete-files"]
+        if excess or delete_files:
+            actions.append(
+                {
+                    "action": "compaction",
+                    "score": excess + delete_files,
+                    "excessFiles": excess,
+                    "deleteFiles": delete_files,
+                    "targetFileSizeBytes": target,
+                    "policy": compaction.get("name") if compaction else None,
+                }
+            )
+
+    expiry = _effective_policy(policies, SNAPSHOT_EXPIRY_POLICY_TYPE)
+    expiry_content = _policy_content(expiry) if expiry else {}
+    if (expiry or not thresholds.require_policy) and expiry_content.get(
+        "enable", True
+    ) is not False:
+        config = expiry_content.get("config")
+        config = config if isinstance(config, dict) else {}
+        age_days = _positive_number(config.get("max_snapshot_age_days"))
+        max_age_hours = (
+            age_days * 24 if age_days is not None else thresholds.max_snapshot_age_hours
+        )
+        # At least the newest snapshot is always kept, whatever its age.
+        keep = max(int(_positive_number(config.get("min_snapshot_to_keep")) or 1), 1)
+        cutoff = now_ms - int(max_age_hours * 3_600_000)
+        timestamps = metrics["snapshot-timestamps"]
+        aged = sum(1 for ts in timestamps[:-keep] if ts < cutoff)
+        over_count = max(
+            metrics["snapshot-count"] - max(thresholds.max_snapshots, keep), 0
+        )
+        expirable = max(aged, over_count)
+        if expirable:
+            actions.append(
+                {
+                    "action": "snapshot-expiry",
+                    "score": expirable,
+                    "expirableSnapshots": expirable,
+                    "snapshotCount": metrics["snapshot-count"],
+                    "oldestSnapshotMs": metrics["oldest-snapshot-ms"],
+                    "maxSnapshotAgeHours": max_age_hours,
+                    "minSnapshotsToKeep": keep,
+                    "policy": expiry.get("name") if expiry else None,
+                }
+            )
+
+    if not actions:
+        return None
+    return {
+        "score": sum(action["score"] for action in actions),
+        "actions": actions,
+        "metrics": {
+            name: metrics[name]
+            for name in (
+                "total-data-files",
+                "total-delete-files",
+                "total-files-size",
+                "added-files-size",
+                "snapshot-count",
+            )
+        },
+    }
+
+
+class MaintenanceScanner:
+    """Rank a catalog's tables by pending compaction and snapshot-expiry work.
+
+    Namespaces, table listings and table loads fan out across ``max_concurrency``
+    workers. Each ``loadTable`` response is reduced to a handful of counters as soon
+    as it arrives, so the scan never holds more than one metadata document per worker.
+    """
+
+    def __init__(
+        self,
+        catalog_rest: PolarisRestTool,
+        policy_cache: ApplicablePolicyCache,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._catalog_rest = catalog_rest
+        self._policy_cache = policy_cache
+        self._max_concurrency = max(max_concurrency, 1)
+
+    def scan(
+        self,
+        catalog: str,
+        root: Optional[Sequence[str]] = None,
+        prefix: Optional[str] = None,
+        thresholds: Optional[ScanThresholds] = None,
+        realm: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> JSONDict:
+        """Return ``{"scanned", "candidates", "errors"}`` with candidates ranked by score."""
+
+        namespaces = select_namespaces(
+            self._catalog_rest,
+            catalog,
+            root=root,
+            prefix=prefix,
+            include_root=True,
+            realm=realm,
+            max_workers=self._max_concurrency,
+        )
+        errors: Dict[str, str] = {}
+        tables: List[Tuple[Namespace, str]] = []
+        for outcome in run_concurrently(
+            lambda namespace: list_tables(
+                self._catalog_rest, catalog, namespace, realm
+            ),
+            namespaces,
+            self._max_concurrency,
+        ):
+            if outcome.error is not None:
+                errors[format_target((outcome.item, None))] = str(outcome.error)
+                continue
+            tables.extend((outcome.item, table) for table in outcome.result or [])
+
+        lock = threading.Lock()
+        completed = [0]
+
+        def measure(target: Tuple[Namespace, str]) -> JSONDict:
+            response = load_table(
+                self._catalog_rest,
+                catalog,
+                target[0],
+                target[1],
+                realm,
+                query={"snapshots": "refs"},
+            )
+            if not response.ok:
+                raise RuntimeError(f"loadTable returned {response.status}")
+            return snapshot_metrics(response.body)
+
+        def report(outcome: TaskOutcome[Tuple[Namespace, str], JSONDict]) -> None:
+            if progress is None:
+                return
+            with lock:
+                completed[0] += 1
+                done = completed[0]
+            progress(float(done), float(len(tables)), format_target(outcome.item))
+
+        measured: Dict[Tuple[Namespace, str], JSONDict] = {}
+        for loaded in run_concurrently(
+            measure, tables, self._max_concurrency, on_complete=report
+        ):
+            if loaded.error is not None:
+                errors[format_target(loaded.item)] = str(loaded.error)
+            else:
+                measured[loaded.item] = loaded.result or {}
+
+        resolved = self._policy_cache.resolve(catalog, list(measured), realm=realm)
+        errors.update(resolved.get("errors") or {})
+        thresholds = thresholds or ScanThresholds()
+        now_ms = int(time.time() * 1000)
+        candidates: List[JSONDict] = []
+        for target, metrics in measured.items():
+            name = format_target(target)
+            assessment = assess_table(
+                metrics, resolved["policies"].get(name, []), thresholds, now_ms
+            )
+            if assessment is not None:
+                candidates.append({"table": name, **assessment})
+        candidates.sort(key=lambda candidate: (-candidate["score"], candidate["table"]))
+        return {"scanned": len(measured), "candidates": candidates, "errors": errors}
@@ -0,0 +1,120 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Cache of parsed table metadata keyed by ``metadata-location``."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+from polaris_mcp.iceberg import ParsedMetadata, parse_metadata
+from polaris_mcp.listing import Namespace, load_table
+from polaris_mcp.rest import PolarisRestTool, RestResponse
+
+DEFAULT_METADATA_CACHE_ENTRIES = 32
+
+_TableKey = Tuple[str, str, Namespace, str]
+
+
+class TableLoadError(RuntimeError):
+    """Raised when ``loadTable`` fails; carries the Polaris response."""
+
+    def __init__(self, response: RestResponse) -> None:
+        super().__init__(f"loadTable returned {response.status}")
+        self.response = response
+
+
+class TableMetadataCache:
+    """Load tables and keep their parsed metadata for repeated evolution queries.
+
+    Every lookup revalidates the table with ``If-None-Match``; a ``304`` (or a response
+    whose ``metadata-location`` was already parsed) reuses the parsed metadata, so only
+    the first query against a metadata file pays for the full document. At most
+    ``max_entries`` metadata files are retained, least recently used first out.
+    """
+
+    def __init__(
+        self,
+        catalog_rest: PolarisRestTool,
+        max_entries: int = DEFAULT_METADATA_CACHE_ENTRIES,
+    ) -> None:
+        self._catalog_rest = catalog_rest
+        self._max_entries = max(max_entries, 1)
+        self._lock = threading.Lock()
+        self._parsed: "OrderedDict[str, ParsedMetadata]" = OrderedDict()
+        self._tables: Dict[_TableKey, Tuple[Optional[str], str]] = {}
+
+    def load(
+        self,
+        catalog: str,
+        namespace: Sequence[str],
+        table: str,
+        realm: Optional[str] = None,
+    ) -> Tuple[ParsedMetadata, bool]:
+        """Return the table's parsed metadata and whether it came from the cache.
+
+        Raises :class:`TableLoadError` when Polaris rejects the ``loadTable`` request.
+        """
+
+        key = (
+            self._catalog_rest.identity({"realm": realm}),
+            catalog,
+            tuple(namespace),
+            table,
+        )
+        with self._lock:
+            known = self._tables.get(key)
+            cached = self._parsed.get(known[1]) if known else None
+        response = load_table(
+            self._catalog_rest,
+            catalog,
+            namespace,
+            table,
+            realm,
+            etag=known[0] if known and cached else None,
+            query={"snapshots": "all"},
+        )
+        if response.status == 304 and cached is not None:
+            with self._lock:
+                self._parsed.move_to_end(cached.metadata_location or "")
+            return cached, True
+        if not response.ok:
+            raise TableLoadError(response)
+        body = response.body if isinstance(response.body, dict) else {}
+        location = body.get("metadata-location")
+        with self._lock:
+            parsed = self._parsed.get(location) if isinstance(location, str) else None
+        hit = parsed is not None
+        if parsed is None:
+            parsed = parse_metadata(body)
+        if isinstance(location, str):
+            with self._lock:
+                self._tables[key] = (response.header("ETag"), location)
+                self._parsed[location] = parsed
+                self._parsed.move_to_end(location)
+                while len(self._parsed) > self._max_entries:
+                    evicted, _ = self._parsed.popitem(last=False)
+                    for table_key in [
+                        k for k, v in self._tables.items() if v[1] == evicted
+                    ]:
+                        del self._tables[table_key]
+        return parsed, hit
@@ -0,0 +1,144 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Batch resolution of applicable Polaris policies with a shared lookup cache."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from polaris_mcp.base import JSONDict
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.listing import Namespace, list_applicable_policies
+from polaris_mcp.rest import PolarisRestTool
+
+DEFAULT_POLICY_CACHE_TTL_SECONDS = 60.0
+
+# (namespace, table); namespace-level targets have no table.
+PolicyTarget = Tuple[Namespace, Optional[str]]
+_LookupKey = Tuple[str, str, Namespace, Optional[str], str]
+
+
+def format_target(target: PolicyTarget) -> str:
+    namespace, table = target
+    return ".".join(namespace + ((table,) if table else ()))
+
+
+def compact_policy(policy: JSONDict, include_content: bool = False) -> JSONDict:
+    """Keep the fields a planner needs to act on an applicable policy."""
+
+    node: JSONDict = {
+        "name": policy.get("name"),
+        "type": policy.get("policy-type"),
+        "inherited": bool(policy.get("inherited")),
+    }
+    if isinstance(policy.get("namespace"), list):
+        node["namespace"] = policy["namespace"]
+    if include_content:
+        node["content"] = policy.get("content")
+        node["version"] = policy.get("version")
+    return node
+
+
+class ApplicablePolicyCache:
+    """Resolve applicable policies for many targets with deduplicated, cached lookups.
+
+    Each distinct (catalog, namespace, table, policy type) is fetched once per batch and
+    cached per caller identity for ``ttl_seconds``, so the namespace-level lookups shared
+    by many targets are issued a single time.
+    """
+
+    def __init__(
+        self,
+        policy_rest: PolarisRestTool,
+        ttl_seconds: float = DEFAULT_POLICY_CACHE_TTL_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._policy_rest = policy_rest
+        self._ttl_seconds = ttl_seconds
+        self._max_concurrency = max(max_concurrency, 1)
+        self._lock = threading.Lock()
+        self._entries: Dict[_LookupKey, Tuple[float, List[JSONDict]]] = {}
+
+    def invalidate(self, catalog: Optional[str] = None) -> None:
+        """Forget cached lookups for ``catalog`` (or for every catalog)."""
+
+        with self._lock:
+            for key in [k for k in self._entries if catalog in (None, k[1])]:
+                del self._entries[key]
+
+    def resolve(
+        self,
+        catalog: str,
+        targets: Sequence[PolicyTarget],
+        policy_type: Optional[str] = None,
+        realm: Optional[str] = None,
+        refresh: bool = False,
+    ) -> JSONDict:
+        """Return ``{"policies": {target: [...]}, ...}`` for every target."""
+
+        scope = self._policy_rest.identity({"realm": realm})
+        keys = {
+            target: (scope, catalog, target[0], target[1], policy_type or "")
+            for target in dict.fromkeys(targets)
+        }
+        now = time.monotonic()
+        resolved: Dict[_LookupKey, List[JSONDict]] = {}
+        with self._lock:
+            for key in set(keys.values()):
+                entry = self._entries.get(key)
+                if (
+                    entry is not None
+                    and not refresh
+                    and now - entry[0] < self._ttl_seconds
+                ):
+                    resolved[key] = entry[1]
+        pending = [key for key in dict.fromkeys(keys.values()) if key not in resolved]
+        errors: Dict[str, str] = {}
+        for outcome in run_concurrently(
+            lambda key: list_applicable_policies(
+                self._policy_rest, catalog, key[2], key[3], policy_type, realm
+            ),
+            pending,
+            self._max_concurrency,
+        ):
+            key = outcome.item
+            if outcome.error is not None:
+                errors[format_target((key[2], key[3]))] = str(outcome.error)
+                continue
+            resolved[key] = outcome.result or []
+            with self._lock:
+                self._entries[key] = (now, resolved[key])
+
+        policies = {
+            format_target(target): resolved[key]
+            for target, key in keys.items()
+            if key in resolved
+        }
+        payload: JSONDict = {
+            "policies": policies,
+            "lookups": len(pending),
+            "cached": len(set(keys.values())) - len(pending),
+        }
+        if errors:
+            payload["errors"] = errors
+        return payload
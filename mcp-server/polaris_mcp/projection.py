@@ -0,0 +1,141 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Project JSON documents down to a handful of selected fields."""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from polaris_mcp.base import JSONDict
+
+WILDCARD = "*"
+
+SELECT_SCHEMA: JSONDict = {
+    "anyOf": [
+        {"type": "string"},
+        {"type": "array", "items": {"type": "string"}},
+    ],
+    "description": (
+        "Optional projection of the response body: JSON pointers (e.g. "
+        "/metadata/current-snapshot-id) or dotted paths (e.g. metadata.snapshots.*.snapshot-id). "
+        "Only the selected values are returned, keyed by selector."
+    ),
+}
+
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+
+
+def parse_selector(selector: str) -> Tuple[str, ...]:
+    """Split a JSON pointer (``/metadata/schemas/0``) or dotted path into tokens.
+
+    Dotted paths (``metadata.schemas.0``) are a convenience for keys without dots; use a
+    JSON pointer when a key contains ``.``. ``*`` matches every element of an array or
+    every value of an object.
+    """
+
+    if not isinstance(selector, str) or not selector.strip():
+        raise ValueError("Selectors must be non-empty strings.")
+    selector = selector.strip()
+    if selector.startswith("/"):
+        tokens = []
+        for token in selector[1:].split("/"):
+            if "~" in token.replace("~0", "").replace("~1", ""):
+                raise ValueError(f"Invalid JSON pointer escape in selector: {selector}")
+            tokens.append(token.replace("~1", "/").replace("~0", "~"))
+        return tuple(tokens)
+    return tuple(selector.split("."))
+
+
+def parse_selectors(value: Any) -> List[str]:
+    """Validate a ``select`` argument (a string or a list of strings)."""
+
+    selectors = [value] if isinstance(value, str) else value
+    if not isinstance(selectors, list) or not selectors:
+        raise ValueError("The 'select' argument must be a string or a list of strings.")
+    for selector in selectors:
+        parse_selector(selector)
+    return [selector.strip() for selector in selectors]
+
+
+def copy_select(source: Any, target: JSONDict) -> None:
+    """Validate a ``select`` argument and copy it into the delegate arguments."""
+
+    if source is not None:
+        target["select"] = parse_selectors(source)
+
+
+def resolve_select(arguments: JSONDict) -> Optional[List[str]]:
+    """Return the validated ``select`` selectors of a tool call, if any."""
+
+    source = arguments.get("select")
+    return parse_selectors(source) if source is not None else None
+
+
+def project(payload: JSONDict, selectors: Optional[Sequence[str]]) -> JSONDict:
+    """Apply :func:`select_fields` when selectors were requested."""
+
+    return select_fields(payload, selectors) if selectors else payload
+
+
+def select_fields(document: Any, selectors: Sequence[str]) -> JSONDict:
+    """Return a mapping of each selector to the value it addresses in ``document``.
+
+    Selectors that do not match anything map to ``None``; wildcards yield a list.
+    """
+
+    projected: JSONDict = {}
+    for selector in selectors:
+        value = _resolve(document, parse_selector(selector))
+        projected[selector] = None if value is _MISSING else value
+    return projected
+
+
+def _resolve(node: Any, tokens: Sequence[str]) -> Any:
+    if not tokens:
+        return node
+    token, rest = tokens[0], tokens[1:]
+    if token == WILDCARD:
+        if isinstance(node, dict):
+            children = list(node.values())
+        elif isinstance(node, list):
+            children = node
+        else:
+            return _MISSING
+        values = [_resolve(child, rest) for child in children]
+        return [value for value in values if value is not _MISSING]
+    if isinstance(node, dict):
+        if token not in node:
+            return _MISSING
+        return _resolve(node[token], rest)
+    if isinstance(node, list):
+        try:
+            index = int(token)
+        except ValueError:
+            return _MISSING
+        if not -len(node) <= index < len(node):
+            return _MISSING
+        return _resolve(node[index], rest)
+    return _MISSING
@@ -0,0 +1,758 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Resolve a principal's effective privileges from the Polaris role graph."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from polaris_mcp.base import JSONDict
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.export import write_csv, write_jsonl
+from polaris_mcp.listing import (
+    list_assigned_catalog_roles,
+    list_catalog_role_assignees,
+    list_catalog_roles,
+    list_catalogs,
+    list_grants,
+    list_principal_roles,
+    list_principals,
+)
+from polaris_mcp.rest import PolarisRestTool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RBAC_CACHE_TTL_SECONDS = 60.0
+MATRIX_FORMATS = ("jsonl", "csv")
+MATRIX_COLUMNS = (
+    "principal",
+    "principalRole",
+    "catalog",
+    "catalogRole",
+    "securableType",
+    "securable",
+    "privilege",
+    "grantedPrivilege",
+)
+
+# Privileges that include narrower ones, following the Polaris privilege hierarchy.
+IMPLIED_PRIVILEGES: Dict[str, Tuple[str, ...]] = {
+    "CATALOG_MANAGE_CONTENT": (
+        "CATALOG_MANAGE_METADATA",
+        "CATALOG_READ_PROPERTIES",
+        "CATALOG_WRITE_PROPERTIES",
+        "NAMESPACE_FULL_METADATA",
+        "TABLE_FULL_METADATA",
+        "TABLE_WRITE_DATA",
+        "VIEW_FULL_METADATA",
+    ),
+    "CATALOG_WRITE_PROPERTIES": ("CATALOG_READ_PROPERTIES",),
+    "NAMESPACE_FULL_METADATA": (
+        "NAMESPACE_CREATE",
+        "NAMESPACE_DROP",
+        "NAMESPACE_LIST",
+        "NAMESPACE_READ_PROPERTIES",
+        "NAMESPACE_WRITE_PROPERTIES",
+    ),
+    "NAMESPACE_WRITE_PROPERTIES": ("NAMESPACE_READ_PROPERTIES",),
+    "NAMESPACE_READ_PROPERTIES": ("NAMESPACE_LIST",),
+    "TABLE_FULL_METADATA": (
+        "TABLE_CREATE",
+        "TABLE_DROP",
+        "TABLE_LIST",
+        "TABLE_READ_PROPERTIES",
+        "TABLE_WRITE_PROPERTIES",
+    ),
+    "TABLE_WRITE_DATA": ("TABLE_READ_DATA",),
+    "TABLE_READ_DATA": ("TABLE_READ_PROPERTIES",),
+    "TABLE_WRITE_PROPERTIES": ("TABLE_READ_PROPERTIES",),
+    "TABLE_READ_PROPERTIES": ("TABLE_LIST",),
+    "VIEW_FULL_METADATA": (
+        "VIEW_CREATE",
+        "VIEW_DROP",
+        "VIEW_LIST",
+        "VIEW_READ_PROPERTIES",
+        "VIEW_WRITE_PROPERTIES",
+    ),
+    "VIEW_WRITE_PROPERTIES": ("VIEW_READ_PROPERTIES",),
+    "VIEW_READ_PROPERTIES": ("VIEW_LIST",),
+}
+
+_ENTITY_NAME_KEYS = {"table": "tableName", "view": "viewName", "policy": "policyName"}
+
+# (securable type, namespace, entity name); catalog grants use ("catalog", (), "").
+SecurableKey = Tuple[str, Tuple[str, ...], str]
+
+
+def expand_privileges(privileges: Sequence[str]) -> Set[str]:
+    """Return ``privileges`` together with every privilege they imply."""
+
+    expanded: Set[str] = set()
+    pending = list(privileges)
+    while pending:
+        privilege = pending.pop()
+        if privilege not in expanded:
+            expanded.add(privilege)
+            pending.extend(IMPLIED_PRIVILEGES.get(privilege, ()))
+    return expanded
+
+
+def grant_identity(grant: JSONDict) -> Tuple[str, str, Tuple[str, ...], str]:
+    """Return a canonical identity for ``grant`` so grant sets can be compared."""
+
+    grant_type = str(grant.get("type") or "").lower()
+    namespace = grant.get("namespace")
+    name_key = _ENTITY_NAME_KEYS.get(grant_type)
+    return (
+        grant_type,
+        str(grant.get("privilege") or "").upper(),
+        tuple(str(part) for part in namespace) if isinstance(namespace, list) else (),
+        str(grant.get(name_key) or "") if name_key else "",
+    )
+
+
+def diff_grants(
+    current: Sequence[JSONDict], desired: Sequence[JSONDict]
+) -> Tuple[List[JSONDict], List[JSONDict], int]:
+    """Return the grants to add, the grants to revoke and the unchanged count."""
+
+    current_by_id = {grant_identity(grant): grant for grant in current}
+    desired_by_id = {grant_identity(grant): grant for grant in desired}
+    add = [grant for key, grant in desired_by_id.items() if key not in current_by_id]
+    revoke = [grant for key, grant in current_by_id.items() if key not in desired_by_id]
+    return add, revoke, len(desired_by_id) - len(add)
+
+
+def grant_applies(
+    grant: JSONDict,
+    namespace: Sequence[str] = (),
+    entity: Optional[str] = None,
+    kind: str = "table",
+) -> bool:
+    """Return whether ``grant`` covers the target, applying securable inheritance.
+
+    Catalog grants cover everything in the catalog, namespace grants cover the namespace
+    and everything nested below it, and table/view grants cover only that entity.
+    """
+
+    grant_type = str(grant.get("type") or "").lower()
+    if grant_type == "catalog":
+        return True
+    grant_namespace = grant.get("namespace")
+    if not isinstance(grant_namespace, list):
+        return False
+    if grant_type == "namespace":
+        return (
+            bool(namespace)
+            and len(grant_namespace) <= len(namespace)
+            and list(namespace[: len(grant_namespace)]) == grant_namespace
+        )
+    name_key = _ENTITY_NAME_KEYS.get(grant_type)
+    return (
+        name_key is not None
+        and grant_type == kind
+        and entity is not None
+        and grant.get(name_key) == entity
+        and grant_namespace == list(namespace)
+    )
+
+
+class RoleGraph:
+    """Cached view of principal -> principal role -> catalog role -> grant edges.
+
+    Each edge list is cached per caller identity for ``ttl_seconds`` so repeated
+    questions about the same principal cost no additional requests.
+    """
+
+    def __init__(
+        self,
+        management_rest: PolarisRestTool,
+        ttl_seconds: float = DEFAULT_RBAC_CACHE_TTL_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._management_rest = management_rest
+        self._ttl_seconds = ttl_seconds
+        self._max_concurrency = max(max_concurrency, 1)
+        self._lock = threading.Lock()
+        self._edges: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+    def invalidate(self) -> None:
+        """Forget every cached edge."""
+
+        with self._lock:
+            self._edges.clear()
+
+    def principal_roles(
+        self, principal: str, realm: Optional[str] = None, refresh: bool = False
+    ) -> List[str]:
+        return self._cached(
+            ("principal", principal),
+            realm,
+            refresh,
+            lambda: list_principal_roles(self._management_rest, principal, realm),
+        )
+
+    def catalog_roles(
+        self,
+        principal_role: str,
+        catalog: str,
+        realm: Optional[str] = None,
+        refresh: bool = False,
+    ) -> List[str]:
+        return self._cached(
+            ("principal-role", principal_role, catalog),
+            realm,
+            refresh,
+            lambda: list_assigned_catalog_roles(
+                self._management_rest, principal_role, catalog, realm
+            ),
+        )
+
+    def grants(
+        self,
+        catalog: str,
+        catalog_role: str,
+        realm: Optional[str] = None,
+        refresh: bool = False,
+    ) -> List[JSONDict]:
+        return self._cached(
+            ("catalog-role", catalog, catalog_role),
+            realm,
+            refresh,
+            lambda: list_grants(self._management_rest, catalog, catalog_role, realm),
+        )
+
+    def resolve(
+        self,
+        principal: str,
+        catalog: str,
+        namespace: Sequence[str] = (),
+        entity: Optional[str] = None,
+        kind: str = "table",
+        realm: Optional[str] = None,
+        refresh: bool = False,
+    ) -> JSONDict:
+        """Return the grants and effective privileges ``principal`` holds on a target.
+
+        Catalog roles are resolved for every principal role concurrently, then the
+        grants of every distinct catalog role are loaded concurrently.
+        """
+
+        principal_roles = self.principal_roles(principal, realm, refresh)
+        via: Dict[str, List[str]] = {}
+        for outcome in run_concurrently(
+            lambda role: self.catalog_roles(role, catalog, realm, refresh),
+            principal_roles,
+            self._max_concurrency,
+        ):
+            if outcome.error is not None:
+                raise outcome.error
+            for catalog_role in outcome.result or []:
+                via.setdefault(catalog_role, []).append(outcome.item)
+
+        applicable: List[JSONDict] = []
+        for loaded in run_concurrently(
+            lambda role: self.grants(catalog, role, realm, refresh),
+            list(via),
+            self._max_concurrency,
+        ):
+            if loaded.error is not None:
+                raise loaded.error
+            for grant in loaded.result or []:
+                if grant_applies(grant, namespace, entity, kind):
+                    applicable.append(dict(grant, catalogRole=loaded.item))
+
+        return {
+            "principal": principal,
+            "catalog": catalog,
+            "principalRoles": principal_roles,
+            "catalogRoles": [
+                {"name": role, "via": sorted(roles)} for role, roles in via.items()
+            ],
+            "grants": applicable,
+            "privileges": sorted(
+                expand_privileges([str(grant.get("privilege")) for grant in applicable])
+            ),
+        }
+
+    def _cached(
+        self,
+        key: Tuple[str, ...],
+        realm: Optional[str],
+        refresh: bool,
+        load: Callable[[], Any],
+    ) -> Any:
+        scoped = (self._management_rest.identity({"realm": realm}),) + key
+        now = time.monotonic()
+        with self._lock:
+            entry = self._edges.get(scoped)
+        if entry is not None and not refresh and now - entry[0] < self._ttl_seconds:
+            return entry[1]
+        value = load()
+        with self._lock:
+            self._edges[scoped] = (now, value)
+        return value
+
+
+def securable_key(grant: JSONDict) -> Optional[SecurableKey]:
+    """Return the index key of the securable ``grant`` is attached to."""
+
+    grant_type = str(grant.get("type") or "").lower()
+    if grant_type == "catalog":
+        return ("catalog", (), "")
+    namespace = grant.get("namespace")
+    if not isinstance(namespace, list):
+        return None
+    if grant_type == "namespace":
+        return ("namespace", tuple(namespace), "")
+    name_key = _ENTITY_NAME_KEYS.get(grant_type)
+    if name_key is None or not isinstance(grant.get(name_key), str):
+        return None
+    return (grant_type, tuple(namespace), grant[name_key])
+
+
+def covering_keys(
+    namespace: Sequence[str] = (), entity: Optional[str] = None, kind: str = "table"
+) -> List[SecurableKey]:
+    """Return every securable whose grants are inherited by the target."""
+
+    keys: List[SecurableKey] = [("catalog", (), "")]
+    keys.extend(
+        ("namespace", tuple(namespace[:depth]), "")
+        for depth in range(1, len(namespace) + 1)
+    )
+    if entity is not None and namespace:
+        keys.append((kind, tuple(namespace), entity))
+    return keys
+
+
+def _describe_key(key: SecurableKey) -> str:
+    kind, namespace, name = key
+    if kind == "catalog":
+        return "catalog"
+    return f"{kind}:{'.'.join(namespace + ((name,) if name else ()))}"
+
+
+@dataclass
+class _RbacSnapshot:
+    built_at: float
+    principal_roles: Dict[str, Set[str]] = field(default_factory=dict)
+    role_principals: Dict[str, Set[str]] = field(default_factory=dict)
+    assignees: Dict[Tuple[str, str], Set[str]] = field(default_factory=dict)
+    role_catalog_roles: Dict[Tuple[str, str], Set[str]] = field(default_factory=dict)
+    grants: Dict[Tuple[str, str], List[JSONDict]] = field(default_factory=dict)
+    # catalog -> securable -> catalog role -> effective privileges held on it.
+    securables: Dict[str, Dict[SecurableKey, Dict[str, Set[str]]]] = field(
+        default_factory=dict
+    )
+
+    def set_principal(self, principal: str, roles: Sequence[str]) -> None:
+        self.drop_principal(principal)
+        self.principal_roles[principal] = set(roles)
+        for role in roles:
+            self.role_principals.setdefault(role, set()).add(principal)
+
+    def drop_principal(self, principal: str) -> None:
+        for role in self.principal_roles.pop(principal, set()):
+            self.role_principals.get(role, set()).discard(principal)
+
+    def set_catalog_role(
+        self,
+        catalog: str,
+        catalog_role: str,
+        assignees: Sequence[str],
+        grants: List[JSONDict],
+    ) -> None:
+        self.drop_catalog_role(catalog, catalog_role)
+        self.assignees[(catalog, catalog_role)] = set(assignees)
+        for role in assignees:
+            self.role_catalog_roles.setdefault((catalog, role), set()).add(catalog_role)
+        self.grants[(catalog, catalog_role)] = grants
+        by_securable = self.securables.setdefault(catalog, {})
+        for grant in grants:
+            key = securable_key(grant)
+            privilege = grant.get("privilege")
+            if key is None or not isinstance(privilege, str):
+                continue
+            held = by_securable.setdefault(key, {}).setdefault(catalog_role, set())
+            held.update(expand_privileges([privilege]))
+
+    def drop_catalog_role(self, catalog: str, catalog_role: str) -> None:
+        for role in self.assignees.pop((catalog, catalog_role), set()):
+            self.role_catalog_roles.get((catalog, role), set()).discard(catalog_role)
+        self.grants.pop((catalog, catalog_role), None)
+        for holders in self.securables.get(catalog, {}).values():
+            holders.pop(catalog_role, None)
+
+    def drop_principal_role(self, principal_role: str) -> None:
+        for principal in self.role_principals.pop(principal_role, set()):
+            self.principal_roles.get(principal, set()).discard(principal_role)
+        for (catalog, role), catalog_roles in list(self.role_catalog_roles.items()):
+            if role != principal_role:
+                continue
+            del self.role_catalog_roles[(catalog, role)]
+            for catalog_role in catalog_roles:
+                self.assignees.get((catalog, catalog_role), set()).discard(role)
+
+
+class RbacIndex:
+    """In-memory index of principals, roles and grants answering access queries locally.
+
+    The index is built once per caller identity with concurrent fetches, then kept
+    current by the ``refresh_*``/``forget_*`` hooks the mutating tools call after
+    successful role and grant changes. Queries are dictionary lookups.
+    """
+
+    def __init__(
+        self,
+        management_rest: PolarisRestTool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        role_graph: Optional[RoleGraph] = None,
+    ) -> None:
+        self._management_rest = management_rest
+        self._max_concurrency = max(max_concurrency, 1)
+        self._role_graph = role_graph
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, _RbacSnapshot] = {}
+
+    def build(self, realm: Optional[str] = None) -> JSONDict:
+        """(Re)build the index for the caller and return its status."""
+
+        started = time.monotonic()
+        snapshot = _RbacSnapshot(built_at=time.time())
+        principals = list_principals(self._management_rest, realm)
+        catalogs = list_catalogs(self._management_rest, realm)
+        for principal_outcome in run_concurrently(
+            lambda principal: list_principal_roles(
+                self._management_rest, principal, realm
+            ),
+            principals,
+            self._max_concurrency,
+        ):
+            if principal_outcome.error is not None:
+                raise principal_outcome.error
+            snapshot.set_principal(
+                principal_outcome.item, principal_outcome.result or []
+            )
+
+        pairs: List[Tuple[str, str]] = []
+        for catalog_outcome in run_concurrently(
+            lambda catalog: list_catalog_roles(self._management_rest, catalog, realm),
+            catalogs,
+            self._max_concurrency,
+        ):
+            if catalog_outcome.error is not None:
+                raise catalog_outcome.error
+            pairs.extend(
+                (catalog_outcome.item, role) for role in catalog_outcome.result or []
+            )
+        for role_outcome in run_concurrently(
+            lambda pair: self._load_catalog_role(pair[0], pair[1], realm),
+            pairs,
+            self._max_concurrency,
+        ):
+            if role_outcome.error is not None:
+                raise role_outcome.error
+            assignees, grants = role_outcome.result or ([], [])
+            snapshot.set_catalog_role(*role_outcome.item, assignees, grants)
+
+        with self._lock:
+            self._snapshots[self._scope(realm)] = snapshot
+        status = self.status(realm)
+        status["buildSeconds"] = round(time.monotonic() - started, 3)
+        return status
+
+    def status(self, realm: Optional[str] = None) -> JSONDict:
+        with self._lock:
+            snapshot = self._snapshots.get(self._scope(realm))
+            if snapshot is None:
+                return {"built": False}
+            return {
+                "built": True,
+                "builtAt": snapshot.built_at,
+                "principals": len(snapshot.principal_roles),
+                "principalRoles": len(snapshot.role_principals),
+                "catalogRoles": len(snapshot.grants),
+                "grants": sum(len(grants) for grants in snapshot.grants.values()),
+            }
+
+    def can(
+        self,
+        principal: str,
+        privilege: str,
+        catalog: str,
+        namespace: Sequence[str] = (),
+        entity: Optional[str] = None,
+        kind: str = "table",
+        realm: Optional[str] = None,
+    ) -> JSONDict:
+        """Return whether ``principal`` holds ``privilege`` on the target, and through what."""
+
+        privilege = privilege.upper()
+        snapshot = self._snapshot(realm)
+        via: List[JSONDict] = []
+        with self._lock:
+            by_securable = snapshot.securables.get(catalog, {})
+            for principal_role in sorted(snapshot.principal_roles.get(principal, ())):
+                catalog_roles = snapshot.role_catalog_roles.get(
+                    (catalog, principal_role), set()
+                )
+                for key in covering_keys(namespace, entity, kind):
+                    for catalog_role, held in by_securable.get(key, {}).items():
+                        if catalog_role in catalog_roles and privilege in held:
+                            via.append(
+                                {
+                                    "principalRole": principal_role,
+                                    "catalogRole": catalog_role,
+                                    "securable": _describe_key(key),
+                                }
+                            )
+        return {
+            "principal": principal,
+            "privilege": privilege,
+            "allowed": bool(via),
+            "via": via,
+        }
+
+    def who_can(
+        self,
+        catalog: str,
+        namespace: Sequence[str] = (),
+        entity: Optional[str] = None,
+        kind: str = "table",
+        privilege: Optional[str] = None,
+        realm: Optional[str] = None,
+    ) -> JSONDict:
+        """Return every principal holding ``privilege`` (or any privilege) on the target."""
+
+        wanted = privilege.upper() if privilege else None
+        snapshot = self._snapshot(realm)
+        holders: Dict[str, Set[str]] = {}
+        with self._lock:
+            by_securable = snapshot.securables.get(catalog, {})
+            for key in covering_keys(namespace, entity, kind):
+                for catalog_role, held in by_securable.get(key, {}).items():
+                    granted = held if wanted is None else held & {wanted}
+                    if not granted:
+                        continue
+                    for principal_role in snapshot.assignees.get(
+                        (catalog, catalog_role), ()
+                    ):
+                        for principal in snapshot.role_principals.get(
+                            principal_role, ()
+                        ):
+                            holders.setdefault(principal, set()).update(granted)
+        return {
+            "principals": [
+                {"principal": principal, "privileges": sorted(holders[principal])}
+                for principal in sorted(holders)
+            ]
+        }
+
+    def iter_matrix(
+        self, realm: Optional[str] = None, expand: bool = True
+    ) -> Iterator[JSONDict]:
+        """Yield one access-matrix row per principal, securable and privilege.
+
+        Rows are produced one principal at a time, so only that principal's rows are
+        held in memory. With ``expand`` implied privileges get their own rows, with
+        ``grantedPrivilege`` naming the privilege actually granted.
+        """
+
+        snapshot = self._snapshot(realm)
+        with self._lock:
+            principals = sorted(snapshot.principal_roles)
+            bindings: Dict[str, List[Tuple[str, str]]] = {}
+            for (catalog, role), catalog_roles in snapshot.role_catalog_roles.items():
+                bindings.setdefault(role, []).extend(
+                    (catalog, catalog_role) for catalog_role in catalog_roles
+                )
+        for principal in principals:
+            rows: List[JSONDict] = []
+            with self._lock:
+                for principal_role in sorted(
+                    snapshot.principal_roles.get(principal, ())
+                ):
+                    for catalog, catalog_role in sorted(
+                        bindings.get(principal_role, ())
+                    ):
+                        for grant in snapshot.grants.get((catalog, catalog_role), ()):
+                            key = securable_key(grant)
+                            granted = grant.get("privilege")
+                            if key is None or not isinstance(granted, str):
+                                continue
+                            base: JSONDict = {
+                                "principal": principal,
+                                "principalRole": principal_role,
+                                "catalog": catalog,
+                                "catalogRole": catalog_role,
+                                "securableType": key[0],
+                                "securable": _describe_key(key).partition(":")[2],
+                            }
+                            for privilege in (
+                                sorted(expand_privileges([granted]))
+                                if expand
+                                else [granted]
+                            ):
+                                rows.append(
+                                    dict(
+                                        base,
+                                        privilege=privilege,
+                                        grantedPrivilege=granted,
+                                    )
+                                )
+            yield from rows
+
+    def refresh_principal(self, principal: str, realm: Optional[str] = None) -> None:
+        """Reload the principal roles of ``principal`` after an assignment change."""
+
+        self._update(
+            realm,
+            lambda: list_principal_roles(self._management_rest, principal, realm),
+            lambda snapshot, roles: snapshot.set_principal(principal, roles),
+        )
+
+    def forget_principal(self, principal: str, realm: Optional[str] = None) -> None:
+        self._update(
+            realm, None, lambda snapshot, _: snapshot.drop_principal(principal)
+        )
+
+    def refresh_catalog_role(
+        self, catalog: str, catalog_role: str, realm: Optional[str] = None
+    ) -> None:
+        """Reload the grants and assignees of ``catalog_role`` after a change."""
+
+        self._update(
+            realm,
+            lambda: self._load_catalog_role(catalog, catalog_role, realm),
+            lambda snapshot, loaded: snapshot.set_catalog_role(
+                catalog, catalog_role, *loaded
+            ),
+        )
+
+    def forget_catalog_role(
+        self, catalog: str, catalog_role: str, realm: Optional[str] = None
+    ) -> None:
+        self._update(
+            realm,
+            None,
+            lambda snapshot, _: snapshot.drop_catalog_role(catalog, catalog_role),
+        )
+
+    def forget_principal_role(
+        self, principal_role: str, realm: Optional[str] = None
+    ) -> None:
+        self._update(
+            realm,
+            None,
+            lambda snapshot, _: snapshot.drop_principal_role(principal_role),
+        )
+
+    def _update(
+        self,
+        realm: Optional[str],
+        load: Optional[Callable[[], Any]],
+        apply: Callable[[_RbacSnapshot, Any], None],
+    ) -> None:
+        if self._role_graph is not None:
+            self._role_graph.invalidate()
+        scope = self._scope(realm)
+        with self._lock:
+            if scope not in self._snapshots:
+                return
+        try:
+            loaded = load() if load is not None else None
+        except Exception:
+            # A partial update would leave the index wrong; rebuild on next use instead.
+            logger.warning("Failed to refresh the RBAC index", exc_info=True)
+            with self._lock:
+                self._snapshots.pop(scope, None)
+            return
+        with self._lock:
+            snapshot = self._snapshots.get(scope)
+            if snapshot is not None:
+                apply(snapshot, loaded)
+
+    def _snapshot(self, realm: Optional[str]) -> _RbacSnapshot:
+        with self._lock:
+            snapshot = self._snapshots.get(self._scope(realm))
+        if snapshot is None:
+            self.build(realm)
+            with self._lock:
+                snapshot = self._snapshots[self._scope(realm)]
+        return snapshot
+
+    def _load_catalog_role(
+        self, catalog: str, catalog_role: str, realm: Optional[str]
+    ) -> Tuple[List[str], List[JSONDict]]:
+        assignees = list_catalog_role_assignees(
+            self._management_rest, catalog, catalog_role, realm
+        )
+        grants = list_grants(self._management_rest, catalog, catalog_role, realm)
+        return assignees, grants
+
+    def _scope(self, realm: Optional[str]) -> str:
+        return self._management_rest.identity({"realm": realm})
+
+
+def write_matrix(
+    rows: Iterable[JSONDict], path: str, fmt: str, export_dir: Optional[str]
+) -> JSONDict:
+    """Stream ``rows`` to ``path`` under ``export_dir`` as JSONL or CSV and return a summary."""
+
+    if fmt not in MATRIX_FORMATS:
+        raise ValueError("format must be one of " + ", ".join(MATRIX_FORMATS))
+    principals: Set[str] = set()
+    catalogs: Set[str] = set()
+
+    def tracked() -> Iterator[JSONDict]:
+        for row in rows:
+            principals.add(row["principal"])
+            catalogs.add(row["catalog"])
+            yield row
+
+    if fmt == "csv":
+        export = write_csv(tracked(), path, MATRIX_COLUMNS, export_dir)
+    else:
+        export = write_jsonl(tracked(), path, export_dir)
+    return {
+        "path": export["path"],
+        "format": fmt,
+        "rows": export["rows"],
+        "principals": len(principals),
+        "catalogs": len(catalogs),
+        "bytes": export["bytes"],
+    }
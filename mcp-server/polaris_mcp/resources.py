@@ -0,0 +1,423 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Cached, subscribable views of Polaris catalogs, namespaces and tables as MCP resources."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
+from urllib.parse import quote, unquote, urlparse
+
+from polaris_mcp.base import JSONDict, NAMESPACE_PATH_DELIMITER
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.listing import (
+    Namespace,
+    list_catalogs,
+    list_namespaces,
+    list_tables,
+    list_views,
+    load_table,
+)
+from polaris_mcp.rest import PolarisRestTool
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_SCHEME = "polaris"
+DEFAULT_REALM_SEGMENT = "default"
+DEFAULT_RESOURCE_TTL_SECONDS = 30.0
+DEFAULT_RESOURCE_POLL_SECONDS = 30.0
+DEFAULT_RESOURCE_CACHE_ENTRIES = 256
+
+
+def parse_namespace(value: str) -> Namespace:
+    """Split a namespace URI segment on the unit separator, or on dots when absent."""
+
+    delimiter = NAMESPACE_PATH_DELIMITER if NAMESPACE_PATH_DELIMITER in value else "."
+    parts = tuple(part for part in value.split(delimiter) if part)
+    if not parts:
+        raise ValueError(f"Invalid namespace in resource URI: {value!r}")
+    return parts
+
+
+def format_namespace(namespace: Sequence[str]) -> str:
+    delimiter = (
+        NAMESPACE_PATH_DELIMITER if any("." in part for part in namespace) else "."
+    )
+    return delimiter.join(namespace)
+
+
+@dataclass(frozen=True)
+class ResourceKey:
+    """Address of a resource: a realm, a catalog, a namespace or a table."""
+
+    realm: str = ""
+    catalog: Optional[str] = None
+    namespace: Optional[Namespace] = None
+    table: Optional[str] = None
+
+    @property
+    def kind(self) -> str:
+        if self.table is not None:
+            return "table"
+        if self.namespace is not None:
+            return "namespace"
+        if self.catalog is not None:
+            return "catalog"
+        return "realm"
+
+    @property
+    def uri(self) -> str:
+        segments = [self.realm or DEFAULT_REALM_SEGMENT]
+        if self.catalog is not None:
+            segments.append(self.catalog)
+        if self.namespace is not None:
+            segments.append(format_namespace(self.namespace))
+        if self.table is not None:
+            segments.append(self.table)
+        return f"{RESOURCE_SCHEME}://" + "/".join(
+            quote(segment, safe=".") for segment in segments
+        )
+
+    @classmethod
+    def from_segments(
+        cls,
+        realm: str,
+        catalog: Optional[str] = None,
+        namespace: Optional[str] = None,
+        table: Optional[str] = None,
+    ) -> "ResourceKey":
+        return cls(
+            realm="" if realm == DEFAULT_REALM_SEGMENT else realm,
+            catalog=catalog,
+            namespace=parse_namespace(namespace) if namespace is not None else None,
+            table=table,
+        )
+
+    @classmethod
+    def parse(cls, uri: str) -> "ResourceKey":
+        parsed = urlparse(uri)
+        if parsed.scheme != RESOURCE_SCHEME or not parsed.netloc:
+            raise ValueError(f"Unsupported resource URI: {uri}")
+        segments = [unquote(parsed.netloc)] + [
+            unquote(segment) for segment in parsed.path.split("/") if segment
+        ]
+        if len(segments) > 4:
+            raise ValueError(f"Unsupported resource URI: {uri}")
+        return cls.from_segments(*segments)
+
+
+@dataclass
+class _CacheEntry:
+    value: JSONDict
+    fetched_at: float
+    etag: Optional[str] = None
+
+
+class PolarisResourceCache:
+    """Shared read-through cache behind the ``polaris://`` resources.
+
+    Listings are re-fetched once older than the TTL; tables are revalidated with
+    ``If-None-Match`` so an unchanged table costs a ``304`` rather than its metadata.
+    At most ``max_entries`` resources are retained, least recently used first out;
+    resources pinned by a subscription are evicted only when nothing else is left.
+    """
+
+    def __init__(
+        self,
+        catalog_rest: PolarisRestTool,
+        management_rest: PolarisRestTool,
+        ttl_seconds: float = DEFAULT_RESOURCE_TTL_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_entries: int = DEFAULT_RESOURCE_CACHE_ENTRIES,
+    ) -> None:
+        self._catalog_rest = catalog_rest
+        self._management_rest = management_rest
+        self._ttl_seconds = ttl_seconds
+        self._max_concurrency = max(max_concurrency, 1)
+        self._max_entries = max(max_entries, 1)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ResourceKey, _CacheEntry]" = OrderedDict()
+        self._pinned: Set[ResourceKey] = set()
+
+    def read(self, key: ResourceKey) -> JSONDict:
+        """Return the resource body, fetching it only when missing or stale."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and time.time() - entry.fetched_at < self._ttl_seconds:
+            return entry.value
+        return self._refresh(key, entry)[0].value
+
+    def revalidate(self, keys: Sequence[ResourceKey]) -> List[ResourceKey]:
+        """Refresh the given resources regardless of age and return those that changed.
+
+        Resources that were not cached yet are loaded as a baseline and not reported.
+        """
+
+        def refresh(key: ResourceKey) -> bool:
+            with self._lock:
+                entry = self._entries.get(key)
+            return self._refresh(key, entry)[1]
+
+        changed: List[ResourceKey] = []
+        for outcome in run_concurrently(refresh, keys, self._max_concurrency):
+            if outcome.error is not None:
+                logger.warning(
+                    "Resource revalidation failed",
+                    extra={"uri": outcome.item.uri, "error": str(outcome.error)},
+                )
+            elif outcome.result:
+                changed.append(outcome.item)
+        return changed
+
+    def pin(self, key: ResourceKey) -> None:
+        """Prefer evicting other resources over ``key`` while it is subscribed."""
+
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: ResourceKey) -> None:
+        with self._lock:
+            self._pinned.discard(key)
+
+    def invalidate(self, key: Optional[ResourceKey] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _refresh(
+        self, key: ResourceKey, entry: Optional[_CacheEntry]
+    ) -> Tuple[_CacheEntry, bool]:
+        if key.kind == "table":
+            value, etag = self._load_table(key, entry)
+        else:
+            value, etag = self._list(key), None
+        now = time.time()
+        if value is None and entry is not None:
+            refreshed = _CacheEntry(value=entry.value, fetched_at=now, etag=entry.etag)
+            changed = False
+        else:
+            refreshed = _CacheEntry(value=value or {}, fetched_at=now, etag=etag)
+            changed = entry is not None and entry.value != refreshed.value
+        with self._lock:
+            self._entries[key] = refreshed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                victim = next(
+                    (k for k in self._entries if k not in self._pinned),
+                    next(iter(self._entries)),
+                )
+                del self._entries[victim]
+        return refreshed, changed
+
+    def _load_table(
+        self, key: ResourceKey, entry: Optional[_CacheEntry]
+    ) -> Tuple[Optional[JSONDict], Optional[str]]:
+        assert key.catalog is not None and key.namespace is not None
+        assert key.table is not None
+        response = load_table(
+            self._catalog_rest,
+            key.catalog,
+            key.namespace,
+            key.table,
+            realm=key.realm or None,
+            etag=entry.etag if entry else None,
+            query={"snapshots": "refs"},
+        )
+        if response.status == 304:
+            return None, None
+        if response.status == 404:
+            raise LookupError(f"Table not found: {key.uri}")
+        if not response.ok:
+            raise RuntimeError(f"loadTable returned {response.status}")
+        body = response.body if isinstance(response.body, dict) else {}
+        return body, response.header("ETag")
+
+    def _list(self, key: ResourceKey) -> JSONDict:
+        realm = key.realm or None
+        if key.catalog is None:
+            return {"catalogs": list_catalogs(self._management_rest, realm)}
+        if key.namespace is None:
+            namespaces = list_namespaces(self._catalog_rest, key.catalog, realm=realm)
+            return {
+                "catalog": key.catalog,
+                "namespaces": [list(namespace) for namespace in namespaces],
+            }
+        children = list_namespaces(
+            self._catalog_rest, key.catalog, parent=key.namespace, realm=realm
+        )
+        return {
+            "catalog": key.catalog,
+            "namespace": list(key.namespace),
+            "namespaces": [list(child) for child in children],
+            "tables": list_tables(
+                self._catalog_rest, key.catalog, key.namespace, realm
+            ),
+            "views": list_views(self._catalog_rest, key.catalog, key.namespace, realm),
+        }
+
+
+class ResourceSubscriber(Protocol):
+    """Receiver of change notifications for subscribed resources."""
+
+    def resource_updated(self, uri: str) -> None: ...
+
+    def resource_list_changed(self) -> None: ...
+
+
+class ResourceSubscriptions:
+    """Track resource subscriptions and poll the subscribed resources in the background.
+
+    Each polling round revalidates only subscribed resources through the shared cache.
+    Subscribers receive ``resource_updated`` for resources that changed, and
+    ``resource_list_changed`` when a subscribed listing gained or lost entries. A
+    subscriber whose notification fails (typically because its session has ended) is
+    dropped from every resource it subscribed to.
+    """
+
+    def __init__(
+        self,
+        cache: PolarisResourceCache,
+        poll_interval_seconds: float = DEFAULT_RESOURCE_POLL_SECONDS,
+    ) -> None:
+        self._cache = cache
+        self._poll_interval_seconds = poll_interval_seconds
+        self._lock = threading.Lock()
+        self._subscribers: Dict[ResourceKey, Set[ResourceSubscriber]] = {}
+        self._wakeup = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+
+    def subscribe(self, uri: str, subscriber: ResourceSubscriber) -> None:
+        key = ResourceKey.parse(uri)
+        # Prime the cache so the first polling round has a baseline to compare with.
+        self._cache.read(key)
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(subscriber)
+            self._cache.pin(key)
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._run,
+                    args=(self._wakeup,),
+                    name="polaris-resource-poller",
+                    daemon=True,
+                )
+                self._poller.start()
+
+    def unsubscribe(self, uri: str, subscriber: ResourceSubscriber) -> None:
+        key = ResourceKey.parse(uri)
+        with self._lock:
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                self._forget(key)
+
+    def drop(self, subscriber: ResourceSubscriber) -> None:
+        """Remove every subscription held by ``subscriber``."""
+
+        with self._lock:
+            for key in list(self._subscribers):
+                subscribers = self._subscribers[key]
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    self._forget(key)
+
+    def subscribed(self) -> List[str]:
+        with self._lock:
+            return sorted(key.uri for key in self._subscribers)
+
+    def poll(self) -> List[ResourceKey]:
+        """Run one polling round, notify subscribers and return the changed resources."""
+
+        with self._lock:
+            keys = list(self._subscribers)
+        changed = self._cache.revalidate(keys)
+        if not changed:
+            return changed
+        with self._lock:
+            targets = [(key, set(self._subscribers.get(key, ()))) for key in changed]
+        listing_changed: Set[ResourceSubscriber] = set()
+        failed: Set[ResourceSubscriber] = set()
+        for key, subscribers in targets:
+            for subscriber in subscribers.difference(failed):
+                if not self._notify(subscriber.resource_updated, key.uri):
+                    failed.add(subscriber)
+                elif key.kind != "table":
+                    listing_changed.add(subscriber)
+        for subscriber in listing_changed.difference(failed):
+            if not self._notify(subscriber.resource_list_changed):
+                failed.add(subscriber)
+        for subscriber in failed:
+            self.drop(subscriber)
+        return changed
+
+    def close(self) -> None:
+        """Stop polling and forget all subscriptions; a later subscribe starts afresh."""
+
+        with self._lock:
+            for key in list(self._subscribers):
+                self._forget(key)
+            self._wakeup.set()
+            self._wakeup = threading.Event()
+            self._poller = None
+
+    def _forget(self, key: ResourceKey) -> None:
+        # Called with ``self._lock`` held.
+        del self._subscribers[key]
+        self._cache.unpin(key)
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self._poll_interval_seconds):
+            try:
+                self.poll()
+            except Exception:  # pragma: no cover - background failures are logged only
+                logger.exception("Resource polling failed")
+
+    @staticmethod
+    def _notify(callback: Callable[..., None], *args: Any) -> bool:
+        try:
+            callback(*args)
+        except Exception:
+            logger.debug(
+                "Dropping subscriber after failed resource notification",
+                exc_info=True,
+            )
+            return False
+        return True
@@ -21,9 +21,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit, quote
 
 import urllib3
@@ -31,6 +33,8 @@ from fastmcp.server.dependencies import get_http_headers
 
 from polaris_mcp.authorization import AuthorizationProvider, none
 from polaris_mcp.base import JSONDict, ToolExecutionResult
+from polaris_mcp.projection import SELECT_SCHEMA, parse_selectors, select_fields
+from polaris_mcp.routing import Backend, RealmRouter
 
 
 def encode_path_segment(value: str) -> str:
@@ -139,6 +143,28 @@ def _maybe_parse_json(text: Optional[str]) -> Tuple[Optional[Any], Optional[str]
         return None, text
 
 
+@dataclass(frozen=True)
+class RestResponse:
+    """Decoded HTTP response returned by :meth:`PolarisRestTool.fetch`."""
+
+    status: int
+    headers: Dict[str, str]
+    body: Any
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    def header(self, name: str) -> Optional[str]:
+        """Return a response header value using a case-insensitive lookup."""
+
+        lowered = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == lowered:
+                return value
+        return None
+
+
 class PolarisRestTool:
     """Issues HTTP requests against the Polaris REST API and packages the response."""
 
@@ -151,12 +177,15 @@ class PolarisRestTool:
         http: urllib3.PoolManager,
         timeout: urllib3.Timeout,
         authorization_provider: Optional[AuthorizationProvider] = None,
+        router: Optional[RealmRouter] = None,
     ) -> None:
         self._name = name
         self._description = description
-        self._base_url = _ensure_trailing_slash(base_url)
         self._path_prefix = _normalize_prefix(default_path_prefix)
-        self._http = http
+        # Realms served by another deployment are sent to its base URL and pool.
+        self._router = router or RealmRouter(
+            Backend(base_url=_ensure_trailing_slash(base_url), http=http)
+        )
         self._authorization = authorization_provider or none()
         self._timeout = timeout
 
@@ -219,57 +248,39 @@ class PolarisRestTool:
                         "are sent as-is."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["path"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
-        if not isinstance(arguments, dict):
-            raise ValueError("Tool arguments must be a JSON object.")
-
-        method = str(arguments.get("method", "GET") or "GET").strip().upper() or "GET"
-        path = self._require_path(arguments)
-        query_params = arguments.get("query")
-        headers_param = arguments.get("headers")
-        body_node = arguments.get("body")
-        realm = arguments.get("realm")
-
-        query = query_params if isinstance(query_params, dict) else None
-        headers = headers_param if isinstance(headers_param, dict) else None
-
-        target_uri = self._resolve_target_uri(path, query)
-
-        header_values = _merge_headers(headers)
-        if not any(name.lower() == "authorization" for name in header_values):
-            token = self._authorization.authorization_header(realm)
-            if token:
-                header_values["Authorization"] = token
-            else:
-                incoming = get_http_headers(include={"authorization"})
-                incoming_auth = incoming.get("authorization", "")
-                if incoming_auth:
-                    header_values["Authorization"] = incoming_auth
-        header_name = os.getenv("POLARIS_REALM_CONTEXT_HEADER_NAME", "Polaris-Realm")
-        if realm and not any(
-            name.lower() == header_name.lower() for name in header_values
-        ):
-            header_values[header_name] = realm
+    def call(
+        self,
+        arguments: Any,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> ToolExecutionResult:
+        """Issue a request and render the exchange as a tool result.
 
-        body_text = _serialize_body(body_node)
-        if body_text is not None and not any(
-            name.lower() == "content-type" for name in header_values
-        ):
-            header_values["Content-Type"] = "application/json"
+        ``transform`` reshapes a successful JSON response body (for example into a table
+        summary) and the ``select`` argument then projects it; both are applied before
+        rendering so only the reduced body is rendered, logged and returned.
+        """
 
-        response = self._http.request(
-            method,
-            target_uri,
-            body=body_text.encode("utf-8") if body_text is not None else None,
-            headers=header_values,
-            timeout=self._timeout,
-        )
+        selectors = None
+        if isinstance(arguments, dict) and arguments.get("select") is not None:
+            selectors = parse_selectors(arguments["select"])
+        method, target_uri, header_values, body_text, response = self._send(arguments)
 
         response_body = response.data.decode("utf-8") if response.data else ""
+        projected = False
+        if (transform is not None or selectors) and response.status < 400:
+            parsed, _ = _maybe_parse_json(response_body or None)
+            if parsed is not None:
+                if transform is not None:
+                    parsed = transform(parsed)
+                if selectors:
+                    parsed = select_fields(parsed, selectors)
+                response_body = json.dumps(parsed)
+                projected = True
         rendered_body = _pretty_body(response_body)
 
         lines = [f"{method} {target_uri}", f"Status: {response.status}"]
@@ -308,10 +319,94 @@ class PolarisRestTool:
                 metadata["response"]["body"] = parsed
             elif fallback is not None:
                 metadata["response"]["bodyText"] = fallback
+        if projected and selectors:
+            metadata["response"]["select"] = selectors
 
         is_error = response.status >= 400
         return ToolExecutionResult(message, is_error, metadata)
 
+    def fetch(self, arguments: Any) -> RestResponse:
+        """Issue a request and return the decoded response without rendering a transcript.
+
+        Accepts the same arguments as :meth:`call`. Intended for server-side helpers that
+        consume Polaris responses directly instead of handing them to the MCP client.
+        """
+
+        _, _, _, _, response = self._send(arguments)
+        response_body = response.data.decode("utf-8") if response.data else ""
+        parsed, fallback = _maybe_parse_json(response_body or None)
+        return RestResponse(
+            status=response.status,
+            headers=_headers_to_dict(response.headers),
+            body=parsed if parsed is not None else fallback,
+        )
+
+    def _send(
+        self, arguments: Any
+    ) -> Tuple[str, str, Dict[str, str], Optional[str], Any]:
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+
+        method = str(arguments.get("method", "GET") or "GET").strip().upper() or "GET"
+        path = self._require_path(arguments)
+        query_params = arguments.get("query")
+        headers_param = arguments.get("headers")
+        body_node = arguments.get("body")
+        realm = arguments.get("realm")
+
+        query = query_params if isinstance(query_params, dict) else None
+        headers = headers_param if isinstance(headers_param, dict) else None
+
+        backend = self._router.backend(realm)
+        target_uri = self._resolve_target_uri(path, query, backend.base_url)
+
+        header_values = _merge_headers(headers)
+        if not any(name.lower() == "authorization" for name in header_values):
+            authorization = self._resolve_authorization(realm)
+            if authorization:
+                header_values["Authorization"] = authorization
+        header_name = os.getenv("POLARIS_REALM_CONTEXT_HEADER_NAME", "Polaris-Realm")
+        if realm and not any(
+            name.lower() == header_name.lower() for name in header_values
+        ):
+            header_values[header_name] = realm
+
+        body_text = _serialize_body(body_node)
+        if body_text is not None and not any(
+            name.lower() == "content-type" for name in header_values
+        ):
+            header_values["Content-Type"] = "application/json"
+
+        response = backend.http.request(
+            method,
+            target_uri,
+            body=body_text.encode("utf-8") if body_text is not None else None,
+            headers=header_values,
+            timeout=self._timeout,
+        )
+        return method, target_uri, header_values, body_text, response
+
+    def identity(self, arguments: Dict[str, Any]) -> str:
+        """Return a stable, non-reversible fingerprint of the caller a request acts as."""
+
+        headers = arguments.get("headers")
+        explicit = None
+        if isinstance(headers, dict):
+            explicit = next(
+                (v for k, v in headers.items() if k.lower() == "authorization"), None
+            )
+        realm = arguments.get("realm")
+        authorization = explicit or self._resolve_authorization(realm) or ""
+        digest = hashlib.sha256(str(authorization).encode("utf-8")).hexdigest()
+        return f"{realm or ''}:{digest[:32]}"
+
+    def _resolve_authorization(self, realm: Optional[str]) -> Optional[str]:
+        token = self._authorization.authorization_header(realm)
+        if token:
+            return token
+        incoming = get_http_headers(include={"authorization"})
+        return incoming.get("authorization") or None
+
     def _require_path(self, args: Dict[str, Any]) -> str:
         path = args.get("path")
         if not isinstance(path, str) or not path.strip():
@@ -333,14 +428,16 @@ class PolarisRestTool:
 
         return sanitized
 
-    def _resolve_target_uri(self, path: str, query: Optional[Dict[str, Any]]) -> str:
+    def _resolve_target_uri(
+        self, path: str, query: Optional[Dict[str, Any]], base_url: str
+    ) -> str:
         if path.startswith(("http://", "https://")):
             target = path
         else:
             relative = path[1:] if path.startswith("/") else path
             if self._path_prefix:
                 relative = f"{self._path_prefix}{relative}"
-            target = urljoin(self._base_url, relative)
+            target = urljoin(_ensure_trailing_slash(base_url), relative)
 
         params = _build_query(query)
         return _append_query(target, params)
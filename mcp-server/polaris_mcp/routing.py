@@ -0,0 +1,109 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+"""Route realms to the Polaris deployment that serves them."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional
+
+import urllib3
+
+_ROUTE_PREFIX = "POLARIS_REALM_"
+_ROUTE_SUFFIX = "_BASE_URL"
+
+
+def _ensure_trailing_slash(url: str) -> str:
+    return url if url.endswith("/") else f"{url}/"
+
+
+@dataclass(frozen=True)
+class Backend:
+    """A Polaris deployment and the connection pool dedicated to it."""
+
+    base_url: str
+    http: urllib3.PoolManager
+
+
+class RealmRouter:
+    """Map realms to backends; realms without a route use the default backend."""
+
+    def __init__(
+        self, default: Backend, routes: Optional[Mapping[str, Backend]] = None
+    ) -> None:
+        self._default = default
+        self._routes = dict(routes or {})
+
+    @property
+    def default(self) -> Backend:
+        return self._default
+
+    def backend(self, realm: Optional[str]) -> Backend:
+        """Return the backend serving ``realm``."""
+
+        if realm and realm in self._routes:
+            return self._routes[realm]
+        return self._default
+
+    def backends(self) -> List[Backend]:
+        """Return each distinct backend once, the default first."""
+
+        distinct = [self._default]
+        for backend in self._routes.values():
+            if all(backend is not seen for seen in distinct):
+                distinct.append(backend)
+        return distinct
+
+
+def configured_routes(environ: Optional[Mapping[str, str]] = None) -> Dict[str, str]:
+    """Return ``{realm: base_url}`` from ``POLARIS_REALM_{realm}_BASE_URL`` variables."""
+
+    env = os.environ if environ is None else environ
+    routes: Dict[str, str] = {}
+    for key, value in env.items():
+        if not (key.startswith(_ROUTE_PREFIX) and key.endswith(_ROUTE_SUFFIX)):
+            continue
+        realm = key[len(_ROUTE_PREFIX) : -len(_ROUTE_SUFFIX)]
+        if realm and value.strip():
+            routes[realm] = value.strip()
+    return routes
+
+
+def build_router(
+    default: Backend,
+    routes: Mapping[str, str],
+    pool_factory: Callable[[], urllib3.PoolManager],
+) -> RealmRouter:
+    """Create a router giving every distinct base URL its own connection pool.
+
+    Realms routed to the same deployment share one pool, and realms routed to the
+    default base URL reuse the default pool, so a slow cluster cannot exhaust the
+    connections of another.
+    """
+
+    backends: Dict[str, Backend] = {_ensure_trailing_slash(default.base_url): default}
+    routed: Dict[str, Backend] = {}
+    for realm, base_url in routes.items():
+        key = _ensure_trailing_slash(base_url)
+        if key not in backends:
+            backends[key] = Backend(base_url=key, http=pool_factory())
+        routed[realm] = backends[key]
+    return RealmRouter(default, routed)
@@ -25,14 +25,29 @@ import sys
 import logging
 import logging.config
 import argparse
+import json
+import asyncio
+import functools
 import os
-from typing import Any, Mapping, MutableMapping, Sequence, Optional
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Optional,
+)
 from urllib.parse import urlparse
 
+import anyio.from_thread
+import anyio.to_thread
 import urllib3
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from fastmcp.resources import ResourceContent, ResourceResult
 from fastmcp.tools.tool import ToolResult as FastMcpToolResult
 from importlib import metadata
+from mcp.server.session import ServerSession
 from mcp.types import TextContent
 from dotenv import find_dotenv, load_dotenv
 
@@ -40,19 +55,55 @@ from polaris_mcp.authorization import (
     AuthorizationProvider,
     ClientCredentialsAuthorizationProvider,
     StaticAuthorizationProvider,
+    configured_realms,
     none,
 )
-from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.base import ProgressCallback, ToolExecutionResult
+from polaris_mcp.bulk import DEFAULT_BULK_REQUESTS_PER_SECOND
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY
+from polaris_mcp.credentials import (
+    DEFAULT_CREDENTIAL_REFRESH_BUFFER_SECONDS,
+    VendedCredentialCache,
+    redact_credentials,
+)
+from polaris_mcp.fanout import RealmFanOut
+from polaris_mcp.inventory import DEFAULT_MAX_CHANGES, InventoryStore, PolarisInventory
+from polaris_mcp.policies import (
+    DEFAULT_POLICY_CACHE_TTL_SECONDS,
+    ApplicablePolicyCache,
+)
+from polaris_mcp.maintenance import MaintenanceScanner
+from polaris_mcp.metadata import DEFAULT_METADATA_CACHE_ENTRIES, TableMetadataCache
+from polaris_mcp.rbac import DEFAULT_RBAC_CACHE_TTL_SECONDS, RbacIndex, RoleGraph
+from polaris_mcp.resources import (
+    DEFAULT_RESOURCE_CACHE_ENTRIES,
+    DEFAULT_RESOURCE_POLL_SECONDS,
+    DEFAULT_RESOURCE_TTL_SECONDS,
+    PolarisResourceCache,
+    ResourceKey,
+    ResourceSubscriptions,
+)
 from polaris_mcp.rest import PolarisRestTool
+from polaris_mcp.routing import (
+    Backend,
+    RealmRouter,
+    build_router,
+    configured_routes,
+)
 from polaris_mcp.tools import (
+    PolarisAccessTool,
     PolarisCatalogRoleTool,
     PolarisCatalogTool,
+    PolarisInventoryTool,
+    PolarisMaintenanceTool,
     PolarisNamespaceTool,
     PolarisPolicyTool,
     PolarisPrincipalRoleTool,
     PolarisPrincipalTool,
     PolarisTableTool,
+    PolarisTableWatchTool,
 )
+from polaris_mcp.watch import TableWatcher
 
 DEFAULT_BASE_URL = "http://localhost:8181/"
 OUTPUT_SCHEMA = {
@@ -69,6 +120,9 @@ DEFAULT_HTTP_TIMEOUT = 30.0
 DEFAULT_HTTP_RETRIES_TOTAL = 3
 DEFAULT_HTTP_RETRIES_BACKOFF_FACTOR = 0.5
 HTTP_RETRIES_STATUS_FORCELIST = [401, 409, 429]
+DEFAULT_INVENTORY_REVALIDATE_SECONDS = 300.0
+DEFAULT_TABLE_SNAPSHOTS_MODE = "refs"
+SESSION_NOTIFY_TIMEOUT_SECONDS = 10.0
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -107,8 +161,24 @@ def create_server() -> FastMCP:
         backoff_factor=backoff_factor,
         status_forcelist=HTTP_RETRIES_STATUS_FORCELIST,
     )
-    http = urllib3.PoolManager(retries=retry_strategy)
-    authorization_provider = _resolve_authorization_provider(base_url, http, timeout)
+    max_concurrency = max(
+        int(os.getenv("POLARIS_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)), 1
+    )
+
+    def new_pool() -> urllib3.PoolManager:
+        # Size the per-host pool to the fan-out width so concurrent requests reuse connections.
+        return urllib3.PoolManager(retries=retry_strategy, maxsize=max_concurrency)
+
+    http = new_pool()
+    # Each deployment named by POLARIS_REALM_{realm}_BASE_URL gets a pool of its own.
+    router = build_router(
+        Backend(base_url=base_url, http=http),
+        {realm: _validate_base_url(url) for realm, url in configured_routes().items()},
+        new_pool,
+    )
+    authorization_provider = _resolve_authorization_provider(
+        base_url, http, timeout, router
+    )
     catalog_rest = PolarisRestTool(
         name="polaris.rest.catalog",
         description="Shared REST delegate for catalog operations",
@@ -117,6 +187,7 @@ def create_server() -> FastMCP:
         http=http,
         authorization_provider=authorization_provider,
         timeout=timeout,
+        router=router,
     )
     management_rest = PolarisRestTool(
         name="polaris.rest.management",
@@ -126,6 +197,7 @@ def create_server() -> FastMCP:
         http=http,
         authorization_provider=authorization_provider,
         timeout=timeout,
+        router=router,
     )
     policy_rest = PolarisRestTool(
         name="polaris.rest.policy",
@@ -135,15 +207,144 @@ def create_server() -> FastMCP:
         http=http,
         authorization_provider=authorization_provider,
         timeout=timeout,
+        router=router,
     )
 
-    table_tool = PolarisTableTool(rest_client=catalog_rest)
-    namespace_tool = PolarisNamespaceTool(rest_client=catalog_rest)
-    principal_tool = PolarisPrincipalTool(rest_client=management_rest)
-    principal_role_tool = PolarisPrincipalRoleTool(rest_client=management_rest)
-    catalog_role_tool = PolarisCatalogRoleTool(rest_client=management_rest)
-    policy_tool = PolarisPolicyTool(rest_client=policy_rest)
-    catalog_tool = PolarisCatalogTool(rest_client=management_rest)
+    export_dir = _resolve_export_dir()
+    table_tool = PolarisTableTool(
+        rest_client=catalog_rest,
+        snapshots_mode=os.getenv(
+            "POLARIS_TABLE_SNAPSHOTS_MODE", DEFAULT_TABLE_SNAPSHOTS_MODE
+        ),
+        max_concurrency=max_concurrency,
+        credential_cache=VendedCredentialCache(
+            refresh_buffer_seconds=_resolve_float(
+                "POLARIS_CREDENTIAL_REFRESH_BUFFER_SECONDS",
+                DEFAULT_CREDENTIAL_REFRESH_BUFFER_SECONDS,
+            )
+        ),
+        metadata_cache=TableMetadataCache(
+            catalog_rest=catalog_rest,
+            max_entries=int(
+                _resolve_float(
+                    "POLARIS_METADATA_CACHE_ENTRIES", DEFAULT_METADATA_CACHE_ENTRIES
+                )
+            ),
+        ),
+        export_dir=export_dir,
+    )
+    namespace_tool = PolarisNamespaceTool(
+        rest_client=catalog_rest,
+        max_concurrency=max_concurrency,
+        requests_per_second=_resolve_float(
+            "POLARIS_BULK_REQUESTS_PER_SECOND", DEFAULT_BULK_REQUESTS_PER_SECOND
+        ),
+        policy_rest_client=policy_rest,
+    )
+    role_graph = RoleGraph(
+        management_rest=management_rest,
+        ttl_seconds=_resolve_float(
+            "POLARIS_RBAC_CACHE_TTL_SECONDS", DEFAULT_RBAC_CACHE_TTL_SECONDS
+        ),
+        max_concurrency=max_concurrency,
+    )
+    rbac_index = RbacIndex(
+        management_rest=management_rest,
+        max_concurrency=max_concurrency,
+        role_graph=role_graph,
+    )
+    principal_tool = PolarisPrincipalTool(
+        rest_client=management_rest, rbac_index=rbac_index
+    )
+    principal_role_tool = PolarisPrincipalRoleTool(
+        rest_client=management_rest, rbac_index=rbac_index
+    )
+    catalog_role_tool = PolarisCatalogRoleTool(
+        rest_client=management_rest,
+        rbac_index=rbac_index,
+        max_concurrency=max_concurrency,
+        requests_per_second=_resolve_float(
+            "POLARIS_BULK_REQUESTS_PER_SECOND", DEFAULT_BULK_REQUESTS_PER_SECOND
+        ),
+    )
+    applicable_policies = ApplicablePolicyCache(
+        policy_rest=policy_rest,
+        ttl_seconds=_resolve_float(
+            "POLARIS_POLICY_CACHE_TTL_SECONDS", DEFAULT_POLICY_CACHE_TTL_SECONDS
+        ),
+        max_concurrency=max_concurrency,
+    )
+    policy_tool = PolarisPolicyTool(
+        rest_client=policy_rest,
+        applicable_cache=applicable_policies,
+        catalog_rest_client=catalog_rest,
+        max_concurrency=max_concurrency,
+        requests_per_second=_resolve_float(
+            "POLARIS_BULK_REQUESTS_PER_SECOND", DEFAULT_BULK_REQUESTS_PER_SECOND
+        ),
+    )
+    catalog_tool = PolarisCatalogTool(
+        rest_client=management_rest,
+        catalog_rest_client=catalog_rest,
+        max_concurrency=max_concurrency,
+        export_dir=export_dir,
+    )
+    inventory = PolarisInventory(
+        catalog_rest=catalog_rest,
+        management_rest=management_rest,
+        base_url=base_url,
+        router=router,
+        store=_resolve_inventory_store(),
+        revalidate_after_seconds=_resolve_float(
+            "POLARIS_INVENTORY_REVALIDATE_SECONDS",
+            DEFAULT_INVENTORY_REVALIDATE_SECONDS,
+        ),
+        max_concurrency=max_concurrency,
+    )
+    inventory.start()
+    inventory_tool = PolarisInventoryTool(inventory=inventory)
+    table_watcher = TableWatcher(
+        catalog_rest=catalog_rest, max_concurrency=max_concurrency
+    )
+    table_watch_tool = PolarisTableWatchTool(watcher=table_watcher)
+    access_tool = PolarisAccessTool(
+        role_graph=role_graph, rbac_index=rbac_index, export_dir=export_dir
+    )
+    maintenance_tool = PolarisMaintenanceTool(
+        scanner=MaintenanceScanner(
+            catalog_rest=catalog_rest,
+            policy_cache=applicable_policies,
+            max_concurrency=max_concurrency,
+        ),
+        export_dir=export_dir,
+    )
+    resource_cache = PolarisResourceCache(
+        catalog_rest=catalog_rest,
+        management_rest=management_rest,
+        ttl_seconds=_resolve_float(
+            "POLARIS_RESOURCE_TTL_SECONDS", DEFAULT_RESOURCE_TTL_SECONDS
+        ),
+        max_concurrency=max_concurrency,
+        max_entries=int(
+            _resolve_float(
+                "POLARIS_RESOURCE_CACHE_ENTRIES", DEFAULT_RESOURCE_CACHE_ENTRIES
+            )
+        ),
+    )
+    resource_subscriptions = ResourceSubscriptions(
+        cache=resource_cache,
+        poll_interval_seconds=_resolve_float(
+            "POLARIS_RESOURCE_POLL_SECONDS", DEFAULT_RESOURCE_POLL_SECONDS
+        ),
+    )
+
+    # Tool calls given a `realms` list run once per realm and merge the results.
+    call_tool = functools.partial(
+        _call_tool,
+        fan_out=RealmFanOut(
+            realms_provider=configured_realms, max_concurrency=max_concurrency
+        ),
+    )
 
     server_version = _resolve_package_version()
     mcp = FastMCP(
@@ -159,33 +360,69 @@ def create_server() -> FastMCP:
     def polaris_iceberg_table(
         operation: str,
         catalog: str,
-        namespace: str | Sequence[str],
+        namespace: str | Sequence[str] | None = None,
         table: str | None = None,
+        tables: Sequence[str | Mapping[str, Any]] | None = None,
+        kind: str | None = None,
+        manifest: Sequence[Mapping[str, Any]] | None = None,
+        manifestPath: str | None = None,
+        retries: int | None = None,
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        snapshots: str | None = None,
+        accessDelegation: str | Sequence[str] | None = None,
+        summary: bool | None = None,
+        windowHours: float | None = None,
+        windows: int | None = None,
+        fromVersion: Mapping[str, int] | None = None,
+        toVersion: Mapping[str, int] | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             table_tool,
             required={
                 "operation": operation,
                 "catalog": catalog,
-                "namespace": namespace,
             },
             optional={
+                "namespace": namespace,
                 "table": table,
+                "tables": tables,
+                "kind": kind,
+                "manifest": manifest,
+                "manifestPath": manifestPath,
+                "retries": retries,
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "snapshots": snapshots,
+                "accessDelegation": accessDelegation,
+                "summary": summary,
+                "windowHours": windowHours,
+                "windows": windows,
+                "fromVersion": fromVersion,
+                "toVersion": toVersion,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
+                "accessDelegation": _normalize_string_list,
+                "tables": _coerce_items,
+                "manifest": _coerce_items,
                 "namespace": _normalize_namespace,
+                "fromVersion": _copy_mapping,
+                "toVersion": _copy_mapping,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
             },
+            progress=_progress_reporter(ctx),
         )
 
     @mcp.tool(
@@ -197,12 +434,22 @@ def create_server() -> FastMCP:
         operation: str,
         catalog: str,
         namespace: str | Sequence[str] | None = None,
+        namespaces: Sequence[str | Sequence[str]] | None = None,
+        parent: str | Sequence[str] | None = None,
+        prefix: str | None = None,
+        ratePerSecond: float | None = None,
+        retries: int | None = None,
+        dryRun: bool | None = None,
+        purge: bool | None = None,
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             namespace_tool,
             required={
                 "operation": operation,
@@ -210,17 +457,30 @@ def create_server() -> FastMCP:
             },
             optional={
                 "namespace": namespace,
+                "namespaces": namespaces,
+                "parent": parent,
+                "prefix": prefix,
+                "ratePerSecond": ratePerSecond,
+                "retries": retries,
+                "dryRun": dryRun,
+                "purge": purge,
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "namespace": _normalize_namespace,
+                "namespaces": _normalize_namespaces,
+                "parent": _normalize_namespace,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
             },
+            progress=_progress_reporter(ctx),
         )
 
     @mcp.tool(
@@ -235,9 +495,11 @@ def create_server() -> FastMCP:
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             principal_tool,
             required={"operation": operation},
             optional={
@@ -246,9 +508,12 @@ def create_server() -> FastMCP:
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
@@ -268,9 +533,11 @@ def create_server() -> FastMCP:
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             principal_role_tool,
             required={"operation": operation},
             optional={
@@ -280,9 +547,12 @@ def create_server() -> FastMCP:
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
@@ -298,12 +568,19 @@ def create_server() -> FastMCP:
         operation: str,
         catalog: str,
         catalogRole: str | None = None,
+        desired: Mapping[str, Sequence[Mapping[str, Any]]] | None = None,
+        dryRun: bool | None = None,
+        ratePerSecond: float | None = None,
+        retries: int | None = None,
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             catalog_role_tool,
             required={
                 "operation": operation,
@@ -311,16 +588,25 @@ def create_server() -> FastMCP:
             },
             optional={
                 "catalogRole": catalogRole,
+                "desired": desired,
+                "dryRun": dryRun,
+                "ratePerSecond": ratePerSecond,
+                "retries": retries,
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
+                "desired": _coerce_grant_sets,
             },
+            progress=_progress_reporter(ctx),
         )
 
     @mcp.tool(
@@ -333,12 +619,25 @@ def create_server() -> FastMCP:
         catalog: str,
         namespace: str | Sequence[str] | None = None,
         policy: str | None = None,
+        targets: Sequence[str | Mapping[str, Any]] | None = None,
+        parent: str | Sequence[str] | None = None,
+        prefix: str | None = None,
+        targetType: str | None = None,
+        dryRun: bool | None = None,
+        ratePerSecond: float | None = None,
+        retries: int | None = None,
+        policyType: str | None = None,
+        includeContent: bool | None = None,
+        refresh: bool | None = None,
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             policy_tool,
             required={
                 "operation": operation,
@@ -347,17 +646,33 @@ def create_server() -> FastMCP:
             optional={
                 "namespace": namespace,
                 "policy": policy,
+                "targets": targets,
+                "parent": parent,
+                "prefix": prefix,
+                "targetType": targetType,
+                "dryRun": dryRun,
+                "ratePerSecond": ratePerSecond,
+                "retries": retries,
+                "policyType": policyType,
+                "includeContent": includeContent,
+                "refresh": refresh,
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "namespace": _normalize_namespace,
+                "targets": _coerce_items,
+                "parent": _normalize_namespace,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
             },
+            progress=_progress_reporter(ctx),
         )
 
     @mcp.tool(
@@ -368,37 +683,340 @@ def create_server() -> FastMCP:
     def polaris_catalog_request(
         operation: str,
         catalog: str | None = None,
+        targetCatalog: str | None = None,
+        targetRealm: str | None = None,
+        includeGrants: bool | None = None,
+        limit: int | None = None,
+        path: str | None = None,
         query: Mapping[str, str | Sequence[str]] | None = None,
         headers: Mapping[str, str | Sequence[str]] | None = None,
         body: Any | None = None,
+        select: str | Sequence[str] | None = None,
         realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
     ) -> FastMcpToolResult:
-        return _call_tool(
+        return call_tool(
             catalog_tool,
             required={"operation": operation},
             optional={
                 "catalog": catalog,
+                "targetCatalog": targetCatalog,
+                "targetRealm": targetRealm,
+                "includeGrants": includeGrants,
+                "limit": limit,
+                "path": path,
                 "query": query,
                 "headers": headers,
                 "body": body,
+                "select": select,
                 "realm": realm,
+                "realms": realms,
             },
             transforms={
+                "select": _normalize_string_list,
                 "query": _copy_mapping,
                 "headers": _copy_mapping,
                 "body": _coerce_body,
             },
+            progress=_progress_reporter(ctx),
         )
 
+    @mcp.tool(
+        name=inventory_tool.name,
+        description=inventory_tool.description,
+        output_schema=OUTPUT_SCHEMA,
+    )
+    def polaris_inventory_request(
+        operation: str,
+        catalog: str | None = None,
+        namespace: str | Sequence[str] | None = None,
+        mode: str | None = None,
+        since: int | None = None,
+        limit: int | None = None,
+        select: str | Sequence[str] | None = None,
+        realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+    ) -> FastMcpToolResult:
+        return call_tool(
+            inventory_tool,
+            required={"operation": operation},
+            optional={
+                "catalog": catalog,
+                "namespace": namespace,
+                "mode": mode,
+                "since": since,
+                "limit": limit,
+                "select": select,
+                "realm": realm,
+                "realms": realms,
+            },
+            transforms={
+                "namespace": _normalize_namespace,
+                "select": _normalize_string_list,
+            },
+        )
+
+    @mcp.tool(
+        name=table_watch_tool.name,
+        description=table_watch_tool.description,
+        output_schema=OUTPUT_SCHEMA,
+    )
+    def polaris_table_watch_request(
+        operation: str,
+        catalog: str | None = None,
+        tables: Sequence[str | Mapping[str, Any]] | None = None,
+        intervalSeconds: float | None = None,
+        durationSeconds: float | None = None,
+        select: str | Sequence[str] | None = None,
+        realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
+    ) -> FastMcpToolResult:
+        return call_tool(
+            table_watch_tool,
+            required={"operation": operation},
+            optional={
+                "catalog": catalog,
+                "tables": tables,
+                "intervalSeconds": intervalSeconds,
+                "durationSeconds": durationSeconds,
+                "select": select,
+                "realm": realm,
+                "realms": realms,
+            },
+            transforms={"tables": _coerce_items, "select": _normalize_string_list},
+            progress=_progress_reporter(ctx),
+        )
+
+    @mcp.tool(
+        name=access_tool.name,
+        description=access_tool.description,
+        output_schema=OUTPUT_SCHEMA,
+    )
+    def polaris_access_request(
+        operation: str,
+        principal: str | None = None,
+        catalog: str | None = None,
+        namespace: str | Sequence[str] | None = None,
+        table: str | None = None,
+        kind: str | None = None,
+        privilege: str | None = None,
+        refresh: bool | None = None,
+        path: str | None = None,
+        format: str | None = None,
+        expand: bool | None = None,
+        select: str | Sequence[str] | None = None,
+        realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+    ) -> FastMcpToolResult:
+        return call_tool(
+            access_tool,
+            required={"operation": operation},
+            optional={
+                "principal": principal,
+                "catalog": catalog,
+                "namespace": namespace,
+                "table": table,
+                "kind": kind,
+                "privilege": privilege,
+                "refresh": refresh,
+                "path": path,
+                "format": format,
+                "expand": expand,
+                "select": select,
+                "realm": realm,
+                "realms": realms,
+            },
+            transforms={
+                "namespace": _normalize_namespace,
+                "select": _normalize_string_list,
+            },
+        )
+
+    @mcp.tool(
+        name=maintenance_tool.name,
+        description=maintenance_tool.description,
+        output_schema=OUTPUT_SCHEMA,
+    )
+    def polaris_maintenance_request(
+        operation: str,
+        catalog: str,
+        parent: str | Sequence[str] | None = None,
+        prefix: str | None = None,
+        limit: int | None = None,
+        minExcessFiles: int | None = None,
+        maxSnapshots: int | None = None,
+        maxSnapshotAgeHours: float | None = None,
+        requirePolicy: bool | None = None,
+        path: str | None = None,
+        select: str | Sequence[str] | None = None,
+        realm: str | None = None,
+        realms: str | Sequence[str] | None = None,
+        ctx: Context | None = None,
+    ) -> FastMcpToolResult:
+        return call_tool(
+            maintenance_tool,
+            required={"operation": operation, "catalog": catalog},
+            optional={
+                "parent": parent,
+                "prefix": prefix,
+                "limit": limit,
+                "minExcessFiles": minExcessFiles,
+                "maxSnapshots": maxSnapshots,
+                "maxSnapshotAgeHours": maxSnapshotAgeHours,
+                "requirePolicy": requirePolicy,
+                "path": path,
+                "select": select,
+                "realm": realm,
+                "realms": realms,
+            },
+            transforms={
+                "parent": _normalize_namespace,
+                "select": _normalize_string_list,
+            },
+            progress=_progress_reporter(ctx),
+        )
+
+    _register_resources(mcp, resource_cache, resource_subscriptions)
+
     return mcp
 
 
+def _register_resources(
+    mcp: FastMCP,
+    cache: PolarisResourceCache,
+    subscriptions: ResourceSubscriptions,
+) -> None:
+    """Expose the catalog tree as ``polaris://`` resource templates with subscriptions."""
+
+    async def read(key: ResourceKey) -> ResourceResult:
+        value = await anyio.to_thread.run_sync(cache.read, key)
+        return ResourceResult(
+            [ResourceContent(json.dumps(value, indent=2), mime_type="application/json")]
+        )
+
+    @mcp.resource(
+        "polaris://{realm}",
+        name="polaris-catalogs",
+        description="Catalogs of a realm (use `default` for the default realm).",
+        mime_type="application/json",
+    )
+    async def polaris_catalogs(realm: str) -> ResourceResult:
+        return await read(ResourceKey.from_segments(realm))
+
+    @mcp.resource(
+        "polaris://{realm}/{catalog}",
+        name="polaris-catalog",
+        description="Top-level namespaces of a catalog.",
+        mime_type="application/json",
+    )
+    async def polaris_catalog(realm: str, catalog: str) -> ResourceResult:
+        return await read(ResourceKey.from_segments(realm, catalog))
+
+    @mcp.resource(
+        "polaris://{realm}/{catalog}/{namespace}",
+        name="polaris-namespace",
+        description="Child namespaces, tables and views of a dot-separated namespace.",
+        mime_type="application/json",
+    )
+    async def polaris_namespace(
+        realm: str, catalog: str, namespace: str
+    ) -> ResourceResult:
+        return await read(ResourceKey.from_segments(realm, catalog, namespace))
+
+    @mcp.resource(
+        "polaris://{realm}/{catalog}/{namespace}/{table}",
+        name="polaris-table",
+        description="Iceberg table metadata as returned by loadTable (snapshots=refs).",
+        mime_type="application/json",
+    )
+    async def polaris_table(
+        realm: str, catalog: str, namespace: str, table: str
+    ) -> ResourceResult:
+        return await read(ResourceKey.from_segments(realm, catalog, namespace, table))
+
+    _enable_resource_subscriptions(mcp, subscriptions)
+
+
+def _enable_resource_subscriptions(
+    mcp: FastMCP, subscriptions: ResourceSubscriptions
+) -> None:
+    """Route ``resources/subscribe`` requests to ``subscriptions`` and advertise them.
+
+    FastMCP has no public hook for resource subscriptions, and the SDK always
+    advertises ``subscribe=False``. This is the only place that reaches into the
+    private low-level server; it fails loudly if a FastMCP upgrade removes it.
+    """
+
+    low_level = getattr(mcp, "_mcp_server", None)
+    if low_level is None or not hasattr(low_level, "get_capabilities"):
+        raise RuntimeError(
+            "FastMCP no longer exposes its low-level server; "
+            "resource subscriptions cannot be enabled."
+        )
+
+    @low_level.subscribe_resource()
+    async def subscribe(uri: Any) -> None:
+        subscriber = _SessionSubscriber(
+            low_level.request_context.session, asyncio.get_running_loop()
+        )
+        await anyio.to_thread.run_sync(subscriptions.subscribe, str(uri), subscriber)
+
+    @low_level.unsubscribe_resource()
+    async def unsubscribe(uri: Any) -> None:
+        subscriber = _SessionSubscriber(
+            low_level.request_context.session, asyncio.get_running_loop()
+        )
+        subscriptions.unsubscribe(str(uri), subscriber)
+
+    get_capabilities = low_level.get_capabilities
+
+    def get_capabilities_with_subscribe(*args: Any, **kwargs: Any) -> Any:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low_level.get_capabilities = get_capabilities_with_subscribe  # type: ignore[method-assign]
+
+
+class _SessionSubscriber:
+    """Deliver resource notifications from the polling thread to one client session."""
+
+    def __init__(self, session: ServerSession, loop: asyncio.AbstractEventLoop) -> None:
+        self._session = session
+        self._loop = loop
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SessionSubscriber) and other._session is self._session
+
+    def __hash__(self) -> int:
+        return id(self._session)
+
+    def resource_updated(self, uri: str) -> None:
+        self._send(lambda: self._session.send_resource_updated(uri))
+
+    def resource_list_changed(self) -> None:
+        self._send(self._session.send_resource_list_changed)
+
+    def _send(self, send: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        # Wait for delivery so a closed session raises and its subscriptions are dropped.
+        if self._loop.is_closed():
+            raise RuntimeError("Client session has ended.")
+        asyncio.run_coroutine_threadsafe(send(), self._loop).result(
+            timeout=SESSION_NOTIFY_TIMEOUT_SECONDS
+        )
+
+
 def _call_tool(
     tool: Any,
     *,
     required: Mapping[str, Any],
     optional: Mapping[str, Any | None] | None = None,
     transforms: Mapping[str, Any] | None = None,
+    progress: ProgressCallback | None = None,
+    fan_out: RealmFanOut | None = None,
 ) -> FastMcpToolResult:
     arguments: MutableMapping[str, Any] = dict(required)
     if optional:
@@ -409,15 +1027,41 @@ def _call_tool(
         for key, transform in transforms.items():
             if key in arguments and arguments[key] is not None:
                 arguments[key] = transform(arguments[key])
+    realms = arguments.pop("realms", None)
+    if realms is not None:
+        if fan_out is None:
+            raise ValueError("Realm fan-out is not available for this tool.")
+        return _to_tool_result(
+            fan_out.call(
+                tool.call, arguments, _normalize_string_list(realms), progress=progress
+            )
+        )
+    if progress is not None:
+        return _to_tool_result(tool.call(arguments, progress=progress))
     return _to_tool_result(tool.call(arguments))
 
 
+def _progress_reporter(ctx: Context | None) -> ProgressCallback | None:
+    """Bridge progress updates from the tool worker thread to MCP progress notifications."""
+    if ctx is None:
+        return None
+
+    def report(progress: float, total: float | None, message: str | None) -> None:
+        try:
+            anyio.from_thread.run(ctx.report_progress, progress, total, message)
+        except Exception:  # pragma: no cover - notifications are best effort
+            logger.debug("Failed to send progress notification", exc_info=True)
+
+    return report
+
+
 def _to_tool_result(result: ToolExecutionResult) -> FastMcpToolResult:
     structured: dict[str, Any] = {"isError": result.is_error}
     if result.metadata is not None:
         structured["meta"] = result.metadata
 
-    logger.info("Tool call result", extra=structured)
+    # Vended storage credentials are returned to the client but never logged.
+    logger.info("Tool call result", extra=redact_credentials(structured))
 
     return FastMcpToolResult(
         content=[TextContent(type="text", text=result.text)],
@@ -448,12 +1092,34 @@ def _coerce_body(body: Any) -> Any:
     return body
 
 
+def _coerce_items(items: Sequence[Any]) -> list[Any]:
+    """Return plain dicts for mapping entries of an array argument."""
+    return [dict(item) if isinstance(item, Mapping) else item for item in items]
+
+
+def _coerce_grant_sets(desired: Mapping[str, Sequence[Any]]) -> dict[str, list[Any]]:
+    """Return plain dicts for the grant lists of each catalog role."""
+    return {str(role): _coerce_items(grants) for role, grants in desired.items()}
+
+
 def _normalize_namespace(namespace: str | Sequence) -> str | list[str]:
     if isinstance(namespace, str):
         return namespace
     return [str(part) for part in namespace]
 
 
+def _normalize_namespaces(
+    namespaces: Sequence[str | Sequence[str]],
+) -> list[str | list[str]]:
+    return [_normalize_namespace(namespace) for namespace in namespaces]
+
+
+def _normalize_string_list(select: str | Sequence[str]) -> str | list[str]:
+    if isinstance(select, str):
+        return select
+    return [str(selector) for selector in select]
+
+
 def _resolve_base_url() -> str:
     for candidate in (
         os.getenv("POLARIS_BASE_URL"),
@@ -495,10 +1161,39 @@ def _resolve_http_timeout() -> urllib3.Timeout:
     return urllib3.Timeout(connect=connect_timeout, read=read_timeout)
 
 
+def _resolve_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    try:
+        return float(raw.strip()) if raw and raw.strip() else default
+    except ValueError:
+        return default
+
+
+def _resolve_inventory_store() -> InventoryStore | None:
+    path = _first_non_blank(os.getenv("POLARIS_INVENTORY_PATH"))
+    if not path:
+        return None
+    return InventoryStore(
+        os.path.expanduser(path),
+        max_changes=int(
+            _resolve_float("POLARIS_INVENTORY_MAX_CHANGES", DEFAULT_MAX_CHANGES)
+        ),
+        max_change_age_seconds=_resolve_float(
+            "POLARIS_INVENTORY_MAX_CHANGE_AGE_SECONDS", 0.0
+        ),
+    )
+
+
+def _resolve_export_dir() -> str | None:
+    path = _first_non_blank(os.getenv("POLARIS_EXPORT_DIR"))
+    return os.path.expanduser(path) if path else None
+
+
 def _resolve_authorization_provider(
     base_url: str,
     http: urllib3.PoolManager,
     timeout: urllib3.Timeout,
+    router: RealmRouter | None = None,
 ) -> AuthorizationProvider:
     token = _resolve_token()
     if token:
@@ -506,8 +1201,11 @@ def _resolve_authorization_provider(
 
     client_id = _first_non_blank(os.getenv("POLARIS_CLIENT_ID"))
     client_secret = _first_non_blank(os.getenv("POLARIS_CLIENT_SECRET"))
+    # Only realm client credentials count; POLARIS_REALM_{realm}_BASE_URL is routing.
     has_realm_credentials = any(
-        key.startswith("POLARIS_REALM_") for key in os.environ.keys()
+        key.startswith("POLARIS_REALM_")
+        and key.endswith(("_CLIENT_ID", "_CLIENT_SECRET"))
+        for key in os.environ.keys()
     )
 
     if client_id and client_secret or has_realm_credentials:
@@ -523,6 +1221,7 @@ def _resolve_authorization_provider(
             http=http,
             refresh_buffer_seconds=refresh_buffer_seconds,
             timeout=timeout,
+            router=router,
         )
 
     return none()
@@ -19,20 +19,28 @@
 
 """Tool definitions exposed by the Polaris MCP server."""
 
+from .access import PolarisAccessTool
 from .catalog import PolarisCatalogTool
 from .catalog_role import PolarisCatalogRoleTool
+from .inventory import PolarisInventoryTool
+from .maintenance import PolarisMaintenanceTool
 from .namespace import PolarisNamespaceTool
 from .policy import PolarisPolicyTool
 from .principal import PolarisPrincipalTool
 from .principal_role import PolarisPrincipalRoleTool
 from .table import PolarisTableTool
+from .watch import PolarisTableWatchTool
 
 __all__ = [
+    "PolarisAccessTool",
     "PolarisCatalogRoleTool",
     "PolarisCatalogTool",
+    "PolarisInventoryTool",
+    "PolarisMaintenanceTool",
     "PolarisNamespaceTool",
     "PolarisPolicyTool",
     "PolarisPrincipalRoleTool",
     "PolarisPrincipalTool",
     "PolarisTableTool",
+    "PolarisTableWatchTool",
 ]
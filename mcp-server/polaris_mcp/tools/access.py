@@ -0,0 +1,285 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Access analysis MCP tool."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from polaris_mcp.base import JSONDict, McpTool, ToolExecutionResult, require_text
+from polaris_mcp.projection import SELECT_SCHEMA, project, resolve_select
+from polaris_mcp.rbac import MATRIX_FORMATS, RbacIndex, RoleGraph, write_matrix
+
+
+class PolarisAccessTool(McpTool):
+    """Answer access questions by resolving the principal/role/grant graph."""
+
+    TOOL_NAME = "polaris-access-request"
+    TOOL_DESCRIPTION = (
+        "Resolve what a principal can do (effective-privileges) on a catalog, namespace, table "
+        "or view in one call, answer can/who-can queries from a prebuilt RBAC index "
+        "(build-index, index-status), or stream the full access matrix to a file (export-matrix)."
+    )
+
+    EFFECTIVE_ALIASES: Set[str] = {"effective-privileges", "privileges", "check"}
+    BUILD_INDEX_ALIASES: Set[str] = {"build-index", "rebuild-index", "index"}
+    INDEX_STATUS_ALIASES: Set[str] = {"index-status"}
+    CAN_ALIASES: Set[str] = {"can", "authorize"}
+    WHO_CAN_ALIASES: Set[str] = {"who-can", "who-has-access"}
+    EXPORT_ALIASES: Set[str] = {"export-matrix", "export"}
+    ENTITY_KINDS = ("table", "view")
+
+    def __init__(
+        self,
+        role_graph: RoleGraph,
+        rbac_index: Optional[RbacIndex] = None,
+        export_dir: Optional[str] = None,
+    ) -> None:
+        self._role_graph = role_graph
+        self._rbac_index = rbac_index
+        self._export_dir = export_dir
+
+    @property
+    def name(self) -> str:
+        return self.TOOL_NAME
+
+    @property
+    def description(self) -> str:
+        return self.TOOL_DESCRIPTION
+
+    def input_schema(self) -> JSONDict:
+        return {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "effective-privileges",
+                        "build-index",
+                        "index-status",
+                        "can",
+                        "who-can",
+                        "export-matrix",
+                    ],
+                    "description": (
+                        "Access operation to execute. effective-privileges resolves the principal's "
+                        "principal roles, their catalog roles and those roles' grants, then applies "
+                        "catalog/namespace inheritance and privilege implication. build-index loads "
+                        "every principal, role and grant of the realm into memory; can and who-can "
+                        "are answered from that index (built on first use). export-matrix streams "
+                        "one row per principal, securable and privilege to a local file and "
+                        "returns only a summary."
+                    ),
+                },
+                "principal": {
+                    "type": "string",
+                    "description": (
+                        "Principal whose privileges are resolved (effective-privileges, can)."
+                    ),
+                },
+                "catalog": {
+                    "type": "string",
+                    "description": (
+                        "Catalog the privileges are resolved in (effective-privileges, can, who-can)."
+                    ),
+                },
+                "namespace": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": (
+                        "Optional namespace target. Omit to resolve catalog-level privileges only."
+                    ),
+                },
+                "table": {
+                    "type": "string",
+                    "description": "Optional table (or view, see `kind`) inside `namespace`.",
+                },
+                "kind": {
+                    "type": "string",
+                    "enum": list(self.ENTITY_KINDS),
+                    "description": "Whether `table` names a table or a view (default table).",
+                },
+                "privilege": {
+                    "type": "string",
+                    "description": (
+                        "Privilege to check (for example TABLE_WRITE_DATA). Required for can, "
+                        "filters who-can, and adds `allowed` to effective-privileges."
+                    ),
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": (
+                        "Bypass the cached role graph (effective-privileges) or rebuild the "
+                        "RBAC index before answering (can, who-can)."
+                    ),
+                },
+                "path": {
+                    "type": "string",
+                    "description": "export-matrix: file the matrix is written to, inside POLARIS_EXPORT_DIR.",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": list(MATRIX_FORMATS),
+                    "description": (
+                        "export-matrix: output format (default csv for a .csv path, otherwise jsonl)."
+                    ),
+                },
+                "expand": {
+                    "type": "boolean",
+                    "description": (
+                        "export-matrix: include rows for implied privileges (default true)."
+                    ),
+                },
+                "select": SELECT_SCHEMA,
+            },
+            "required": ["operation"],
+        }
+
+    def call(self, arguments: Any) -> ToolExecutionResult:
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+
+        operation = require_text(arguments, "operation").lower().strip()
+        normalized = self._normalize_operation(operation)
+        selectors = resolve_select(arguments)
+        realm = arguments.get("realm")
+        realm = realm if isinstance(realm, str) and realm.strip() else None
+        refresh = arguments.get("refresh") is True
+
+        if normalized == "effective-privileges":
+            payload = self._handle_effective_privileges(arguments, realm, refresh)
+        else:
+            index = self._require_index()
+            if refresh and normalized != "build-index":
+                index.build(realm)
+            if normalized == "build-index":
+                payload = index.build(realm)
+            elif normalized == "index-status":
+                payload = index.status(realm)
+            elif normalized == "can":
+                namespace, table, kind = self._resolve_target(arguments)
+                payload = index.can(
+                    require_text(arguments, "principal"),
+                    require_text(arguments, "privilege"),
+                    require_text(arguments, "catalog"),
+                    namespace,
+                    table,
+                    kind,
+                    realm=realm,
+                )
+            elif normalized == "who-can":
+                namespace, table, kind = self._resolve_target(arguments)
+                privilege = arguments.get("privilege")
+                payload = index.who_can(
+                    require_text(arguments, "catalog"),
+                    namespace,
+                    table,
+                    kind,
+                    privilege=privilege if isinstance(privilege, str) else None,
+                    realm=realm,
+                )
+            elif normalized == "export-matrix":
+                path = require_text(arguments, "path")
+                fmt = arguments.get("format") or (
+                    "csv" if path.lower().endswith(".csv") else "jsonl"
+                )
+                payload = write_matrix(
+                    index.iter_matrix(
+                        realm, expand=arguments.get("expand") is not False
+                    ),
+                    path,
+                    str(fmt).lower(),
+                    self._export_dir,
+                )
+            else:  # pragma: no cover - normalize guarantees handled cases
+                raise ValueError(f"Unsupported operation: {operation}")
+
+        payload = project(payload, selectors)
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
+    def _handle_effective_privileges(
+        self, arguments: Dict[str, Any], realm: Optional[str], refresh: bool
+    ) -> JSONDict:
+        principal = require_text(arguments, "principal")
+        catalog = require_text(arguments, "catalog")
+        namespace, table, kind = self._resolve_target(arguments)
+        payload = self._role_graph.resolve(
+            principal, catalog, namespace, table, kind, realm=realm, refresh=refresh
+        )
+        target: JSONDict = {"namespace": namespace}
+        if table is not None:
+            target[kind] = table
+        payload["target"] = target
+        privilege = arguments.get("privilege")
+        if isinstance(privilege, str) and privilege.strip():
+            payload["allowed"] = privilege.strip().upper() in payload["privileges"]
+        return payload
+
+    def _resolve_target(
+        self, arguments: Dict[str, Any]
+    ) -> Tuple[List[str], Optional[str], str]:
+        namespace = self._resolve_namespace(arguments.get("namespace"))
+        table = arguments.get("table")
+        if table is not None and (not isinstance(table, str) or not table.strip()):
+            raise ValueError("table must be a non-empty string.")
+        if table is not None and not namespace:
+            raise ValueError("A `namespace` is required when `table` is provided.")
+        kind = str(arguments.get("kind") or "table").strip().lower()
+        if kind not in self.ENTITY_KINDS:
+            raise ValueError("kind must be one of " + ", ".join(self.ENTITY_KINDS))
+        return namespace, table.strip() if table is not None else None, kind
+
+    def _require_index(self) -> RbacIndex:
+        if self._rbac_index is None:
+            raise ValueError("The RBAC index is not configured for this server.")
+        return self._rbac_index
+
+    def _resolve_namespace(self, namespace: Any) -> List[str]:
+        if namespace is None:
+            return []
+        parts = namespace.split(".") if isinstance(namespace, str) else namespace
+        if not isinstance(parts, list) or not all(
+            isinstance(part, str) and part.strip() for part in parts
+        ):
+            raise ValueError(
+                "Namespace must be a non-empty string or array of strings."
+            )
+        return [part.strip() for part in parts]
+
+    def _normalize_operation(self, operation: str) -> str:
+        if operation in self.EFFECTIVE_ALIASES:
+            return "effective-privileges"
+        if operation in self.BUILD_INDEX_ALIASES:
+            return "build-index"
+        if operation in self.INDEX_STATUS_ALIASES:
+            return "index-status"
+        if operation in self.CAN_ALIASES:
+            return "can"
+        if operation in self.WHO_CAN_ALIASES:
+            return "who-can"
+        if operation in self.EXPORT_ALIASES:
+            return "export-matrix"
+        raise ValueError(f"Unsupported operation: {operation}")
@@ -21,15 +21,21 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Optional, Set
+import json
+from typing import Any, Dict, Iterator, Optional, Set
 
 from polaris_mcp.base import (
     JSONDict,
     McpTool,
+    ProgressCallback,
     ToolExecutionResult,
     copy_if_object,
     require_text,
 )
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY
+from polaris_mcp.drift import compare_catalogs, iter_drift
+from polaris_mcp.export import write_jsonl
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select, project, resolve_select
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -37,16 +43,29 @@ class PolarisCatalogTool(McpTool):
     """Interact with the Polaris management API for catalog lifecycle operations."""
 
     TOOL_NAME = "polaris-catalog-request"
-    TOOL_DESCRIPTION = "Perform catalog operations (list, get, create, update, delete)."
+    TOOL_DESCRIPTION = (
+        "Perform catalog operations (list, get, create, update, delete, diff)."
+    )
 
     LIST_ALIASES: Set[str] = {"list", "ls"}
     GET_ALIASES: Set[str] = {"get", "load", "fetch"}
     CREATE_ALIASES: Set[str] = {"create"}
     UPDATE_ALIASES: Set[str] = {"update"}
     DELETE_ALIASES: Set[str] = {"delete", "drop", "remove"}
+    DIFF_ALIASES: Set[str] = {"diff", "drift", "compare"}
+    DEFAULT_DIFF_LIMIT = 50
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self,
+        rest_client: PolarisRestTool,
+        catalog_rest_client: Optional[PolarisRestTool] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        export_dir: Optional[str] = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._catalog_rest_client = catalog_rest_client
+        self._max_concurrency = max(max_concurrency, 1)
+        self._export_dir = export_dir
 
     @property
     def name(self) -> str:
@@ -62,9 +81,11 @@ class PolarisCatalogTool(McpTool):
             "properties": {
                 "operation": {
                     "type": "string",
-                    "enum": ["list", "get", "create", "update", "delete"],
+                    "enum": ["list", "get", "create", "update", "delete", "diff"],
                     "description": (
-                        "Catalog operation to execute. Supported values: list, get, create, update, delete."
+                        "Catalog operation to execute. Supported values: list, get, create, update, delete, "
+                        "diff (crawls `catalog` and `targetCatalog` concurrently and reports drift in "
+                        "namespaces, tables, metadata locations, properties and catalog-role grants)."
                     ),
                 },
                 "catalog": {
@@ -73,6 +94,30 @@ class PolarisCatalogTool(McpTool):
                         "Catalog name (required for get, update, delete). Automatically appended to the path."
                     ),
                 },
+                "targetCatalog": {
+                    "type": "string",
+                    "description": "For diff: catalog compared against `catalog` (defaults to `catalog`).",
+                },
+                "targetRealm": {
+                    "type": "string",
+                    "description": "For diff: realm of `targetCatalog` (defaults to `realm`).",
+                },
+                "includeGrants": {
+                    "type": "boolean",
+                    "description": "For diff: also compare catalog roles and their grants (default true).",
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        f"For diff: names listed per drift category (default {self.DEFAULT_DIFF_LIMIT}); "
+                        "`path` receives every entry."
+                    ),
+                },
+                "path": {
+                    "type": "string",
+                    "description": "For diff: optional file inside POLARIS_EXPORT_DIR that receives every drift entry as JSONL.",
+                },
                 "query": {
                     "type": "object",
                     "description": "Optional query parameters.",
@@ -89,20 +134,26 @@ class PolarisCatalogTool(McpTool):
                         "Optional request body payload for create/update. See polaris-management-service.yml."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
         if not isinstance(arguments, dict):
             raise ValueError("Tool arguments must be a JSON object.")
 
         operation = require_text(arguments, "operation").lower().strip()
         normalized = self._normalize_operation(operation)
+        if normalized == "diff":
+            return self._handle_diff(arguments, progress)
 
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -159,6 +210,73 @@ class PolarisCatalogTool(McpTool):
         delegate_args["method"] = "DELETE"
         delegate_args["path"] = f"catalogs/{catalog_name}"
 
+    def _handle_diff(
+        self, arguments: Dict[str, Any], progress: Optional[ProgressCallback]
+    ) -> ToolExecutionResult:
+        if self._catalog_rest_client is None:
+            raise ValueError("Catalog diffs require the catalog REST client.")
+        catalog = require_text(arguments, "catalog")
+        target_catalog = arguments.get("targetCatalog") or catalog
+        if not isinstance(target_catalog, str) or not target_catalog.strip():
+            raise ValueError("targetCatalog must be a non-empty string.")
+        realm = arguments.get("realm")
+        realm = realm.strip() if isinstance(realm, str) and realm.strip() else None
+        target_realm = arguments.get("targetRealm")
+        if not isinstance(target_realm, str) or not target_realm.strip():
+            target_realm = realm
+        source_side = (catalog, realm)
+        target_side = (target_catalog.strip(), target_realm)
+        if source_side == target_side:
+            raise ValueError(
+                "Provide a targetCatalog or targetRealm to compare against."
+            )
+        limit = arguments.get("limit", self.DEFAULT_DIFF_LIMIT)
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+            raise ValueError("limit must be a non-negative integer.")
+
+        source, target = compare_catalogs(
+            self._catalog_rest_client,
+            self._rest_client,
+            source_side,
+            target_side,
+            include_grants=arguments.get("includeGrants") is not False,
+            max_workers=self._max_concurrency,
+            progress=progress,
+        )
+        drift: Dict[str, Dict[str, JSONDict]] = {}
+
+        def tally(entries: Iterator[JSONDict]) -> Iterator[JSONDict]:
+            for entry in entries:
+                bucket = drift.setdefault(entry["kind"], {}).setdefault(
+                    entry["drift"], {"count": 0, "names": []}
+                )
+                bucket["count"] += 1
+                if len(bucket["names"]) < limit:
+                    bucket["names"].append(entry["name"])
+                yield entry
+
+        path = arguments.get("path")
+        export: Optional[JSONDict] = None
+        if isinstance(path, str) and path.strip():
+            export = write_jsonl(
+                tally(iter_drift(source, target)), path.strip(), self._export_dir
+            )
+        else:
+            for _ in tally(iter_drift(source, target)):
+                pass
+        payload: JSONDict = {
+            "inSync": not drift and not source.errors and not target.errors,
+            "source": source.describe(),
+            "target": target.describe(),
+            "drift": drift,
+        }
+        if export is not None:
+            payload["export"] = export
+        payload = project(payload, resolve_select(arguments))
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
     def _maybe_augment_error(
         self, result: ToolExecutionResult, operation: str
     ) -> ToolExecutionResult:
@@ -201,4 +319,6 @@ class PolarisCatalogTool(McpTool):
             return "update"
         if operation in self.DELETE_ALIASES:
             return "delete"
+        if operation in self.DIFF_ALIASES:
+            return "diff"
         raise ValueError(f"Unsupported operation: {operation}")
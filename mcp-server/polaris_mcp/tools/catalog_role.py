@@ -22,15 +22,31 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, Optional, Set
+import json
+from typing import Any, Dict, List, Optional, Set
 
 from polaris_mcp.base import (
     JSONDict,
     McpTool,
+    ProgressCallback,
     ToolExecutionResult,
     copy_if_object,
     require_text,
 )
+from polaris_mcp.bulk import (
+    DEFAULT_BULK_REQUESTS_PER_SECOND,
+    DEFAULT_BULK_RETRIES,
+    BulkAction,
+    run_actions,
+)
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    RateLimiter,
+    run_concurrently,
+)
+from polaris_mcp.listing import list_grants
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select
+from polaris_mcp.rbac import RbacIndex, diff_grants
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -38,7 +54,7 @@ class PolarisCatalogRoleTool(McpTool):
     """Manage catalog roles and grants via the Polaris management API."""
 
     TOOL_NAME = "polaris-catalog-role-request"
-    TOOL_DESCRIPTION = "Perform catalog role operations (list, get, create, update, delete, list-principal-roles, list-grants, add-grant, revoke-grant)."
+    TOOL_DESCRIPTION = "Perform catalog role operations (list, get, create, update, delete, list-principal-roles, list-grants, add-grant, revoke-grant, reconcile-grants)."
 
     LIST_ALIASES: Set[str] = {"list", "ls"}
     GET_ALIASES: Set[str] = {"get", "load", "fetch"}
@@ -52,9 +68,19 @@ class PolarisCatalogRoleTool(McpTool):
     LIST_GRANTS_ALIASES: Set[str] = {"list-grants"}
     ADD_GRANT_ALIASES: Set[str] = {"add-grant", "grant"}
     REVOKE_GRANT_ALIASES: Set[str] = {"revoke-grant"}
-
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    RECONCILE_ALIASES: Set[str] = {"reconcile-grants", "sync-grants"}
+
+    def __init__(
+        self,
+        rest_client: PolarisRestTool,
+        rbac_index: Optional[RbacIndex] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: float = DEFAULT_BULK_REQUESTS_PER_SECOND,
+    ) -> None:
         self._rest_client = rest_client
+        self._rbac_index = rbac_index
+        self._max_concurrency = max_concurrency
+        self._requests_per_second = requests_per_second
 
     @property
     def name(self) -> str:
@@ -80,10 +106,11 @@ class PolarisCatalogRoleTool(McpTool):
                         "list-grants",
                         "add-grant",
                         "revoke-grant",
+                        "reconcile-grants",
                     ],
                     "description": (
                         "Catalog role operation (list, get, create, update, delete, list-principal-roles, "
-                        "list-grants, add-grant, revoke-grant)."
+                        "list-grants, add-grant, revoke-grant, reconcile-grants)."
                     ),
                 },
                 "catalog": {
@@ -94,6 +121,38 @@ class PolarisCatalogRoleTool(McpTool):
                     "type": "string",
                     "description": "Catalog role name for role-specific operations.",
                 },
+                "desired": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "array",
+                        "items": {"type": "object"},
+                    },
+                    "description": (
+                        "reconcile-grants: desired grants per catalog role, keyed by role name. "
+                        "Each grant uses the GrantResource shape (type, privilege, namespace, "
+                        "tableName/viewName/policyName). Grants missing here are revoked."
+                    ),
+                },
+                "dryRun": {
+                    "type": "boolean",
+                    "description": "reconcile-grants: return the plan without applying it.",
+                },
+                "ratePerSecond": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": (
+                        "reconcile-grants: maximum grant changes started per second "
+                        "(defaults to POLARIS_BULK_REQUESTS_PER_SECOND; 0 disables the limit)."
+                    ),
+                },
+                "retries": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        "reconcile-grants: retries per change for throttled, server or transport "
+                        f"errors (default {DEFAULT_BULK_RETRIES})."
+                    ),
+                },
                 "query": {
                     "type": "object",
                     "description": "Optional query string parameters.",
@@ -111,11 +170,14 @@ class PolarisCatalogRoleTool(McpTool):
                         "See polaris-management-service.yml for schemas like CreateCatalogRoleRequest, AddGrantRequest."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation", "catalog"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
         if not isinstance(arguments, dict):
             raise ValueError("Tool arguments must be a JSON object.")
 
@@ -126,6 +188,7 @@ class PolarisCatalogRoleTool(McpTool):
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -133,6 +196,8 @@ class PolarisCatalogRoleTool(McpTool):
 
         base_path = f"catalogs/{catalog}/catalog-roles"
 
+        if normalized == "reconcile-grants":
+            return self._handle_reconcile(arguments, delegate_args, base_path, progress)
         if normalized == "list":
             self._handle_list(delegate_args, base_path)
         elif normalized == "create":
@@ -155,6 +220,8 @@ class PolarisCatalogRoleTool(McpTool):
             raise ValueError(f"Unsupported operation: {operation}")
 
         raw = self._rest_client.call(delegate_args)
+        if not raw.is_error and self._rbac_index is not None:
+            self._sync_rbac_index(normalized, arguments, delegate_args.get("realm"))
         return self._maybe_augment_error(raw, normalized)
 
     def _handle_list(self, delegate_args: JSONDict, base_path: str) -> None:
@@ -228,6 +295,112 @@ class PolarisCatalogRoleTool(McpTool):
         if isinstance(arguments.get("body"), dict):
             delegate_args["body"] = copy.deepcopy(arguments["body"])
 
+    def _handle_reconcile(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        base_path: str,
+        progress: Optional[ProgressCallback],
+    ) -> ToolExecutionResult:
+        desired = arguments.get("desired")
+        if not isinstance(desired, dict) or not desired:
+            raise ValueError(
+                "reconcile-grants requires `desired`, an object mapping catalog roles to grants."
+            )
+        for role, grants in desired.items():
+            if not isinstance(grants, list) or not all(
+                isinstance(grant, dict) and grant.get("type") and grant.get("privilege")
+                for grant in grants
+            ):
+                raise ValueError(
+                    f"Desired grants for `{role}` must be an array of grant objects "
+                    "with `type` and `privilege`."
+                )
+        retries = arguments.get("retries", DEFAULT_BULK_RETRIES)
+        if not isinstance(retries, int) or isinstance(retries, bool) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        rate = arguments.get("ratePerSecond", self._requests_per_second)
+        if not isinstance(rate, (int, float)) or isinstance(rate, bool) or rate < 0:
+            raise ValueError("ratePerSecond must be a non-negative number.")
+
+        catalog = require_text(arguments, "catalog")
+        realm = delegate_args.get("realm")
+        roles: JSONDict = {}
+        actions: List[BulkAction] = []
+        for outcome in run_concurrently(
+            lambda role: list_grants(self._rest_client, catalog, role, realm),
+            list(desired),
+            self._max_concurrency,
+        ):
+            if outcome.error is not None:
+                raise outcome.error
+            role = outcome.item
+            add, revoke, unchanged = diff_grants(outcome.result or [], desired[role])
+            roles[role] = {"add": add, "revoke": revoke, "unchanged": unchanged}
+            grants_path = f"{base_path}/{encode_path_segment(role)}/grants"
+            for method, action, grants in (
+                ("PUT", "add", add),
+                ("POST", "revoke", revoke),
+            ):
+                start = len(actions)
+                actions.extend(
+                    BulkAction(
+                        index=start + offset,
+                        action=f"{action}-grant",
+                        target=role,
+                        method=method,
+                        path=grants_path,
+                        body={"grant": grant},
+                    )
+                    for offset, grant in enumerate(grants)
+                )
+        payload: JSONDict = {
+            "catalog": catalog,
+            "roles": roles,
+            "adds": sum(len(plan["add"]) for plan in roles.values()),
+            "revokes": sum(len(plan["revoke"]) for plan in roles.values()),
+        }
+        if arguments.get("dryRun") is True or not actions:
+            payload["dryRun"] = arguments.get("dryRun") is True
+            return ToolExecutionResult(
+                text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+            )
+
+        payload.update(
+            run_actions(
+                self._rest_client,
+                actions,
+                realm=realm,
+                max_concurrency=self._max_concurrency,
+                retries=retries,
+                progress=progress,
+                rate_limiter=RateLimiter(float(rate)),
+                include_successes=False,
+            )
+        )
+        if self._rbac_index is not None:
+            for role, plan in roles.items():
+                if plan["add"] or plan["revoke"]:
+                    self._rbac_index.refresh_catalog_role(catalog, role, realm)
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=payload["failed"] > 0,
+            metadata=payload,
+        )
+
+    def _sync_rbac_index(
+        self, operation: str, arguments: Dict[str, Any], realm: Optional[str]
+    ) -> None:
+        assert self._rbac_index is not None
+        if operation in ("add-grant", "revoke-grant"):
+            self._rbac_index.refresh_catalog_role(
+                arguments["catalog"], arguments["catalogRole"], realm
+            )
+        elif operation == "delete":
+            self._rbac_index.forget_catalog_role(
+                arguments["catalog"], arguments["catalogRole"], realm
+            )
+
     def _catalog_role_path(self, base_path: str, arguments: Dict[str, Any]) -> str:
         role = encode_path_segment(require_text(arguments, "catalogRole"))
         return f"{base_path}/{role}"
@@ -286,4 +459,6 @@ class PolarisCatalogRoleTool(McpTool):
             return "add-grant"
         if operation in self.REVOKE_GRANT_ALIASES:
             return "revoke-grant"
+        if operation in self.RECONCILE_ALIASES:
+            return "reconcile-grants"
         raise ValueError(f"Unsupported operation: {operation}")
@@ -0,0 +1,264 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Catalog inventory MCP tool."""
+
+from __future__ import annotations
+
+import json
+import string
+from typing import Any, Dict, List, Optional, Set
+
+from polaris_mcp.base import (
+    JSONDict,
+    McpTool,
+    ToolExecutionResult,
+    require_text,
+)
+from polaris_mcp.inventory import (
+    SYNC_MODES,
+    InventorySnapshot,
+    PolarisInventory,
+    namespaces_under,
+)
+from polaris_mcp.listing import Namespace
+from polaris_mcp.projection import SELECT_SCHEMA, project, resolve_select
+
+
+class PolarisInventoryTool(McpTool):
+    """Answer structural catalog questions from the locally cached inventory."""
+
+    TOOL_NAME = "polaris-inventory-request"
+    TOOL_DESCRIPTION = (
+        "Query the cached catalog inventory (list-catalogs, list-namespaces, list-tables, refresh, sync, "
+        "changes, status) without crawling Polaris on every call."
+    )
+
+    LIST_CATALOGS_ALIASES: Set[str] = {"list-catalogs", "catalogs"}
+    LIST_NAMESPACES_ALIASES: Set[str] = {"list-namespaces", "namespaces"}
+    LIST_TABLES_ALIASES: Set[str] = {"list-tables", "tables"}
+    REFRESH_ALIASES: Set[str] = {"refresh", "revalidate"}
+    SYNC_ALIASES: Set[str] = {"sync"}
+    CHANGES_ALIASES: Set[str] = {"changes", "change-feed"}
+    STATUS_ALIASES: Set[str] = {"status"}
+
+    def __init__(self, inventory: PolarisInventory) -> None:
+        self._inventory = inventory
+
+    @property
+    def name(self) -> str:
+        return self.TOOL_NAME
+
+    @property
+    def description(self) -> str:
+        return self.TOOL_DESCRIPTION
+
+    def input_schema(self) -> JSONDict:
+        return {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": [
+                        "list-catalogs",
+                        "list-namespaces",
+                        "list-tables",
+                        "refresh",
+                        "sync",
+                        "changes",
+                        "status",
+                    ],
+                    "description": (
+                        "Inventory operation to execute. Supported values: list-catalogs, list-namespaces, "
+                        "list-tables, refresh, sync, changes, status."
+                    ),
+                },
+                "catalog": {
+                    "type": "string",
+                    "description": "Catalog name (required for list-namespaces and list-tables).",
+                },
+                "namespace": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": (
+                        "Optional namespace used to restrict list-namespaces and list-tables to a subtree. "
+                        'Provide as a dot-delimited string or an array of strings (e.g. ["analytics", "daily"]).'
+                    ),
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": list(SYNC_MODES),
+                    "description": (
+                        "Sync mode: structure (re-list only), incremental (default; reload only tables whose "
+                        "ETag or metadata-location changed) or full (reload every table)."
+                    ),
+                },
+                "since": {
+                    "type": "integer",
+                    "description": "Return change feed entries with a sequence number greater than this value.",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of change feed entries to return (default 1000).",
+                },
+                "select": SELECT_SCHEMA,
+            },
+            "required": ["operation"],
+        }
+
+    def call(self, arguments: Any) -> ToolExecutionResult:
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+
+        operation = require_text(arguments, "operation").lower().strip()
+        normalized = self._normalize_operation(operation)
+        selectors = resolve_select(arguments)
+
+        realm = arguments.get("realm")
+        realm = realm.strip() if isinstance(realm, str) and realm.strip() else None
+
+        if normalized == "refresh":
+            snapshot = self._inventory.refresh(realm)
+            payload: JSONDict = {"refreshed": True}
+        elif normalized == "sync":
+            mode = arguments.get("mode") or "incremental"
+            result = self._inventory.sync(realm, str(mode).strip().lower())
+            snapshot = result.snapshot
+            payload = {
+                "mode": result.mode,
+                "baseline": result.baseline,
+                "loaded": result.loaded,
+                "notModified": result.not_modified,
+                "baselined": result.baselined,
+                "changes": [change.to_json() for change in result.changes],
+                "failures": result.failures,
+            }
+        elif normalized == "changes":
+            since = self._resolve_int(arguments, "since", 0)
+            limit = self._resolve_int(arguments, "limit", 1000)
+            changes = self._inventory.changes_since(realm, since, limit)
+            payload = {
+                "since": since,
+                "changes": [change.to_json() for change in changes],
+                "next": changes[-1].seq if changes else since,
+            }
+            payload = project(payload, selectors)
+            return ToolExecutionResult(
+                text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+            )
+        else:
+            snapshot = self._inventory.snapshot(realm)
+            if normalized == "list-catalogs":
+                payload = {"catalogs": list(snapshot.catalogs)}
+            elif normalized == "list-namespaces":
+                payload = self._handle_list_namespaces(arguments, snapshot)
+            elif normalized == "list-tables":
+                payload = self._handle_list_tables(arguments, snapshot)
+            elif normalized == "status":
+                payload = {
+                    "catalogs": len(snapshot.catalogs),
+                    "namespaces": sum(len(ns) for ns in snapshot.namespaces.values()),
+                    "tables": snapshot.table_count(),
+                    "refreshing": self._inventory.is_refreshing(realm),
+                }
+                store = self._inventory.store
+                if store is not None:
+                    payload["path"] = store.path
+            else:  # pragma: no cover - normalize guarantees handled cases
+                raise ValueError(f"Unsupported operation: {operation}")
+
+        payload["refreshedAt"] = snapshot.refreshed_at
+        payload = project(payload, selectors)
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
+    def _handle_list_namespaces(
+        self, arguments: Dict[str, Any], snapshot: InventorySnapshot
+    ) -> JSONDict:
+        catalog = require_text(arguments, "catalog")
+        self._require_catalog(snapshot, catalog)
+        parent = self._resolve_namespace(arguments.get("namespace"))
+        namespaces = namespaces_under(snapshot.namespaces.get(catalog, []), parent)
+        return {"catalog": catalog, "namespaces": [list(ns) for ns in namespaces]}
+
+    def _handle_list_tables(
+        self, arguments: Dict[str, Any], snapshot: InventorySnapshot
+    ) -> JSONDict:
+        catalog = require_text(arguments, "catalog")
+        self._require_catalog(snapshot, catalog)
+        parent = self._resolve_namespace(arguments.get("namespace"))
+        namespaces = namespaces_under(snapshot.namespaces.get(catalog, []), parent)
+        identifiers: List[JSONDict] = []
+        for namespace in namespaces:
+            for name in snapshot.tables.get((catalog, namespace), []):
+                identifiers.append({"namespace": list(namespace), "name": name})
+        return {"catalog": catalog, "identifiers": identifiers}
+
+    @staticmethod
+    def _resolve_int(arguments: Dict[str, Any], field: str, default: int) -> int:
+        value = arguments.get(field)
+        if value is None:
+            return default
+        try:
+            return max(int(value), 0)
+        except (TypeError, ValueError):
+            raise ValueError(f"`{field}` must be a non-negative integer.") from None
+
+    @staticmethod
+    def _require_catalog(snapshot: InventorySnapshot, catalog: str) -> None:
+        if catalog not in snapshot.catalogs:
+            raise ValueError(f"Catalog not found in inventory: {catalog}")
+
+    def _resolve_namespace(self, namespace: Any) -> Optional[Namespace]:
+        if namespace is None:
+            return None
+        if isinstance(namespace, list):
+            parts: List[str] = []
+            for element in namespace:
+                if not isinstance(element, str) or not element.strip(string.whitespace):
+                    raise ValueError(
+                        "Namespace array elements must be non-empty strings."
+                    )
+                parts.append(element.strip(string.whitespace))
+            return tuple(parts) or None
+        if not isinstance(namespace, str):
+            raise ValueError("Namespace must be a non-empty string.")
+        trimmed = namespace.strip()
+        return tuple(trimmed.split(".")) if trimmed else None
+
+    def _normalize_operation(self, operation: str) -> str:
+        if operation in self.LIST_CATALOGS_ALIASES:
+            return "list-catalogs"
+        if operation in self.LIST_NAMESPACES_ALIASES:
+            return "list-namespaces"
+        if operation in self.LIST_TABLES_ALIASES:
+            return "list-tables"
+        if operation in self.REFRESH_ALIASES:
+            return "refresh"
+        if operation in self.SYNC_ALIASES:
+            return "sync"
+        if operation in self.CHANGES_ALIASES:
+            return "changes"
+        if operation in self.STATUS_ALIASES:
+            return "status"
+        raise ValueError(f"Unsupported operation: {operation}")
@@ -0,0 +1,244 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Table maintenance planning MCP tool."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Set
+
+from polaris_mcp.base import (
+    JSONDict,
+    McpTool,
+    ProgressCallback,
+    ToolExecutionResult,
+    require_text,
+)
+from polaris_mcp.export import write_jsonl
+from polaris_mcp.maintenance import (
+    DEFAULT_CANDIDATE_LIMIT,
+    DEFAULT_MAX_SNAPSHOT_AGE_HOURS,
+    DEFAULT_MAX_SNAPSHOTS,
+    DEFAULT_MIN_EXCESS_FILES,
+    MaintenanceScanner,
+    ScanThresholds,
+)
+from polaris_mcp.projection import SELECT_SCHEMA, project, resolve_select
+
+
+class PolarisMaintenanceTool(McpTool):
+    """Find tables that need compaction or snapshot expiry."""
+
+    TOOL_NAME = "polaris-maintenance-request"
+    TOOL_DESCRIPTION = (
+        "Scan a catalog (or a namespace subtree) for tables that need compaction or snapshot "
+        "expiry. Snapshot counters and applicable system.data-compaction/system.snapshot-expiry "
+        "policies are evaluated server-side and only a ranked candidate list is returned (scan)."
+    )
+
+    SCAN_ALIASES: Set[str] = {"scan", "scan-candidates", "candidates"}
+
+    def __init__(
+        self, scanner: MaintenanceScanner, export_dir: Optional[str] = None
+    ) -> None:
+        self._scanner = scanner
+        self._export_dir = export_dir
+
+    @property
+    def name(self) -> str:
+        return self.TOOL_NAME
+
+    @property
+    def description(self) -> str:
+        return self.TOOL_DESCRIPTION
+
+    def input_schema(self) -> JSONDict:
+        return {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["scan"],
+                    "description": (
+                        "Maintenance operation to execute. scan loads every selected table "
+                        "concurrently, keeps only its current-snapshot totals and snapshot "
+                        "history, joins them with the table's applicable maintenance policies "
+                        "and ranks the tables by pending work."
+                    ),
+                },
+                "catalog": {
+                    "type": "string",
+                    "description": "Catalog to scan.",
+                },
+                "parent": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": "Only scan this namespace and its descendants.",
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": (
+                        "Only scan namespaces whose dotted name starts with this prefix."
+                    ),
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": (
+                        f"Maximum candidates returned (default {DEFAULT_CANDIDATE_LIMIT}). "
+                        "`path` always receives the full list."
+                    ),
+                },
+                "minExcessFiles": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        "Data files beyond what the table's bytes need at the target file size "
+                        f"before compaction is suggested (default {DEFAULT_MIN_EXCESS_FILES})."
+                    ),
+                },
+                "maxSnapshots": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": (
+                        f"Snapshots retained before expiry is suggested (default {DEFAULT_MAX_SNAPSHOTS})."
+                    ),
+                },
+                "maxSnapshotAgeHours": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": (
+                        "Age after which snapshots are considered expirable "
+                        f"(default {DEFAULT_MAX_SNAPSHOT_AGE_HOURS:g})."
+                    ),
+                },
+                "requirePolicy": {
+                    "type": "boolean",
+                    "description": (
+                        "Only suggest actions backed by an applicable maintenance policy."
+                    ),
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Optional file inside POLARIS_EXPORT_DIR that receives every candidate as JSONL.",
+                },
+                "select": SELECT_SCHEMA,
+            },
+            "required": ["operation", "catalog"],
+        }
+
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+
+        operation = require_text(arguments, "operation").lower().strip()
+        self._normalize_operation(operation)
+        catalog = require_text(arguments, "catalog")
+        realm = arguments.get("realm")
+        realm = realm if isinstance(realm, str) and realm.strip() else None
+        prefix = arguments.get("prefix")
+        if prefix is not None and not isinstance(prefix, str):
+            raise ValueError("prefix must be a string.")
+        limit = self._resolve_number(arguments, "limit", DEFAULT_CANDIDATE_LIMIT, 1)
+        thresholds = ScanThresholds(
+            min_excess_files=int(
+                self._resolve_number(
+                    arguments, "minExcessFiles", DEFAULT_MIN_EXCESS_FILES, 0
+                )
+            ),
+            max_snapshots=int(
+                self._resolve_number(
+                    arguments, "maxSnapshots", DEFAULT_MAX_SNAPSHOTS, 1
+                )
+            ),
+            max_snapshot_age_hours=float(
+                self._resolve_number(
+                    arguments,
+                    "maxSnapshotAgeHours",
+                    DEFAULT_MAX_SNAPSHOT_AGE_HOURS,
+                    0,
+                    integral=False,
+                )
+            ),
+            require_policy=arguments.get("requirePolicy") is True,
+        )
+
+        report = self._scanner.scan(
+            catalog,
+            root=self._resolve_namespace(arguments.get("parent")),
+            prefix=prefix or None,
+            thresholds=thresholds,
+            realm=realm,
+            progress=progress,
+        )
+        candidates: List[JSONDict] = report["candidates"]
+        payload: JSONDict = {
+            "catalog": catalog,
+            "scanned": report["scanned"],
+            "total": len(candidates),
+            "candidates": candidates[: int(limit)],
+        }
+        path = arguments.get("path")
+        if isinstance(path, str) and path.strip():
+            payload["export"] = write_jsonl(candidates, path.strip(), self._export_dir)
+        if report["errors"]:
+            payload["errors"] = report["errors"]
+        payload = project(payload, resolve_select(arguments))
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
+    @staticmethod
+    def _resolve_number(
+        arguments: Dict[str, Any],
+        field: str,
+        default: float,
+        minimum: float,
+        integral: bool = True,
+    ) -> float:
+        value = arguments.get(field, default)
+        valid_type = int if integral else (int, float)
+        if not isinstance(value, valid_type) or isinstance(value, bool):
+            raise ValueError(f"{field} must be a number.")
+        if value < minimum:
+            raise ValueError(f"{field} must be at least {minimum:g}.")
+        return value
+
+    def _resolve_namespace(self, namespace: Any) -> Optional[List[str]]:
+        if namespace is None:
+            return None
+        parts = namespace.split(".") if isinstance(namespace, str) else namespace
+        if not isinstance(parts, list) or not all(
+            isinstance(part, str) and part.strip() for part in parts
+        ):
+            raise ValueError(
+                "Namespace must be a non-empty string or array of strings."
+            )
+        return [part.strip() for part in parts]
+
+    def _normalize_operation(self, operation: str) -> str:
+        if operation in self.SCAN_ALIASES:
+            return "scan"
+        raise ValueError(f"Unsupported operation: {operation}")
@@ -22,17 +22,41 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
+import json
 import string
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from polaris_mcp.base import (
     JSONDict,
     McpTool,
+    ProgressCallback,
     ToolExecutionResult,
     copy_if_object,
     require_text,
     NAMESPACE_PATH_DELIMITER,
 )
+from polaris_mcp.bulk import (
+    DEFAULT_BULK_REQUESTS_PER_SECOND,
+    DEFAULT_BULK_RETRIES,
+    BulkAction,
+    run_actions,
+)
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    RateLimiter,
+    run_concurrently,
+)
+from polaris_mcp.listing import (
+    Namespace,
+    list_policies,
+    list_tables,
+    list_views,
+    namespace_path,
+    select_namespaces,
+    walk_namespaces,
+)
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -40,7 +64,10 @@ class PolarisNamespaceTool(McpTool):
     """Manage namespaces through the Polaris REST API."""
 
     TOOL_NAME = "polaris-namespace-request"
-    TOOL_DESCRIPTION = "Perform namespace operations (list, get, create, exists, get-properties, delete)."
+    TOOL_DESCRIPTION = (
+        "Perform namespace operations (list, get, create, exists, get-properties, delete, "
+        "delete-recursive, bulk-update-properties)."
+    )
 
     LIST_ALIASES: Set[str] = {"list", "ls"}
     GET_ALIASES: Set[str] = {"get", "load", "fetch"}
@@ -53,9 +80,27 @@ class PolarisNamespaceTool(McpTool):
     }
     GET_PROPS_ALIASES: Set[str] = {"get-properties", "properties"}
     DELETE_ALIASES: Set[str] = {"delete", "drop", "remove"}
+    DELETE_RECURSIVE_ALIASES: Set[str] = {
+        "delete-recursive",
+        "drop-recursive",
+        "cascade-delete",
+    }
+    BULK_UPDATE_PROPS_ALIASES: Set[str] = {
+        "bulk-update-properties",
+        "bulk-set-properties",
+    }
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self,
+        rest_client: PolarisRestTool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: float = DEFAULT_BULK_REQUESTS_PER_SECOND,
+        policy_rest_client: Optional[PolarisRestTool] = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._policy_rest_client = policy_rest_client
+        self._max_concurrency = max_concurrency
+        self._requests_per_second = requests_per_second
 
     @property
     def name(self) -> str:
@@ -79,10 +124,13 @@ class PolarisNamespaceTool(McpTool):
                         "update-properties",
                         "get-properties",
                         "delete",
+                        "delete-recursive",
+                        "bulk-update-properties",
                     ],
                     "description": (
                         "Namespace operation to execute. Supported values: list, get, exists, create, "
-                        "update-properties, get-properties, delete."
+                        "update-properties, get-properties, delete, delete-recursive, "
+                        "bulk-update-properties."
                     ),
                 },
                 "catalog": {
@@ -99,6 +147,67 @@ class PolarisNamespaceTool(McpTool):
                         'or an array of strings (e.g. ["analytics", "daily"]) for nested namespaces.'
                     ),
                 },
+                "namespaces": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ]
+                    },
+                    "description": (
+                        "bulk-update-properties: explicit namespaces to update. Mutually exclusive "
+                        "with `parent` and `prefix`."
+                    ),
+                },
+                "parent": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": (
+                        "bulk-update-properties: update every namespace nested below this one "
+                        "(the parent itself is not updated)."
+                    ),
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": (
+                        "bulk-update-properties: update every namespace whose dotted name starts "
+                        'with this prefix (for example "analytics." or "sales_"). Combined with '
+                        "`parent`, only its descendants are matched."
+                    ),
+                },
+                "ratePerSecond": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": (
+                        "bulk-update-properties: maximum requests started per second "
+                        "(defaults to POLARIS_BULK_REQUESTS_PER_SECOND; 0 disables the limit)."
+                    ),
+                },
+                "retries": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        "bulk-update-properties and delete-recursive: retries per request for "
+                        f"throttled, server or transport errors (default {DEFAULT_BULK_RETRIES})."
+                    ),
+                },
+                "dryRun": {
+                    "type": "boolean",
+                    "description": (
+                        "bulk-update-properties and delete-recursive: report the namespaces "
+                        "(and entities) that would be affected without changing anything."
+                    ),
+                },
+                "purge": {
+                    "type": "boolean",
+                    "description": (
+                        "delete-recursive: request that dropped tables have their data and "
+                        "metadata purged (purgeRequested=true)."
+                    ),
+                },
                 "query": {
                     "type": "object",
                     "description": "Optional query string parameters (for example page-size, page-token).",
@@ -112,15 +221,19 @@ class PolarisNamespaceTool(McpTool):
                 "body": {
                     "type": "object",
                     "description": (
-                        "Optional request body payload (required for create and update-properties). "
+                        "Optional request body payload (required for create, update-properties and "
+                        "bulk-update-properties). "
                         "See the Iceberg REST catalog specification for the expected schema."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation", "catalog"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
         if not isinstance(arguments, dict):
             raise ValueError("Tool arguments must be a JSON object.")
 
@@ -131,11 +244,20 @@ class PolarisNamespaceTool(McpTool):
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
             delegate_args["realm"] = realm
 
+        if normalized == "delete-recursive":
+            return self._handle_delete_recursive(
+                arguments, delegate_args, catalog, progress
+            )
+        if normalized == "bulk-update-properties":
+            return self._handle_bulk_update_properties(
+                arguments, delegate_args, catalog, progress
+            )
         if normalized == "list":
             self._handle_list(delegate_args, catalog)
         elif normalized == "get":
@@ -206,6 +328,105 @@ class PolarisNamespaceTool(McpTool):
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}/properties"
         delegate_args["body"] = copy.deepcopy(body)
 
+    def _handle_bulk_update_properties(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        progress: Optional[ProgressCallback],
+    ) -> ToolExecutionResult:
+        body = arguments.get("body")
+        if not isinstance(body, dict) or not (
+            body.get("updates") or body.get("removals")
+        ):
+            raise ValueError(
+                "bulk-update-properties requires a body with `updates` and/or `removals`."
+            )
+        retries = arguments.get("retries", DEFAULT_BULK_RETRIES)
+        if not isinstance(retries, int) or isinstance(retries, bool) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        rate = arguments.get("ratePerSecond", self._requests_per_second)
+        if not isinstance(rate, (int, float)) or isinstance(rate, bool) or rate < 0:
+            raise ValueError("ratePerSecond must be a non-negative number.")
+
+        realm = delegate_args.get("realm")
+        namespaces = self._select_namespaces(
+            arguments, require_text(arguments, "catalog"), realm
+        )
+        if arguments.get("dryRun") is True:
+            payload: JSONDict = {
+                "total": len(namespaces),
+                "namespaces": [list(namespace) for namespace in namespaces],
+            }
+            return ToolExecutionResult(
+                text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+            )
+
+        actions = [
+            BulkAction(
+                index=index,
+                action="update-properties",
+                target=".".join(namespace),
+                method="POST",
+                path=f"{catalog}/namespaces/{namespace_path(namespace)}/properties",
+                body=copy.deepcopy(body),
+            )
+            for index, namespace in enumerate(namespaces)
+        ]
+        payload = run_actions(
+            self._rest_client,
+            actions,
+            realm=realm,
+            max_concurrency=self._max_concurrency,
+            retries=retries,
+            progress=progress,
+            rate_limiter=RateLimiter(float(rate)),
+            include_successes=False,
+        )
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=payload["failed"] > 0,
+            metadata=payload,
+        )
+
+    def _select_namespaces(
+        self, arguments: Dict[str, Any], catalog: str, realm: Optional[str]
+    ) -> List[Namespace]:
+        explicit = arguments.get("namespaces")
+        parent = arguments.get("parent")
+        prefix = arguments.get("prefix")
+        if prefix is not None and not isinstance(prefix, str):
+            raise ValueError("prefix must be a string.")
+        if explicit is not None:
+            if parent is not None or prefix is not None:
+                raise ValueError(
+                    "Provide either `namespaces` or `parent`/`prefix`, not both."
+                )
+            if not isinstance(explicit, list) or not explicit:
+                raise ValueError("namespaces must be a non-empty array.")
+            selected = [
+                tuple(self._resolve_namespace_array({"namespace": entry}))
+                for entry in explicit
+            ]
+            return list(dict.fromkeys(selected))
+        if parent is None and prefix is None:
+            raise ValueError(
+                "bulk-update-properties requires `namespaces`, `parent` or `prefix`."
+            )
+        root = (
+            self._resolve_namespace_array({"namespace": parent})
+            if parent is not None
+            else None
+        )
+        return select_namespaces(
+            self._rest_client,
+            catalog,
+            root=root,
+            prefix=prefix,
+            realm=realm,
+            max_workers=self._max_concurrency,
+        )
+
     def _handle_get_properties(
         self, arguments: Dict[str, Any], delegate_args: JSONDict, catalog: str
     ) -> None:
@@ -220,6 +441,178 @@ class PolarisNamespaceTool(McpTool):
         delegate_args["method"] = "DELETE"
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}"
 
+    def _handle_delete_recursive(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        progress: Optional[ProgressCallback],
+    ) -> ToolExecutionResult:
+        retries = arguments.get("retries", DEFAULT_BULK_RETRIES)
+        if not isinstance(retries, int) or isinstance(retries, bool) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        purge = arguments.get("purge") is True
+        realm = delegate_args.get("realm")
+        raw_catalog = require_text(arguments, "catalog")
+        root: Namespace = tuple(self._resolve_namespace_array(arguments))
+
+        namespaces = [root] + walk_namespaces(
+            self._rest_client,
+            raw_catalog,
+            root=root,
+            realm=realm,
+            max_workers=self._max_concurrency,
+        )
+        outcomes = run_concurrently(
+            lambda namespace: self._list_contents(raw_catalog, namespace, realm),
+            namespaces,
+            self._max_concurrency,
+        )
+        tables: List[Tuple[Namespace, str]] = []
+        views: List[Tuple[Namespace, str]] = []
+        policies: List[Tuple[Namespace, str]] = []
+        for outcome in outcomes:
+            if outcome.error is not None:
+                raise outcome.error
+            table_names, view_names, policy_names = outcome.result or ([], [], [])
+            tables.extend((outcome.item, name) for name in table_names)
+            views.extend((outcome.item, name) for name in view_names)
+            policies.extend((outcome.item, name) for name in policy_names)
+
+        # Deepest namespaces first, so children are dropped before their parents.
+        deepest_first = sorted(namespaces, key=len, reverse=True)
+        payload: JSONDict = {
+            "namespace": list(root),
+            "purge": purge,
+            "tables": [_qualify(namespace, name) for namespace, name in tables],
+            "views": [_qualify(namespace, name) for namespace, name in views],
+            "policies": [_qualify(namespace, name) for namespace, name in policies],
+            "namespaces": [".".join(namespace) for namespace in deepest_first],
+        }
+        total = len(tables) + len(views) + len(policies) + len(namespaces)
+        payload["total"] = total
+        if arguments.get("dryRun") is True:
+            payload["dryRun"] = True
+            return ToolExecutionResult(
+                text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+            )
+
+        table_query = {"purgeRequested": "true"} if purge else None
+        entity_actions = [
+            self._drop_action(
+                "drop-table", catalog, namespace, "tables", name, table_query
+            )
+            for namespace, name in tables
+        ] + [
+            self._drop_action("drop-view", catalog, namespace, "views", name)
+            for namespace, name in views
+        ]
+        policy_actions = [
+            self._drop_action(
+                "drop-policy",
+                catalog,
+                namespace,
+                "policies",
+                name,
+                {"detach-all": "true"},
+            )
+            for namespace, name in policies
+        ]
+        stages: List[Tuple[PolarisRestTool, List[BulkAction]]] = [
+            (self._rest_client, entity_actions)
+        ]
+        if self._policy_rest_client is not None:
+            stages.append((self._policy_rest_client, policy_actions))
+        for depth in sorted({len(namespace) for namespace in namespaces}, reverse=True):
+            stages.append(
+                (
+                    self._rest_client,
+                    [
+                        BulkAction(
+                            index=0,
+                            action="drop-namespace",
+                            target=".".join(namespace),
+                            method="DELETE",
+                            path=f"{catalog}/namespaces/{namespace_path(namespace)}",
+                        )
+                        for namespace in deepest_first
+                        if len(namespace) == depth
+                    ],
+                )
+            )
+
+        done = 0
+        succeeded = 0
+        failures: List[JSONDict] = []
+        for rest_client, actions in stages:
+            if not actions:
+                continue
+            if failures:
+                break
+            summary = run_actions(
+                rest_client,
+                [
+                    dataclasses.replace(action, index=done + offset)
+                    for offset, action in enumerate(actions)
+                ],
+                realm=realm,
+                max_concurrency=self._max_concurrency,
+                retries=retries,
+                progress=_offset_progress(progress, done, total),
+                include_successes=False,
+            )
+            done += summary["total"]
+            succeeded += summary["succeeded"]
+            failures.extend(summary["failures"])
+
+        # Parents of a failed entity cannot be dropped, so later stages are skipped.
+        payload.update(
+            {
+                "succeeded": succeeded,
+                "failed": len(failures),
+                "skipped": total - done,
+                "failures": failures,
+            }
+        )
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=bool(failures),
+            metadata=payload,
+        )
+
+    def _list_contents(
+        self, catalog: str, namespace: Namespace, realm: Optional[str]
+    ) -> Tuple[List[str], List[str], List[str]]:
+        tables = list_tables(self._rest_client, catalog, namespace, realm)
+        views = list_views(self._rest_client, catalog, namespace, realm)
+        policies = (
+            list_policies(self._policy_rest_client, catalog, namespace, realm)
+            if self._policy_rest_client is not None
+            else []
+        )
+        return tables, views, policies
+
+    @staticmethod
+    def _drop_action(
+        action: str,
+        catalog: str,
+        namespace: Namespace,
+        kind: str,
+        name: str,
+        query: Optional[Dict[str, Any]] = None,
+    ) -> BulkAction:
+        return BulkAction(
+            index=0,
+            action=action,
+            target=_qualify(namespace, name),
+            method="DELETE",
+            path=(
+                f"{catalog}/namespaces/{namespace_path(namespace)}/{kind}/"
+                f"{encode_path_segment(name)}"
+            ),
+            query=query,
+        )
+
     def _maybe_augment_error(
         self, result: ToolExecutionResult, operation: str
     ) -> ToolExecutionResult:
@@ -299,4 +692,26 @@ class PolarisNamespaceTool(McpTool):
             return "get-properties"
         if operation in self.DELETE_ALIASES:
             return "delete"
+        if operation in self.DELETE_RECURSIVE_ALIASES:
+            return "delete-recursive"
+        if operation in self.BULK_UPDATE_PROPS_ALIASES:
+            return "bulk-update-properties"
         raise ValueError(f"Unsupported operation: {operation}")
+
+
+def _qualify(namespace: Namespace, name: str) -> str:
+    return ".".join(namespace + (name,))
+
+
+def _offset_progress(
+    progress: Optional[ProgressCallback], offset: int, total: int
+) -> Optional[ProgressCallback]:
+    """Map a stage's progress onto the overall progress of a multi-stage run."""
+
+    if progress is None:
+        return None
+
+    def report(done: float, _: Optional[float], message: Optional[str]) -> None:
+        progress(offset + done, float(total), message)
+
+    return report
@@ -22,15 +22,36 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, Optional, Set
+import json
+from typing import Any, Dict, List, Optional, Set
 
 from polaris_mcp.base import (
     JSONDict,
     McpTool,
+    ProgressCallback,
     ToolExecutionResult,
     copy_if_object,
     require_text,
 )
+from polaris_mcp.bulk import (
+    DEFAULT_BULK_REQUESTS_PER_SECOND,
+    DEFAULT_BULK_RETRIES,
+    BulkAction,
+    run_actions,
+)
+from polaris_mcp.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    RateLimiter,
+    run_concurrently,
+)
+from polaris_mcp.listing import list_tables, select_namespaces
+from polaris_mcp.policies import (
+    ApplicablePolicyCache,
+    PolicyTarget,
+    compact_policy,
+    format_target,
+)
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select, project, resolve_select
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -38,7 +59,7 @@ class PolarisPolicyTool(McpTool):
     """Expose Polaris policy endpoints via MCP."""
 
     TOOL_NAME = "polaris-policy-request"
-    TOOL_DESCRIPTION = "Perform policy operations (list, get, create, update, delete, attach, detach, applicable)."
+    TOOL_DESCRIPTION = "Perform policy operations (list, get, create, update, delete, attach, detach, applicable, applicable-batch)."
 
     LIST_ALIASES: Set[str] = {"list", "ls"}
     GET_ALIASES: Set[str] = {"get", "load", "fetch"}
@@ -48,9 +69,25 @@ class PolarisPolicyTool(McpTool):
     ATTACH_ALIASES: Set[str] = {"attach", "map"}
     DETACH_ALIASES: Set[str] = {"detach", "unmap", "unattach"}
     APPLICABLE_ALIASES: Set[str] = {"applicable", "applicable-policies"}
+    APPLICABLE_BATCH_ALIASES: Set[str] = {"applicable-batch", "batch-applicable"}
+    BULK_ATTACH_ALIASES: Set[str] = {"bulk-attach", "attach-many"}
+    BULK_DETACH_ALIASES: Set[str] = {"bulk-detach", "detach-many"}
+    MUTATING_OPERATIONS = ("create", "update", "delete", "attach", "detach")
+    TARGET_TYPES = ("table", "namespace")
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self,
+        rest_client: PolarisRestTool,
+        applicable_cache: Optional[ApplicablePolicyCache] = None,
+        catalog_rest_client: Optional[PolarisRestTool] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: float = DEFAULT_BULK_REQUESTS_PER_SECOND,
+    ) -> None:
         self._rest_client = rest_client
+        self._applicable_cache = applicable_cache or ApplicablePolicyCache(rest_client)
+        self._catalog_rest_client = catalog_rest_client
+        self._max_concurrency = max_concurrency
+        self._requests_per_second = requests_per_second
 
     @property
     def name(self) -> str:
@@ -75,9 +112,13 @@ class PolarisPolicyTool(McpTool):
                         "attach",
                         "detach",
                         "applicable",
+                        "applicable-batch",
+                        "bulk-attach",
+                        "bulk-detach",
                     ],
                     "description": (
-                        "Policy operation to execute. Supported values: list, get, create, update, delete, attach, detach, applicable."
+                        "Policy operation to execute. Supported values: list, get, create, update, delete, attach, detach, applicable, "
+                        "applicable-batch, bulk-attach, bulk-detach."
                     ),
                 },
                 "catalog": {
@@ -98,6 +139,92 @@ class PolarisPolicyTool(McpTool):
                     "type": "string",
                     "description": "Policy identifier for operations that target a specific policy.",
                 },
+                "targets": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {
+                                "type": "object",
+                                "properties": {
+                                    "namespace": {
+                                        "anyOf": [
+                                            {"type": "string"},
+                                            {
+                                                "type": "array",
+                                                "items": {"type": "string"},
+                                            },
+                                        ]
+                                    },
+                                    "table": {"type": "string"},
+                                },
+                                "required": ["namespace"],
+                            },
+                        ]
+                    },
+                    "description": (
+                        'applicable-batch, bulk-attach, bulk-detach: targets. Strings use "namespace.table" '
+                        "notation; objects without `table` name a namespace."
+                    ),
+                },
+                "parent": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": (
+                        "bulk-attach/bulk-detach: select targets in this namespace tree instead of "
+                        "listing `targets` (tables of the parent and every descendant, or the "
+                        "descendant namespaces when `targetType` is namespace)."
+                    ),
+                },
+                "prefix": {
+                    "type": "string",
+                    "description": (
+                        "bulk-attach/bulk-detach: only select targets in namespaces whose dotted "
+                        "name starts with this prefix."
+                    ),
+                },
+                "targetType": {
+                    "type": "string",
+                    "enum": list(self.TARGET_TYPES),
+                    "description": "bulk-attach/bulk-detach: selector target type (default table).",
+                },
+                "dryRun": {
+                    "type": "boolean",
+                    "description": "bulk-attach/bulk-detach: list the selected targets only.",
+                },
+                "ratePerSecond": {
+                    "type": "number",
+                    "minimum": 0,
+                    "description": (
+                        "bulk-attach/bulk-detach: maximum mapping requests started per second "
+                        "(defaults to POLARIS_BULK_REQUESTS_PER_SECOND; 0 disables the limit)."
+                    ),
+                },
+                "retries": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        "bulk-attach/bulk-detach: retries per target for throttled, server or "
+                        f"transport errors (default {DEFAULT_BULK_RETRIES})."
+                    ),
+                },
+                "policyType": {
+                    "type": "string",
+                    "description": (
+                        "applicable-batch: only resolve policies of this type "
+                        "(for example system.data-compaction)."
+                    ),
+                },
+                "includeContent": {
+                    "type": "boolean",
+                    "description": "applicable-batch: include policy content and version.",
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "applicable-batch: bypass cached lookups.",
+                },
                 "query": {
                     "type": "object",
                     "description": (
@@ -117,11 +244,14 @@ class PolarisPolicyTool(McpTool):
                         "The structure must follow the corresponding Polaris REST schema."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation", "catalog"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
         if not isinstance(arguments, dict):
             raise ValueError("Tool arguments must be a JSON object.")
 
@@ -129,6 +259,10 @@ class PolarisPolicyTool(McpTool):
         normalized = self._normalize_operation(operation)
 
         catalog = encode_path_segment(require_text(arguments, "catalog"))
+        if normalized == "applicable-batch":
+            return self._handle_applicable_batch(arguments)
+        if normalized in ("bulk-attach", "bulk-detach"):
+            return self._handle_bulk_mappings(arguments, normalized, progress)
         namespace: Optional[str] = None
         if normalized != "applicable":
             namespace = encode_path_segment(
@@ -142,6 +276,7 @@ class PolarisPolicyTool(McpTool):
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -169,6 +304,8 @@ class PolarisPolicyTool(McpTool):
                 raise ValueError(f"Unsupported operation: {operation}")
 
         raw = self._rest_client.call(delegate_args)
+        if not raw.is_error and normalized in self.MUTATING_OPERATIONS:
+            self._applicable_cache.invalidate(require_text(arguments, "catalog"))
         return self._maybe_augment_error(raw, normalized)
 
     def _handle_list(
@@ -294,6 +431,186 @@ class PolarisPolicyTool(McpTool):
         delegate_args["method"] = "GET"
         delegate_args["path"] = f"{catalog}/applicable-policies"
 
+    def _handle_applicable_batch(
+        self, arguments: Dict[str, Any]
+    ) -> ToolExecutionResult:
+        catalog = require_text(arguments, "catalog")
+        targets = arguments.get("targets")
+        if not isinstance(targets, list) or not targets:
+            raise ValueError("applicable-batch requires a non-empty `targets` array.")
+        resolved_targets = [self._resolve_target(target) for target in targets]
+        policy_type = arguments.get("policyType")
+        if policy_type is None and isinstance(arguments.get("query"), dict):
+            policy_type = arguments["query"].get("policyType")
+        realm = arguments.get("realm")
+
+        payload = self._applicable_cache.resolve(
+            catalog,
+            resolved_targets,
+            policy_type=policy_type if isinstance(policy_type, str) else None,
+            realm=realm if isinstance(realm, str) and realm.strip() else None,
+            refresh=arguments.get("refresh") is True,
+        )
+        include_content = arguments.get("includeContent") is True
+        payload["policies"] = {
+            target: [compact_policy(policy, include_content) for policy in policies]
+            for target, policies in payload["policies"].items()
+        }
+        payload = project(payload, resolve_select(arguments))
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=bool(payload.get("errors")),
+            metadata=payload,
+        )
+
+    def _handle_bulk_mappings(
+        self,
+        arguments: Dict[str, Any],
+        operation: str,
+        progress: Optional[ProgressCallback],
+    ) -> ToolExecutionResult:
+        catalog = require_text(arguments, "catalog")
+        policy = require_text(
+            arguments, "policy", f"Policy name is required for {operation} operations."
+        )
+        policy_namespace = self._resolve_namespace(arguments.get("namespace"))
+        retries = arguments.get("retries", DEFAULT_BULK_RETRIES)
+        if not isinstance(retries, int) or isinstance(retries, bool) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        rate = arguments.get("ratePerSecond", self._requests_per_second)
+        if not isinstance(rate, (int, float)) or isinstance(rate, bool) or rate < 0:
+            raise ValueError("ratePerSecond must be a non-negative number.")
+        body = arguments.get("body")
+        parameters = body.get("parameters") if isinstance(body, dict) else None
+        realm = arguments.get("realm")
+        realm = realm if isinstance(realm, str) and realm.strip() else None
+
+        targets = self._select_targets(arguments, catalog, realm)
+        payload: JSONDict
+        if arguments.get("dryRun") is True:
+            payload = {
+                "policy": policy,
+                "total": len(targets),
+                "targets": [format_target(target) for target in targets],
+            }
+            return ToolExecutionResult(
+                text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+            )
+
+        path = (
+            f"{encode_path_segment(catalog)}/namespaces/"
+            f"{encode_path_segment(policy_namespace)}/policies/"
+            f"{encode_path_segment(policy)}/mappings"
+        )
+        actions = []
+        for index, (namespace, table) in enumerate(targets):
+            mapping: JSONDict = {
+                "target": {
+                    "type": "table-like" if table else "namespace",
+                    "path": list(namespace) + ([table] if table else []),
+                }
+            }
+            if operation == "bulk-attach" and isinstance(parameters, dict):
+                mapping["parameters"] = copy.deepcopy(parameters)
+            actions.append(
+                BulkAction(
+                    index=index,
+                    action=operation[len("bulk-") :],
+                    target=format_target((namespace, table)),
+                    method="PUT" if operation == "bulk-attach" else "POST",
+                    path=path,
+                    body=mapping,
+                )
+            )
+        payload = run_actions(
+            self._rest_client,
+            actions,
+            realm=realm,
+            max_concurrency=self._max_concurrency,
+            retries=retries,
+            progress=progress,
+            rate_limiter=RateLimiter(float(rate)),
+            include_successes=False,
+        )
+        payload["policy"] = policy
+        if payload["succeeded"]:
+            self._applicable_cache.invalidate(catalog)
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=payload["failed"] > 0,
+            metadata=payload,
+        )
+
+    def _select_targets(
+        self, arguments: Dict[str, Any], catalog: str, realm: Optional[str]
+    ) -> List[PolicyTarget]:
+        explicit = arguments.get("targets")
+        parent = arguments.get("parent")
+        prefix = arguments.get("prefix")
+        if prefix is not None and not isinstance(prefix, str):
+            raise ValueError("prefix must be a string.")
+        if explicit is not None:
+            if parent is not None or prefix is not None:
+                raise ValueError(
+                    "Provide either `targets` or `parent`/`prefix`, not both."
+                )
+            if not isinstance(explicit, list) or not explicit:
+                raise ValueError("targets must be a non-empty array.")
+            return list(
+                dict.fromkeys(self._resolve_target(target) for target in explicit)
+            )
+        if parent is None and prefix is None:
+            raise ValueError(
+                "Provide `targets`, `parent` or `prefix` to select targets."
+            )
+        if self._catalog_rest_client is None:
+            raise ValueError("Target selectors require the catalog REST client.")
+        target_type = str(arguments.get("targetType") or "table").strip().lower()
+        if target_type not in self.TARGET_TYPES:
+            raise ValueError(
+                "targetType must be one of " + ", ".join(self.TARGET_TYPES)
+            )
+        catalog_rest = self._catalog_rest_client
+        namespaces = select_namespaces(
+            catalog_rest,
+            catalog,
+            root=tuple(self._resolve_namespace(parent).split(".")) if parent else None,
+            prefix=prefix,
+            include_root=target_type == "table",
+            realm=realm,
+            max_workers=self._max_concurrency,
+        )
+        if target_type == "namespace":
+            return [(namespace, None) for namespace in namespaces]
+        targets: List[PolicyTarget] = []
+        for outcome in run_concurrently(
+            lambda namespace: list_tables(catalog_rest, catalog, namespace, realm),
+            namespaces,
+            self._max_concurrency,
+        ):
+            if outcome.error is not None:
+                raise outcome.error
+            targets.extend((outcome.item, table) for table in outcome.result or [])
+        return targets
+
+    def _resolve_target(self, target: Any) -> PolicyTarget:
+        if isinstance(target, str):
+            parts = [part.strip() for part in target.split(".")]
+            if len(parts) < 2 or not all(parts):
+                raise ValueError(
+                    f'Invalid table target "{target}"; use "namespace.table" notation.'
+                )
+            return tuple(parts[:-1]), parts[-1]
+        if isinstance(target, dict):
+            namespace: List[str] = self._resolve_namespace(
+                target.get("namespace")
+            ).split(".")
+            table = target.get("table")
+            if table is not None and (not isinstance(table, str) or not table.strip()):
+                raise ValueError("Target `table` must be a non-empty string.")
+            return tuple(namespace), table.strip() if table else None
+        raise ValueError("Each target must be a string or an object with `namespace`.")
+
     def _maybe_augment_error(
         self, result: ToolExecutionResult, operation: str
     ) -> ToolExecutionResult:
@@ -353,6 +670,12 @@ class PolarisPolicyTool(McpTool):
             return "detach"
         if operation in self.APPLICABLE_ALIASES:
             return "applicable"
+        if operation in self.APPLICABLE_BATCH_ALIASES:
+            return "applicable-batch"
+        if operation in self.BULK_ATTACH_ALIASES:
+            return "bulk-attach"
+        if operation in self.BULK_DETACH_ALIASES:
+            return "bulk-detach"
         raise ValueError(f"Unsupported operation: {operation}")
 
     def _require_namespace(self, namespace: Optional[str], operation: str) -> str:
@@ -31,6 +31,8 @@ from polaris_mcp.base import (
     copy_if_object,
     require_text,
 )
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select
+from polaris_mcp.rbac import RbacIndex
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -51,8 +53,11 @@ class PolarisPrincipalTool(McpTool):
     ASSIGN_ROLE_ALIASES: Set[str] = {"assign-principal-role", "assign-role"}
     REVOKE_ROLE_ALIASES: Set[str] = {"revoke-principal-role", "revoke-role"}
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self, rest_client: PolarisRestTool, rbac_index: Optional[RbacIndex] = None
+    ) -> None:
         self._rest_client = rest_client
+        self._rbac_index = rbac_index
 
     @property
     def name(self) -> str:
@@ -111,6 +116,7 @@ class PolarisPrincipalTool(McpTool):
                         "See polaris-management-service.yml for schemas such as CreatePrincipalRequest."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation"],
         }
@@ -125,6 +131,7 @@ class PolarisPrincipalTool(McpTool):
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -154,6 +161,8 @@ class PolarisPrincipalTool(McpTool):
             raise ValueError(f"Unsupported operation: {operation}")
 
         raw = self._rest_client.call(delegate_args)
+        if not raw.is_error and self._rbac_index is not None:
+            self._sync_rbac_index(normalized, arguments, delegate_args.get("realm"))
         return self._maybe_augment_error(raw, normalized)
 
     def _handle_list(self, delegate_args: JSONDict) -> None:
@@ -239,6 +248,15 @@ class PolarisPrincipalTool(McpTool):
         delegate_args["method"] = "DELETE"
         delegate_args["path"] = f"principals/{principal}/principal-roles/{role}"
 
+    def _sync_rbac_index(
+        self, operation: str, arguments: Dict[str, Any], realm: Optional[str]
+    ) -> None:
+        assert self._rbac_index is not None
+        if operation in ("assign-principal-role", "revoke-principal-role"):
+            self._rbac_index.refresh_principal(arguments["principal"], realm)
+        elif operation == "delete":
+            self._rbac_index.forget_principal(arguments["principal"], realm)
+
     def _maybe_augment_error(
         self, result: ToolExecutionResult, operation: str
     ) -> ToolExecutionResult:
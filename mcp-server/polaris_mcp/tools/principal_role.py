@@ -30,6 +30,8 @@ from polaris_mcp.base import (
     copy_if_object,
     require_text,
 )
+from polaris_mcp.projection import SELECT_SCHEMA, copy_select
+from polaris_mcp.rbac import RbacIndex
 from polaris_mcp.rest import PolarisRestTool, encode_path_segment
 
 
@@ -58,8 +60,11 @@ class PolarisPrincipalRoleTool(McpTool):
         "remove-catalog-role",
     }
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self, rest_client: PolarisRestTool, rbac_index: Optional[RbacIndex] = None
+    ) -> None:
         self._rest_client = rest_client
+        self._rbac_index = rbac_index
 
     @property
     def name(self) -> str:
@@ -120,6 +125,7 @@ class PolarisPrincipalRoleTool(McpTool):
                         "See polaris-management-service.yml for request schemas."
                     ),
                 },
+                "select": SELECT_SCHEMA,
             },
             "required": ["operation"],
         }
@@ -134,6 +140,7 @@ class PolarisPrincipalRoleTool(McpTool):
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -161,6 +168,8 @@ class PolarisPrincipalRoleTool(McpTool):
             raise ValueError(f"Unsupported operation: {operation}")
 
         raw = self._rest_client.call(delegate_args)
+        if not raw.is_error and self._rbac_index is not None:
+            self._sync_rbac_index(normalized, arguments, delegate_args.get("realm"))
         return self._maybe_augment_error(raw, normalized)
 
     def _handle_list(self, delegate_args: JSONDict) -> None:
@@ -217,6 +226,23 @@ class PolarisPrincipalRoleTool(McpTool):
             f"{self._principal_role_catalog_path(arguments)}/{catalog_role}"
         )
 
+    def _sync_rbac_index(
+        self, operation: str, arguments: Dict[str, Any], realm: Optional[str]
+    ) -> None:
+        assert self._rbac_index is not None
+        if operation == "delete":
+            self._rbac_index.forget_principal_role(arguments["principalRole"], realm)
+        elif operation in ("assign-catalog-role", "revoke-catalog-role"):
+            catalog_role = arguments.get("catalogRole")
+            body = arguments.get("body")
+            granted = body.get("catalogRole") if isinstance(body, dict) else None
+            if isinstance(granted, dict) and isinstance(granted.get("name"), str):
+                catalog_role = granted["name"]
+            if isinstance(catalog_role, str):
+                self._rbac_index.refresh_catalog_role(
+                    arguments["catalog"], catalog_role, realm
+                )
+
     def _principal_role_path(self, arguments: Dict[str, Any]) -> str:
         role = encode_path_segment(require_text(arguments, "principalRole"))
         return f"principal-roles/{role}"
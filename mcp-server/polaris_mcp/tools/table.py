@@ -22,34 +22,99 @@
 from __future__ import annotations
 
 import copy
+import json
 import string
-from typing import Any, Dict, List, Set
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from polaris_mcp.base import (
     JSONDict,
     McpTool,
+    ProgressCallback,
     ToolExecutionResult,
     copy_if_object,
     require_text,
     NAMESPACE_PATH_DELIMITER,
 )
-from polaris_mcp.rest import PolarisRestTool, encode_path_segment
+from polaris_mcp.bulk import (
+    DEFAULT_BULK_RETRIES,
+    BulkAction,
+    load_manifest,
+    run_actions,
+)
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.credentials import (
+    VENDED_CREDENTIALS,
+    VendedCredentialCache,
+    apply_credentials,
+)
+from polaris_mcp.iceberg import (
+    diff_partition_specs,
+    diff_schemas,
+    diff_sort_orders,
+    resolve_schema_id,
+    snapshot_analytics,
+    summarize_table,
+)
+from polaris_mcp.metadata import TableLoadError, TableMetadataCache
+from polaris_mcp.projection import (
+    SELECT_SCHEMA,
+    copy_select,
+    project,
+    resolve_select,
+)
+from polaris_mcp.rest import PolarisRestTool, RestResponse, encode_path_segment
 
 
 class PolarisTableTool(McpTool):
     """Expose Polaris table REST endpoints through MCP."""
 
     TOOL_NAME = "polaris-iceberg-table-request"
-    TOOL_DESCRIPTION = "Perform table operations (list, get, create, update, delete)."
+    TOOL_DESCRIPTION = (
+        "Perform table operations (list, get, exists, create, update, "
+        "commit-transaction, delete, bulk, snapshot-stats, diff-schema)."
+    )
 
     LIST_ALIASES: Set[str] = {"list", "ls"}
     GET_ALIASES: Set[str] = {"get", "load", "fetch"}
+    EXISTS_ALIASES: Set[str] = {"exists", "head"}
     CREATE_ALIASES: Set[str] = {"create"}
     COMMIT_ALIASES: Set[str] = {"commit", "update"}
+    TRANSACTION_ALIASES: Set[str] = {
+        "commit-transaction",
+        "transaction",
+        "commit-tables",
+    }
     DELETE_ALIASES: Set[str] = {"delete", "drop", "remove"}
+    BULK_ALIASES: Set[str] = {"bulk", "apply-manifest"}
+    SNAPSHOT_STATS_ALIASES: Set[str] = {
+        "snapshot-stats",
+        "snapshot-analytics",
+        "history-stats",
+    }
+    DIFF_SCHEMA_ALIASES: Set[str] = {"diff-schema", "schema-diff", "evolution"}
+    BULK_ACTIONS = ("create", "register", "drop")
+    SNAPSHOT_MODES = ("all", "refs")
+    ENTITY_KINDS = ("table", "view")
+    ACCESS_DELEGATION_HEADER = "X-Iceberg-Access-Delegation"
 
-    def __init__(self, rest_client: PolarisRestTool) -> None:
+    def __init__(
+        self,
+        rest_client: PolarisRestTool,
+        snapshots_mode: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        credential_cache: Optional[VendedCredentialCache] = None,
+        metadata_cache: Optional[TableMetadataCache] = None,
+        export_dir: Optional[str] = None,
+    ) -> None:
         self._rest_client = rest_client
+        self._export_dir = export_dir
+        self._credential_cache = credential_cache
+        self._metadata_cache = metadata_cache or TableMetadataCache(rest_client)
+        self._max_concurrency = max(max_concurrency, 1)
+        self._snapshots_mode = (
+            self._resolve_snapshots_mode(snapshots_mode) if snapshots_mode else None
+        )
 
     @property
     def name(self) -> str:
@@ -65,10 +130,25 @@ class PolarisTableTool(McpTool):
             "properties": {
                 "operation": {
                     "type": "string",
-                    "enum": ["list", "get", "create", "commit", "delete"],
+                    "enum": [
+                        "list",
+                        "get",
+                        "exists",
+                        "create",
+                        "commit",
+                        "commit-transaction",
+                        "delete",
+                        "bulk",
+                        "snapshot-stats",
+                        "diff-schema",
+                    ],
                     "description": (
                         "Table operation to execute. Supported values: list, get (synonyms: load, fetch), "
-                        "create, commit (synonym: update), delete (synonym: drop)."
+                        "exists (synonym: head), create, commit (synonym: update), commit-transaction "
+                        "(synonym: transaction; atomically commits several tables), delete (synonym: drop), "
+                        "bulk (runs a manifest of create/register/drop actions concurrently), "
+                        "snapshot-stats (aggregates the snapshot history into growth and activity statistics), "
+                        "diff-schema (field-level schema, partition spec and sort order evolution diff)."
                     ),
                 },
                 "catalog": {
@@ -82,15 +162,50 @@ class PolarisTableTool(McpTool):
                     ],
                     "description": (
                         "Namespace that contains the target tables. Provide as a string for a single namespace "
-                        'or an array of strings (e.g. ["analytics", "daily"]) for nested namespaces.'
+                        'or an array of strings (e.g. ["analytics", "daily"]) for nested namespaces. '
+                        "Required for every operation except commit-transaction and bulk (where it is "
+                        "the default for manifest entries)."
                     ),
                 },
                 "table": {
                     "type": "string",
                     "description": (
-                        "Table identifier for operations that target a specific table (get, commit, delete)."
+                        "Table identifier for operations that target a specific table (get, exists, commit, delete)."
                     ),
                 },
+                "tables": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {
+                                "type": "object",
+                                "properties": {
+                                    "namespace": {
+                                        "anyOf": [
+                                            {"type": "string"},
+                                            {
+                                                "type": "array",
+                                                "items": {"type": "string"},
+                                            },
+                                        ]
+                                    },
+                                    "table": {"type": "string"},
+                                },
+                                "required": ["namespace", "table"],
+                            },
+                        ]
+                    },
+                    "description": (
+                        "For exists: check many identifiers concurrently and return a boolean map. "
+                        "Strings are names within `namespace`; objects name their own namespace."
+                    ),
+                },
+                "kind": {
+                    "type": "string",
+                    "enum": list(self.ENTITY_KINDS),
+                    "description": "For exists: whether to check tables (default) or views.",
+                },
                 "query": {
                     "type": "object",
                     "description": "Optional query string parameters (for example page-size, page-token, include-drop).",
@@ -103,13 +218,96 @@ class PolarisTableTool(McpTool):
                 },
                 "body": {
                     "type": "object",
-                    "description": "Optional request body payload for create or commit operations.",
+                    "description": (
+                        "Optional request body payload for create, commit or commit-transaction operations."
+                    ),
+                },
+                "manifest": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": (
+                        "For bulk: actions such as "
+                        '{"action": "create", "namespace": "db", "table": "t", "body": {CreateTableRequest}}, '
+                        '{"action": "register", "namespace": "db", "table": "t", "metadataLocation": "s3://..."} '
+                        'or {"action": "drop", "namespace": "db", "table": "t", "purge": false}.'
+                    ),
+                },
+                "manifestPath": {
+                    "type": "string",
+                    "description": "For bulk: JSON or JSONL file inside POLARIS_EXPORT_DIR holding the manifest instead of `manifest`.",
+                },
+                "retries": {
+                    "type": "integer",
+                    "description": "For bulk: retries per item on throttling or server errors (default 2).",
+                },
+                "snapshots": {
+                    "type": "string",
+                    "enum": list(self.SNAPSHOT_MODES),
+                    "description": (
+                        "For get: all returns every snapshot, refs only the snapshots referenced by a "
+                        "branch or tag. Defaults to the server's POLARIS_TABLE_SNAPSHOTS_MODE."
+                    ),
                 },
+                "accessDelegation": {
+                    "anyOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": (
+                        "For get and create: access delegation mechanisms to request, e.g. "
+                        "vended-credentials or remote-signing (sent as X-Iceberg-Access-Delegation)."
+                    ),
+                },
+                "summary": {
+                    "type": "boolean",
+                    "description": (
+                        "For get: return only a summary (current schema, partition spec, sort order, "
+                        "current snapshot totals, snapshot count, last-updated time) instead of the "
+                        "full table metadata."
+                    ),
+                },
+                "windowHours": {
+                    "type": "number",
+                    "exclusiveMinimum": 0,
+                    "description": "For snapshot-stats: width of each time window (default 24).",
+                },
+                "windows": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": (
+                        "For snapshot-stats: number of consecutive windows ending now (default 7)."
+                    ),
+                },
+                "fromVersion": {
+                    "type": "object",
+                    "properties": {
+                        "schemaId": {"type": "integer"},
+                        "snapshotId": {"type": "integer"},
+                        "timestampMs": {"type": "integer"},
+                        "specId": {"type": "integer"},
+                        "sortOrderId": {"type": "integer"},
+                    },
+                    "description": (
+                        "For diff-schema: the older version. Select the schema by schemaId, by "
+                        "snapshotId, or by timestampMs (the snapshot current at that time). "
+                        "specId/sortOrderId add partition spec and sort order diffs."
+                    ),
+                },
+                "toVersion": {
+                    "type": "object",
+                    "description": (
+                        "For diff-schema: the newer version, with the same fields as fromVersion. "
+                        "Defaults to the current schema, default spec and default sort order."
+                    ),
+                },
+                "select": SELECT_SCHEMA,
             },
-            "required": ["operation", "catalog", "namespace"],
+            "required": ["operation", "catalog"],
         }
 
-    def call(self, arguments: Any) -> ToolExecutionResult:
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
         if not isinstance(arguments, dict):
             raise ValueError("Tool arguments must be a JSON object.")
 
@@ -117,12 +315,21 @@ class PolarisTableTool(McpTool):
         normalized = self._normalize_operation(operation)
 
         catalog = encode_path_segment(require_text(arguments, "catalog"))
-        namespace_parts = self._resolve_namespace(arguments.get("namespace"))
-        namespace = encode_path_segment(NAMESPACE_PATH_DELIMITER.join(namespace_parts))
+        if normalized == "commit-transaction" or (
+            normalized == "bulk" and arguments.get("namespace") is None
+        ):
+            namespace_parts: List[str] = []
+            namespace = ""
+        else:
+            namespace_parts = self._resolve_namespace(arguments.get("namespace"))
+            namespace = encode_path_segment(
+                NAMESPACE_PATH_DELIMITER.join(namespace_parts)
+            )
 
         delegate_args: JSONDict = {}
         copy_if_object(arguments.get("query"), delegate_args, "query")
         copy_if_object(arguments.get("headers"), delegate_args, "headers")
+        copy_select(arguments.get("select"), delegate_args)
 
         realm = arguments.get("realm")
         if isinstance(realm, str) and realm.strip():
@@ -132,15 +339,42 @@ class PolarisTableTool(McpTool):
             self._handle_list(delegate_args, catalog, namespace)
         elif normalized == "get":
             self._handle_get(arguments, delegate_args, catalog, namespace)
+        elif normalized == "exists":
+            if arguments.get("tables") is not None:
+                return self._handle_exists_batch(
+                    arguments, delegate_args, catalog, namespace_parts
+                )
+            self._handle_exists(arguments, delegate_args, catalog, namespace)
         elif normalized == "create":
             self._handle_create(arguments, delegate_args, catalog, namespace)
         elif normalized == "commit":
             self._handle_commit(arguments, delegate_args, catalog, namespace)
+        elif normalized == "commit-transaction":
+            self._handle_commit_transaction(arguments, delegate_args, catalog)
+        elif normalized == "bulk":
+            return self._handle_bulk(
+                arguments, delegate_args, catalog, namespace_parts, progress
+            )
         elif normalized == "delete":
             self._handle_delete(arguments, delegate_args, catalog, namespace)
+        elif normalized == "diff-schema":
+            return self._handle_diff_schema(arguments, namespace_parts)
+        elif normalized == "snapshot-stats":
+            return self._handle_snapshot_stats(
+                arguments, delegate_args, catalog, namespace
+            )
         else:  # pragma: no cover - defensive, normalize guarantees handled cases
             raise ValueError(f"Unsupported operation: {operation}")
 
+        transform: Optional[Callable[[Any], Any]] = None
+        if normalized == "get" and arguments.get("summary") is True:
+            transform = summarize_table
+        if normalized == "get" and self._credential_cache is not None:
+            transform = self._apply_credential_cache(delegate_args, transform)
+        elif normalized == "delete" and self._credential_cache is not None:
+            self._credential_cache.invalidate(delegate_args["path"])
+        if transform is not None:
+            return self._rest_client.call(delegate_args, transform=transform)
         return self._rest_client.call(delegate_args)
 
     def _handle_list(
@@ -163,6 +397,216 @@ class PolarisTableTool(McpTool):
         )
         delegate_args["method"] = "GET"
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}/tables/{table}"
+        mode = arguments.get("snapshots")
+        snapshots = (
+            self._resolve_snapshots_mode(mode)
+            if mode is not None
+            else self._snapshots_mode
+        )
+        query = delegate_args.setdefault("query", {})
+        if snapshots and "snapshots" not in query:
+            query["snapshots"] = snapshots
+        if not query:
+            del delegate_args["query"]
+        self._apply_access_delegation(arguments, delegate_args)
+
+    def _handle_snapshot_stats(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        namespace: str,
+    ) -> ToolExecutionResult:
+        table = encode_path_segment(
+            require_text(
+                arguments,
+                "table",
+                "Table name is required for snapshot-stats operations.",
+            )
+        )
+        window_hours = arguments.get("windowHours", 24)
+        if (
+            not isinstance(window_hours, (int, float))
+            or isinstance(window_hours, bool)
+            or window_hours <= 0
+        ):
+            raise ValueError("windowHours must be a positive number.")
+        windows = arguments.get("windows", 7)
+        if not isinstance(windows, int) or isinstance(windows, bool) or windows < 0:
+            raise ValueError("windows must be a non-negative integer.")
+        delegate_args["method"] = "GET"
+        delegate_args["path"] = f"{catalog}/namespaces/{namespace}/tables/{table}"
+        # The statistics need every snapshot's summary, not only the referenced ones.
+        delegate_args.setdefault("query", {})["snapshots"] = "all"
+        now_ms = int(time.time() * 1000)
+        return self._rest_client.call(
+            delegate_args,
+            transform=lambda body: snapshot_analytics(
+                body, float(window_hours), windows, now_ms
+            ),
+        )
+
+    def _handle_diff_schema(
+        self, arguments: Dict[str, Any], namespace_parts: List[str]
+    ) -> ToolExecutionResult:
+        table = require_text(
+            arguments, "table", "Table name is required for diff-schema operations."
+        )
+        versions = []
+        for field in ("fromVersion", "toVersion"):
+            version = arguments.get(field)
+            if version is not None and not isinstance(version, dict):
+                raise ValueError(f"{field} must be an object.")
+            versions.append(version or {})
+        old, new = versions
+        if not old:
+            raise ValueError("fromVersion is required for diff-schema operations.")
+        realm = arguments.get("realm")
+        try:
+            parsed, cached = self._metadata_cache.load(
+                require_text(arguments, "catalog"),
+                namespace_parts,
+                table,
+                realm if isinstance(realm, str) and realm.strip() else None,
+            )
+        except TableLoadError as error:
+            failure: JSONDict = {
+                "table": ".".join([*namespace_parts, table]),
+                "response": _response_summary(error.response),
+            }
+            return ToolExecutionResult(
+                text=json.dumps(failure, indent=2), is_error=True, metadata=failure
+            )
+
+        old_schema = resolve_schema_id(parsed, old)
+        new_schema = resolve_schema_id(parsed, new)
+        old_fields = parsed.schemas.get(old_schema)
+        new_fields = parsed.schemas.get(new_schema)
+        if old_fields is None or new_fields is None:
+            # v1 or trimmed metadata can reference schemas it no longer carries.
+            missing = old_schema if old_fields is None else new_schema
+            failure = {
+                "table": ".".join([*namespace_parts, table]),
+                "error": f"Schema {missing} is not present in the table metadata.",
+            }
+            return ToolExecutionResult(
+                text=json.dumps(failure, indent=2), is_error=True, metadata=failure
+            )
+        payload: JSONDict = {
+            "table": ".".join([*namespace_parts, table]),
+            "metadataLocation": parsed.metadata_location,
+            "cached": cached,
+            "schema": {
+                "from": old_schema,
+                "to": new_schema,
+                **diff_schemas(old_fields, new_fields),
+            },
+        }
+        for label, field, default, entries, differ in (
+            (
+                "partitionSpec",
+                "specId",
+                parsed.default_spec_id,
+                parsed.specs,
+                diff_partition_specs,
+            ),
+            (
+                "sortOrder",
+                "sortOrderId",
+                parsed.default_sort_order_id,
+                parsed.sort_orders,
+                diff_sort_orders,
+            ),
+        ):
+            if old.get(field) is None and new.get(field) is None:
+                continue
+            ids: List[int] = []
+            for version in (old, new):
+                entry_id = version.get(field, default)
+                if not isinstance(entry_id, int) or entry_id not in entries:
+                    raise ValueError(f"Unknown {field}: {entry_id}")
+                ids.append(entry_id)
+            payload[label] = {
+                "from": ids[0],
+                "to": ids[1],
+                **differ(entries[ids[0]], entries[ids[1]], parsed.column_names),
+            }
+        payload = project(payload, resolve_select(arguments))
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
+    def _handle_exists(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        namespace: str,
+    ) -> None:
+        table = encode_path_segment(
+            require_text(
+                arguments, "table", "Table name (or tables) is required for exists."
+            )
+        )
+        kind = self._resolve_kind(arguments)
+        delegate_args["method"] = "HEAD"
+        delegate_args["path"] = f"{catalog}/namespaces/{namespace}/{kind}s/{table}"
+
+    def _handle_exists_batch(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        namespace_parts: List[str],
+    ) -> ToolExecutionResult:
+        kind = self._resolve_kind(arguments)
+        entries = arguments.get("tables")
+        if not isinstance(entries, list) or not entries:
+            raise ValueError("tables must be a non-empty array.")
+        targets: List[Tuple[str, str]] = []
+        for entry in entries:
+            if isinstance(entry, str) and entry.strip():
+                parts, name = namespace_parts, entry.strip()
+            elif isinstance(entry, dict):
+                parts = self._resolve_namespace(entry.get("namespace"))
+                name = require_text(entry, "table")
+            else:
+                raise ValueError(
+                    "Entries of tables must be table names or {namespace, table} objects."
+                )
+            path = encode_path_segment(NAMESPACE_PATH_DELIMITER.join(parts))
+            targets.append(
+                (
+                    ".".join([*parts, name]),
+                    f"{catalog}/namespaces/{path}/{kind}s/{encode_path_segment(name)}",
+                )
+            )
+
+        def head(target: Tuple[str, str]) -> RestResponse:
+            return self._rest_client.fetch(
+                {**delegate_args, "method": "HEAD", "path": target[1]}
+            )
+
+        exists: Dict[str, bool] = {}
+        errors: Dict[str, JSONDict] = {}
+        for outcome in run_concurrently(head, targets, self._max_concurrency):
+            name, response = outcome.item[0], outcome.result
+            if outcome.error is not None or response is None:
+                errors[name] = {"error": str(outcome.error)}
+            elif response.status == 404:
+                exists[name] = False
+            elif not response.ok:
+                errors[name] = _response_summary(response)
+            else:
+                exists[name] = True
+        payload: JSONDict = {"exists": exists}
+        if errors:
+            payload["errors"] = errors
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=bool(errors),
+            metadata=payload,
+        )
 
     def _handle_create(
         self,
@@ -180,6 +624,7 @@ class PolarisTableTool(McpTool):
         delegate_args["method"] = "POST"
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}/tables"
         delegate_args["body"] = copy.deepcopy(body)
+        self._apply_access_delegation(arguments, delegate_args)
 
     def _handle_commit(
         self,
@@ -202,6 +647,132 @@ class PolarisTableTool(McpTool):
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}/tables/{table}"
         delegate_args["body"] = copy.deepcopy(body)
 
+    def _handle_commit_transaction(
+        self, arguments: Dict[str, Any], delegate_args: JSONDict, catalog: str
+    ) -> None:
+        body = arguments.get("body")
+        changes = body.get("table-changes") if isinstance(body, dict) else None
+        if not isinstance(changes, list) or not changes:
+            raise ValueError(
+                "Commit-transaction operations require a body matching the CommitTransactionRequest "
+                'schema: {"table-changes": [CommitTableRequest, ...]}.'
+            )
+        for change in changes:
+            identifier = change.get("identifier") if isinstance(change, dict) else None
+            if (
+                not isinstance(identifier, dict)
+                or not isinstance(identifier.get("namespace"), list)
+                or not isinstance(identifier.get("name"), str)
+            ):
+                raise ValueError(
+                    "Every entry of table-changes needs an identifier with a namespace "
+                    "array and a table name."
+                )
+        delegate_args["method"] = "POST"
+        delegate_args["path"] = f"{catalog}/transactions/commit"
+        delegate_args["body"] = copy.deepcopy(body)
+
+    def _handle_bulk(
+        self,
+        arguments: Dict[str, Any],
+        delegate_args: JSONDict,
+        catalog: str,
+        namespace_parts: List[str],
+        progress: Optional[ProgressCallback],
+    ) -> ToolExecutionResult:
+        entries = load_manifest(
+            arguments.get("manifest"), arguments.get("manifestPath"), self._export_dir
+        )
+        actions = [
+            self._resolve_bulk_action(index, entry, catalog, namespace_parts)
+            for index, entry in enumerate(entries)
+        ]
+        retries = arguments.get("retries", DEFAULT_BULK_RETRIES)
+        if not isinstance(retries, int) or isinstance(retries, bool) or retries < 0:
+            raise ValueError("retries must be a non-negative integer.")
+        payload = run_actions(
+            self._rest_client,
+            actions,
+            realm=delegate_args.get("realm"),
+            max_concurrency=self._max_concurrency,
+            retries=retries,
+            progress=progress,
+        )
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2),
+            is_error=payload["failed"] > 0,
+            metadata=payload,
+        )
+
+    def _resolve_bulk_action(
+        self,
+        index: int,
+        entry: Dict[str, Any],
+        catalog: str,
+        default_namespace: List[str],
+    ) -> BulkAction:
+        action = str(entry.get("action") or "").strip().lower()
+        if action not in self.BULK_ACTIONS:
+            raise ValueError(
+                f"Manifest entry {index}: action must be one of "
+                + ", ".join(self.BULK_ACTIONS)
+            )
+        namespace_parts = (
+            self._resolve_namespace(entry["namespace"])
+            if entry.get("namespace") is not None
+            else default_namespace
+        )
+        if not namespace_parts:
+            raise ValueError(f"Manifest entry {index}: namespace is required.")
+        body = copy.deepcopy(entry.get("body")) if entry.get("body") else {}
+        if not isinstance(body, dict):
+            raise ValueError(f"Manifest entry {index}: body must be an object.")
+        name = entry.get("table") or body.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Manifest entry {index}: table is required.")
+        name = name.strip()
+        namespace = encode_path_segment(NAMESPACE_PATH_DELIMITER.join(namespace_parts))
+        base = f"{catalog}/namespaces/{namespace}"
+        target = ".".join([*namespace_parts, name])
+        if action == "drop":
+            purge = entry.get("purge")
+            return BulkAction(
+                index=index,
+                action=action,
+                target=target,
+                method="DELETE",
+                path=f"{base}/tables/{encode_path_segment(name)}",
+                query={"purgeRequested": "true"} if purge is True else None,
+            )
+        body["name"] = name
+        if action == "register":
+            location = entry.get("metadataLocation") or body.get("metadata-location")
+            if not isinstance(location, str) or not location.strip():
+                raise ValueError(
+                    f"Manifest entry {index}: register requires metadataLocation."
+                )
+            body["metadata-location"] = location.strip()
+            return BulkAction(
+                index=index,
+                action=action,
+                target=target,
+                method="POST",
+                path=f"{base}/register",
+                body=body,
+            )
+        if "schema" not in body:
+            raise ValueError(
+                f"Manifest entry {index}: create requires a CreateTableRequest body with a schema."
+            )
+        return BulkAction(
+            index=index,
+            action=action,
+            target=target,
+            method="POST",
+            path=f"{base}/tables",
+            body=body,
+        )
+
     def _handle_delete(
         self,
         arguments: Dict[str, Any],
@@ -217,17 +788,115 @@ class PolarisTableTool(McpTool):
         delegate_args["method"] = "DELETE"
         delegate_args["path"] = f"{catalog}/namespaces/{namespace}/tables/{table}"
 
+    def _apply_credential_cache(
+        self,
+        delegate_args: JSONDict,
+        transform: Optional[Callable[[Any], Any]],
+    ) -> Optional[Callable[[Any], Any]]:
+        """Serve vended credentials from the cache, or cache the ones about to be vended.
+
+        On a hit the delegation header is dropped, so Polaris does not mint new
+        credentials, and the cached ones are merged into the response.
+        """
+
+        assert self._credential_cache is not None
+        headers = delegate_args.get("headers") or {}
+        header = next(
+            (
+                name
+                for name in headers
+                if name.lower() == self.ACCESS_DELEGATION_HEADER.lower()
+            ),
+            None,
+        )
+        mechanisms = [m.strip() for m in str(headers.get(header, "")).split(",")]
+        if header is None or VENDED_CREDENTIALS not in mechanisms:
+            return transform
+        cache = self._credential_cache
+        key = (delegate_args["path"], self._rest_client.identity(delegate_args))
+        cached = cache.get(key)
+        if cached is not None:
+            remaining = [m for m in mechanisms if m and m != VENDED_CREDENTIALS]
+            if remaining:
+                headers[header] = ",".join(remaining)
+            else:
+                del headers[header]
+
+            def prepare(body: Any) -> Any:
+                return apply_credentials(body, cached)
+
+        else:
+
+            def prepare(body: Any) -> Any:
+                cache.store(key, body)
+                return body
+
+        def chained(body: Any) -> Any:
+            body = prepare(body)
+            return transform(body) if transform is not None else body
+
+        return chained
+
+    def _resolve_kind(self, arguments: Dict[str, Any]) -> str:
+        kind = str(arguments.get("kind") or "table").strip().lower()
+        if kind not in self.ENTITY_KINDS:
+            raise ValueError(
+                f"Unsupported kind: {kind}. Expected one of: "
+                + ", ".join(self.ENTITY_KINDS)
+            )
+        return kind
+
+    def _resolve_snapshots_mode(self, mode: Any) -> str:
+        normalized = str(mode).strip().lower()
+        if normalized not in self.SNAPSHOT_MODES:
+            raise ValueError(
+                f"Unsupported snapshots mode: {mode}. Expected one of: "
+                + ", ".join(self.SNAPSHOT_MODES)
+            )
+        return normalized
+
+    def _apply_access_delegation(
+        self, arguments: Dict[str, Any], delegate_args: JSONDict
+    ) -> None:
+        delegation = arguments.get("accessDelegation")
+        if delegation is None:
+            return
+        mechanisms = [delegation] if isinstance(delegation, str) else delegation
+        if not isinstance(mechanisms, list) or not all(
+            isinstance(item, str) and item.strip() for item in mechanisms
+        ):
+            raise ValueError(
+                "accessDelegation must be a string or an array of non-empty strings."
+            )
+        headers = delegate_args.setdefault("headers", {})
+        if not any(
+            name.lower() == self.ACCESS_DELEGATION_HEADER.lower() for name in headers
+        ):
+            headers[self.ACCESS_DELEGATION_HEADER] = ",".join(
+                item.strip() for item in mechanisms
+            )
+
     def _normalize_operation(self, operation: str) -> str:
         if operation in self.LIST_ALIASES:
             return "list"
         if operation in self.GET_ALIASES:
             return "get"
+        if operation in self.EXISTS_ALIASES:
+            return "exists"
         if operation in self.CREATE_ALIASES:
             return "create"
         if operation in self.COMMIT_ALIASES:
             return "commit"
+        if operation in self.TRANSACTION_ALIASES:
+            return "commit-transaction"
         if operation in self.DELETE_ALIASES:
             return "delete"
+        if operation in self.BULK_ALIASES:
+            return "bulk"
+        if operation in self.SNAPSHOT_STATS_ALIASES:
+            return "snapshot-stats"
+        if operation in self.DIFF_SCHEMA_ALIASES:
+            return "diff-schema"
         raise ValueError(f"Unsupported operation: {operation}")
 
     def _resolve_namespace(self, namespace: Any) -> List[str]:
@@ -252,3 +921,12 @@ class PolarisTableTool(McpTool):
         if not isinstance(namespace, str):
             raise ValueError("Namespace must be a non-empty string.")
         return namespace.strip().split(".")
+
+
+def _response_summary(response: RestResponse) -> JSONDict:
+    """Return the status and, when present, the error body of a failed response."""
+
+    summary: JSONDict = {"status": response.status}
+    if response.body is not None:
+        summary["body"] = response.body
+    return summary
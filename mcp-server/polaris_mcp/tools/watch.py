@@ -0,0 +1,296 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Table change watch MCP tool."""
+
+from __future__ import annotations
+
+import json
+import string
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from polaris_mcp.base import (
+    JSONDict,
+    McpTool,
+    ProgressCallback,
+    ToolExecutionResult,
+    require_text,
+)
+from polaris_mcp.projection import SELECT_SCHEMA, project, resolve_select
+from polaris_mcp.watch import PollResult, TableRef, TableWatcher
+
+
+class PolarisTableWatchTool(McpTool):
+    """Watch Iceberg tables for new snapshots, schema/spec and property changes."""
+
+    TOOL_NAME = "polaris-table-watch-request"
+    TOOL_DESCRIPTION = (
+        "Watch tables for changes (watch, unwatch, list, poll, stream) using conditional requests "
+        "and return compact diffs."
+    )
+
+    WATCH_ALIASES: Set[str] = {"watch", "add"}
+    UNWATCH_ALIASES: Set[str] = {"unwatch", "remove"}
+    LIST_ALIASES: Set[str] = {"list", "ls"}
+    POLL_ALIASES: Set[str] = {"poll"}
+    STREAM_ALIASES: Set[str] = {"stream", "follow"}
+
+    DEFAULT_INTERVAL_SECONDS = 15.0
+    MIN_INTERVAL_SECONDS = 1.0
+    DEFAULT_DURATION_SECONDS = 60.0
+    MAX_DURATION_SECONDS = 3600.0
+
+    def __init__(self, watcher: TableWatcher) -> None:
+        self._watcher = watcher
+
+    @property
+    def name(self) -> str:
+        return self.TOOL_NAME
+
+    @property
+    def description(self) -> str:
+        return self.TOOL_DESCRIPTION
+
+    def input_schema(self) -> JSONDict:
+        return {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "enum": ["watch", "unwatch", "list", "poll", "stream"],
+                    "description": (
+                        "Watch operation to execute. watch registers tables and loads their baseline, "
+                        "poll runs one polling round, stream polls repeatedly and reports diffs as "
+                        "progress notifications."
+                    ),
+                },
+                "catalog": {
+                    "type": "string",
+                    "description": "Default catalog for entries of `tables` that do not name one.",
+                },
+                "tables": {
+                    "type": "array",
+                    "items": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {
+                                "type": "object",
+                                "properties": {
+                                    "catalog": {"type": "string"},
+                                    "namespace": {
+                                        "anyOf": [
+                                            {"type": "string"},
+                                            {
+                                                "type": "array",
+                                                "items": {"type": "string"},
+                                            },
+                                        ]
+                                    },
+                                    "table": {"type": "string"},
+                                },
+                                "required": ["namespace", "table"],
+                            },
+                        ]
+                    },
+                    "description": (
+                        'Tables to watch, unwatch or poll. Strings use "namespace.table" notation '
+                        "(nested namespaces are dot-delimited). Omit to poll every watched table."
+                    ),
+                },
+                "intervalSeconds": {
+                    "type": "number",
+                    "minimum": self.MIN_INTERVAL_SECONDS,
+                    "description": "Delay between polling rounds for stream (default 15, minimum 1).",
+                },
+                "durationSeconds": {
+                    "type": "number",
+                    "description": "How long stream keeps polling (default 60, maximum 3600).",
+                },
+                "select": SELECT_SCHEMA,
+            },
+            "required": ["operation"],
+        }
+
+    def call(
+        self, arguments: Any, progress: Optional[ProgressCallback] = None
+    ) -> ToolExecutionResult:
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+
+        operation = require_text(arguments, "operation").lower().strip()
+        normalized = self._normalize_operation(operation)
+        selectors = resolve_select(arguments)
+
+        realm = arguments.get("realm")
+        realm = realm.strip() if isinstance(realm, str) and realm.strip() else ""
+        refs = self._resolve_tables(arguments, realm)
+
+        if normalized == "watch":
+            if not refs:
+                raise ValueError("watch requires at least one entry in `tables`.")
+            payload = self._watcher.watch(refs).to_json()
+            payload["watching"] = len(self._watcher.watched())
+        elif normalized == "unwatch":
+            if not refs:
+                raise ValueError("unwatch requires at least one entry in `tables`.")
+            payload = {
+                "removed": self._watcher.unwatch(refs),
+                "watching": len(self._watcher.watched()),
+            }
+        elif normalized == "list":
+            payload = {"tables": [ref.to_json() for ref in self._watcher.watched()]}
+        elif normalized == "poll":
+            payload = self._watcher.poll(refs or None).to_json()
+        elif normalized == "stream":
+            payload = self._handle_stream(arguments, refs, progress)
+        else:  # pragma: no cover - normalize guarantees handled cases
+            raise ValueError(f"Unsupported operation: {operation}")
+
+        payload = project(payload, selectors)
+        return ToolExecutionResult(
+            text=json.dumps(payload, indent=2), is_error=False, metadata=payload
+        )
+
+    def _handle_stream(
+        self,
+        arguments: Dict[str, Any],
+        refs: List[TableRef],
+        progress: Optional[ProgressCallback],
+    ) -> JSONDict:
+        interval = self._resolve_seconds(
+            arguments,
+            "intervalSeconds",
+            self.DEFAULT_INTERVAL_SECONDS,
+            minimum=self.MIN_INTERVAL_SECONDS,
+        )
+        duration = min(
+            self._resolve_seconds(
+                arguments, "durationSeconds", self.DEFAULT_DURATION_SECONDS
+            ),
+            self.MAX_DURATION_SECONDS,
+        )
+        if refs:
+            self._watcher.watch(refs)
+        deadline = time.monotonic() + duration
+        combined = PollResult()
+        rounds = 0
+        while True:
+            result = self._watcher.poll(refs or None)
+            rounds += 1
+            combined.diffs.extend(result.diffs)
+            combined.loaded += result.loaded
+            combined.not_modified += result.not_modified
+            combined.failures.extend(result.failures)
+            if progress is not None:
+                progress(
+                    float(rounds),
+                    None,
+                    json.dumps(result.diffs) if result.diffs else None,
+                )
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        payload = combined.to_json()
+        payload["rounds"] = rounds
+        return payload
+
+    @staticmethod
+    def _resolve_seconds(
+        arguments: Dict[str, Any], field: str, default: float, minimum: float = 0.0
+    ) -> float:
+        value = arguments.get(field)
+        if value is None:
+            return default
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"`{field}` must be a number of seconds.") from None
+        if seconds < 0:
+            raise ValueError(f"`{field}` must not be negative.")
+        if seconds < minimum:
+            raise ValueError(f"`{field}` must be at least {minimum:g}.")
+        return seconds
+
+    def _resolve_tables(self, arguments: Dict[str, Any], realm: str) -> List[TableRef]:
+        entries = arguments.get("tables")
+        if entries is None:
+            return []
+        if not isinstance(entries, list):
+            raise ValueError("`tables` must be an array.")
+        default_catalog = arguments.get("catalog")
+        refs: List[TableRef] = []
+        for entry in entries:
+            if isinstance(entry, str):
+                parts = self._split(entry)
+                if len(parts) < 2:
+                    raise ValueError(
+                        f'Table entries must use "namespace.table" notation: {entry}'
+                    )
+                catalog, namespace, table = default_catalog, parts[:-1], parts[-1]
+            elif isinstance(entry, dict):
+                catalog = entry.get("catalog") or default_catalog
+                raw_namespace = entry.get("namespace")
+                namespace = (
+                    self._split(raw_namespace)
+                    if isinstance(raw_namespace, str)
+                    else self._namespace_parts(raw_namespace)
+                )
+                table = require_text(entry, "table")
+            else:
+                raise ValueError("Table entries must be strings or objects.")
+            if not isinstance(catalog, str) or not catalog.strip():
+                raise ValueError(
+                    "Each table needs a catalog; provide `catalog` or set it per entry."
+                )
+            refs.append(TableRef(catalog.strip(), tuple(namespace), table, realm))
+        return refs
+
+    @staticmethod
+    def _split(value: str) -> List[str]:
+        parts = [part.strip() for part in value.strip().split(".")]
+        if not all(parts):
+            raise ValueError(f"Invalid table identifier: {value}")
+        return parts
+
+    @staticmethod
+    def _namespace_parts(namespace: Any) -> List[str]:
+        if not isinstance(namespace, list) or not namespace:
+            raise ValueError("Namespace must be a non-empty string or array.")
+        parts: List[str] = []
+        for element in namespace:
+            if not isinstance(element, str) or not element.strip(string.whitespace):
+                raise ValueError("Namespace array elements must be non-empty strings.")
+            parts.append(element.strip(string.whitespace))
+        return parts
+
+    def _normalize_operation(self, operation: str) -> str:
+        if operation in self.WATCH_ALIASES:
+            return "watch"
+        if operation in self.UNWATCH_ALIASES:
+            return "unwatch"
+        if operation in self.LIST_ALIASES:
+            return "list"
+        if operation in self.POLL_ALIASES:
+            return "poll"
+        if operation in self.STREAM_ALIASES:
+            return "stream"
+        raise ValueError(f"Unsupported operation: {operation}")
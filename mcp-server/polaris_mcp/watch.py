@@ -0,0 +1,173 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Poll Iceberg tables with conditional requests and report compact metadata diffs."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from polaris_mcp.base import JSONDict
+from polaris_mcp.concurrency import DEFAULT_MAX_CONCURRENCY, run_concurrently
+from polaris_mcp.iceberg import TableDigest, diff_digests, digest_table
+from polaris_mcp.listing import Namespace, load_table
+from polaris_mcp.rest import PolarisRestTool
+
+
+@dataclass(frozen=True)
+class TableRef:
+    """Fully qualified table identifier, including the realm it lives in."""
+
+    catalog: str
+    namespace: Namespace
+    table: str
+    realm: str = ""
+
+    def to_json(self) -> JSONDict:
+        node: JSONDict = {
+            "catalog": self.catalog,
+            "namespace": list(self.namespace),
+            "table": self.table,
+        }
+        if self.realm:
+            node["realm"] = self.realm
+        return node
+
+
+@dataclass
+class PollResult:
+    """Outcome of one polling round."""
+
+    diffs: List[JSONDict] = field(default_factory=list)
+    loaded: int = 0
+    not_modified: int = 0
+    failures: List[JSONDict] = field(default_factory=list)
+
+    def to_json(self) -> JSONDict:
+        return {
+            "diffs": self.diffs,
+            "loaded": self.loaded,
+            "notModified": self.not_modified,
+            "failures": self.failures,
+        }
+
+
+@dataclass
+class _WatchEntry:
+    etag: Optional[str] = None
+    digest: Optional[TableDigest] = None
+
+
+class TableWatcher:
+    """Track a set of tables and detect new snapshots, schema/spec and property changes.
+
+    Only an ETag and a compact :class:`~polaris_mcp.iceberg.TableDigest` are retained per
+    table, and every poll uses ``If-None-Match`` so unchanged tables cost a ``304``.
+    """
+
+    def __init__(
+        self,
+        catalog_rest: PolarisRestTool,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._catalog_rest = catalog_rest
+        self._max_concurrency = max(max_concurrency, 1)
+        self._lock = threading.Lock()
+        self._entries: Dict[TableRef, _WatchEntry] = {}
+
+    def watched(self) -> List[TableRef]:
+        with self._lock:
+            return list(self._entries)
+
+    def watch(self, refs: Sequence[TableRef]) -> PollResult:
+        """Add tables to the watch set and load their baseline state."""
+
+        with self._lock:
+            new_refs = [ref for ref in dict.fromkeys(refs) if ref not in self._entries]
+            for ref in new_refs:
+                self._entries[ref] = _WatchEntry()
+        return self._poll(new_refs)
+
+    def unwatch(self, refs: Sequence[TableRef]) -> int:
+        with self._lock:
+            removed = [ref for ref in refs if self._entries.pop(ref, None) is not None]
+        return len(removed)
+
+    def poll(self, refs: Optional[Sequence[TableRef]] = None) -> PollResult:
+        """Revalidate watched tables (or the given subset) and return their diffs."""
+
+        with self._lock:
+            targets = [
+                ref
+                for ref in dict.fromkeys(refs if refs is not None else self._entries)
+                if ref in self._entries
+            ]
+        return self._poll(targets)
+
+    def _poll(self, refs: Sequence[TableRef]) -> PollResult:
+        result = PollResult()
+
+        def revalidate(ref: TableRef) -> Tuple[int, Optional[str], Optional[dict]]:
+            with self._lock:
+                entry = self._entries.get(ref)
+            response = load_table(
+                self._catalog_rest,
+                ref.catalog,
+                ref.namespace,
+                ref.table,
+                realm=ref.realm or None,
+                etag=entry.etag if entry and entry.digest else None,
+                query={"snapshots": "refs"},
+            )
+            if response.status in (304, 404):
+                return response.status, None, None
+            if not response.ok:
+                raise RuntimeError(f"loadTable returned {response.status}")
+            body = response.body if isinstance(response.body, dict) else {}
+            return response.status, response.header("ETag"), body
+
+        for outcome in run_concurrently(revalidate, refs, self._max_concurrency):
+            ref = outcome.item
+            if outcome.error is not None or outcome.result is None:
+                result.failures.append({**ref.to_json(), "error": str(outcome.error)})
+                continue
+            status, etag, body = outcome.result
+            if status == 304:
+                result.not_modified += 1
+                continue
+            if status == 404:
+                with self._lock:
+                    self._entries.pop(ref, None)
+                result.diffs.append({"table": ref.to_json(), "dropped": True})
+                continue
+            result.loaded += 1
+            digest = digest_table(body)
+            with self._lock:
+                entry = self._entries.setdefault(ref, _WatchEntry())
+                previous = entry.digest
+                entry.etag = etag
+                entry.digest = digest
+            if previous is not None:
+                diff = diff_digests(previous, digest, body)
+                if diff:
+                    result.diffs.append({"table": ref.to_json(), **diff})
+        return result
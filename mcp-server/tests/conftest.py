@@ -0,0 +1,70 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Shared fakes for the ``polaris_mcp`` unit tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from polaris_mcp.rest import RestResponse
+
+
+class FakeCatalog:
+    """In-memory ``prod`` catalog with one ``db`` namespace and conditional loadTable.
+
+    ``tables`` maps each table name to its loadTable body. The body's
+    ``metadata-location`` doubles as the ETag, so ``If-None-Match`` with the current
+    location gets a ``304``, and a table missing from ``tables`` gets a ``404``.
+    Every loadTable request is recorded in ``loads``.
+    """
+
+    def __init__(self, **locations: str) -> None:
+        self.tables: dict[str, dict[str, Any]] = {}
+        self.loads: list[dict[str, Any]] = []
+        for name, location in locations.items():
+            self.commit(name, location)
+
+    def commit(
+        self, name: str, location: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        body: dict[str, Any] = {"metadata-location": location}
+        if metadata is not None:
+            body["metadata"] = metadata
+        self.tables[name] = body
+
+    def fetch(self, arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        if path.endswith("/namespaces"):
+            parent = (arguments.get("query") or {}).get("parent")
+            return RestResponse(200, {}, {"namespaces": [] if parent else [["db"]]})
+        if path.endswith("/tables"):
+            identifiers = [{"namespace": ["db"], "name": n} for n in self.tables]
+            return RestResponse(200, {}, {"identifiers": identifiers})
+        if path.endswith("/views"):
+            return RestResponse(200, {}, {"identifiers": []})
+        self.loads.append(arguments)
+        body = self.tables.get(path.rsplit("/", 1)[-1])
+        if body is None:
+            return RestResponse(404, {}, None)
+        etag = body["metadata-location"]
+        if (arguments.get("headers") or {}).get("If-None-Match") == etag:
+            return RestResponse(304, {}, None)
+        return RestResponse(200, {"ETag": etag}, body)
@@ -0,0 +1,335 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.rbac`` and ``polaris_mcp.tools.access``."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.rbac import RbacIndex, RoleGraph, expand_privileges, grant_applies
+from polaris_mcp.rest import RestResponse
+from polaris_mcp.tools.access import PolarisAccessTool
+from polaris_mcp.tools.catalog_role import PolarisCatalogRoleTool
+from polaris_mcp.tools.principal import PolarisPrincipalTool
+
+RESPONSES: dict[str, Any] = {
+    "principals": {"principals": [{"name": "alice"}, {"name": "bob"}]},
+    "principals/bob/principal-roles": {"roles": [{"name": "analyst"}]},
+    "catalogs": {"catalogs": [{"name": "prod"}]},
+    "catalogs/prod/catalog-roles": {"roles": [{"name": "reader"}, {"name": "writer"}]},
+    "catalogs/prod/catalog-roles/reader/principal-roles": {
+        "roles": [{"name": "analyst"}, {"name": "engineer"}]
+    },
+    "catalogs/prod/catalog-roles/writer/principal-roles": {
+        "roles": [{"name": "engineer"}]
+    },
+    "principals/alice/principal-roles": {
+        "roles": [{"name": "analyst"}, {"name": "engineer"}]
+    },
+    "principal-roles/analyst/catalog-roles/prod": {"roles": [{"name": "reader"}]},
+    "principal-roles/engineer/catalog-roles/prod": {
+        "roles": [{"name": "reader"}, {"name": "writer"}]
+    },
+    "catalogs/prod/catalog-roles/reader/grants": {
+        "grants": [
+            {"type": "catalog", "privilege": "CATALOG_READ_PROPERTIES"},
+            {
+                "type": "namespace",
+                "namespace": ["sales"],
+                "privilege": "TABLE_READ_DATA",
+            },
+        ]
+    },
+    "catalogs/prod/catalog-roles/writer/grants": {
+        "grants": [
+            {
+                "type": "table",
+                "namespace": ["sales", "eu"],
+                "tableName": "orders",
+                "privilege": "TABLE_WRITE_DATA",
+            },
+            {
+                "type": "namespace",
+                "namespace": ["ops"],
+                "privilege": "NAMESPACE_FULL_METADATA",
+            },
+        ]
+    },
+}
+
+
+def _build_tool(export_dir: str | None = None) -> tuple[PolarisAccessTool, mock.Mock]:
+    rest_client = mock.Mock()
+    rest_client.identity.return_value = ":caller"
+    rest_client.fetch.side_effect = lambda arguments: RestResponse(
+        200, {}, RESPONSES[arguments["path"]]
+    )
+    role_graph = RoleGraph(rest_client)
+    tool = PolarisAccessTool(
+        role_graph=role_graph,
+        rbac_index=RbacIndex(rest_client, role_graph=role_graph),
+        export_dir=export_dir,
+    )
+    return tool, rest_client
+
+
+def test_grant_applies_follows_namespace_inheritance() -> None:
+    namespace_grant = {"type": "namespace", "namespace": ["sales"]}
+    table_grant = {"type": "table", "namespace": ["sales"], "tableName": "orders"}
+
+    assert grant_applies(namespace_grant, ["sales", "eu"], "orders")
+    assert not grant_applies(namespace_grant, ["ops"])
+    assert not grant_applies(namespace_grant, [])
+    assert grant_applies(table_grant, ["sales"], "orders")
+    assert not grant_applies(table_grant, ["sales"], "orders", kind="view")
+    assert not grant_applies(table_grant, ["sales"])
+    assert expand_privileges(["TABLE_WRITE_DATA"]) == {
+        "TABLE_WRITE_DATA",
+        "TABLE_READ_DATA",
+        "TABLE_READ_PROPERTIES",
+        "TABLE_LIST",
+    }
+
+
+def test_effective_privileges_resolves_role_graph_for_table() -> None:
+    tool, _ = _build_tool()
+
+    result = tool.call(
+        {
+            "operation": "effective-privileges",
+            "principal": "alice",
+            "catalog": "prod",
+            "namespace": "sales.eu",
+            "table": "orders",
+            "privilege": "table_read_data",
+        }
+    )
+
+    assert result.metadata is not None
+    assert result.metadata["principalRoles"] == ["analyst", "engineer"]
+    assert result.metadata["catalogRoles"] == [
+        {"name": "reader", "via": ["analyst", "engineer"]},
+        {"name": "writer", "via": ["engineer"]},
+    ]
+    assert [grant["catalogRole"] for grant in result.metadata["grants"]] == [
+        "reader",
+        "reader",
+        "writer",
+    ]
+    assert "TABLE_WRITE_DATA" in result.metadata["privileges"]
+    assert "NAMESPACE_CREATE" not in result.metadata["privileges"]
+    assert result.metadata["allowed"] is True
+    assert result.metadata["target"] == {
+        "namespace": ["sales", "eu"],
+        "table": "orders",
+    }
+
+
+def test_effective_privileges_caches_role_graph_until_refresh() -> None:
+    tool, rest_client = _build_tool()
+    arguments = {
+        "operation": "check",
+        "principal": "alice",
+        "catalog": "prod",
+        "namespace": ["ops"],
+        "privilege": "NAMESPACE_DROP",
+        "select": ["allowed"],
+    }
+
+    first = tool.call(arguments)
+    calls = rest_client.fetch.call_count
+    second = tool.call(arguments)
+    assert rest_client.fetch.call_count == calls
+    tool.call(dict(arguments, refresh=True))
+
+    assert calls == 5
+    assert rest_client.fetch.call_count == 2 * calls
+    assert first.metadata == second.metadata == {"allowed": True}
+    with pytest.raises(ValueError, match="namespace"):
+        tool.call(
+            {
+                "operation": "check",
+                "principal": "alice",
+                "catalog": "prod",
+                "table": "orders",
+            }
+        )
+
+
+def test_index_answers_can_and_who_can_queries() -> None:
+    tool, rest_client = _build_tool()
+
+    status = tool.call({"operation": "build-index"})
+    calls = rest_client.fetch.call_count
+    can = tool.call(
+        {
+            "operation": "can",
+            "principal": "alice",
+            "privilege": "table_read_data",
+            "catalog": "prod",
+            "namespace": ["sales", "eu"],
+            "table": "orders",
+        }
+    )
+    who = tool.call(
+        {
+            "operation": "who-can",
+            "catalog": "prod",
+            "namespace": "ops.daily",
+            "privilege": "NAMESPACE_DROP",
+        }
+    )
+
+    assert status.metadata is not None
+    assert status.metadata["principals"] == 2
+    assert status.metadata["catalogRoles"] == 2
+    assert status.metadata["grants"] == 4
+    assert rest_client.fetch.call_count == calls
+    assert can.metadata is not None
+    assert can.metadata["allowed"] is True
+    assert {entry["securable"] for entry in can.metadata["via"]} == {
+        "namespace:sales",
+        "table:sales.eu.orders",
+    }
+    assert who.metadata == {
+        "principals": [{"principal": "alice", "privileges": ["NAMESPACE_DROP"]}]
+    }
+
+
+def test_mutating_tools_refresh_the_index_incrementally() -> None:
+    responses = dict(RESPONSES)
+    rest_client = mock.Mock()
+    rest_client.identity.return_value = ":caller"
+    rest_client.fetch.side_effect = lambda arguments: RestResponse(
+        200, {}, responses[arguments["path"]]
+    )
+    index = RbacIndex(rest_client)
+    tool = PolarisAccessTool(role_graph=RoleGraph(rest_client), rbac_index=index)
+    tool.call({"operation": "build-index"})
+    management = mock.Mock()
+    management.call.return_value = ToolExecutionResult(text="ok", is_error=False)
+    catalog_role_tool = PolarisCatalogRoleTool(management, rbac_index=index)
+    principal_tool = PolarisPrincipalTool(management, rbac_index=index)
+    ops_drop = {
+        "operation": "can",
+        "principal": "bob",
+        "privilege": "NAMESPACE_DROP",
+        "catalog": "prod",
+        "namespace": "ops",
+    }
+    assert tool.call(ops_drop).metadata == {
+        "principal": "bob",
+        "privilege": "NAMESPACE_DROP",
+        "allowed": False,
+        "via": [],
+    }
+
+    responses["principals/bob/principal-roles"] = {"roles": [{"name": "engineer"}]}
+    principal_tool.call(
+        {
+            "operation": "assign-role",
+            "principal": "bob",
+            "body": {"principalRole": {"name": "engineer"}},
+        }
+    )
+    result = tool.call(ops_drop)
+    assert result.metadata is not None
+    assert result.metadata["allowed"] is True
+
+    responses["catalogs/prod/catalog-roles/writer/grants"] = {"grants": []}
+    catalog_role_tool.call(
+        {
+            "operation": "revoke-grant",
+            "catalog": "prod",
+            "catalogRole": "writer",
+            "body": {"grant": {"type": "namespace", "namespace": ["ops"]}},
+        }
+    )
+    result = tool.call(ops_drop)
+    assert result.metadata is not None
+    assert result.metadata["allowed"] is False
+    # 9 requests build the index; the two updates cost one and two more.
+    assert rest_client.fetch.call_count == 12
+
+
+def test_export_matrix_streams_rows_to_file(tmp_path: Path) -> None:
+    tool, _ = _build_tool(export_dir=str(tmp_path))
+
+    jsonl = tool.call(
+        {
+            "operation": "export-matrix",
+            "path": str(tmp_path / "matrix.jsonl"),
+            "expand": False,
+        }
+    )
+    exported = tool.call({"operation": "export", "path": "matrix.csv"})
+
+    assert jsonl.metadata is not None
+    assert jsonl.metadata["format"] == "jsonl"
+    assert jsonl.metadata["principals"] == 2
+    rows = [
+        json.loads(line)
+        for line in Path(jsonl.metadata["path"]).read_text().splitlines()
+    ]
+    assert len(rows) == jsonl.metadata["rows"] == 8
+    assert {
+        "principal": "bob",
+        "principalRole": "analyst",
+        "catalog": "prod",
+        "catalogRole": "reader",
+        "securableType": "namespace",
+        "securable": "sales",
+        "privilege": "TABLE_READ_DATA",
+        "grantedPrivilege": "TABLE_READ_DATA",
+    } in rows
+    assert exported.metadata is not None
+    with open(exported.metadata["path"], newline="") as handle:
+        csv_rows = list(csv.DictReader(handle))
+    assert len(csv_rows) == exported.metadata["rows"]
+    assert {
+        row["privilege"]
+        for row in csv_rows
+        if row["principal"] == "bob" and row["grantedPrivilege"] == "TABLE_READ_DATA"
+    } == {"TABLE_READ_DATA", "TABLE_READ_PROPERTIES", "TABLE_LIST"}
+    assert exported.metadata["path"] == str(tmp_path / "matrix.csv")
+    assert "grantedPrivilege" not in exported.text
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_export_matrix_is_confined_to_the_export_directory(tmp_path: Path) -> None:
+    exports = tmp_path / "exports"
+    exports.mkdir()
+    (exports / "escape").symlink_to(tmp_path)
+    tool, _ = _build_tool(export_dir=str(exports))
+
+    for path in ("../matrix.jsonl", str(tmp_path / "matrix.jsonl"), "escape/m.csv"):
+        with pytest.raises(ValueError, match="must be a file inside"):
+            tool.call({"operation": "export-matrix", "path": path})
+    with pytest.raises(ValueError, match="POLARIS_EXPORT_DIR"):
+        _build_tool()[0].call({"operation": "export-matrix", "path": "m.jsonl"})
+    assert list(tmp_path.rglob("*.jsonl")) == []
@@ -31,8 +31,10 @@ import pytest
 from polaris_mcp.authorization import (
     ClientCredentialsAuthorizationProvider,
     StaticAuthorizationProvider,
+    configured_realms,
     none,
 )
+from polaris_mcp.routing import Backend, build_router
 
 
 def test_static_authorization_provider_trims_and_formats() -> None:
@@ -370,3 +372,50 @@ def test_two_realms_one_incomplete(monkeypatch: pytest.MonkeyPatch) -> None:
     http.request.reset_mock()
     assert provider.authorization_header(realm=f"{realm2_name}") is None
     assert http.request.call_count == 0
+
+
+def test_configured_realms_lists_realms_with_complete_credentials() -> None:
+    environ = {
+        "POLARIS_CLIENT_ID": "global",
+        "POLARIS_CLIENT_SECRET": "secret",
+        "POLARIS_REALM_west_CLIENT_ID": "client",
+        "POLARIS_REALM_west_CLIENT_SECRET": "secret",
+        "POLARIS_REALM_EU_CENTRAL_CLIENT_ID": "client",
+        "POLARIS_REALM_EU_CENTRAL_CLIENT_SECRET": "secret",
+        "POLARIS_REALM_east_CLIENT_ID": "client",
+        "POLARIS_REALM_blank_CLIENT_ID": "client",
+        "POLARIS_REALM_blank_CLIENT_SECRET": "  ",
+        "POLARIS_REALM_CONTEXT_HEADER_NAME": "Polaris-Realm",
+    }
+
+    assert configured_realms(environ) == ["EU_CENTRAL", "west"]
+
+
+def test_client_credentials_fetches_routed_realm_token_from_its_backend(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("POLARIS_REALM_west_CLIENT_ID", "client")
+    monkeypatch.setenv("POLARIS_REALM_west_CLIENT_SECRET", "secret")
+    default_http, west_http = mock.Mock(), mock.Mock()
+    west_http.request.return_value = SimpleNamespace(
+        status=200,
+        data=json.dumps({"access_token": "west-token"}).encode("utf-8"),
+    )
+    router = build_router(
+        Backend(base_url="https://polaris/", http=default_http),
+        {"west": "https://west/"},
+        lambda: west_http,
+    )
+    provider = ClientCredentialsAuthorizationProvider(
+        base_url="https://polaris/",
+        http=default_http,
+        refresh_buffer_seconds=60.0,
+        timeout=mock.sentinel.timeout,
+        router=router,
+    )
+
+    assert provider.authorization_header(realm="west") == "Bearer west-token"
+    assert west_http.request.call_args.args[1] == (
+        "https://west/api/catalog/v1/oauth/tokens"
+    )
+    default_http.request.assert_not_called()
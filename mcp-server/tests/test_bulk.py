@@ -0,0 +1,208 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.bulk`` and the table tool's bulk operation."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import urllib3
+
+from polaris_mcp.bulk import load_manifest
+from polaris_mcp.rest import RestResponse
+from polaris_mcp.tools.table import PolarisTableTool
+
+SCHEMA = {"type": "struct", "fields": []}
+
+
+def test_load_manifest_reads_inline_json_and_jsonl(tmp_path: Path) -> None:
+    entries = [{"action": "drop", "table": "a"}, {"action": "drop", "table": "b"}]
+    jsonl = tmp_path / "manifest.jsonl"
+    jsonl.write_text("\n".join(json.dumps(entry) for entry in entries) + "\n")
+    wrapped = tmp_path / "manifest.json"
+    wrapped.write_text(json.dumps({"actions": entries}))
+
+    assert load_manifest(entries) == entries
+    assert load_manifest(path=str(jsonl), export_dir=str(tmp_path)) == entries
+    assert load_manifest(path="manifest.json", export_dir=str(tmp_path)) == entries
+    with pytest.raises(ValueError, match="exactly one"):
+        load_manifest(entries, str(jsonl))
+    with pytest.raises(ValueError, match="not found: missing.json"):
+        load_manifest(path="missing.json", export_dir=str(tmp_path))
+
+
+def test_load_manifest_only_reads_inside_export_dir(tmp_path: Path) -> None:
+    inside = tmp_path / "exports"
+    inside.mkdir()
+    outside = tmp_path / "secret.json"
+    outside.write_text(json.dumps([{"action": "drop", "table": "a"}]))
+
+    with pytest.raises(ValueError, match="disabled"):
+        load_manifest(path=str(outside))
+    with pytest.raises(ValueError, match="must be a file inside"):
+        load_manifest(path=str(outside), export_dir=str(inside))
+    with pytest.raises(ValueError, match="must be a file inside"):
+        load_manifest(path="../secret.json", export_dir=str(inside))
+
+
+def test_bulk_operation_runs_manifest_with_retries_and_progress() -> None:
+    attempts: dict[str, int] = {}
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        attempts[path] = attempts.get(path, 0) + 1
+        if path.endswith("/register") and attempts[path] == 1:
+            return RestResponse(503, {}, None)
+        if path.endswith("/tables/gone"):
+            return RestResponse(
+                404, {}, {"error": {"message": "Table does not exist: gone"}}
+            )
+        return RestResponse(200, {}, {})
+
+    rest_client = mock.Mock()
+    rest_client.fetch.side_effect = fetch
+    tool = PolarisTableTool(rest_client=rest_client, max_concurrency=2)
+    progress = mock.Mock()
+
+    with mock.patch("polaris_mcp.concurrency.time.sleep"):
+        result = tool.call(
+            {
+                "operation": "bulk",
+                "catalog": "prod",
+                "namespace": "db",
+                "manifest": [
+                    {"action": "create", "table": "events", "body": {"schema": SCHEMA}},
+                    {
+                        "action": "register",
+                        "namespace": ["core", "sales"],
+                        "table": "orders",
+                        "metadataLocation": "s3://m/orders.json",
+                    },
+                    {"action": "drop", "table": "gone", "purge": True},
+                ],
+                "realm": "POLARIS",
+            },
+            progress=progress,
+        )
+
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert result.metadata["succeeded"] == 2
+    items = result.metadata["items"]
+    assert items[0] == {
+        "index": 0,
+        "action": "create",
+        "target": "db.events",
+        "attempts": 1,
+        "status": 200,
+        "ok": True,
+    }
+    assert items[1]["target"] == "core.sales.orders"
+    assert items[1]["attempts"] == 2
+    assert items[2]["error"] == "Table does not exist: gone"
+
+    calls = {
+        call.args[0]["path"]: call.args[0] for call in rest_client.fetch.mock_calls
+    }
+    assert calls["prod/namespaces/db/tables"]["body"] == {
+        "schema": SCHEMA,
+        "name": "events",
+    }
+    assert calls["prod/namespaces/core%1Fsales/register"]["body"] == {
+        "name": "orders",
+        "metadata-location": "s3://m/orders.json",
+    }
+    assert calls["prod/namespaces/db/tables/gone"]["query"] == {
+        "purgeRequested": "true"
+    }
+    assert {args["realm"] for args in calls.values()} == {"POLARIS"}
+    assert progress.call_count == 3
+    assert progress.call_args.args[1] == 3.0
+
+
+def test_bulk_operation_retries_post_only_when_it_cannot_have_run() -> None:
+    attempts: dict[str, int] = {}
+    connect_error = urllib3.exceptions.MaxRetryError(
+        mock.Mock(),
+        "/prod",
+        urllib3.exceptions.NewConnectionError(mock.Mock(), "refused"),
+    )
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        key = f"{arguments['method']} {path}"
+        attempts[key] = attempts.get(key, 0) + 1
+        if path.endswith("/register") and attempts[key] == 1:
+            raise connect_error
+        if arguments["method"] == "POST":
+            raise urllib3.exceptions.ReadTimeoutError(mock.Mock(), path, "timed out")
+        if attempts[key] == 1:
+            raise urllib3.exceptions.ReadTimeoutError(mock.Mock(), path, "timed out")
+        return RestResponse(204, {}, None)
+
+    rest_client = mock.Mock()
+    rest_client.fetch.side_effect = fetch
+    tool = PolarisTableTool(rest_client=rest_client)
+
+    with mock.patch("polaris_mcp.concurrency.time.sleep"):
+        result = tool.call(
+            {
+                "operation": "bulk",
+                "catalog": "prod",
+                "namespace": "db",
+                "manifest": [
+                    {"action": "create", "table": "events", "body": {"schema": SCHEMA}},
+                    {
+                        "action": "register",
+                        "table": "orders",
+                        "metadataLocation": "s3://m/orders.json",
+                    },
+                    {"action": "drop", "table": "gone"},
+                ],
+            }
+        )
+
+    assert result.metadata is not None
+    assert [item["attempts"] for item in result.metadata["items"]] == [1, 2, 2]
+    assert [item["ok"] for item in result.metadata["items"]] == [False, False, True]
+    assert "timed out" in result.metadata["items"][0]["error"]
+
+
+def test_bulk_operation_validates_entries_before_sending() -> None:
+    rest_client = mock.Mock()
+    tool = PolarisTableTool(rest_client=rest_client)
+
+    with pytest.raises(ValueError, match="Manifest entry 1: namespace is required"):
+        tool.call(
+            {
+                "operation": "bulk",
+                "catalog": "prod",
+                "manifest": [
+                    {"action": "drop", "namespace": "db", "table": "a"},
+                    {"action": "drop", "table": "b"},
+                ],
+            }
+        )
+    rest_client.fetch.assert_not_called()
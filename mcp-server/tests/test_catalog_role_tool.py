@@ -22,9 +22,11 @@
 from __future__ import annotations
 
 import pytest
+from typing import Any
 from unittest import mock
 
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.rest import RestResponse
 from polaris_mcp.tools.catalog_role import PolarisCatalogRoleTool
 
 
@@ -71,3 +73,118 @@ def test_add_grant_fails_without_body() -> None:
         tool.call(
             {"operation": "add-grant", "catalog": "prod", "catalogRole": "analyst"}
         )
+
+
+READ = {"type": "namespace", "namespace": ["sales"], "privilege": "TABLE_READ_DATA"}
+WRITE = {
+    "type": "table",
+    "namespace": ["sales"],
+    "tableName": "orders",
+    "privilege": "TABLE_WRITE_DATA",
+}
+LIST = {"type": "catalog", "privilege": "NAMESPACE_LIST"}
+
+
+def _reconcile_tool() -> tuple[PolarisCatalogRoleTool, mock.Mock]:
+    current = {"analyst": [READ, LIST], "engineer": [WRITE]}
+    rest_client = mock.Mock()
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        role = arguments["path"].split("/")[3]
+        if arguments["method"] == "GET":
+            return RestResponse(200, {}, {"grants": current[role]})
+        return RestResponse(201 if arguments["method"] == "PUT" else 204, {}, None)
+
+    rest_client.fetch.side_effect = fetch
+    tool = PolarisCatalogRoleTool(rest_client=rest_client, requests_per_second=0)
+    return tool, rest_client
+
+
+def test_reconcile_grants_dry_run_returns_minimal_plan() -> None:
+    tool, rest_client = _reconcile_tool()
+
+    result = tool.call(
+        {
+            "operation": "reconcile-grants",
+            "catalog": "prod",
+            "desired": {
+                "analyst": [dict(READ, privilege="table_read_data"), WRITE],
+                "engineer": [WRITE],
+            },
+            "dryRun": True,
+        }
+    )
+
+    assert result.metadata == {
+        "catalog": "prod",
+        "roles": {
+            "analyst": {"add": [WRITE], "revoke": [LIST], "unchanged": 1},
+            "engineer": {"add": [], "revoke": [], "unchanged": 1},
+        },
+        "adds": 1,
+        "revokes": 1,
+        "dryRun": True,
+    }
+    assert {call.args[0]["method"] for call in rest_client.fetch.call_args_list} == {
+        "GET"
+    }
+
+
+def test_reconcile_grants_applies_adds_and_revokes() -> None:
+    tool, rest_client = _reconcile_tool()
+
+    result = tool.call(
+        {
+            "operation": "sync-grants",
+            "catalog": "prod",
+            "desired": {"analyst": [READ, WRITE], "engineer": []},
+        }
+    )
+
+    changes = sorted(
+        (call.args[0]["method"], call.args[0]["path"], call.args[0]["body"]["grant"])
+        for call in rest_client.fetch.call_args_list
+        if call.args[0]["method"] != "GET"
+    )
+    assert changes == [
+        ("POST", "catalogs/prod/catalog-roles/analyst/grants", LIST),
+        ("POST", "catalogs/prod/catalog-roles/engineer/grants", WRITE),
+        ("PUT", "catalogs/prod/catalog-roles/analyst/grants", WRITE),
+    ]
+    assert result.is_error is False
+    assert result.metadata is not None
+    assert result.metadata["succeeded"] == 3
+    assert result.metadata["failures"] == []
+    with pytest.raises(ValueError, match="privilege"):
+        tool.call(
+            {
+                "operation": "reconcile-grants",
+                "catalog": "prod",
+                "desired": {"analyst": [{"type": "catalog"}]},
+            }
+        )
+
+
+def test_reconcile_grants_reports_failures_with_action_indices() -> None:
+    tool, rest_client = _reconcile_tool()
+    fetch = rest_client.fetch.side_effect
+
+    def reject_adds(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["method"] == "PUT":
+            return RestResponse(400, {}, {"error": {"message": "bad grant"}})
+        return fetch(arguments)
+
+    rest_client.fetch.side_effect = reject_adds
+    grants = [dict(READ, namespace=[f"ns{index}"]) for index in range(3)]
+
+    result = tool.call(
+        {
+            "operation": "reconcile-grants",
+            "catalog": "prod",
+            "desired": {"analyst": [], "engineer": [WRITE, *grants]},
+        }
+    )
+
+    assert result.metadata is not None
+    assert result.metadata["succeeded"] == 2
+    assert [failure["index"] for failure in result.metadata["failures"]] == [2, 3, 4]
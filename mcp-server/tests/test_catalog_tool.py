@@ -21,10 +21,15 @@
 
 from __future__ import annotations
 
+import json
+from pathlib import Path
+from typing import Any
+
 import pytest
 from unittest import mock
 
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.rest import RestResponse
 from polaris_mcp.tools.catalog import PolarisCatalogTool
 
 
@@ -74,3 +79,122 @@ def test_create_operation_requires_body_present() -> None:
     tool, _ = _build_tool()
     with pytest.raises(ValueError, match="Create operations require"):
         tool.call({"operation": "create"})
+
+
+CATALOGS: dict[str, dict[str, Any]] = {
+    "src": {
+        "namespaces": {"sales": {"owner": "a"}, "ops": {}},
+        "tables": {
+            "sales": {"orders": "s3://src/orders/3.json", "returns": "s3://r.json"},
+            "ops": {"jobs": "s3://jobs.json"},
+        },
+        "grants": {"reader": [{"type": "catalog", "privilege": "TABLE_READ_DATA"}]},
+    },
+    "dst": {
+        "namespaces": {"sales": {"owner": "a"}, "ops": {}, "tmp": {}},
+        "tables": {
+            "sales": {"orders": "s3://dst/orders/3.json"},
+            "ops": {"jobs": None},
+            "tmp": {},
+        },
+        "grants": {"reader": [{"type": "catalog", "privilege": "TABLE_WRITE_DATA"}]},
+    },
+}
+
+
+def _diff_tool(export_dir: str | None = None) -> PolarisCatalogTool:
+    catalog_rest = mock.Mock()
+
+    def catalog_fetch(arguments: dict[str, Any]) -> RestResponse:
+        catalog, _, *rest = arguments["path"].split("/")
+        state = CATALOGS[catalog]
+        if not rest:
+            if arguments.get("query", {}).get("parent"):
+                return RestResponse(200, {}, {"namespaces": []})
+            names = [[name] for name in state["namespaces"]]
+            return RestResponse(200, {}, {"namespaces": names})
+        namespace = rest[0]
+        if len(rest) == 1:
+            properties = state["namespaces"][namespace]
+            return RestResponse(
+                200, {}, {"namespace": [namespace], "properties": properties}
+            )
+        if len(rest) == 2:
+            identifiers = [{"name": name} for name in state["tables"][namespace]]
+            return RestResponse(200, {}, {"identifiers": identifiers})
+        location = state["tables"][namespace][rest[2]]
+        if location is None:
+            return RestResponse(403, {}, {"error": {"message": "denied"}})
+        return RestResponse(
+            200, {}, {"metadata-location": location, "metadata": {"properties": {}}}
+        )
+
+    catalog_rest.fetch.side_effect = catalog_fetch
+    management_rest = mock.Mock()
+
+    def management_fetch(arguments: dict[str, Any]) -> RestResponse:
+        parts = arguments["path"].split("/")
+        grants = CATALOGS[parts[1]]["grants"]
+        if parts[-1] == "catalog-roles":
+            return RestResponse(200, {}, {"roles": [{"name": n} for n in grants]})
+        return RestResponse(200, {}, {"grants": grants[parts[3]]})
+
+    management_rest.fetch.side_effect = management_fetch
+    return PolarisCatalogTool(
+        rest_client=management_rest,
+        catalog_rest_client=catalog_rest,
+        export_dir=export_dir,
+    )
+
+
+def test_diff_reports_drift_between_catalogs(tmp_path: Path) -> None:
+    tool = _diff_tool(export_dir=str(tmp_path))
+    progress = mock.Mock()
+    export = tmp_path / "drift.jsonl"
+
+    result = tool.call(
+        {
+            "operation": "drift",
+            "catalog": "src",
+            "targetCatalog": "dst",
+            "path": str(export),
+        },
+        progress=progress,
+    )
+
+    assert result.metadata is not None
+    assert result.metadata["inSync"] is False
+    assert result.metadata["drift"] == {
+        "namespace": {"extra": {"count": 1, "names": ["tmp"]}},
+        "table": {
+            "missing": {"count": 1, "names": ["sales.returns"]},
+            "metadataLocationChanged": {"count": 1, "names": ["sales.orders"]},
+        },
+        "catalogRole": {"grantsChanged": {"count": 1, "names": ["reader"]}},
+    }
+    assert result.metadata["source"]["tables"] == 3
+    assert result.metadata["target"]["errors"] == {"ops.jobs": "loadTable returned 403"}
+    assert result.metadata["export"]["rows"] == 4
+    rows = [json.loads(line) for line in export.read_text().splitlines()]
+    assert rows[0] == {"kind": "namespace", "drift": "extra", "name": "tmp"}
+    assert progress.call_count == 5
+
+
+def test_diff_requires_distinct_sides() -> None:
+    tool = _diff_tool()
+
+    with pytest.raises(ValueError, match="targetCatalog or targetRealm"):
+        tool.call({"operation": "diff", "catalog": "src"})
+
+    result = tool.call(
+        {
+            "operation": "diff",
+            "catalog": "src",
+            "targetCatalog": "dst",
+            "includeGrants": False,
+            "limit": 0,
+        }
+    )
+    assert result.metadata is not None
+    assert result.metadata["drift"]["table"]["missing"] == {"count": 1, "names": []}
+    assert "catalogRole" not in result.metadata["drift"]
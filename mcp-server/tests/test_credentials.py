@@ -0,0 +1,129 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.credentials`` and its use by the table tool."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest import mock
+
+from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.credentials import (
+    REDACTED,
+    VendedCredentialCache,
+    redact_credentials,
+)
+from polaris_mcp.tools.table import PolarisTableTool
+
+
+def _load_result(expires_in_seconds: float) -> dict[str, Any]:
+    expires_at_ms = int((time.time() + expires_in_seconds) * 1000)
+    return {
+        "metadata-location": "s3://m/1.json",
+        "metadata": {"format-version": 2},
+        "config": {
+            "s3.access-key-id": "AKIA",
+            "s3.secret-access-key": "secret",
+            "s3.session-token": "session",
+            "s3.session-token-expires-at-ms": str(expires_at_ms),
+            "client.region": "us-east-1",
+        },
+        "storage-credentials": [
+            {
+                "prefix": "s3://warehouse/events",
+                "config": {
+                    "s3.secret-access-key": "secret",
+                    "s3.session-token-expires-at-ms": str(expires_at_ms),
+                },
+            }
+        ],
+    }
+
+
+def _build_tool(cache: VendedCredentialCache) -> tuple[PolarisTableTool, mock.Mock]:
+    rest_client = mock.Mock()
+    rest_client.identity.return_value = "POLARIS:abc"
+
+    def call(arguments: dict[str, Any], transform: Any = None) -> ToolExecutionResult:
+        body: Any = {"metadata-location": "s3://m/1.json", "config": {}}
+        headers = arguments.get("headers") or {}
+        if "vended-credentials" in headers.get("X-Iceberg-Access-Delegation", ""):
+            body = _load_result(3600)
+        if transform is not None:
+            body = transform(body)
+        return ToolExecutionResult(text="ok", is_error=False, metadata={"body": body})
+
+    rest_client.call.side_effect = call
+    return PolarisTableTool(
+        rest_client=rest_client, credential_cache=cache
+    ), rest_client
+
+
+def test_repeat_loads_reuse_cached_vended_credentials() -> None:
+    cache = VendedCredentialCache(refresh_buffer_seconds=60)
+    tool, rest_client = _build_tool(cache)
+    arguments = {
+        "operation": "get",
+        "catalog": "prod",
+        "namespace": "db",
+        "table": "events",
+        "accessDelegation": "vended-credentials",
+    }
+
+    first = tool.call(arguments)
+    second = tool.call(arguments)
+
+    first_headers = rest_client.call.call_args_list[0].args[0]["headers"]
+    second_headers = rest_client.call.call_args_list[1].args[0].get("headers", {})
+    assert first_headers["X-Iceberg-Access-Delegation"] == "vended-credentials"
+    assert "X-Iceberg-Access-Delegation" not in second_headers
+    assert first.metadata is not None and second.metadata is not None
+    body = second.metadata["body"]
+    assert body["config"]["s3.session-token"] == "session"
+    assert "client.region" not in body["config"]
+    assert body["storage-credentials"][0]["prefix"] == "s3://warehouse/events"
+    assert len(cache) == 1
+
+    tool.call({**arguments, "operation": "drop"})
+    assert len(cache) == 0
+
+
+def test_cache_skips_credentials_close_to_expiry() -> None:
+    cache = VendedCredentialCache(refresh_buffer_seconds=300)
+
+    cache.store(("path", "me"), _load_result(120))
+    assert cache.get(("path", "me")) is None
+
+    cache.store(("path", "me"), {"config": {"s3.secret-access-key": "no-expiry"}})
+    assert len(cache) == 0
+
+
+def test_redact_credentials_masks_secrets_only() -> None:
+    redacted = redact_credentials({"meta": {"response": {"body": _load_result(60)}}})
+
+    body = redacted["meta"]["response"]["body"]
+    assert body["config"]["s3.secret-access-key"] == REDACTED
+    assert body["config"]["s3.session-token"] == REDACTED
+    assert body["config"]["client.region"] == "us-east-1"
+    assert body["config"]["s3.session-token-expires-at-ms"] != REDACTED
+    assert body["storage-credentials"][0]["config"]["s3.secret-access-key"] == REDACTED
+    assert body["storage-credentials"][0]["prefix"] == "s3://warehouse/events"
@@ -0,0 +1,98 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+"""Unit tests for ``polaris_mcp.fanout``."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.fanout import RealmFanOut
+
+
+def _call(arguments: dict[str, Any]) -> ToolExecutionResult:
+    realm = arguments["realm"]
+    if realm == "broken":
+        raise RuntimeError("connection refused")
+    if realm == "denied":
+        return ToolExecutionResult(text="403", is_error=True, metadata={"status": 403})
+    return ToolExecutionResult(
+        text=f"{arguments['operation']} {realm}",
+        is_error=False,
+        metadata={"catalogs": [f"{realm}-catalog"]},
+    )
+
+
+def test_resolve_expands_configured_realms_and_deduplicates() -> None:
+    fan_out = RealmFanOut(realms_provider=lambda: ["east", "west"])
+
+    assert fan_out.resolve("*") == ["east", "west"]
+    assert fan_out.resolve(["west", " *", "north"]) == ["west", "east", "north"]
+    with pytest.raises(ValueError, match="non-empty"):
+        fan_out.resolve(["east", " "])
+    with pytest.raises(ValueError, match="at least one"):
+        fan_out.resolve([])
+    with pytest.raises(ValueError, match="No realms are configured"):
+        RealmFanOut(realms_provider=list).resolve("*")
+
+
+def test_call_merges_per_realm_results_with_status() -> None:
+    updates: list[tuple[float, float | None, str | None]] = []
+    fan_out = RealmFanOut(realms_provider=list, max_concurrency=4)
+
+    result = fan_out.call(
+        _call,
+        {"operation": "list"},
+        ["east", "denied", "broken"],
+        progress=lambda *update: updates.append(update),
+    )
+
+    assert result.is_error is False
+    payload = json.loads(result.text)
+    assert payload["realms"] == 3
+    assert payload["succeeded"] == 1
+    assert payload["failed"] == 2
+    assert payload["results"] == [
+        {
+            "realm": "east",
+            "status": "ok",
+            "text": "list east",
+            "meta": {"catalogs": ["east-catalog"]},
+        },
+        {"realm": "denied", "status": "error", "text": "403", "meta": {"status": 403}},
+        {"realm": "broken", "status": "failed", "error": "connection refused"},
+    ]
+    assert result.metadata is not None
+    assert [entry.get("text") for entry in result.metadata["results"]] == [None] * 3
+    assert sorted(update[0] for update in updates) == [1.0, 2.0, 3.0]
+    assert {update[1] for update in updates} == {3.0}
+
+
+def test_call_is_error_when_no_realm_succeeds() -> None:
+    fan_out = RealmFanOut(realms_provider=list)
+
+    result = fan_out.call(_call, {"operation": "list"}, ["broken", "denied"])
+
+    assert result.is_error is True
+    with pytest.raises(ValueError, match="either realm or realms"):
+        fan_out.call(_call, {"operation": "list", "realm": "east"}, ["west"])
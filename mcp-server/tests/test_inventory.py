@@ -0,0 +1,410 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.inventory`` and the inventory tool."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+import urllib3
+from conftest import FakeCatalog
+
+from polaris_mcp.inventory import (
+    InventorySnapshot,
+    InventoryStore,
+    PolarisInventory,
+    TableChange,
+)
+from polaris_mcp.listing import list_namespaces
+from polaris_mcp.rest import RestResponse
+from polaris_mcp.routing import Backend, RealmRouter
+from polaris_mcp.tools.inventory import PolarisInventoryTool
+
+
+def _management_rest() -> mock.Mock:
+    rest = mock.Mock()
+    rest.fetch.return_value = RestResponse(
+        status=200, headers={}, body={"catalogs": [{"name": "prod"}]}
+    )
+    return rest
+
+
+def _catalog_rest() -> mock.Mock:
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        query = arguments.get("query") or {}
+        if path == "prod/namespaces" and "parent" not in query:
+            if "pageToken" not in query:
+                return RestResponse(
+                    200,
+                    {},
+                    {"namespaces": [["analytics"]], "next-page-token": "p2"},
+                )
+            return RestResponse(200, {}, {"namespaces": [["sales"]]})
+        if path == "prod/namespaces" and query["parent"] == "analytics":
+            return RestResponse(200, {}, {"namespaces": [["analytics", "daily"]]})
+        if path == "prod/namespaces":
+            return RestResponse(200, {}, {"namespaces": []})
+        if path == "prod/namespaces/analytics%1Fdaily/tables":
+            return RestResponse(
+                200,
+                {},
+                {"identifiers": [{"namespace": ["analytics", "daily"], "name": "t1"}]},
+            )
+        return RestResponse(200, {}, {"identifiers": []})
+
+    rest = mock.Mock()
+    rest.fetch.side_effect = fetch
+    return rest
+
+
+def test_refresh_crawls_catalog_tree_and_persists_snapshot(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"))
+    inventory = PolarisInventory(
+        catalog_rest=_catalog_rest(),
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+        store=store,
+    )
+
+    snapshot = inventory.refresh("POLARIS")
+
+    assert snapshot.catalogs == ["prod"]
+    assert snapshot.namespaces["prod"] == [
+        ("analytics",),
+        ("sales",),
+        ("analytics", "daily"),
+    ]
+    assert snapshot.tables[("prod", ("analytics", "daily"))] == ["t1"]
+
+    (loaded,) = store.load_all("https://polaris/")
+    assert loaded.realm == "POLARIS"
+    assert loaded.tables[("prod", ("analytics", "daily"))] == ["t1"]
+    assert store.load_all("https://other/") == []
+
+
+def test_listing_rejects_a_repeated_page_token() -> None:
+    rest = mock.Mock()
+    rest.fetch.return_value = RestResponse(
+        200, {}, {"namespaces": [["db"]], "next-page-token": "p2"}
+    )
+
+    with pytest.raises(RuntimeError, match="repeated page token 'p2'"):
+        list_namespaces(rest, "prod")
+
+    assert [call.args[0].get("query") for call in rest.fetch.call_args_list] == [
+        None,
+        {"pageToken": "p2"},
+    ]
+
+
+def test_start_serves_persisted_snapshot_without_crawling(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"))
+    store.save(
+        "https://polaris/",
+        InventorySnapshot(
+            realm="",
+            refreshed_at=123.0,
+            catalogs=["prod"],
+            namespaces={"prod": [("analytics",)]},
+            tables={("prod", ("analytics",)): ["events"]},
+        ),
+    )
+    catalog_rest = mock.Mock()
+    management_rest = mock.Mock()
+    inventory = PolarisInventory(
+        catalog_rest=catalog_rest,
+        management_rest=management_rest,
+        base_url="https://polaris/",
+        store=store,
+        revalidate_after_seconds=float("inf"),
+    )
+
+    with mock.patch.object(inventory, "_revalidate_in_background") as revalidate:
+        inventory.start()
+        snapshot = inventory.snapshot()
+
+    revalidate.assert_called_once_with("")
+    assert snapshot.tables == {("prod", ("analytics",)): ["events"]}
+    management_rest.fetch.assert_not_called()
+    catalog_rest.fetch.assert_not_called()
+
+
+def test_inventory_tool_lists_tables_under_namespace() -> None:
+    inventory = PolarisInventory(
+        catalog_rest=_catalog_rest(),
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+    )
+    tool = PolarisInventoryTool(inventory=inventory)
+
+    result = tool.call(
+        {"operation": "list-tables", "catalog": "prod", "namespace": "analytics"}
+    )
+
+    assert not result.is_error
+    payload = json.loads(result.text)
+    assert payload["identifiers"] == [
+        {"namespace": ["analytics", "daily"], "name": "t1"}
+    ]
+
+    with pytest.raises(ValueError, match="Catalog not found"):
+        tool.call({"operation": "list-namespaces", "catalog": "missing"})
+
+
+def _two_tables() -> FakeCatalog:
+    return FakeCatalog(t1="s3://m/t1-1.json", t2="s3://m/t2-1.json")
+
+
+def test_incremental_sync_reloads_only_changed_tables_and_records_feed() -> None:
+    fake = _two_tables()
+    catalog_rest = mock.Mock()
+    catalog_rest.fetch.side_effect = fake.fetch
+    inventory = PolarisInventory(
+        catalog_rest=catalog_rest,
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+    )
+
+    baseline = inventory.sync(mode="incremental")
+    assert baseline.baseline
+    assert baseline.loaded == 2
+    assert baseline.changes == []
+
+    assert {load["query"]["snapshots"] for load in fake.loads} == {"refs"}
+    fake.loads.clear()
+    fake.commit("t2", "s3://m/t2-2.json")
+    fake.commit("t3", "s3://m/t3-1.json")
+    del fake.tables["t1"]
+
+    result = inventory.sync(mode="incremental")
+
+    loads = [
+        (
+            load["path"].rsplit("/", 1)[-1],
+            (load.get("headers") or {}).get("If-None-Match"),
+        )
+        for load in fake.loads
+    ]
+    assert sorted(loads) == [("t2", "s3://m/t2-1.json"), ("t3", None)]
+    assert result.loaded == 2
+    summary = {(c.change, c.name, c.metadata_location) for c in result.changes}
+    assert summary == {
+        ("removed", "t1", None),
+        ("updated", "t2", "s3://m/t2-2.json"),
+        ("added", "t3", "s3://m/t3-1.json"),
+    }
+
+    fake.loads.clear()
+    unchanged = inventory.sync(mode="incremental")
+    assert unchanged.not_modified == 2
+    assert unchanged.changes == []
+
+    feed = inventory.changes_since(since=0)
+    assert [c.seq for c in feed] == [1, 2, 3]
+    assert inventory.changes_since(since=2)[0].seq == 3
+
+    with pytest.raises(ValueError, match="Unsupported sync mode"):
+        inventory.sync(mode="bogus")
+
+
+def test_incremental_sync_after_structure_sync_records_no_changes() -> None:
+    fake = _two_tables()
+    inventory = PolarisInventory(
+        catalog_rest=mock.Mock(**{"fetch.side_effect": fake.fetch}),
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+    )
+    inventory.refresh()
+
+    result = inventory.sync(mode="incremental")
+
+    assert not result.baseline
+    assert result.loaded == 2
+    assert result.baselined == 2
+    assert result.changes == []
+    assert inventory.changes_since(since=0) == []
+
+    fake.commit("t1", "s3://m/t1-2.json")
+    updated = inventory.sync(mode="incremental")
+    assert [(c.change, c.previous_metadata_location) for c in updated.changes] == [
+        ("updated", "s3://m/t1-1.json")
+    ]
+
+
+def test_incremental_sync_records_added_table_whose_first_load_fails() -> None:
+    fake = _two_tables()
+    failing = {"t3"}
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["path"].rsplit("/", 1)[-1] in failing:
+            return RestResponse(503, {}, None)
+        return fake.fetch(arguments)
+
+    inventory = PolarisInventory(
+        catalog_rest=mock.Mock(**{"fetch.side_effect": fetch}),
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+    )
+    inventory.sync(mode="incremental")
+    fake.commit("t3", "s3://m/t3-1.json")
+
+    first = inventory.sync(mode="incremental")
+
+    assert [failure["name"] for failure in first.failures] == ["t3"]
+    assert [(c.change, c.name) for c in first.changes] == [("added", "t3")]
+
+    failing.clear()
+    second = inventory.sync(mode="incremental")
+
+    assert second.failures == []
+    assert second.baselined == 1
+    assert second.changes == []
+    assert [c.change for c in inventory.changes_since(since=0)] == ["added"]
+
+
+def test_sync_records_transport_failures_per_catalog() -> None:
+    fake = _two_tables()
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["path"].startswith("dev/"):
+            raise urllib3.exceptions.ProtocolError("Connection aborted.")
+        return fake.fetch(arguments)
+
+    management_rest = mock.Mock()
+    management_rest.fetch.return_value = RestResponse(
+        200, {}, {"catalogs": [{"name": "dev"}, {"name": "prod"}]}
+    )
+    inventory = PolarisInventory(
+        catalog_rest=mock.Mock(**{"fetch.side_effect": fetch}),
+        management_rest=management_rest,
+        base_url="https://polaris/",
+    )
+
+    result = inventory.sync(mode="incremental")
+
+    assert result.failures == [{"catalog": "dev", "error": "Connection aborted."}]
+    assert result.snapshot.tables[("prod", ("db",))] == ["t1", "t2"]
+    assert result.loaded == 2
+
+
+def test_store_migrates_and_persists_change_feed(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"))
+    inventory = PolarisInventory(
+        catalog_rest=mock.Mock(**{"fetch.side_effect": _two_tables().fetch}),
+        management_rest=_management_rest(),
+        base_url="https://polaris/",
+        store=store,
+    )
+    inventory.sync(mode="incremental")
+
+    (loaded,) = InventoryStore(store.path).load_all("https://polaris/")
+    state = loaded.table_states[("prod", ("db",), "t1")]
+    assert state.metadata_location == "s3://m/t1-1.json"
+    assert state.etag == "s3://m/t1-1.json"
+
+
+def test_store_keys_routed_realms_by_their_own_base_url(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"))
+    router = RealmRouter(
+        Backend("https://polaris/", mock.Mock()),
+        {"east": Backend("https://east/", mock.Mock())},
+    )
+    fake = _two_tables()
+
+    def build(routed: bool) -> PolarisInventory:
+        return PolarisInventory(
+            catalog_rest=mock.Mock(**{"fetch.side_effect": fake.fetch}),
+            management_rest=_management_rest(),
+            base_url="https://polaris/",
+            store=store,
+            router=router if routed else None,
+        )
+
+    inventory = build(routed=True)
+    inventory.sync("east", mode="incremental")
+    fake.commit("t1", "s3://m/t1-2.json")
+    inventory.sync("east", mode="incremental")
+
+    assert [s.realm for s in store.load_all("https://east/")] == ["east"]
+    assert store.load_all("https://polaris/") == []
+    assert [c.name for c in store.changes_since("https://east/", "east", 0, 10)] == [
+        "t1"
+    ]
+    assert inventory.changes_since("east") != []
+
+    restarted = build(routed=True)
+    restarted.start()
+    assert (
+        restarted.snapshot("east").table_keys()
+        == inventory.snapshot("east").table_keys()
+    )
+    # The same realm name on the default deployment has no history of its own.
+    assert build(routed=False).changes_since("east") == []
+
+
+def test_store_closes_its_connections(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"))
+    opened: list[sqlite3.Connection] = []
+    connect = sqlite3.connect
+
+    def tracking_connect(path: str) -> sqlite3.Connection:
+        opened.append(connect(path))
+        return opened[-1]
+
+    with mock.patch("polaris_mcp.inventory.sqlite3.connect", tracking_connect):
+        store.record_changes(
+            "https://polaris/", "", [TableChange("added", "prod", ("db",), "t")]
+        )
+        store.load_all("https://polaris/")
+
+    assert opened
+    for connection in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_store_prunes_change_feed_by_count_and_age(tmp_path: Path) -> None:
+    store = InventoryStore(str(tmp_path / "inventory.sqlite3"), max_changes=3)
+
+    def changes(*names: str, recorded_at: float = 0.0) -> list[TableChange]:
+        return [
+            TableChange("added", "prod", ("db",), name, recorded_at=recorded_at)
+            for name in names
+        ]
+
+    store.record_changes("https://polaris/", "", changes("a", "b", "c", "d", "e"))
+    store.record_changes("https://polaris/", "other", changes("x"))
+
+    feed = store.changes_since("https://polaris/", "", 0, 100)
+    assert [change.name for change in feed] == ["c", "d", "e"]
+    assert len(store.changes_since("https://polaris/", "other", 0, 100)) == 1
+
+    aged = InventoryStore(store.path, max_change_age_seconds=60.0)
+    aged.record_changes("https://polaris/", "", changes("f", recorded_at=time.time()))
+    feed = aged.changes_since("https://polaris/", "", 0, 100)
+    assert [change.name for change in feed] == ["f"]
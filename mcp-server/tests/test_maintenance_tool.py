@@ -0,0 +1,233 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.tools.maintenance``."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from polaris_mcp.maintenance import MaintenanceScanner, ScanThresholds, assess_table
+from polaris_mcp.policies import ApplicablePolicyCache
+from polaris_mcp.rest import RestResponse
+from polaris_mcp.tools.maintenance import PolarisMaintenanceTool
+
+MiB = 1024 * 1024
+HOUR_MS = 3_600_000
+
+
+def _table(
+    data_files: int, delete_files: int, size: int, snapshot_ages_hours: list[int]
+) -> dict[str, Any]:
+    now = int(time.time() * 1000)
+    log = [
+        {"snapshot-id": index + 1, "timestamp-ms": now - age * HOUR_MS}
+        for index, age in enumerate(snapshot_ages_hours)
+    ]
+    current = len(log)
+    return {
+        "metadata-location": "s3://bucket/metadata.json",
+        "metadata": {
+            "current-snapshot-id": current,
+            "snapshots": [
+                {
+                    "snapshot-id": current,
+                    "timestamp-ms": log[-1]["timestamp-ms"],
+                    "summary": {
+                        "operation": "append",
+                        "total-data-files": str(data_files),
+                        "total-delete-files": str(delete_files),
+                        "total-files-size": str(size),
+                        "added-files-size": str(MiB),
+                    },
+                }
+            ],
+            "snapshot-log": log,
+        },
+    }
+
+
+TABLES = {
+    ("sales", "orders"): _table(200, 5, 200 * MiB, [300, 200, 1]),
+    ("sales", "tidy"): _table(2, 0, 1024 * MiB, [2, 1]),
+    ("sales.eu", "events"): _table(40, 0, 40 * MiB, [1]),
+}
+POLICIES = {
+    ("sales", "orders"): [
+        {
+            "name": "daily",
+            "policy-type": "system.data-compaction",
+            "content": json.dumps({"enable": True, "target_file_size_bytes": 64 * MiB}),
+        }
+    ],
+    ("sales.eu", "events"): [
+        {
+            "name": "off",
+            "policy-type": "system.data-compaction",
+            "content": json.dumps({"enable": False}),
+        }
+    ],
+}
+
+
+def _build_tool(
+    export_dir: str | None = None,
+) -> tuple[PolarisMaintenanceTool, mock.Mock]:
+    catalog_rest = mock.Mock()
+
+    def catalog_fetch(arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        if path.endswith("/namespaces"):
+            parent = arguments.get("query", {}).get("parent", "")
+            children = {"": [["sales"]], "sales": [["sales", "eu"]]}
+            return RestResponse(200, {}, {"namespaces": children.get(parent, [])})
+        namespace = path.split("/")[2].replace("%1F", ".")
+        if path.endswith("/tables"):
+            names = [name for ns, name in TABLES if ns == namespace]
+            return RestResponse(
+                200, {}, {"identifiers": [{"name": name} for name in names]}
+            )
+        assert arguments["query"] == {"snapshots": "refs"}
+        return RestResponse(200, {}, TABLES[(namespace, path.rsplit("/", 1)[1])])
+
+    catalog_rest.fetch.side_effect = catalog_fetch
+    policy_rest = mock.Mock()
+    policy_rest.identity.return_value = ":caller"
+
+    def policy_fetch(arguments: dict[str, Any]) -> RestResponse:
+        query = arguments["query"]
+        key = (query["namespace"].replace("\x1f", "."), query["target-name"])
+        return RestResponse(200, {}, {"applicable-policies": POLICIES.get(key, [])})
+
+    policy_rest.fetch.side_effect = policy_fetch
+    scanner = MaintenanceScanner(catalog_rest, ApplicablePolicyCache(policy_rest))
+    return PolarisMaintenanceTool(scanner, export_dir=export_dir), policy_rest
+
+
+def test_scan_ranks_candidates_with_policies(tmp_path: Path) -> None:
+    tool, _ = _build_tool(export_dir=str(tmp_path))
+    progress = mock.Mock()
+    export = tmp_path / "candidates.jsonl"
+
+    result = tool.call(
+        {
+            "operation": "scan",
+            "catalog": "prod",
+            "maxSnapshotAgeHours": 24,
+            "limit": 1,
+            "path": str(export),
+        },
+        progress=progress,
+    )
+
+    assert result.metadata is not None
+    assert result.metadata["scanned"] == 3
+    assert result.metadata["total"] == 1
+    [orders] = result.metadata["candidates"]
+    assert orders["table"] == "sales.orders"
+    compaction, expiry = orders["actions"]
+    # 200 MiB at a 64 MiB target needs 4 files: 196 excess plus 5 delete files.
+    assert compaction == {
+        "action": "compaction",
+        "score": 201,
+        "excessFiles": 196,
+        "deleteFiles": 5,
+        "targetFileSizeBytes": 64 * MiB,
+        "policy": "daily",
+    }
+    assert expiry["expirableSnapshots"] == 2
+    assert expiry["policy"] is None
+    assert orders["score"] == 203
+    assert orders["metrics"]["total-data-files"] == 200
+    assert result.metadata["export"]["rows"] == 1
+    assert json.loads(export.read_text())["table"] == "sales.orders"
+    assert progress.call_count == 3
+
+
+def test_scan_require_policy_and_validation() -> None:
+    tool, _ = _build_tool()
+
+    result = tool.call(
+        {
+            "operation": "candidates",
+            "catalog": "prod",
+            "parent": "sales",
+            "requirePolicy": True,
+            "maxSnapshotAgeHours": 24,
+        }
+    )
+
+    assert result.metadata is not None
+    assert [entry["table"] for entry in result.metadata["candidates"]] == [
+        "sales.orders"
+    ]
+    assert [
+        action["action"] for action in result.metadata["candidates"][0]["actions"]
+    ] == ["compaction"]
+
+    with pytest.raises(ValueError, match="maxSnapshots must be at least 1"):
+        tool.call({"operation": "scan", "catalog": "prod", "maxSnapshots": 0})
+
+
+def test_assess_table_uses_snapshot_expiry_policy_config() -> None:
+    now = 1000 * HOUR_MS
+    metrics = {
+        "total-data-files": 1,
+        "total-delete-files": 0,
+        "total-files-size": MiB,
+        "added-files-size": MiB,
+        "snapshot-count": 5,
+        "snapshot-timestamps": [now - age * HOUR_MS for age in (96, 72, 60, 30, 1)],
+        "oldest-snapshot-ms": now - 96 * HOUR_MS,
+    }
+    policy = {
+        "name": "retention",
+        "policy-type": "system.snapshot-expiry",
+        "content": json.dumps(
+            {
+                "enable": True,
+                "config": {"max_snapshot_age_days": 2, "min_snapshot_to_keep": 3},
+            }
+        ),
+    }
+
+    thresholds = ScanThresholds(max_snapshot_age_hours=24)
+
+    # The tool threshold alone (24 hours, keep the newest) ages out four snapshots.
+    unmanaged = assess_table(metrics, [], thresholds, now)
+    assert unmanaged is not None
+    [fallback] = unmanaged["actions"]
+    assert fallback["expirableSnapshots"] == 4
+    assert fallback["maxSnapshotAgeHours"] == 24
+
+    # The policy allows 48 hours and keeps the three newest, so only two are aged.
+    managed = assess_table(metrics, [policy], thresholds, now)
+    assert managed is not None
+    [expiry] = managed["actions"]
+    assert expiry["expirableSnapshots"] == 2
+    assert expiry["maxSnapshotAgeHours"] == 48
+    assert expiry["minSnapshotsToKeep"] == 3
+    assert expiry["policy"] == "retention"
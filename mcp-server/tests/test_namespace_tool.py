@@ -21,9 +21,14 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest import mock
 
+import pytest
+
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.concurrency import RateLimiter
+from polaris_mcp.rest import RestResponse
 from polaris_mcp.tools.namespace import PolarisNamespaceTool
 
 
@@ -73,3 +78,217 @@ def test_create_operation_infers_namespace_array_from_string() -> None:
     assert payload["body"]["properties"] is not body["properties"]
     body["properties"]["owner"] = "changed"
     assert payload["body"]["properties"]["owner"] == "analytics"
+
+
+def _bulk_delegate(tree: dict[str, list[list[str]]]) -> mock.Mock:
+    rest_client = mock.Mock()
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["method"] == "GET":
+            parent = arguments.get("query", {}).get("parent", "")
+            return RestResponse(200, {}, {"namespaces": tree.get(parent, [])})
+        if "broken" in arguments["path"]:
+            return RestResponse(403, {}, {"error": {"message": "denied"}})
+        return RestResponse(200, {}, {"updated": ["owner"], "removed": []})
+
+    rest_client.fetch.side_effect = fetch
+    return rest_client
+
+
+def test_bulk_update_properties_selects_descendants_by_prefix() -> None:
+    delegate = _bulk_delegate(
+        {
+            "": [["sales"], ["ops"]],
+            "sales": [["sales", "eu"], ["sales", "broken"]],
+            "sales\x1feu": [["sales", "eu", "daily"]],
+        }
+    )
+    tool = PolarisNamespaceTool(rest_client=delegate, requests_per_second=0)
+    progress = mock.Mock()
+
+    result = tool.call(
+        {
+            "operation": "bulk-set-properties",
+            "catalog": "prod",
+            "prefix": "sales.",
+            "body": {"updates": {"owner": "finance"}},
+        },
+        progress=progress,
+    )
+
+    posts = [
+        call.args[0]
+        for call in delegate.fetch.call_args_list
+        if call.args[0]["method"] == "POST"
+    ]
+    assert sorted(post["path"] for post in posts) == [
+        "prod/namespaces/sales%1Fbroken/properties",
+        "prod/namespaces/sales%1Feu%1Fdaily/properties",
+        "prod/namespaces/sales%1Feu/properties",
+    ]
+    assert all(post["body"] == {"updates": {"owner": "finance"}} for post in posts)
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert result.metadata["total"] == 3
+    assert result.metadata["succeeded"] == 2
+    assert [entry["target"] for entry in result.metadata["failures"]] == [
+        "sales.broken"
+    ]
+    assert result.metadata["failures"][0]["error"] == "denied"
+    assert "items" not in result.metadata
+    assert progress.call_count == 3
+
+
+def test_bulk_update_properties_dry_run_and_validation() -> None:
+    delegate = _bulk_delegate({"ops": [["ops", "a"], ["ops", "b"]]})
+    tool = PolarisNamespaceTool(rest_client=delegate)
+
+    result = tool.call(
+        {
+            "operation": "bulk-update-properties",
+            "catalog": "prod",
+            "parent": "ops",
+            "dryRun": True,
+            "body": {"removals": ["stale"]},
+        }
+    )
+
+    assert result.metadata == {"total": 2, "namespaces": [["ops", "a"], ["ops", "b"]]}
+    assert all(
+        call.args[0]["method"] == "GET" for call in delegate.fetch.call_args_list
+    )
+    with pytest.raises(ValueError, match="not both"):
+        tool.call(
+            {
+                "operation": "bulk-update-properties",
+                "catalog": "prod",
+                "namespaces": ["a"],
+                "prefix": "a",
+                "body": {"updates": {"k": "v"}},
+            }
+        )
+    with pytest.raises(ValueError, match="updates"):
+        tool.call(
+            {
+                "operation": "bulk-update-properties",
+                "catalog": "prod",
+                "namespaces": ["a"],
+                "body": {},
+            }
+        )
+
+
+def test_rate_limiter_spaces_acquisitions() -> None:
+    with mock.patch("polaris_mcp.concurrency.time") as clock:
+        clock.monotonic.return_value = 100.0
+        limiter = RateLimiter(4)
+        for _ in range(3):
+            limiter.acquire()
+
+    assert [call.args[0] for call in clock.sleep.call_args_list] == [0.25, 0.5]
+
+
+def _teardown_delegates(
+    fail_path: str | None = None,
+) -> tuple[mock.Mock, mock.Mock, list[str]]:
+    deletes: list[str] = []
+    listings = {
+        "prod/namespaces": {"namespaces": [["sales", "eu"]]},
+        "prod/namespaces/sales/tables": {"identifiers": [{"name": "orders"}]},
+        "prod/namespaces/sales%1Feu/tables": {"identifiers": [{"name": "daily"}]},
+        "prod/namespaces/sales%1Feu/views": {"identifiers": [{"name": "latest"}]},
+        "prod/namespaces/sales/policies": {"identifiers": [{"name": "compact"}]},
+    }
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        path = arguments["path"]
+        if arguments["method"] == "GET":
+            if path == "prod/namespaces" and arguments["query"]["parent"] != "sales":
+                return RestResponse(200, {}, {"namespaces": []})
+            return RestResponse(200, {}, listings.get(path, {}))
+        deletes.append(path)
+        if path == fail_path:
+            return RestResponse(409, {}, {"error": {"message": "conflict"}})
+        return RestResponse(204, {}, None)
+
+    catalog_rest = mock.Mock()
+    catalog_rest.fetch.side_effect = fetch
+    policy_rest = mock.Mock()
+    policy_rest.fetch.side_effect = fetch
+    return catalog_rest, policy_rest, deletes
+
+
+def test_delete_recursive_dry_run_reports_plan_without_deleting() -> None:
+    catalog_rest, policy_rest, deletes = _teardown_delegates()
+    tool = PolarisNamespaceTool(
+        rest_client=catalog_rest, policy_rest_client=policy_rest
+    )
+
+    result = tool.call(
+        {
+            "operation": "delete-recursive",
+            "catalog": "prod",
+            "namespace": "sales",
+            "dryRun": True,
+        }
+    )
+
+    assert deletes == []
+    assert result.metadata == {
+        "namespace": ["sales"],
+        "purge": False,
+        "tables": ["sales.orders", "sales.eu.daily"],
+        "views": ["sales.eu.latest"],
+        "policies": ["sales.compact"],
+        "namespaces": ["sales.eu", "sales"],
+        "total": 6,
+        "dryRun": True,
+    }
+
+
+def test_delete_recursive_drops_leaves_before_namespaces() -> None:
+    catalog_rest, policy_rest, deletes = _teardown_delegates()
+    tool = PolarisNamespaceTool(
+        rest_client=catalog_rest, policy_rest_client=policy_rest
+    )
+
+    result = tool.call(
+        {
+            "operation": "cascade-delete",
+            "catalog": "prod",
+            "namespace": "sales",
+            "purge": True,
+        }
+    )
+
+    assert result.is_error is False
+    assert result.metadata is not None
+    assert result.metadata["succeeded"] == 6
+    assert deletes[-2:] == ["prod/namespaces/sales%1Feu", "prod/namespaces/sales"]
+    assert deletes[3] == "prod/namespaces/sales/policies/compact"
+    table_drops = [
+        call.args[0]
+        for call in catalog_rest.fetch.call_args_list
+        if call.args[0]["method"] == "DELETE" and "/tables/" in call.args[0]["path"]
+    ]
+    assert all(drop["query"] == {"purgeRequested": "true"} for drop in table_drops)
+
+
+def test_delete_recursive_stops_before_parents_of_failed_entities() -> None:
+    catalog_rest, policy_rest, deletes = _teardown_delegates(
+        fail_path="prod/namespaces/sales%1Feu/views/latest"
+    )
+    tool = PolarisNamespaceTool(
+        rest_client=catalog_rest, policy_rest_client=policy_rest
+    )
+
+    result = tool.call(
+        {"operation": "delete-recursive", "catalog": "prod", "namespace": "sales"}
+    )
+
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert result.metadata["failed"] == 1
+    assert result.metadata["skipped"] == 3
+    assert result.metadata["failures"][0]["target"] == "sales.eu.latest"
+    assert not any(path.endswith("/policies/compact") for path in deletes)
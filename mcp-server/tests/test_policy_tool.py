@@ -22,9 +22,11 @@
 from __future__ import annotations
 
 import pytest
+from typing import Any
 from unittest import mock
 
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.rest import RestResponse
 from polaris_mcp.tools.policy import PolarisPolicyTool
 
 
@@ -57,3 +59,226 @@ def test_attach_operation_requires_policy() -> None:
         tool.call(
             {"operation": "attach", "catalog": "prod", "namespace": "ns", "body": {}}
         )
+
+
+COMPACTION = {
+    "name": "weekly",
+    "policy-type": "system.data-compaction",
+    "inherited": True,
+    "namespace": ["sales"],
+    "content": "{}",
+    "version": 1,
+}
+
+
+def _applicable_tool() -> tuple[PolarisPolicyTool, mock.Mock]:
+    rest_client = mock.Mock()
+    rest_client.identity.return_value = ":caller"
+    rest_client.call.return_value = ToolExecutionResult(text="ok", is_error=False)
+
+    def fetch(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["query"].get("target-name") == "missing":
+            return RestResponse(404, {}, {"error": {"message": "not found"}})
+        return RestResponse(200, {}, {"applicable-policies": [COMPACTION]})
+
+    rest_client.fetch.side_effect = fetch
+    return PolarisPolicyTool(rest_client=rest_client), rest_client
+
+
+def test_applicable_batch_deduplicates_and_caches_lookups() -> None:
+    tool, rest_client = _applicable_tool()
+    arguments = {
+        "operation": "applicable-batch",
+        "catalog": "prod",
+        "targets": [
+            "sales.orders",
+            {"namespace": ["sales"], "table": "orders"},
+            {"namespace": "sales"},
+            "sales.eu.daily",
+        ],
+        "policyType": "system.data-compaction",
+    }
+
+    first = tool.call(arguments)
+    second = tool.call(arguments)
+
+    queries = [call.args[0]["query"] for call in rest_client.fetch.call_args_list]
+    assert sorted(queries, key=str) == sorted(
+        [
+            {"namespace": "sales", "policyType": "system.data-compaction"},
+            {
+                "namespace": "sales",
+                "target-name": "orders",
+                "policyType": "system.data-compaction",
+            },
+            {
+                "namespace": "sales\x1feu",
+                "target-name": "daily",
+                "policyType": "system.data-compaction",
+            },
+        ],
+        key=str,
+    )
+    assert first.metadata is not None and second.metadata is not None
+    assert first.metadata["lookups"] == 3
+    assert second.metadata["lookups"] == 0
+    assert second.metadata["cached"] == 3
+    assert first.metadata["policies"]["sales.orders"] == [
+        {
+            "name": "weekly",
+            "type": "system.data-compaction",
+            "inherited": True,
+            "namespace": ["sales"],
+        }
+    ]
+
+
+def test_applicable_batch_reports_errors_and_invalidates_on_attach() -> None:
+    tool, rest_client = _applicable_tool()
+    arguments = {
+        "operation": "batch-applicable",
+        "catalog": "prod",
+        "targets": ["sales.orders", "sales.missing"],
+    }
+
+    result = tool.call(arguments)
+    tool.call(
+        {
+            "operation": "attach",
+            "catalog": "prod",
+            "namespace": "sales",
+            "policy": "weekly",
+            "body": {"target": {"type": "catalog"}},
+        }
+    )
+    tool.call(arguments)
+
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert list(result.metadata["errors"]) == ["sales.missing"]
+    assert list(result.metadata["policies"]) == ["sales.orders"]
+    assert rest_client.fetch.call_count == 4
+
+
+def _bulk_mapping_tool() -> tuple[PolarisPolicyTool, mock.Mock, mock.Mock]:
+    namespaces = {"": [["sales"]], "sales": [["sales", "eu"]]}
+    tables = {"sales": ["orders"], "sales\x1feu": ["orders", "broken"]}
+    catalog_rest = mock.Mock()
+
+    def list_catalog(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["path"].endswith("/tables"):
+            namespace = arguments["path"].split("/")[2].replace("%1F", "\x1f")
+            identifiers = [{"name": name} for name in tables.get(namespace, [])]
+            return RestResponse(200, {}, {"identifiers": identifiers})
+        parent = arguments.get("query", {}).get("parent", "")
+        return RestResponse(200, {}, {"namespaces": namespaces.get(parent, [])})
+
+    catalog_rest.fetch.side_effect = list_catalog
+    policy_rest = mock.Mock()
+    policy_rest.identity.return_value = ":caller"
+
+    def mapping(arguments: dict[str, Any]) -> RestResponse:
+        if arguments["body"]["target"]["path"][-1] == "broken":
+            return RestResponse(404, {}, {"error": {"message": "no such table"}})
+        return RestResponse(204, {}, None)
+
+    policy_rest.fetch.side_effect = mapping
+    tool = PolarisPolicyTool(
+        rest_client=policy_rest,
+        catalog_rest_client=catalog_rest,
+        requests_per_second=0,
+    )
+    return tool, policy_rest, catalog_rest
+
+
+def test_bulk_attach_expands_table_selector() -> None:
+    tool, policy_rest, _ = _bulk_mapping_tool()
+    progress = mock.Mock()
+
+    result = tool.call(
+        {
+            "operation": "attach-many",
+            "catalog": "prod",
+            "namespace": "governance",
+            "policy": "weekly",
+            "parent": "sales",
+            "body": {"parameters": {"window": "7d"}},
+        },
+        progress=progress,
+    )
+
+    requests = [call.args[0] for call in policy_rest.fetch.call_args_list]
+    assert {request["method"] for request in requests} == {"PUT"}
+    assert {request["path"] for request in requests} == {
+        "prod/namespaces/governance/policies/weekly/mappings"
+    }
+    assert sorted(request["body"]["target"]["path"] for request in requests) == [
+        ["sales", "eu", "broken"],
+        ["sales", "eu", "orders"],
+        ["sales", "orders"],
+    ]
+    assert all(
+        request["body"]["target"]["type"] == "table-like" for request in requests
+    )
+    assert all(
+        request["body"]["parameters"] == {"window": "7d"} for request in requests
+    )
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert result.metadata["policy"] == "weekly"
+    assert (result.metadata["total"], result.metadata["succeeded"]) == (3, 2)
+    assert [entry["target"] for entry in result.metadata["failures"]] == [
+        "sales.eu.broken"
+    ]
+    assert progress.call_count == 3
+
+
+def test_bulk_detach_namespaces_and_dry_run() -> None:
+    tool, policy_rest, _ = _bulk_mapping_tool()
+
+    plan = tool.call(
+        {
+            "operation": "bulk-detach",
+            "catalog": "prod",
+            "namespace": "governance",
+            "policy": "weekly",
+            "prefix": "sales",
+            "targetType": "namespace",
+            "dryRun": True,
+        }
+    )
+    assert plan.metadata == {
+        "policy": "weekly",
+        "total": 2,
+        "targets": ["sales", "sales.eu"],
+    }
+    policy_rest.fetch.assert_not_called()
+
+    result = tool.call(
+        {
+            "operation": "bulk-detach",
+            "catalog": "prod",
+            "namespace": "governance",
+            "policy": "weekly",
+            "targets": [{"namespace": "sales"}, "sales.orders"],
+        }
+    )
+    requests = [call.args[0] for call in policy_rest.fetch.call_args_list]
+    assert [request["method"] for request in requests] == ["POST", "POST"]
+    assert [request["body"] for request in requests] == [
+        {"target": {"type": "namespace", "path": ["sales"]}},
+        {"target": {"type": "table-like", "path": ["sales", "orders"]}},
+    ]
+    assert result.is_error is False
+
+    with pytest.raises(ValueError, match="not both"):
+        tool.call(
+            {
+                "operation": "bulk-detach",
+                "catalog": "prod",
+                "namespace": "governance",
+                "policy": "weekly",
+                "targets": ["sales.orders"],
+                "parent": "sales",
+            }
+        )
@@ -0,0 +1,177 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.resources``."""
+
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import pytest
+from conftest import FakeCatalog
+
+from polaris_mcp.resources import (
+    PolarisResourceCache,
+    ResourceKey,
+    ResourceSubscriptions,
+)
+
+
+def test_resource_key_round_trips_uris() -> None:
+    key = ResourceKey.parse("polaris://default/prod/analytics.daily/events")
+    assert key == ResourceKey("", "prod", ("analytics", "daily"), "events")
+    assert key.kind == "table"
+    assert key.uri == "polaris://default/prod/analytics.daily/events"
+
+    dotted = ResourceKey("POLARIS", "prod", ("v1.0", "raw"))
+    assert dotted.uri == "polaris://POLARIS/prod/v1.0%1Fraw"
+    assert ResourceKey.parse(dotted.uri) == dotted
+    assert ResourceKey.parse("polaris://POLARIS").kind == "realm"
+
+    with pytest.raises(ValueError, match="Unsupported resource URI"):
+        ResourceKey.parse("s3://bucket/key")
+
+
+def _build_cache(
+    ttl_seconds: float = 60.0, max_entries: int = 256
+) -> tuple[PolarisResourceCache, FakeCatalog]:
+    fake = FakeCatalog(events="s3://m/1.json")
+    catalog_rest = mock.Mock()
+    catalog_rest.fetch.side_effect = fake.fetch
+    cache = PolarisResourceCache(
+        catalog_rest=catalog_rest,
+        management_rest=mock.Mock(),
+        ttl_seconds=ttl_seconds,
+        max_concurrency=1,
+        max_entries=max_entries,
+    )
+    return cache, fake
+
+
+def test_cache_serves_fresh_entries_and_revalidates_tables_conditionally() -> None:
+    cache, fake = _build_cache()
+    key = ResourceKey("", "prod", ("db",), "events")
+
+    assert cache.read(key) == {"metadata-location": "s3://m/1.json"}
+    assert cache.read(key) == {"metadata-location": "s3://m/1.json"}
+    assert len(fake.loads) == 1
+    assert fake.loads[0]["query"] == {"snapshots": "refs"}
+
+    assert cache.revalidate([key]) == []
+    assert fake.loads[-1]["headers"] == {"If-None-Match": "s3://m/1.json"}
+
+    fake.commit("events", "s3://m/2.json")
+    assert cache.revalidate([key]) == [key]
+    assert cache.read(key) == {"metadata-location": "s3://m/2.json"}
+
+
+def test_cache_evicts_least_recently_used_unsubscribed_entries_first() -> None:
+    cache, fake = _build_cache(max_entries=2)
+    fake.commit("clicks", "s3://m/c.json")
+    fake.commit("orders", "s3://m/o.json")
+    events, clicks, orders = (
+        ResourceKey("", "prod", ("db",), name)
+        for name in ("events", "clicks", "orders")
+    )
+    subscriptions = ResourceSubscriptions(cache=cache, poll_interval_seconds=3600)
+    try:
+        # The subscribed table is the oldest entry, yet the unsubscribed one goes first.
+        subscriptions.subscribe(events.uri, mock.Mock())
+        cache.read(clicks)
+        cache.read(orders)
+        cache.read(events)
+        cache.read(clicks)
+    finally:
+        subscriptions.close()
+
+    loaded = [load["path"].rsplit("/", 1)[-1] for load in fake.loads]
+    assert loaded == ["events", "clicks", "orders", "clicks"]
+
+
+def test_subscriptions_notify_updated_and_list_changed() -> None:
+    cache, fake = _build_cache()
+    subscriptions = ResourceSubscriptions(cache=cache, poll_interval_seconds=3600)
+    subscriber = mock.Mock()
+    other = mock.Mock()
+    subscriptions.subscribe("polaris://default/prod/db", subscriber)
+    subscriptions.subscribe("polaris://default/prod/db/events", other)
+    try:
+        assert subscriptions.poll() == []
+
+        fake.commit("clicks", "s3://m/1.json")
+        fake.commit("events", "s3://m/2.json")
+        changed = subscriptions.poll()
+
+        assert {key.kind for key in changed} == {"namespace", "table"}
+        subscriber.resource_updated.assert_called_once_with("polaris://default/prod/db")
+        subscriber.resource_list_changed.assert_called_once_with()
+        other.resource_updated.assert_called_once_with(
+            "polaris://default/prod/db/events"
+        )
+        other.resource_list_changed.assert_not_called()
+
+        subscriptions.unsubscribe("polaris://default/prod/db", subscriber)
+        assert subscriptions.subscribed() == ["polaris://default/prod/db/events"]
+    finally:
+        subscriptions.close()
+
+
+def test_subscriptions_drop_subscribers_whose_notifications_fail() -> None:
+    cache, fake = _build_cache()
+    subscriptions = ResourceSubscriptions(cache=cache, poll_interval_seconds=3600)
+    closed = mock.Mock()
+    closed.resource_updated.side_effect = RuntimeError("session closed")
+    live = mock.Mock()
+    for subscriber in (closed, live):
+        subscriptions.subscribe("polaris://default/prod/db", subscriber)
+    subscriptions.subscribe("polaris://default/prod/db/events", closed)
+    try:
+        fake.commit("clicks", "s3://m/1.json")
+        subscriptions.poll()
+
+        closed.resource_list_changed.assert_not_called()
+        live.resource_list_changed.assert_called_once_with()
+        assert subscriptions.subscribed() == ["polaris://default/prod/db"]
+
+        fake.commit("events", "s3://m/2.json")
+        subscriptions.poll()
+        assert closed.resource_updated.call_count == 1
+    finally:
+        subscriptions.close()
+
+
+def test_subscribe_after_close_restarts_polling() -> None:
+    cache, _ = _build_cache()
+    subscriptions = ResourceSubscriptions(cache=cache, poll_interval_seconds=0.01)
+    subscriptions.subscribe("polaris://default/prod/db", mock.Mock())
+    subscriptions.close()
+    assert subscriptions.subscribed() == []
+
+    with mock.patch.object(subscriptions, "poll") as poll:
+        subscriptions.subscribe("polaris://default/prod/db", mock.Mock())
+        try:
+            deadline = time.monotonic() + 5
+            while not poll.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            subscriptions.close()
+
+    assert poll.called
@@ -28,6 +28,7 @@ import pytest
 from urllib3._collections import HTTPHeaderDict
 
 from polaris_mcp.rest import PolarisRestTool
+from polaris_mcp.routing import Backend, build_router, configured_routes
 
 
 def _build_response(
@@ -303,3 +304,112 @@ def test_call_explicit_authorization_header_skips_incoming_forwarding() -> None:
     get_headers.assert_not_called()
     headers = http.request.call_args[1]["headers"]
     assert headers["Authorization"] == "Bearer explicit"
+
+
+def test_call_projects_selected_fields_before_rendering() -> None:
+    tool, http, _ = _create_tool()
+    http.request.return_value = _build_response(
+        status=200,
+        body=(
+            '{"metadata-location":"s3://m/2.json","metadata":{"current-snapshot-id":2,'
+            '"snapshots":[{"snapshot-id":1},{"snapshot-id":2}],"a/b":{"c.d":true}}}'
+        ),
+    )
+
+    result = tool.call(
+        {
+            "path": "prod/namespaces/db/tables/events",
+            "select": [
+                "metadata.current-snapshot-id",
+                "metadata.snapshots.*.snapshot-id",
+                "/metadata/a~1b/c.d",
+                "metadata.missing",
+            ],
+        }
+    )
+
+    expected = {
+        "metadata.current-snapshot-id": 2,
+        "metadata.snapshots.*.snapshot-id": [1, 2],
+        "/metadata/a~1b/c.d": True,
+        "metadata.missing": None,
+    }
+    assert result.metadata is not None
+    assert result.metadata["response"]["body"] == expected
+    assert result.metadata["response"]["select"] == list(expected)
+    assert "s3://m/2.json" not in result.text
+
+
+def test_call_applies_transform_before_select() -> None:
+    tool, http, _ = _create_tool()
+    http.request.return_value = _build_response(status=200, body='{"a":{"b":1}}')
+
+    result = tool.call(
+        {"path": "tables/t", "select": "wrapped.b"},
+        transform=lambda body: {"wrapped": body["a"]},
+    )
+
+    assert result.metadata is not None
+    assert result.metadata["response"]["body"] == {"wrapped.b": 1}
+
+
+def test_call_skips_projection_for_errors_and_rejects_invalid_selectors() -> None:
+    tool, http, _ = _create_tool()
+    http.request.return_value = _build_response(
+        status=404, body='{"error":{"message":"missing"}}'
+    )
+
+    result = tool.call({"path": "tables/t", "select": "metadata"})
+
+    assert result.is_error is True
+    assert result.metadata is not None
+    assert result.metadata["response"]["body"] == {"error": {"message": "missing"}}
+
+    with pytest.raises(ValueError, match="select"):
+        tool.call({"path": "tables/t", "select": []})
+    with pytest.raises(ValueError, match="JSON pointer"):
+        tool.call({"path": "tables/t", "select": "/metadata/~2"})
+
+
+def test_call_routes_realms_to_their_backend_and_pool() -> None:
+    default_http, west_http = mock.Mock(), mock.Mock()
+    pools = iter([west_http])
+    routes = configured_routes(
+        {
+            "POLARIS_REALM_west_BASE_URL": " https://west.test ",
+            "POLARIS_REALM_west2_BASE_URL": "https://west.test/",
+            "POLARIS_REALM_east_BASE_URL": "https://example.test/",
+            "POLARIS_REALM_west_CLIENT_ID": "client",
+        }
+    )
+    router = build_router(
+        Backend(base_url="https://example.test/", http=default_http),
+        routes,
+        lambda: next(pools),
+    )
+    assert [backend.base_url for backend in router.backends()] == [
+        "https://example.test/",
+        "https://west.test/",
+    ]
+    assert router.backend("west2") is router.backend("west")
+    assert router.backend("east") is router.default
+    tool = PolarisRestTool(
+        name="test",
+        description="desc",
+        base_url="https://example.test/",
+        default_path_prefix="api/catalog/v1/",
+        http=default_http,
+        timeout=mock.sentinel.timeout,
+        router=router,
+    )
+    for http in (default_http, west_http):
+        http.request.return_value = _build_response(200, "{}")
+
+    tool.call({"path": "namespaces", "realm": "west"})
+    tool.call({"path": "namespaces", "realm": "other"})
+
+    west_call = west_http.request.call_args
+    assert west_call.args[1] == "https://west.test/api/catalog/v1/namespaces"
+    assert west_call.kwargs["headers"]["Polaris-Realm"] == "west"
+    default_call = default_http.request.call_args
+    assert default_call.args[1] == "https://example.test/api/catalog/v1/namespaces"
@@ -21,14 +21,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import pytest
 from collections import UserDict
 from importlib import metadata
 from unittest import mock
 
+from mcp import types
+from mcp.server.lowlevel import NotificationOptions
+
 from polaris_mcp import server
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.fanout import RealmFanOut
 
 
 class TestServerHelpers:
@@ -73,6 +78,58 @@ class TestServerHelpers:
         assert isinstance(tool_result_arg, ToolExecutionResult)
         assert tool_result_arg.text == "done"
 
+    def test_call_tool_fans_out_across_realms(self) -> None:
+        seen: list[str] = []
+
+        class DummyTool:
+            def call(self, arguments: dict[str, object]) -> ToolExecutionResult:
+                seen.append(str(arguments["realm"]))
+                return ToolExecutionResult(text="done", is_error=False)
+
+        fan_out = RealmFanOut(realms_provider=lambda: ["east", "west"])
+        result = server._call_tool(
+            DummyTool(),
+            required={"operation": "list"},
+            optional={"realm": None, "realms": ("*",)},
+            fan_out=fan_out,
+        )
+
+        assert sorted(seen) == ["east", "west"]
+        assert result.structured_content is not None
+        assert result.structured_content["meta"]["succeeded"] == 2
+        with pytest.raises(ValueError, match="not available"):
+            server._call_tool(
+                DummyTool(), required={"operation": "list"}, optional={"realms": "x"}
+            )
+
+    def test_session_subscriber_raises_once_the_session_loop_is_gone(self) -> None:
+        loop = asyncio.new_event_loop()
+        session = mock.Mock()
+        subscriber = server._SessionSubscriber(session, loop)
+        loop.close()
+
+        with pytest.raises(RuntimeError, match="session has ended"):
+            subscriber.resource_updated("polaris://default/prod")
+        session.send_resource_updated.assert_not_called()
+
+    def test_enable_resource_subscriptions_advertises_subscribe(self) -> None:
+        # Fails when a FastMCP upgrade drops the private low-level server.
+        mcp = server.FastMCP("polaris-test")
+        server._enable_resource_subscriptions(mcp, mock.Mock())
+
+        low_level = mcp._mcp_server
+        assert types.SubscribeRequest in low_level.request_handlers
+        assert types.UnsubscribeRequest in low_level.request_handlers
+        capabilities = low_level.get_capabilities(NotificationOptions(), {})
+        assert capabilities.resources is not None
+        assert capabilities.resources.subscribe is True
+
+    def test_enable_resource_subscriptions_rejects_missing_low_level_server(
+        self,
+    ) -> None:
+        with pytest.raises(RuntimeError, match="no longer exposes"):
+            server._enable_resource_subscriptions(object(), mock.Mock())  # type: ignore[arg-type]
+
     def test_copy_mapping_filters_none_and_normalizes_sequences(self) -> None:
         source = {"a": "keep", "b": None, "c": ["one", 2], "d": ("x", 3)}
         copied = server._copy_mapping(source)
@@ -246,8 +303,25 @@ class TestAuthorizationProviderResolution:
             http=fake_http,
             refresh_buffer_seconds=60.0,
             timeout=mock.sentinel.timeout,
+            router=None,
         )
 
+    def test_resolve_authorization_provider_ignores_realm_routes(self) -> None:
+        with (
+            mock.patch("polaris_mcp.server._resolve_token", return_value=None),
+            mock.patch.dict(
+                os.environ,
+                {"POLARIS_REALM_east_BASE_URL": "https://east/"},
+                clear=True,
+            ),
+        ):
+            provider = server._resolve_authorization_provider(
+                "https://base/", object(), mock.sentinel.timeout
+            )
+
+        assert not isinstance(provider, server.ClientCredentialsAuthorizationProvider)
+        assert provider.authorization_header() is None
+
 
 class TestServerConfiguration:
     def test_resolve_http_timeout_defaults(self) -> None:
@@ -332,7 +406,10 @@ class TestServerRetry:
                 backoff_factor=0.5,
                 status_forcelist=server.HTTP_RETRIES_STATUS_FORCELIST,
             )
-            mock_pool_manager.assert_called_once_with(retries=mock_retry.return_value)
+            mock_pool_manager.assert_called_once_with(
+                retries=mock_retry.return_value,
+                maxsize=server.DEFAULT_MAX_CONCURRENCY,
+            )
 
     def test_create_server_custom_retry(self) -> None:
         """Verify that the HTTP client is created with a custom retry strategy from environment variables."""
@@ -355,4 +432,37 @@ class TestServerRetry:
             backoff_factor=1.0,
             status_forcelist=server.HTTP_RETRIES_STATUS_FORCELIST,
         )
-        mock_pool_manager.assert_called_once_with(retries=mock_retry.return_value)
+        mock_pool_manager.assert_called_once_with(
+            retries=mock_retry.return_value,
+            maxsize=server.DEFAULT_MAX_CONCURRENCY,
+        )
+
+    def test_create_server_creates_one_pool_per_routed_backend(self) -> None:
+        with (
+            mock.patch("polaris_mcp.server.urllib3.PoolManager") as mock_pool_manager,
+            mock.patch.dict(
+                os.environ,
+                {
+                    "POLARIS_REALM_west_BASE_URL": "https://west:8181/",
+                    "POLARIS_REALM_west2_BASE_URL": "https://west:8181",
+                    "POLARIS_REALM_east_BASE_URL": server.DEFAULT_BASE_URL,
+                    "POLARIS_MAX_CONCURRENCY": "4",
+                },
+                clear=True,
+            ),
+        ):
+            server.create_server()
+
+        assert mock_pool_manager.call_count == 2
+        assert {
+            call.kwargs["maxsize"] for call in mock_pool_manager.call_args_list
+        } == {4}
+
+    def test_create_server_rejects_invalid_realm_base_url(self) -> None:
+        with (
+            mock.patch.dict(
+                os.environ, {"POLARIS_REALM_west_BASE_URL": "ftp://west/"}, clear=True
+            ),
+            pytest.raises(ValueError, match="http or https"),
+        ):
+            server.create_server()
@@ -21,11 +21,14 @@
 
 from __future__ import annotations
 
+import copy
 import pytest
 from unittest import mock
 from typing import Any
 
 from polaris_mcp.base import ToolExecutionResult
+from polaris_mcp.iceberg import snapshot_analytics, summarize_table
+from polaris_mcp.rest import RestResponse
 from polaris_mcp.tools.table import PolarisTableTool
 
 
@@ -77,6 +80,203 @@ def test_get_operation_accepts_alias_and_encodes_table() -> None:
     assert payload["method"] == "GET"
     assert payload["path"] == "prod/namespaces/core%1Fsales/tables/Daily%20Metrics"
     assert "body" not in payload
+    assert "select" not in payload
+
+
+def test_get_operation_forwards_select_to_delegate() -> None:
+    tool, delegate = _build_tool()
+
+    tool.call(
+        {
+            "operation": "get",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "events",
+            "select": "metadata.current-snapshot-id",
+        }
+    )
+
+    payload = delegate.call.call_args.args[0]
+    assert payload["select"] == ["metadata.current-snapshot-id"]
+
+
+def test_get_operation_applies_snapshots_mode_and_access_delegation() -> None:
+    rest_client = mock.Mock()
+    tool = PolarisTableTool(rest_client=rest_client, snapshots_mode="refs")
+    arguments: dict[str, Any] = {
+        "operation": "get",
+        "catalog": "prod",
+        "namespace": "db",
+        "table": "events",
+        "accessDelegation": ["vended-credentials", "remote-signing"],
+    }
+
+    tool.call(arguments)
+    payload = rest_client.call.call_args.args[0]
+    assert payload["query"] == {"snapshots": "refs"}
+    assert payload["headers"] == {
+        "X-Iceberg-Access-Delegation": "vended-credentials,remote-signing"
+    }
+
+    tool.call({**arguments, "snapshots": "ALL", "query": {"page-size": "1"}})
+    payload = rest_client.call.call_args.args[0]
+    assert payload["query"] == {"page-size": "1", "snapshots": "all"}
+
+    tool.call({**arguments, "query": {"snapshots": "all"}})
+    payload = rest_client.call.call_args.args[0]
+    assert payload["query"] == {"snapshots": "all"}
+
+    with pytest.raises(ValueError, match="Unsupported snapshots mode"):
+        tool.call({**arguments, "snapshots": "latest"})
+
+
+def test_get_operation_with_summary_passes_summarizing_transform() -> None:
+    tool, delegate = _build_tool()
+
+    tool.call(
+        {
+            "operation": "get",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "events",
+            "summary": True,
+        }
+    )
+
+    assert delegate.call.call_args.kwargs == {"transform": summarize_table}
+
+
+def test_summarize_table_reduces_metadata_to_current_state() -> None:
+    result = {
+        "metadata-location": "s3://m/3.json",
+        "config": {"token": "secret"},
+        "metadata": {
+            "format-version": 2,
+            "location": "s3://warehouse/events",
+            "last-updated-ms": 3000,
+            "current-schema-id": 1,
+            "schemas": [
+                {"schema-id": 0, "fields": []},
+                {
+                    "schema-id": 1,
+                    "fields": [
+                        {"id": 1, "name": "id", "type": "long", "required": True},
+                        {"id": 2, "name": "ts", "type": "timestamp", "required": False},
+                    ],
+                },
+            ],
+            "default-spec-id": 0,
+            "partition-specs": [
+                {
+                    "spec-id": 0,
+                    "fields": [
+                        {
+                            "name": "ts_day",
+                            "transform": "day",
+                            "source-id": 2,
+                            "field-id": 1000,
+                        }
+                    ],
+                }
+            ],
+            "default-sort-order-id": 0,
+            "sort-orders": [{"order-id": 0, "fields": []}],
+            "current-snapshot-id": 2,
+            "snapshots": [
+                {"snapshot-id": 1, "summary": {"operation": "append"}},
+                {
+                    "snapshot-id": 2,
+                    "timestamp-ms": 2000,
+                    "summary": {
+                        "operation": "overwrite",
+                        "added-records": "5",
+                        "total-records": "15",
+                        "total-files-size": "4096",
+                    },
+                },
+            ],
+            "snapshot-log": [{"snapshot-id": 1}, {"snapshot-id": 2}],
+            "properties": {"owner": "etl"},
+        },
+    }
+
+    summary = summarize_table(result)
+
+    assert summary["schema"]["schema-id"] == 1
+    assert [field["name"] for field in summary["schema"]["fields"]] == ["id", "ts"]
+    assert summary["partition-spec"]["fields"][0]["source"] == "ts"
+    assert summary["current-snapshot"] == {
+        "snapshot-id": 2,
+        "timestamp-ms": 2000,
+        "operation": "overwrite",
+        "total-records": "15",
+        "total-files-size": "4096",
+    }
+    assert summary["snapshot-count"] == 2
+    assert summary["last-updated-ms"] == 3000
+    assert "config" not in summary
+    assert "snapshot-log" not in summary
+
+
+def test_exists_operation_uses_head_for_tables_and_views() -> None:
+    tool, delegate = _build_tool()
+
+    tool.call(
+        {"operation": "head", "catalog": "prod", "namespace": "db", "table": "events"}
+    )
+    payload = delegate.call.call_args.args[0]
+    assert payload["method"] == "HEAD"
+    assert payload["path"] == "prod/namespaces/db/tables/events"
+
+    tool.call(
+        {
+            "operation": "exists",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "daily",
+            "kind": "view",
+        }
+    )
+    assert delegate.call.call_args.args[0]["path"] == "prod/namespaces/db/views/daily"
+
+
+def test_exists_operation_checks_tables_in_batch() -> None:
+    tool, delegate = _build_tool()
+    statuses = {
+        "prod/namespaces/db/tables/events": 204,
+        "prod/namespaces/db/tables/missing": 404,
+        "prod/namespaces/core%1Fsales/tables/orders": 204,
+        "prod/namespaces/db/tables/locked": 403,
+    }
+    delegate.fetch.side_effect = lambda args: RestResponse(
+        statuses[args["path"]], {}, None
+    )
+
+    result = tool.call(
+        {
+            "operation": "exists",
+            "catalog": "prod",
+            "namespace": "db",
+            "tables": [
+                "events",
+                "missing",
+                {"namespace": ["core", "sales"], "table": "orders"},
+                "locked",
+            ],
+            "realm": "POLARIS",
+        }
+    )
+
+    assert result.metadata == {
+        "exists": {"db.events": True, "db.missing": False, "core.sales.orders": True},
+        "errors": {"db.locked": {"status": 403}},
+    }
+    assert result.is_error is True
+    delegate.call.assert_not_called()
+    assert {call.args[0]["method"] for call in delegate.fetch.call_args_list} == {
+        "HEAD"
+    }
+    assert delegate.fetch.call_args.args[0]["realm"] == "POLARIS"
 
 
 def test_get_operation_requires_table_argument() -> None:
@@ -167,6 +367,47 @@ def test_commit_operation_post_request_with_body_copy() -> None:
     assert payload["body"]["changes"][0]["snapshot-id"] == 5
 
 
+def test_commit_transaction_posts_all_table_changes_without_namespace() -> None:
+    tool, delegate = _build_tool()
+    body = {
+        "table-changes": [
+            {
+                "identifier": {"namespace": ["db"], "name": "orders"},
+                "requirements": [],
+                "updates": [{"action": "set-properties", "updates": {"a": "1"}}],
+            },
+            {
+                "identifier": {"namespace": ["db"], "name": "payments"},
+                "requirements": [],
+                "updates": [],
+            },
+        ]
+    }
+
+    tool.call({"operation": "transaction", "catalog": "prod", "body": body})
+
+    payload = delegate.call.call_args.args[0]
+    assert payload["method"] == "POST"
+    assert payload["path"] == "prod/transactions/commit"
+    assert payload["body"] == body
+    assert payload["body"] is not body
+
+
+def test_commit_transaction_requires_identified_table_changes() -> None:
+    tool, _ = _build_tool()
+
+    with pytest.raises(ValueError, match="CommitTransactionRequest"):
+        tool.call({"operation": "commit-transaction", "catalog": "prod", "body": {}})
+    with pytest.raises(ValueError, match="identifier"):
+        tool.call(
+            {
+                "operation": "commit-transaction",
+                "catalog": "prod",
+                "body": {"table-changes": [{"updates": []}]},
+            }
+        )
+
+
 def test_delete_operation_uses_alias_and_encodes_table() -> None:
     tool, delegate = _build_tool()
 
@@ -196,3 +437,266 @@ def test_namespace_validation_rejects_blank_values() -> None:
 
     with pytest.raises(ValueError, match="Namespace array elements"):
         tool.call({"operation": "list", "catalog": "prod", "namespace": ["ok", " "]})
+
+
+def _history(*snapshots: tuple[int, str, int, int, int]) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "snapshots": [
+                {
+                    "snapshot-id": index,
+                    "timestamp-ms": timestamp,
+                    "summary": {
+                        "operation": operation,
+                        "added-data-files": str(added),
+                        "total-data-files": str(data_files),
+                        "total-delete-files": str(delete_files),
+                        "total-files-size": str(data_files * 100),
+                    },
+                }
+                for index, (timestamp, operation, added, data_files, delete_files) in (
+                    enumerate(snapshots)
+                )
+            ]
+        }
+    }
+
+
+def test_snapshot_stats_requests_full_history_and_aggregates() -> None:
+    tool, delegate = _build_tool()
+
+    tool.call(
+        {
+            "operation": "snapshot-stats",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "events",
+            "query": {"snapshots": "refs"},
+            "windowHours": 12,
+            "windows": 2,
+        }
+    )
+
+    payload = delegate.call.call_args.args[0]
+    assert payload["method"] == "GET"
+    assert payload["path"] == "prod/namespaces/db/tables/events"
+    assert payload["query"] == {"snapshots": "all"}
+    transform = delegate.call.call_args.kwargs["transform"]
+    stats = transform(_history((1000, "append", 4, 4, 0)))
+    assert stats["snapshots"] == 1
+    assert [window["commits"] for window in stats["windows"]] == [0, 0]
+
+    with pytest.raises(ValueError, match="windowHours must be a positive number"):
+        tool.call(
+            {
+                "operation": "history-stats",
+                "catalog": "prod",
+                "namespace": "db",
+                "table": "events",
+                "windowHours": 0,
+            }
+        )
+
+
+def test_snapshot_analytics_computes_growth_and_windows() -> None:
+    day = 86_400_000
+    # Listed out of order on purpose; the overwrite omits total-delete-files.
+    result = _history(
+        (2 * day, "append", 6, 10, 2),
+        (0, "append", 4, 4, 0),
+        (3 * day, "delete", 0, 10, 5),
+        (day, "overwrite", 2, 6, 0),
+    )
+    del result["metadata"]["snapshots"][3]["summary"]["total-delete-files"]
+
+    stats = snapshot_analytics(result, window_hours=48, windows=2, now_ms=3 * day)
+
+    assert stats["snapshots"] == 4
+    assert stats["commitsPerDay"] == 1.0
+    assert stats["operations"] == {"append": 2, "overwrite": 1, "delete": 1}
+    assert stats["dataFiles"] == {"first": 4, "last": 10, "growth": 6, "perDay": 2.0}
+    assert stats["sizeBytes"]["growth"] == 600
+    assert stats["deleteFileRatio"] == round(5 / 15, 4)
+    older, recent = stats["windows"]
+    assert (older["startMs"], older["endMs"]) == (-day, day)
+    assert older["commits"] == 2
+    assert older["dataFileGrowth"] == 6
+    assert older["deleteFileRatio"] == 0.0
+    assert recent["commits"] == 2
+    assert recent["operations"] == {"append": 1, "delete": 1}
+    assert recent["addedDataFiles"] == 6
+    assert recent["dataFileGrowth"] == 4
+    assert recent["sizeGrowthBytes"] == 400
+    assert snapshot_analytics({"metadata": {}}) == {"snapshots": 0}
+
+
+EVOLVING_TABLE = {
+    "metadata-location": "s3://m/5.json",
+    "metadata": {
+        "current-schema-id": 1,
+        "schemas": [
+            {
+                "schema-id": 0,
+                "fields": [
+                    {"id": 1, "name": "id", "type": "int", "required": True},
+                    {"id": 2, "name": "amount", "type": "decimal(9,2)"},
+                    {"id": 3, "name": "legacy", "type": "string"},
+                    {
+                        "id": 4,
+                        "name": "tags",
+                        "type": {
+                            "type": "list",
+                            "element-id": 5,
+                            "element": "string",
+                            "element-required": False,
+                        },
+                    },
+                ],
+            },
+            {
+                "schema-id": 1,
+                "fields": [
+                    {"id": 1, "name": "id", "type": "long", "required": True},
+                    {"id": 2, "name": "total", "type": "decimal(12,2)"},
+                    {
+                        "id": 4,
+                        "name": "tags",
+                        "type": {
+                            "type": "list",
+                            "element-id": 5,
+                            "element": "string",
+                            "element-required": True,
+                        },
+                    },
+                    {"id": 6, "name": "ts", "type": "timestamp"},
+                ],
+            },
+        ],
+        "default-spec-id": 1,
+        "partition-specs": [
+            {"spec-id": 0, "fields": []},
+            {
+                "spec-id": 1,
+                "fields": [
+                    {
+                        "name": "ts_day",
+                        "transform": "day",
+                        "source-id": 6,
+                        "field-id": 1000,
+                    }
+                ],
+            },
+        ],
+        "snapshots": [
+            {"snapshot-id": 10, "timestamp-ms": 1000, "schema-id": 0},
+            {"snapshot-id": 11, "timestamp-ms": 5000, "schema-id": 1},
+        ],
+        "snapshot-log": [
+            {"snapshot-id": 10, "timestamp-ms": 1000},
+            {"snapshot-id": 11, "timestamp-ms": 5000},
+        ],
+    },
+}
+
+
+def test_diff_schema_reports_field_and_spec_evolution_from_cache() -> None:
+    delegate = mock.Mock()
+    delegate.identity.return_value = ":caller"
+    delegate.fetch.side_effect = [
+        RestResponse(200, {"ETag": '"v5"'}, EVOLVING_TABLE),
+        RestResponse(304, {}, None),
+        RestResponse(304, {}, None),
+    ]
+    tool = PolarisTableTool(rest_client=delegate)
+    arguments = {
+        "operation": "diff-schema",
+        "catalog": "prod",
+        "namespace": "db",
+        "table": "orders",
+        "fromVersion": {"timestampMs": 4000, "specId": 0},
+    }
+
+    result = tool.call(arguments)
+
+    request = delegate.fetch.call_args.args[0]
+    assert request["query"] == {"snapshots": "all"}
+    assert "headers" not in request
+    assert result.metadata is not None
+    assert result.metadata["cached"] is False
+    assert result.metadata["schema"] == {
+        "from": 0,
+        "to": 1,
+        "added": [{"id": 6, "name": "ts", "type": "timestamp", "required": False}],
+        "dropped": [{"id": 3, "name": "legacy", "type": "string", "required": False}],
+        "renamed": [{"id": 2, "from": "amount", "to": "total"}],
+        "promoted": [
+            {"id": 1, "name": "id", "from": "int", "to": "long"},
+            {"id": 2, "name": "total", "from": "decimal(9,2)", "to": "decimal(12,2)"},
+        ],
+        "requiredChanged": [{"id": 5, "name": "tags.element", "required": True}],
+    }
+    assert result.metadata["partitionSpec"] == {
+        "from": 0,
+        "to": 1,
+        "added": [{"name": "ts_day", "source": "ts", "transform": "day"}],
+    }
+    assert "sortOrder" not in result.metadata
+
+    repeat = tool.call({**arguments, "fromVersion": {"snapshotId": 11}})
+
+    assert delegate.fetch.call_args.args[0]["headers"] == {"If-None-Match": '"v5"'}
+    assert repeat.metadata is not None
+    assert repeat.metadata["cached"] is True
+    assert repeat.metadata["schema"] == {"from": 1, "to": 1}
+
+    with pytest.raises(ValueError, match="Unknown schema id: 7"):
+        tool.call({**arguments, "fromVersion": {"schemaId": 7}})
+
+
+def test_diff_schema_reports_schema_missing_from_trimmed_metadata() -> None:
+    trimmed: dict[str, Any] = copy.deepcopy(EVOLVING_TABLE)
+    del trimmed["metadata"]["schemas"][0]
+    delegate = mock.Mock()
+    delegate.identity.return_value = ":caller"
+    delegate.fetch.return_value = RestResponse(200, {}, trimmed)
+    tool = PolarisTableTool(rest_client=delegate)
+
+    result = tool.call(
+        {
+            "operation": "diff-schema",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "orders",
+            "fromVersion": {"snapshotId": 10},
+        }
+    )
+
+    assert result.is_error is True
+    assert result.metadata == {
+        "table": "db.orders",
+        "error": "Schema 0 is not present in the table metadata.",
+    }
+
+
+def test_diff_schema_returns_polaris_error_for_missing_table() -> None:
+    delegate = mock.Mock()
+    delegate.identity.return_value = ":caller"
+    body = {"error": {"code": 404, "message": "Table does not exist: db.orders"}}
+    delegate.fetch.return_value = RestResponse(404, {}, body)
+    tool = PolarisTableTool(rest_client=delegate)
+
+    result = tool.call(
+        {
+            "operation": "diff-schema",
+            "catalog": "prod",
+            "namespace": "db",
+            "table": "orders",
+            "fromVersion": {"schemaId": 0},
+        }
+    )
+
+    assert result.is_error is True
+    assert result.metadata == {
+        "table": "db.orders",
+        "response": {"status": 404, "body": body},
+    }
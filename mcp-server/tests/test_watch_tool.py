@@ -0,0 +1,128 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+
+"""Unit tests for ``polaris_mcp.watch`` and the table watch tool."""
+
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+from conftest import FakeCatalog
+
+from polaris_mcp.tools.watch import PolarisTableWatchTool
+from polaris_mcp.watch import TableRef, TableWatcher
+
+
+def _metadata(snapshot_ids: list[int], **properties: str) -> dict:
+    return {
+        "current-snapshot-id": snapshot_ids[-1],
+        "current-schema-id": 0,
+        "default-spec-id": 0,
+        "snapshots": [
+            {
+                "snapshot-id": sid,
+                "timestamp-ms": sid * 1000,
+                "summary": {"operation": "append", "added-records": "10"},
+            }
+            for sid in snapshot_ids
+        ],
+        "properties": properties,
+    }
+
+
+def _build_watcher() -> tuple[TableWatcher, FakeCatalog]:
+    fake = FakeCatalog()
+    fake.commit("events", "s3://m/1.json", _metadata([1], owner="a"))
+    rest = mock.Mock()
+    rest.fetch.side_effect = fake.fetch
+    return TableWatcher(catalog_rest=rest), fake
+
+
+def test_poll_uses_conditional_requests_and_reports_compact_diffs() -> None:
+    watcher, fake = _build_watcher()
+    ref = TableRef("prod", ("db",), "events")
+    baseline = watcher.watch([ref])
+    assert baseline.loaded == 1
+    assert baseline.diffs == []
+    assert fake.loads[0]["path"] == "prod/namespaces/db/tables/events"
+    assert fake.loads[0]["query"] == {"snapshots": "refs"}
+
+    unchanged = watcher.poll()
+    assert unchanged.not_modified == 1
+    assert fake.loads[-1]["headers"] == {"If-None-Match": "s3://m/1.json"}
+
+    fake.commit("events", "s3://m/2.json", _metadata([1, 2], owner="b", retention="7d"))
+    changed = watcher.poll()
+
+    (diff,) = changed.diffs
+    assert diff["table"] == {"catalog": "prod", "namespace": ["db"], "table": "events"}
+    assert diff["newSnapshots"] == [
+        {
+            "snapshot-id": 2,
+            "timestamp-ms": 2000,
+            "operation": "append",
+            "added-records": "10",
+        }
+    ]
+    assert diff["currentSnapshotId"] == {"from": 1, "to": 2}
+    assert diff["properties"] == {"set": {"owner": "b", "retention": "7d"}}
+    assert diff["metadataLocation"]["to"] == "s3://m/2.json"
+    assert "currentSchemaId" not in diff
+
+    del fake.tables["events"]
+    dropped = watcher.poll()
+    assert dropped.diffs == [{"table": diff["table"], "dropped": True}]
+    assert watcher.watched() == []
+
+
+def test_tool_parses_table_identifiers_and_streams_progress() -> None:
+    watcher, _ = _build_watcher()
+    tool = PolarisTableWatchTool(watcher=watcher)
+    progress = mock.Mock()
+
+    result = tool.call(
+        {
+            "operation": "stream",
+            "catalog": "prod",
+            "tables": [
+                "db.events",
+                {"catalog": "prod", "namespace": ["db"], "table": "events"},
+            ],
+            "intervalSeconds": 1,
+            "durationSeconds": 0,
+            "realm": "POLARIS",
+        },
+        progress=progress,
+    )
+
+    payload = json.loads(result.text)
+    assert payload["rounds"] == 1
+    assert payload["notModified"] == 1
+    progress.assert_called_once_with(1.0, None, None)
+    assert watcher.watched() == [TableRef("prod", ("db",), "events", "POLARIS")]
+
+    with pytest.raises(ValueError, match="at least 1"):
+        tool.call({"operation": "stream", "intervalSeconds": 0})
+    with pytest.raises(ValueError, match="namespace.table"):
+        tool.call({"operation": "watch", "catalog": "prod", "tables": ["events"]})
+    with pytest.raises(ValueError, match="needs a catalog"):
+        tool.call({"operation": "watch", "tables": ["db.events"]})